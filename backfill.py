@@ -0,0 +1,179 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+과거 이슈 일괄 요약 (Backfill)
+smol.ai 날짜 범위 또는 Weekly Robotics 이슈 번호 범위를 한 번에 요약
+"""
+
+import os
+import sys
+import argparse
+import textwrap
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.config import Config
+from src.logger import logger, setup_logger
+from src.response_cache import configure_response_cache
+from src.tracing import get_tracer, span
+from src.metrics import MetricsServer, finish_run
+from src.backfill import (
+    BackfillRunner,
+    BackfillCheckpoint,
+    DEFAULT_CHECKPOINT_PATH,
+    parse_issue_date,
+    smol_ai_issue_urls,
+    weekly_robotics_issue_urls,
+    format_duration,
+)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description="과거 뉴스 이슈 일괄 요약 → outputs/YYYY/MM/ 저장",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=textwrap.dedent("""
+        예시:
+          # smol.ai 날짜 범위
+          python backfill.py --smol-from 25-08-01 --smol-to 25-08-31
+
+          # Weekly Robotics 이슈 번호 범위
+          python backfill.py --robotics-from 300 --robotics-to 315 --workers 2
+
+          # 대상 목록만 확인
+          python backfill.py --smol-from 25-08-01 --smol-to 25-08-31 --dry-run
+        """)
+    )
+
+    parser.add_argument("--smol-from", help="smol.ai 시작 날짜 (YY-MM-DD)")
+    parser.add_argument("--smol-to", help="smol.ai 종료 날짜 (YY-MM-DD, 기본: 시작 날짜)")
+    parser.add_argument("--robotics-from", type=int, help="Weekly Robotics 시작 이슈 번호")
+    parser.add_argument("--robotics-to", type=int, help="Weekly Robotics 종료 이슈 번호 (기본: 시작 번호)")
+
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=Config.BATCH_CONCURRENCY,
+        help=f"동시 요약 수 (기본: {Config.BATCH_CONCURRENCY})"
+    )
+
+    parser.add_argument(
+        "--checkpoint",
+        default=DEFAULT_CHECKPOINT_PATH,
+        help=f"체크포인트 파일 경로 (기본: {DEFAULT_CHECKPOINT_PATH})"
+    )
+
+    parser.add_argument("--timeframe", default="", help="기간 정보 (선택)")
+    parser.add_argument("--dry-run", action="store_true", help="요약하지 않고 대상 목록만 출력")
+    parser.add_argument("--debug", action="store_true", help="디버그 모드 (상세 로그 출력)")
+
+    # 캐시 옵션
+    parser.add_argument("--no-cache", action="store_true", help="OpenAI 응답 캐시를 사용하지 않음")
+    parser.add_argument("--refresh", action="store_true", help="캐시된 응답을 무시하고 새로 생성하여 캐시 갱신")
+
+    # 메트릭 옵션
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=Config.METRICS_PORT,
+        help="실행 중 /metrics를 제공할 HTTP 포트 (기본: METRICS_PORT, 0이면 비활성화)"
+    )
+
+    args = parser.parse_args()
+    if not args.smol_from and args.robotics_from is None:
+        parser.error("--smol-from 또는 --robotics-from 중 하나 이상 필요합니다")
+    return args
+
+
+def main() -> int:
+    """메인 함수"""
+    try:
+        args = parse_arguments()
+
+        log_level = "DEBUG" if args.debug else "INFO"
+        setup_logger(level=log_level)
+
+        # 대상 URL 열거
+        try:
+            urls = []
+            if args.smol_from:
+                start = parse_issue_date(args.smol_from)
+                end = parse_issue_date(args.smol_to) if args.smol_to else start
+                urls.extend(smol_ai_issue_urls(start, end))
+            if args.robotics_from is not None:
+                last = args.robotics_to if args.robotics_to is not None else args.robotics_from
+                urls.extend(weekly_robotics_issue_urls(args.robotics_from, last))
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+
+        logger.info("=" * 60)
+        logger.info(f"Backfill 시작: {len(urls)}개 이슈 (workers: {args.workers})")
+        logger.info("=" * 60)
+
+        runner = BackfillRunner(
+            workers=args.workers,
+            checkpoint=BackfillCheckpoint(args.checkpoint)
+        )
+
+        if args.dry_run:
+            pending = runner.plan(urls)
+            logger.info(f"[DRY-RUN] 요약 대상 {len(pending)}건 (건너뜀 {len(urls) - len(pending)}건)")
+            for url in pending:
+                logger.info(f"  - {url}")
+            return 0
+
+        try:
+            Config.validate()
+        except ValueError as e:
+            logger.error(str(e))
+            return 1
+
+        response_cache = configure_response_cache(
+            enabled=not args.no_cache,
+            refresh=args.refresh
+        )
+
+        # 장시간 실행 중 Prometheus가 직접 수집할 수 있도록 HTTP 제공
+        metrics_server = MetricsServer(args.metrics_port).start() if args.metrics_port else None
+        try:
+            with span("run", command="backfill", urls=len(urls)):
+                report = runner.run(urls, timeframe=args.timeframe)
+        finally:
+            if metrics_server:
+                metrics_server.stop()
+
+        # 결과 요약
+        logger.info("=" * 60)
+        logger.info("📊 Backfill 결과:")
+        logger.info(f"  - 전체: {report['total']}건")
+        logger.info(f"  - 건너뜀 (기존 출력/체크포인트): {report['skipped']}건")
+        logger.info(f"  - 성공: {report['succeeded']}건")
+        logger.info(f"  - 실패: {report['failed']}건 (다음 실행 시 재시도)")
+        logger.info(f"  - 소요 시간: {format_duration(report['elapsed'])}")
+        logger.info(f"  - 처리량: {report['throughput']:.1f}건/분")
+        if response_cache.enabled:
+            stats = response_cache.stats()
+            logger.info(f"  - 응답 캐시: 적중 {stats['hits']}회, 미스 {stats['misses']}회")
+        
+        # 실행 전체 트레이스 (logs/trace_<trace_id>.json)
+        get_tracer().write()
+        logger.info("=" * 60)
+
+        return 0 if report['failed'] == 0 else 1
+
+    except KeyboardInterrupt:
+        logger.warning("\n사용자에 의해 중단됨 (체크포인트에서 재개 가능)")
+        return 130
+    except Exception as e:
+        logger.error(f"예상치 못한 오류: {str(e)}", exc_info=True)
+        return 1
+
+
+if __name__ == "__main__":
+    exit_code = main()
+    # 실행 결과 메트릭을 node-exporter textfile로 기록
+    finish_run("backfill", exit_code == 0)
+    sys.exit(exit_code)
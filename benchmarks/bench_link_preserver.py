@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LinkPreserver 벤치마크
+링크 5,000개짜리 합성 문서로 이전 구현(placeholder마다 전체 스캔)과 비교
+
+사용법:
+    python benchmarks/bench_link_preserver.py [--links 5000] [--repeat 3]
+"""
+
+import re
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.utils.link_preserver import LinkPreserver
+from src.logger import logger
+
+
+def make_document(link_count: int) -> str:
+    """마크다운 링크와 일반 URL이 섞인 합성 문서 생성"""
+    lines = ["## AI Twitter Recap", ""]
+    for i in range(link_count):
+        if i % 3 == 0:
+            lines.append(f"- 항목 {i}: https://example.com/plain/{i}")
+        else:
+            lines.append(f"- 항목 {i}: [트윗 {i}](https://x.com/user{i % 97}/status/{10**18 + i})")
+    return "\n".join(lines)
+
+
+def legacy_restore_links(content: str, link_map: dict) -> str:
+    """이전 restore_links: placeholder마다 re.search + re.sub로 전체 문서 스캔"""
+    restored = content
+    for placeholder, url in link_map.items():
+        for pattern in (f"\\[{placeholder}\\]", placeholder):
+            if re.search(pattern, restored):
+                restored = re.sub(pattern, url, restored)
+                break
+    return restored
+
+
+def legacy_extract_links(content: str) -> list:
+    """이전 extract_links: 리스트 멤버십으로 중복 제거"""
+    links = []
+    for _, url in re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content):
+        if not url.startswith('[LINK_'):
+            links.append(url)
+    for url in re.findall(r'https?://[^\s\)\]<>"]+', content):
+        if url not in links:
+            links.append(url)
+    return links
+
+
+def best_of(func, repeat: int) -> float:
+    """repeat회 실행 중 최소 소요 시간(초)"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="LinkPreserver 벤치마크")
+    parser.add_argument("--links", type=int, default=5000, help="문서의 링크 수 (기본: 5000)")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (기본: 3)")
+    args = parser.parse_args()
+
+    # 치환/복원 로그가 측정 결과를 가리지 않도록 경고 이상만 출력
+    logger.setLevel("WARNING")
+
+    document = make_document(args.links)
+    preserver = LinkPreserver()
+    preserved, link_map = preserver.preserve_links(document)
+
+    restored = preserver.restore_links(preserved, link_map)
+    assert restored == document, "복원 결과가 원본과 다름"
+    assert legacy_restore_links(preserved, link_map) == document
+
+    rows = [
+        ("restore_links", lambda: legacy_restore_links(preserved, link_map),
+         lambda: preserver.restore_links(preserved, link_map)),
+        ("extract_links", lambda: legacy_extract_links(document),
+         lambda: preserver.extract_links(document)),
+    ]
+
+    print(f"문서: 링크 {len(link_map):,}개, {len(document):,}자 (best of {args.repeat})")
+    print(f"{'작업':<16}{'이전(초)':>12}{'현재(초)':>12}{'배수':>10}")
+    for name, legacy, current in rows:
+        legacy_seconds = best_of(legacy, args.repeat)
+        current_seconds = best_of(current, args.repeat)
+        speedup = legacy_seconds / current_seconds if current_seconds else float("inf")
+        print(f"{name:<16}{legacy_seconds:>12.3f}{current_seconds:>12.4f}{speedup:>9.0f}x")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+오프라인 end-to-end 파이프라인 벤치마크
+main.py의 단계 그래프(요약 → 후처리 → Compact → Discord/Kakao 변환 → GitHub/Discord/Kakao 발송)를
+녹화된 OpenAI Responses 페이로드와 로컬 발송 싱크로 실행하고 단계별 소요 시간, 최대 RSS를 측정
+
+- 녹화 파일(benchmarks/fixtures/*.json)의 recordings: 요청 입력에 match 문자열이 있으면 response를 반환
+- 지연: 녹화된 latency_seconds × --latency-scale (종류별 --latency kind=초 로 덮어쓰기)
+- 결과 JSON을 --baseline과 비교해 느려진 단계가 있으면 종료 코드 1
+
+사용법:
+    python benchmarks/bench_pipeline.py [--repeat 3] [--latency-scale 0.01] [--json result.json]
+    python benchmarks/bench_pipeline.py --latency summarize=0.5 --sink-latency 0.05
+    python benchmarks/bench_pipeline.py --baseline baseline.json --tolerance 0.25
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import resource
+import tempfile
+import statistics
+from argparse import Namespace
+from contextlib import contextmanager, ExitStack
+from pathlib import Path
+from typing import Dict, List, Any, Iterator
+from unittest.mock import patch
+
+# 프로젝트 루트를 Python 경로에 추가
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from main import build_pipeline
+from src import response_cache, usage_ledger, tracing, github_id_cache, discussion_index, publish_ledger
+from src.config import Config
+from src.response_cache import ResponseCache, _deserialize_response
+from src.usage_ledger import UsageLedger, llm_context
+from src.github_id_cache import GitHubIdCache
+from src.discussion_index import DiscussionIndex
+from src.publish_ledger import PublishLedger
+from src.tracing import Tracer, span
+from src.summarizer import SummarizerFactory
+from src.logger import logger
+from local_sink import LocalSink
+
+DEFAULT_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "smol_ai_news_25-09-01.json"
+
+# OpenAI 클라이언트를 생성하는 모듈 (녹화 재생 클라이언트로 교체)
+OPENAI_MODULES = (
+    "src.summarizers.smol_ai_news",
+    "src.summarizers.weekly_robotics",
+    "src.summarizers.compact",
+    "src.summarizers.postprocessors.base",
+)
+
+# 단계 외에 집계할 span 이름 접두사
+SPAN_PREFIXES = ("llm.", "postprocess.", "compact", "file.", "discord.", "kakao.", "github.", "tinyurl.")
+
+
+class ReplayResponses:
+    """녹화된 페이로드를 돌려주는 responses 엔드포인트"""
+
+    def __init__(self, recordings: List[Dict[str, Any]], latencies: Dict[str, float]):
+        self.recordings = recordings
+        self.latencies = latencies
+        self.calls: List[str] = []
+
+    def create(self, **params):
+        text = json.dumps(params.get("input"), ensure_ascii=False)
+        for recording in self.recordings:
+            if recording["match"] in text:
+                self.calls.append(recording["kind"])
+                time.sleep(self.latencies[recording["kind"]])
+                return _deserialize_response(json.dumps(recording["response"], ensure_ascii=False))
+        raise RuntimeError(f"일치하는 녹화 응답 없음: {text[:120]}")
+
+
+class ReplayClient:
+    """OpenAI 클라이언트 대역 (responses.create만 제공)"""
+
+    def __init__(self, responses: ReplayResponses):
+        self.responses = responses
+
+
+@contextmanager
+def offline_environment(sink: LocalSink, client: ReplayClient, workdir: str) -> Iterator[None]:
+    """OpenAI 클라이언트와 발송 대상을 로컬로 돌리고 캐시/원장을 임시 디렉토리로 격리"""
+    settings = {
+        "OPENAI_API_KEY": "bench-key",
+        "DISCORD_WEBHOOK_URL": f"{sink.base_url}/discord",
+        "KAKAO_BOT_WEBHOOK_URL": f"{sink.base_url}/kakao",
+        "GITHUB_TOKEN": "bench-token",
+        "GH_REPO": "bench/news",
+        "GH_ORG": None,
+        "GH_DISCUSSION_CATEGORY": LocalSink.CATEGORY,
+        "GH_GRAPHQL_URL": f"{sink.base_url}/graphql",
+        "TINYURL_API_URL": f"{sink.base_url}/tinyurl",
+    }
+    with ExitStack() as stack:
+        for name, value in settings.items():
+            stack.enter_context(patch.object(Config, name, value))
+        for module in OPENAI_MODULES:
+            stack.enter_context(patch(f"{module}.OpenAI", lambda *args, **kwargs: client))
+
+        # 매 실행 실제 처리 시간을 재도록 응답 캐시 비활성화
+        stack.enter_context(patch.object(
+            response_cache, "_response_cache", ResponseCache(path=os.path.join(workdir, "cache.sqlite3"), enabled=False)
+        ))
+        stack.enter_context(patch.object(
+            usage_ledger, "_usage_ledger", UsageLedger(path=os.path.join(workdir, "llm_usage.jsonl"))
+        ))
+        # 저장소 ID 조회도 매 실행 측정하고, 게시 기록은 임시 디렉토리에만 남김
+        stack.enter_context(patch.object(
+            github_id_cache, "_github_id_cache", GitHubIdCache(path=os.path.join(workdir, "github_ids.json"), enabled=False)
+        ))
+        stack.enter_context(patch.object(
+            discussion_index, "_discussion_index", DiscussionIndex(path=os.path.join(workdir, "discussions.sqlite3"))
+        ))
+        stack.enter_context(patch.object(
+            publish_ledger, "_publish_ledger", PublishLedger(path=os.path.join(workdir, "publish_ledger.sqlite3"))
+        ))
+        yield
+
+
+def run_once(fixture: Dict[str, Any], latencies: Dict[str, float], sink_latency: float) -> Dict[str, Any]:
+    """main.py 단계 그래프를 한 번 실행하고 단계/span별 소요 시간 반환"""
+    url = fixture["url"]
+    responses = ReplayResponses(fixture["recordings"], latencies)
+    sink = LocalSink(latency=sink_latency).start()
+    tracer = Tracer()
+
+    with tempfile.TemporaryDirectory() as workdir, patch.object(tracing, "_tracer", tracer):
+        try:
+            with offline_environment(sink, ReplayClient(responses), workdir):
+                summarizer = SummarizerFactory.create_from_url(url)
+                args = Namespace(
+                    url=url, timeframe="", out=os.path.join(workdir, "bench.md"), title="",
+                    send_github=True, send_discord=True, send_kakao=True, dry_run=False,
+                )
+                started = time.perf_counter()
+                with llm_context(source_url=url), span("run", command="bench_pipeline", url=url):
+                    result = build_pipeline(args, summarizer, {}).run()
+                wall = time.perf_counter() - started
+        finally:
+            sink.stop()
+
+    failed = {name: str(stage) for name, stage in result.results.items() if not stage.ok}
+    spans: Dict[str, Dict[str, float]] = {}
+    for recorded in tracer.spans:
+        if recorded.name.startswith(SPAN_PREFIXES):
+            entry = spans.setdefault(recorded.name, {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += recorded.duration
+
+    return {
+        "wall_seconds": wall,
+        "stages": {name: stage.elapsed for name, stage in result.results.items()},
+        "spans": spans,
+        "failed": failed,
+        "llm_calls": list(responses.calls),
+        "sink_requests": {path: sink.count(path) for path in ("/discord", "/kakao", "/graphql", "/tinyurl")},
+    }
+
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS(MB) (Linux는 KB, macOS는 바이트 단위로 보고)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def summarize_runs(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """반복 실행 결과의 중앙값 집계"""
+    stage_names = list(dict.fromkeys(name for run in runs for name in run["stages"]))
+    span_names = sorted({name for run in runs for name in run["spans"]})
+    return {
+        "wall_seconds": statistics.median(run["wall_seconds"] for run in runs),
+        "stages": {
+            name: statistics.median(run["stages"].get(name, 0.0) for run in runs) for name in stage_names
+        },
+        "spans": {
+            name: {
+                "count": runs[-1]["spans"].get(name, {}).get("count", 0),
+                "seconds": statistics.median(run["spans"].get(name, {}).get("seconds", 0.0) for run in runs),
+            }
+            for name in span_names
+        },
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, noise: float) -> List[str]:
+    """기준 결과 대비 느려진 항목 목록 (상대 tolerance와 절대 noise를 모두 넘어야 회귀)"""
+    regressions = []
+    pairs = [("wall", current["wall_seconds"], baseline.get("wall_seconds"))]
+    pairs += [
+        (f"stage.{name}", seconds, baseline.get("stages", {}).get(name))
+        for name, seconds in current["stages"].items()
+    ]
+    for name, now, before in pairs:
+        if before is None:
+            continue
+        if now > before * (1 + tolerance) and now - before > noise:
+            regressions.append(f"{name}: {before:.3f}s → {now:.3f}s (+{(now / before - 1) * 100 if before else 0:.0f}%)")
+    return regressions
+
+
+def parse_latency_overrides(values: List[str]) -> Dict[str, float]:
+    """--latency kind=초 목록 파싱"""
+    overrides = {}
+    for value in values:
+        kind, _, seconds = value.partition("=")
+        if not seconds:
+            raise SystemExit(f"--latency 형식 오류 (kind=초): {value}")
+        overrides[kind] = float(seconds)
+    return overrides
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="오프라인 end-to-end 파이프라인 벤치마크")
+    parser.add_argument("--fixture", default=str(DEFAULT_FIXTURE), help="녹화 응답 파일")
+    parser.add_argument("--repeat", type=int, default=3, help="반복 횟수 (중앙값 보고, 기본: 3)")
+    parser.add_argument("--latency-scale", type=float, default=0.01, help="녹화된 지연 배율 (기본: 0.01)")
+    parser.add_argument("--latency", action="append", default=[], metavar="KIND=SEC",
+                        help="응답 종류별 지연 덮어쓰기 (summarize, headline, compact)")
+    parser.add_argument("--sink-latency", type=float, default=0.0, help="발송 싱크 요청당 지연(초)")
+    parser.add_argument("--json", dest="json_path", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 상대 증가율 (기본: 0.25)")
+    parser.add_argument("--noise", type=float, default=0.05, help="무시할 절대 증가량(초, 기본: 0.05)")
+    args = parser.parse_args()
+
+    # 단계 로그가 측정 결과를 가리지 않도록 경고 이상만 출력
+    logger.setLevel("WARNING")
+
+    fixture = json.loads(Path(args.fixture).read_text(encoding="utf-8"))
+    latencies = {
+        recording["kind"]: recording.get("latency_seconds", 0.0) * args.latency_scale
+        for recording in fixture["recordings"]
+    }
+    latencies.update(parse_latency_overrides(args.latency))
+
+    runs = [run_once(fixture, latencies, args.sink_latency) for _ in range(args.repeat)]
+    failed = runs[-1]["failed"]
+    summary = summarize_runs(runs)
+    result = {
+        "benchmark": "pipeline",
+        "fixture": os.path.basename(args.fixture),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "latencies": latencies,
+        "sink_latency": args.sink_latency,
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "llm_calls": runs[-1]["llm_calls"],
+        "sink_requests": runs[-1]["sink_requests"],
+        "failed": failed,
+        **summary,
+    }
+
+    print(f"파이프라인 벤치마크 ({result['fixture']}, {args.repeat}회 중앙값)")
+    print(f"  재생 지연: " + ", ".join(f"{kind} {seconds:.3f}s" for kind, seconds in latencies.items()))
+    print(f"  {'단계':<18}{'소요(s)':>10}")
+    for name, seconds in summary["stages"].items():
+        print(f"  {name:<18}{seconds:>10.3f}")
+    print(f"  {'span':<28}{'횟수':>6}{'합계(s)':>10}")
+    for name, entry in summary["spans"].items():
+        print(f"  {name:<28}{entry['count']:>6}{entry['seconds']:>10.3f}")
+    print(f"  전체: {summary['wall_seconds']:.3f}s, 최대 RSS: {result['peak_rss_mb']:.1f}MB")
+    print(f"  LLM 호출: {result['llm_calls']}, 발송 요청: {result['sink_requests']}")
+
+    if args.json_path:
+        Path(args.json_path).write_text(json.dumps(result, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"  결과 저장: {args.json_path}")
+
+    exit_code = 0
+    if failed:
+        print(f"  ❌ 실패한 단계: {failed}")
+        exit_code = 1
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare(summary, baseline, args.tolerance, args.noise)
+        if regressions:
+            print(f"  ❌ 기준 대비 느려짐 (허용 +{args.tolerance * 100:.0f}%):")
+            for line in regressions:
+                print(f"    - {line}")
+            exit_code = 1
+        else:
+            print(f"  ✅ 기준 대비 회귀 없음 ({args.baseline})")
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,383 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 OpenAI Responses API 대역 서버 (부하/소크 테스트용)
+asyncio 표준 라이브러리만으로 POST /v1/responses의 일반/스트리밍 응답을 흉내내고
+429·5xx 오류와 지연 분포를 주입
+
+- 응답 본문: --fixture의 recordings 중 요청 입력에 match 문자열이 있는 항목 (없으면 기본 문구)
+- usage: 녹화된 usage, 없으면 입력/출력 길이로 추정
+- GET /stats: 요청 수, 상태 코드별 수, 동시 처리 최대치 (동시성 튜닝용)
+
+사용법:
+    python benchmarks/fake_openai_server.py --port 8787 --latency lognormal:0.5,0.6 --rate-429 0.05
+    OPENAI_BASE_URL=http://127.0.0.1:8787/v1 OPENAI_API_KEY=local python main.py --url https://news.smol.ai/issues/25-09-01
+"""
+
+import sys
+import json
+import time
+import uuid
+import random
+import asyncio
+import argparse
+import threading
+from pathlib import Path
+from typing import Optional, Dict, List, Any, Tuple
+
+DEFAULT_FIXTURE = Path(__file__).resolve().parent / "fixtures" / "smol_ai_news_25-09-01.json"
+DEFAULT_TEXT = "로컬 대역 서버 응답입니다."
+
+REASONS = {200: "OK", 404: "Not Found", 429: "Too Many Requests", 500: "Internal Server Error",
+           502: "Bad Gateway", 503: "Service Unavailable"}
+
+
+class LatencyModel:
+    """지연 분포 (fixed:초, uniform:최소,최대, normal:평균,표준편차, lognormal:mu,sigma, exp:평균)"""
+
+    def __init__(self, spec: str = "0", seed: Optional[int] = None):
+        """
+        Args:
+            spec: 분포 표기 (숫자만 쓰면 fixed)
+            seed: 난수 시드
+        """
+        self.spec = spec
+        kind, _, args = spec.partition(":") if ":" in spec else ("fixed", "", spec)
+        self.kind = kind
+        self.args = [float(value) for value in args.split(",") if value]
+        self._random = random.Random(seed)
+        expected = {"fixed": 1, "uniform": 2, "normal": 2, "lognormal": 2, "exp": 1}
+        if kind not in expected or len(self.args) != expected[kind]:
+            raise ValueError(f"지연 분포 형식 오류: {spec}")
+
+    def sample(self) -> float:
+        """지연 한 번 추출 (초, 0 이상)"""
+        r = self._random
+        if self.kind == "fixed":
+            value = self.args[0]
+        elif self.kind == "uniform":
+            value = r.uniform(*self.args)
+        elif self.kind == "normal":
+            value = r.gauss(*self.args)
+        elif self.kind == "lognormal":
+            value = r.lognormvariate(*self.args)
+        else:
+            value = r.expovariate(1 / self.args[0]) if self.args[0] > 0 else 0.0
+        return max(0.0, value)
+
+
+class ResponseBook:
+    """요청 → 응답 텍스트/usage 선택 (bench_pipeline 녹화 파일 형식)"""
+
+    def __init__(self, fixture: Optional[str] = None):
+        self.recordings: List[Dict[str, Any]] = []
+        if fixture:
+            self.recordings = json.loads(Path(fixture).read_text(encoding="utf-8"))["recordings"]
+
+    def pick(self, params: Dict[str, Any]) -> Tuple[str, Optional[Dict[str, Any]]]:
+        text = json.dumps(params.get("input"), ensure_ascii=False)
+        for recording in self.recordings:
+            if recording["match"] in text:
+                response = recording["response"]
+                return response.get("output_text") or "", response.get("usage")
+        return DEFAULT_TEXT, None
+
+
+def _estimate_usage(params: Dict[str, Any], text: str) -> Dict[str, Any]:
+    """녹화 usage가 없을 때 길이 기반 usage (4자당 1토큰)"""
+    input_tokens = len(json.dumps(params.get("input"), ensure_ascii=False)) // 4 + 1
+    output_tokens = len(text) // 4 + 1
+    return {
+        "input_tokens": input_tokens,
+        "input_tokens_details": {"cached_tokens": 0},
+        "output_tokens": output_tokens,
+        "output_tokens_details": {"reasoning_tokens": 0},
+        "total_tokens": input_tokens + output_tokens,
+    }
+
+
+def build_response(params: Dict[str, Any], text: str, usage: Optional[Dict[str, Any]],
+                   status: str = "completed") -> Dict[str, Any]:
+    """Responses API 응답 객체 (output에 web_search_call/message 항목)"""
+    output: List[Dict[str, Any]] = []
+    tools = [tool for tool in params.get("tools") or [] if isinstance(tool, dict)]
+    if any(tool.get("type", "").startswith("web_search") for tool in tools):
+        output.append({
+            "type": "web_search_call", "id": f"ws_{uuid.uuid4().hex[:24]}", "status": "completed",
+            "action": {"type": "search", "query": "local stand-in"},
+        })
+    output.append({
+        "type": "message", "id": f"msg_{uuid.uuid4().hex[:24]}", "status": status, "role": "assistant",
+        "content": [{"type": "output_text", "text": text if status == "completed" else "", "annotations": []}],
+    })
+    return {
+        "id": f"resp_{uuid.uuid4().hex[:24]}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "status": status,
+        "model": params.get("model", ""),
+        "output": output,
+        "parallel_tool_calls": True,
+        "tool_choice": "auto",
+        "tools": tools,
+        "reasoning": {"effort": (params.get("reasoning") or {}).get("effort"), "summary": None},
+        "text": {"format": {"type": "text"}},
+        "truncation": "disabled",
+        "instructions": None,
+        "metadata": {},
+        "error": None,
+        "incomplete_details": None,
+        "usage": (usage or _estimate_usage(params, text)) if status == "completed" else None,
+    }
+
+
+class FakeResponsesServer:
+    """POST /v1/responses 대역 서버"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: str = "0",
+        stream_delay: float = 0.0,
+        chunk_chars: int = 40,
+        rate_429: float = 0.0,
+        rate_5xx: float = 0.0,
+        retry_after: float = 1.0,
+        fixture: Optional[str] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            host: 바인드 주소
+            port: 포트 (0이면 임의 포트)
+            latency: 첫 바이트까지 지연 분포 (LatencyModel 표기)
+            stream_delay: 스트리밍 델타 사이 지연(초)
+            chunk_chars: 스트리밍 델타 하나의 글자 수
+            rate_429: 429 응답 비율 (0~1)
+            rate_5xx: 500/502/503 응답 비율 (0~1)
+            retry_after: 429 응답의 retry-after(초)
+            fixture: 응답 녹화 파일 (bench_pipeline 형식)
+            seed: 지연/오류 난수 시드
+        """
+        self.host = host
+        self.port = port
+        self.latency = LatencyModel(latency, seed)
+        self.stream_delay = stream_delay
+        self.chunk_chars = max(1, chunk_chars)
+        self.rate_429 = rate_429
+        self.rate_5xx = rate_5xx
+        self.retry_after = retry_after
+        self.book = ResponseBook(fixture)
+        self._random = random.Random(seed)
+        self.stats: Dict[str, Any] = {
+            "requests": 0, "streamed": 0, "status": {}, "in_flight": 0, "peak_in_flight": 0,
+        }
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """OPENAI_BASE_URL로 쓸 주소"""
+        return f"http://{self.host}:{self.port}/v1"
+
+    async def start(self) -> "FakeResponsesServer":
+        """현재 이벤트 루프에서 리스닝 시작"""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    def start_in_thread(self) -> "FakeResponsesServer":
+        """백그라운드 스레드의 이벤트 루프에서 실행 (테스트/벤치마크용)"""
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            self._loop.run_until_complete(self.start())
+            ready.set()
+            self._loop.run_forever()
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name="fake-openai", daemon=True)
+        self._thread.start()
+        ready.wait(timeout=5)
+        return self
+
+    def stop(self) -> None:
+        """백그라운드 스레드 서버 종료"""
+        if not self._loop:
+            return
+
+        async def shutdown():
+            self._server.close()
+            tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in tasks:  # keep-alive 연결 정리
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """HTTP/1.1 keep-alive 연결 처리"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                headers: Dict[str, str] = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                body = await reader.readexactly(int(headers.get("content-length") or 0))
+
+                await self._dispatch(method, target.split("?", 1)[0], body, writer)
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def _dispatch(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter) -> None:
+        if method == "GET" and path == "/stats":
+            await self._send_json(writer, 200, self.stats)
+            return
+        if method != "POST" or path.rstrip("/") != "/v1/responses":
+            await self._send_error(writer, 404, "not_found", f"{method} {path}")
+            return
+
+        self.stats["requests"] += 1
+        self.stats["in_flight"] += 1
+        self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.stats["in_flight"])
+        try:
+            await asyncio.sleep(self.latency.sample())
+            roll = self._random.random()
+            if roll < self.rate_429:
+                await self._send_error(
+                    writer, 429, "rate_limit_exceeded", "Rate limit reached (injected)",
+                    {"retry-after": f"{self.retry_after:g}"}
+                )
+                return
+            if roll < self.rate_429 + self.rate_5xx:
+                status = self._random.choice((500, 502, 503))
+                await self._send_error(writer, status, "server_error", "Injected server error")
+                return
+
+            params = json.loads(body or b"{}")
+            text, usage = self.book.pick(params)
+            if params.get("stream"):
+                self.stats["streamed"] += 1
+                await self._send_stream(writer, params, text, usage)
+            else:
+                await self._send_json(writer, 200, build_response(params, text, usage))
+        finally:
+            self.stats["in_flight"] -= 1
+
+    def _count(self, status: int) -> None:
+        self.stats["status"][str(status)] = self.stats["status"].get(str(status), 0) + 1
+
+    async def _send_json(self, writer: asyncio.StreamWriter, status: int, payload: Any,
+                         extra_headers: Optional[Dict[str, str]] = None) -> None:
+        self._count(status)
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        headers = {"content-type": "application/json", "content-length": str(len(data)),
+                   "x-request-id": f"req_{uuid.uuid4().hex[:16]}", **(extra_headers or {})}
+        writer.write(self._head(status, headers) + data)
+        await writer.drain()
+
+    async def _send_error(self, writer: asyncio.StreamWriter, status: int, code: str, message: str,
+                          extra_headers: Optional[Dict[str, str]] = None) -> None:
+        error_type = "requests" if status == 429 else "server_error"
+        await self._send_json(
+            writer, status, {"error": {"message": message, "type": error_type, "code": code, "param": None}},
+            extra_headers
+        )
+
+    async def _send_stream(self, writer: asyncio.StreamWriter, params: Dict[str, Any], text: str,
+                           usage: Optional[Dict[str, Any]]) -> None:
+        """SSE 스트리밍 (chunked): created → output_text.delta… → completed"""
+        self._count(200)
+        writer.write(self._head(200, {"content-type": "text/event-stream", "transfer-encoding": "chunked"}))
+        final = build_response(params, text, usage)
+        message = final["output"][-1]
+        in_progress = dict(final, status="in_progress", output=[], usage=None)
+        sequence = 0
+
+        async def emit(event_type: str, **data):
+            nonlocal sequence
+            payload = json.dumps({"type": event_type, "sequence_number": sequence, **data}, ensure_ascii=False)
+            sequence += 1
+            chunk = f"event: {event_type}\ndata: {payload}\n\n".encode("utf-8")
+            writer.write(f"{len(chunk):x}\r\n".encode("ascii") + chunk + b"\r\n")
+            await writer.drain()
+
+        await emit("response.created", response=in_progress)
+        await emit("response.in_progress", response=in_progress)
+        output_index = len(final["output"]) - 1
+        await emit("response.output_item.added", output_index=output_index,
+                   item=dict(message, status="in_progress", content=[]))
+        part = {"type": "output_text", "text": "", "annotations": []}
+        await emit("response.content_part.added", item_id=message["id"], output_index=output_index,
+                   content_index=0, part=part)
+        for start in range(0, len(text), self.chunk_chars):
+            if self.stream_delay:
+                await asyncio.sleep(self.stream_delay)
+            await emit("response.output_text.delta", item_id=message["id"], output_index=output_index,
+                       content_index=0, delta=text[start:start + self.chunk_chars], logprobs=[])
+        await emit("response.output_text.done", item_id=message["id"], output_index=output_index,
+                   content_index=0, text=text, logprobs=[])
+        await emit("response.content_part.done", item_id=message["id"], output_index=output_index,
+                   content_index=0, part=dict(part, text=text))
+        await emit("response.output_item.done", output_index=output_index, item=message)
+        await emit("response.completed", response=final)
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+    @staticmethod
+    def _head(status: int, headers: Dict[str, str]) -> bytes:
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로컬 OpenAI Responses API 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8787, help="포트 (기본: 8787)")
+    parser.add_argument("--latency", default="0", help="첫 바이트 지연 분포 (예: 0.5, uniform:0.2,2, lognormal:0.5,0.6)")
+    parser.add_argument("--stream-delay", type=float, default=0.0, help="스트리밍 델타 간 지연(초)")
+    parser.add_argument("--chunk-chars", type=int, default=40, help="스트리밍 델타 글자 수 (기본: 40)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="5xx 응답 비율 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 retry-after 초 (기본: 1)")
+    parser.add_argument("--fixture", default=str(DEFAULT_FIXTURE), help="응답 녹화 파일 (빈 값이면 기본 문구)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    args = parser.parse_args()
+
+    server = FakeResponsesServer(
+        host=args.host, port=args.port, latency=args.latency, stream_delay=args.stream_delay,
+        chunk_chars=args.chunk_chars, rate_429=args.rate_429, rate_5xx=args.rate_5xx,
+        retry_after=args.retry_after, fixture=args.fixture or None, seed=args.seed,
+    )
+    print(f"OpenAI Responses 대역 서버: OPENAI_BASE_URL=http://{args.host}:{args.port}/v1 (통계: /stats)")
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        print(f"종료: {json.dumps(server.stats, ensure_ascii=False)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,385 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 발송 대역 서버 (벤치마크/오프라인 테스트용)
+Discord/Kakao 웹훅, GitHub GraphQL, TinyURL 요청을 받아 모두 기록하고 실제 서비스와 비슷한 응답을 돌려주는 HTTP 서버
+
+- Discord: 2000자/임베드 제한 검증(400), 웹훅별 X-RateLimit-* 헤더, 한도 초과 시 429 + retry_after
+- Kakao: {"text": ...} 페이로드 검증
+- GitHub GraphQL: repository { discussionCategories }, createDiscussion(별칭 묶음 포함), discussions(페이지네이션),
+  rateLimit, X-RateLimit-* 헤더
+
+사용법:
+    python benchmarks/local_sink.py --port 8788 --discord-limit 5 --discord-window 2
+    DISCORD_WEBHOOK_URL=http://127.0.0.1:8788/api/webhooks/1/bench \\
+    KAKAO_BOT_WEBHOOK_URL=http://127.0.0.1:8788/kakao \\
+    GH_GRAPHQL_URL=http://127.0.0.1:8788/graphql TINYURL_API_URL=http://127.0.0.1:8788/tinyurl python main.py ...
+"""
+
+import re
+import sys
+import json
+import math
+import time
+import zlib
+import argparse
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, List, Any, Tuple
+from urllib.parse import urlsplit, parse_qs
+
+
+# createDiscussion 호출 (별칭 포함)과 input 필드 → 변수 대응
+CREATE_DISCUSSION_RE = re.compile(r"(?:(\w+)\s*:\s*)?createDiscussion\s*\(\s*input\s*:\s*\{(.*?)\}\s*\)", re.S)
+INPUT_FIELD_RE = re.compile(r"(\w+)\s*:\s*\$(\w+)")
+
+
+class LocalSink:
+    """발송 대상 흉내 서버 (백그라운드 스레드)
+
+    - POST /discord, /api/webhooks/{id}/{token}: 204 (?wait=true면 200 + 메시지 객체)
+    - POST /kakao: 200 {"ok": true}
+    - POST /graphql: repository/카테고리 조회, createDiscussion(별칭 d0, d1, ... 묶음 가능), discussions 목록
+    - GET /tinyurl?url=...: 단축 URL 텍스트
+    """
+
+    CATEGORY = "News"
+    REPOSITORY_ID = "R_bench"
+    CATEGORY_ID = "DIC_bench"
+
+    DISCORD_MAX_CONTENT = 2000
+    DISCORD_MAX_EMBEDS = 10
+    DISCORD_EMBED_LIMITS = {"title": 256, "description": 4096}
+    DISCORD_EMBED_TOTAL = 6000
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        discord_limit: int = 5,
+        discord_window: float = 2.0,
+        graphql_limit: int = 5000
+    ):
+        """
+        Args:
+            latency: 요청당 인위적 지연(초)
+            host: 바인드 주소
+            port: 포트 (0이면 임의 포트)
+            discord_limit: 웹훅별 윈도우당 허용 요청 수 (0이면 제한 없음)
+            discord_window: Discord 레이트 리밋 윈도우(초)
+            graphql_limit: 시간당 GraphQL 포인트 (요청당 1포인트 차감, X-RateLimit-* 헤더로 알림)
+        """
+        self.latency = latency
+        self.discord_limit = discord_limit
+        self.discord_window = discord_window
+        self.graphql_limit = graphql_limit
+        self.graphql_reset = time.time() + 3600
+        self.requests: List[Dict[str, Any]] = []
+        self.discussions: List[Dict[str, Any]] = []
+        self.repo = "bench/news"
+        self._buckets: Dict[str, Tuple[float, int]] = {}
+        self._lock = threading.Lock()
+        sink = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                sink._handle(self, "GET")
+
+            def do_POST(self):
+                sink._handle(self, "POST")
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-sink", daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "LocalSink":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+
+    def count(self, path: str, status: Optional[int] = None) -> int:
+        """경로별 수신 요청 수 (status 지정 시 해당 응답 코드만)"""
+        with self._lock:
+            return sum(
+                1 for request in self.requests
+                if request["path"] == path and (status is None or request["status"] == status)
+            )
+
+    def payloads(self, path: str) -> List[Any]:
+        """경로별로 정상 처리(2xx)된 요청의 JSON 본문"""
+        with self._lock:
+            return [
+                request["json"] for request in self.requests
+                if request["path"] == path and 200 <= request["status"] < 300
+            ]
+
+    def _handle(self, handler: BaseHTTPRequestHandler, method: str) -> None:
+        parts = urlsplit(handler.path)
+        query = parse_qs(parts.query)
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else b""
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            payload = None
+        record = {
+            "method": method, "path": parts.path, "bytes": len(body), "json": payload,
+            "time": time.time(), "status": 0,
+        }
+        with self._lock:
+            self.requests.append(record)
+        if self.latency:
+            time.sleep(self.latency)
+
+        if parts.path == "/discord" or parts.path.startswith("/api/webhooks/"):
+            status, reply, headers = self._discord(parts.path, payload, query.get("wait") == ["true"])
+        elif parts.path == "/kakao":
+            status, reply, headers = self._kakao(payload)
+        elif parts.path == "/graphql":
+            status, reply, headers = self._graphql(handler.headers.get("Authorization", ""), payload or {})
+        elif parts.path == "/tinyurl":
+            url = query.get("url", [""])[0]
+            short = f"https://tinyurl.com/b{zlib.crc32(url.encode('utf-8')) % 10**6:06d}"
+            status, reply, headers = 200, short, {"Content-Type": "text/plain"}
+        else:
+            status, reply, headers = 404, {"message": "404: Not Found", "code": 0}, {}
+        record["status"] = status
+        self._reply(handler, status, reply, headers)
+
+    def _discord(self, path: str, payload: Any, wait: bool) -> Tuple[int, Any, Dict[str, str]]:
+        """Discord 웹훅 실행 (레이트 리밋 → 본문 검증 순)"""
+        headers = {}
+        if self.discord_limit:
+            now = time.time()
+            with self._lock:
+                started, used = self._buckets.get(path, (now, 0))
+                if now - started >= self.discord_window:
+                    started, used = now, 0
+                limited = used >= self.discord_limit
+                if not limited:
+                    used += 1
+                self._buckets[path] = (started, used)
+            reset_after = max(0.0, started + self.discord_window - now)
+            headers = {
+                "X-RateLimit-Bucket": f"{zlib.crc32(path.encode('utf-8')):08x}",
+                "X-RateLimit-Limit": str(self.discord_limit),
+                "X-RateLimit-Remaining": str(self.discord_limit - used),
+                "X-RateLimit-Reset": f"{started + self.discord_window:.3f}",
+                "X-RateLimit-Reset-After": f"{reset_after:.3f}",
+            }
+            if limited:
+                headers.update({"X-RateLimit-Scope": "user", "Retry-After": str(math.ceil(reset_after))})
+                return 429, {
+                    "message": "You are being rate limited.", "retry_after": round(reset_after, 3), "global": False,
+                }, headers
+
+        errors = self._discord_errors(payload)
+        if errors:
+            return 400, {"code": 50035, "message": "Invalid Form Body", "errors": errors}, headers
+        if not wait:
+            return 204, None, headers
+        return 200, {
+            "id": str(len(self.requests)), "type": 0, "channel_id": "1",
+            "webhook_id": path.split("/")[3] if path.startswith("/api/webhooks/") else "0",
+            "content": payload.get("content", ""), "embeds": payload.get("embeds", []),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }, headers
+
+    def _discord_errors(self, payload: Any) -> Dict[str, Any]:
+        """Discord 웹훅 본문 검증 (Discord 오류 형식의 errors 객체, 문제 없으면 빈 dict)"""
+        def error(code: str, message: str) -> Dict[str, Any]:
+            return {"_errors": [{"code": code, "message": message}]}
+
+        if not isinstance(payload, dict):
+            return {"_errors": [{"code": "BASE_TYPE_REQUIRED", "message": "This field is required"}]}
+        content = payload.get("content") or ""
+        embeds = payload.get("embeds") or []
+        errors: Dict[str, Any] = {}
+        if not content and not embeds:
+            errors["content"] = error("BASE_TYPE_REQUIRED", "Cannot send an empty message")
+        if len(content) > self.DISCORD_MAX_CONTENT:
+            errors["content"] = error(
+                "BASE_TYPE_MAX_LENGTH", f"Must be {self.DISCORD_MAX_CONTENT} or fewer in length."
+            )
+        if len(embeds) > self.DISCORD_MAX_EMBEDS:
+            errors["embeds"] = error("BASE_TYPE_MAX_LENGTH", f"Must be {self.DISCORD_MAX_EMBEDS} or fewer in length.")
+        total = 0
+        for index, embed in enumerate(embeds):
+            for field, limit in self.DISCORD_EMBED_LIMITS.items():
+                value = str(embed.get(field) or "")
+                total += len(value)
+                if len(value) > limit:
+                    errors.setdefault("embeds", {}).setdefault(str(index), {})[field] = error(
+                        "BASE_TYPE_MAX_LENGTH", f"Must be {limit} or fewer in length."
+                    )
+            total += sum(len(str(f.get("name", ""))) + len(str(f.get("value", ""))) for f in embed.get("fields") or [])
+        if total > self.DISCORD_EMBED_TOTAL:
+            errors.setdefault("embeds", {}).update(
+                error("MAX_EMBED_SIZE_EXCEEDED", f"Embed size exceeds maximum size of {self.DISCORD_EMBED_TOTAL}")
+            )
+        return errors
+
+    @staticmethod
+    def _kakao(payload: Any) -> Tuple[int, Any, Dict[str, str]]:
+        if not isinstance(payload, dict) or not isinstance(payload.get("text"), str) or not payload["text"].strip():
+            return 400, {"ok": False, "error": "text is required"}, {}
+        return 200, {"ok": True}, {}
+
+    def _graphql(self, authorization: str, payload: Dict[str, Any]) -> Tuple[int, Any, Dict[str, str]]:
+        """GitHubPublisher가 쓰는 GraphQL 쿼리/뮤테이션 처리"""
+        if not authorization.startswith("Bearer ") or not authorization[7:].strip():
+            return 401, {"message": "Bad credentials", "documentation_url": "https://docs.github.com/graphql"}, {}
+        query = payload.get("query", "")
+        variables = payload.get("variables") or {}
+        data: Dict[str, Any] = {}
+        errors: List[Dict[str, Any]] = []
+        used = self.count("/graphql")
+        headers = {
+            "X-RateLimit-Limit": str(self.graphql_limit),
+            "X-RateLimit-Remaining": str(max(0, self.graphql_limit - used)),
+            "X-RateLimit-Used": str(used),
+            "X-RateLimit-Reset": str(int(self.graphql_reset)),
+            "X-RateLimit-Resource": "graphql",
+        }
+        if used > self.graphql_limit:
+            return 403, {"message": "API rate limit exceeded", "documentation_url": "https://docs.github.com/graphql"}, headers
+
+        mutations = list(CREATE_DISCUSSION_RE.finditer(query))
+        if mutations:
+            for match in mutations:
+                alias = match.group(1) or "createDiscussion"
+                fields = {name: variables.get(var) for name, var in INPUT_FIELD_RE.findall(match.group(2))}
+                data[alias], error = self._create_from_input(fields)
+                if error:
+                    errors.append(dict(error, path=[alias]))
+        elif re.search(r"\bdiscussions\s*\(", query):
+            data["repository"] = {"discussions": self._list_discussions(variables)}
+        elif "repository" in query:
+            if variables.get("owner") and variables.get("name"):
+                self.repo = f"{variables['owner']}/{variables['name']}"
+            data["repository"] = {
+                "id": self.REPOSITORY_ID,
+                "discussionCategories": {"nodes": [{"id": self.CATEGORY_ID, "name": self.CATEGORY}]},
+            }
+        if "rateLimit" in query:
+            data["rateLimit"] = {
+                "limit": self.graphql_limit, "cost": 1, "remaining": max(0, self.graphql_limit - used),
+                "resetAt": datetime.fromtimestamp(self.graphql_reset, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+        reply: Dict[str, Any] = {"data": data}
+        if errors:
+            reply["errors"] = errors
+        return 200, reply, headers
+
+    def _create_from_input(self, fields: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[Dict[str, Any]]]:
+        """createDiscussion input 하나 처리 → (결과, 오류)"""
+        repository_id = fields.get("repositoryId")
+        if repository_id != self.REPOSITORY_ID or fields.get("categoryId") != self.CATEGORY_ID:
+            return None, {
+                "type": "NOT_FOUND",
+                "message": f"Could not resolve to a node with the global id of '{repository_id}'",
+            }
+        if not str(fields.get("title") or "").strip():
+            return None, {"type": "UNPROCESSABLE", "message": "Title can't be blank"}
+        return {"discussion": self._create_discussion(fields)}, None
+
+    def _create_discussion(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            number = len(self.discussions) + 1
+            discussion = {
+                "id": f"D_bench{number}",
+                "number": number,
+                "title": variables.get("title", ""),
+                "body": variables.get("body", ""),
+                "url": f"https://github.com/{self.repo}/discussions/{number}",
+                "createdAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "category": {"name": self.CATEGORY},
+            }
+            self.discussions.append(discussion)
+        return discussion
+
+    def _list_discussions(self, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """최신순 Discussion 목록 (after 커서는 목록 내 위치)"""
+        size = int(variables.get("limit") or variables.get("first") or 10)
+        start = int(variables.get("after") or 0)
+        with self._lock:
+            ordered = list(reversed(self.discussions))
+        nodes = ordered[start:start + size]
+        end = start + len(nodes)
+        return {
+            "totalCount": len(ordered),
+            "nodes": nodes,
+            "pageInfo": {"hasNextPage": end < len(ordered), "endCursor": str(end) if nodes else None},
+        }
+
+    @staticmethod
+    def _reply(handler: BaseHTTPRequestHandler, status: int, body: Any = None,
+               headers: Optional[Dict[str, str]] = None) -> None:
+        headers = dict(headers or {})
+        if body is None:
+            data = b""
+        elif isinstance(body, str):
+            data = body.encode("utf-8")
+        else:
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            headers.setdefault("Content-Type", "application/json")
+        handler.send_response(status)
+        for name, value in headers.items():
+            handler.send_header(name, value)
+        handler.send_header("Content-Length", str(len(data)))
+        handler.end_headers()
+        if data:
+            handler.wfile.write(data)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="로컬 Discord/Kakao/GitHub 발송 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소 (기본: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8788, help="포트 (기본: 8788)")
+    parser.add_argument("--latency", type=float, default=0.0, help="요청당 지연(초)")
+    parser.add_argument("--discord-limit", type=int, default=5, help="웹훅별 윈도우당 요청 수 (0이면 제한 없음)")
+    parser.add_argument("--discord-window", type=float, default=2.0, help="Discord 레이트 리밋 윈도우(초)")
+    parser.add_argument("--graphql-limit", type=int, default=5000, help="시간당 GitHub GraphQL 포인트")
+    args = parser.parse_args()
+
+    sink = LocalSink(
+        latency=args.latency, host=args.host, port=args.port,
+        discord_limit=args.discord_limit, discord_window=args.discord_window, graphql_limit=args.graphql_limit,
+    ).start()
+    base = sink.base_url
+    print("로컬 발송 대역 서버 실행 중 (Ctrl+C 종료)")
+    print(f"  DISCORD_WEBHOOK_URL={base}/api/webhooks/1/bench")
+    print(f"  KAKAO_BOT_WEBHOOK_URL={base}/kakao")
+    print(f"  GH_GRAPHQL_URL={base}/graphql  GH_DISCUSSION_CATEGORY={LocalSink.CATEGORY}")
+    print(f"  TINYURL_API_URL={base}/tinyurl")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        statuses: Dict[str, int] = {}
+        for request in sink.requests:
+            key = f"{request['path']} {request['status']}"
+            statuses[key] = statuses.get(key, 0) + 1
+        print(f"종료: {json.dumps(statuses, ensure_ascii=False)}")
+        sink.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
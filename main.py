@@ -9,9 +9,6 @@ import os
 import sys
 import argparse
 import textwrap
-from typing import List
-from datetime import datetime
-import re
 
 # src 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -20,9 +17,26 @@ from src.config import Config
 from src.logger import logger, setup_logger
 from src.summarizer import SummarizerFactory, NewsSource
 from src.markdown_utils import save_markdown
+from src.output_paths import default_output_path
+from src.response_cache import configure_response_cache
+from src.usage_ledger import get_usage_ledger, usage_report_path, llm_context
+from src.tracing import get_tracer, span, trace_path
+from src.metrics import finish_run
+from src.pipeline import Pipeline
+from src.stages import (
+    run_summarizer,
+    make_title,
+    uses_compact,
+    generate_compact,
+    is_complete_summary,
+    build_discord_content,
+    save_discord_variants,
+)
 from src.publishers.discord import DiscordPublisher
 from src.publishers.github import GitHubPublisher
 from src.publishers.kakao import KakaoPublisher
+from src.discussion_index import find_published, record_published
+from src.publish_ledger import configure_publish_ledger, resumable
 
 
 def parse_arguments() -> argparse.Namespace:
@@ -116,9 +130,174 @@ def parse_arguments() -> argparse.Namespace:
         help="실제 발송하지 않고 시뮬레이션만 수행"
     )
     
+    # 스트리밍 옵션
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="응답을 스트리밍으로 받아 .md 파일에 즉시 기록 (섹션 완료 시점 로그)"
+    )
+    
+    # 캐시 옵션
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="OpenAI 응답 캐시를 사용하지 않음"
+    )
+    
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="캐시된 응답을 무시하고 새로 생성하여 캐시 갱신"
+    )
+    
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="이미 게시된 이슈여도 다시 요약/발송 (Discussion 색인과 발송 원장 무시)"
+    )
+    
     return parser.parse_args()
 
 
+def build_pipeline(args: argparse.Namespace, summarizer, stream_kwargs: dict) -> Pipeline:
+    """CLI 옵션에 맞는 단계 그래프 구성
+    
+    summarize ─┬─ save
+               ├─ title ── github ─┐
+               ├─ compact ─────────┴─ discord_content ─┬─ save_discord
+               │                                       └─ discord
+               └─ kakao
+    
+    Args:
+        args: 명령줄 인자
+        summarizer: 요약에 사용할 Summarizer
+        stream_kwargs: 스트리밍 옵션
+    
+    Returns:
+        실행 준비된 Pipeline
+    """
+    pipeline = Pipeline("main")
+    
+    # 1. 요약 생성 (재시도는 OpenAI 클라이언트/summarize_with_retry가 담당)
+    def summarize(_):
+        logger.info("📝 요약 생성 중...")
+        return run_summarizer(summarizer, args.url, timeframe=args.timeframe, **stream_kwargs)
+    
+    # 이전 실행에서 끝난 LLM 단계는 발송 원장의 출력을 재사용 (중단된 실행을 싸게 재시도)
+    pipeline.add("summarize", resumable("summarize", summarize, args.url, validate=is_complete_summary))
+    
+    # 2. 파일 저장
+    def save(inputs):
+        logger.info(f"💾 파일 저장: {args.out}")
+        save_markdown(args.out, inputs["summarize"][0])
+        logger.info(f"✅ 저장 완료: {os.path.abspath(args.out)}")
+        return args.out
+    
+    pipeline.add("save", save, deps=["summarize"])
+    
+    # GitHub 발송 (Discord보다 먼저 끝나야 URL 포함 가능)
+    if args.send_github:
+        pipeline.add(
+            "title",
+            lambda inputs: args.title or make_title(inputs["summarize"][1], args.url),
+            deps=["summarize"]
+        )
+        
+        def publish_github(inputs):
+            logger.info("📤 GitHub Discussions 게시 중...")
+            if args.dry_run:
+                logger.info("[DRY-RUN] GitHub 게시 시뮬레이션")
+                return None
+            github = GitHubPublisher()
+            if not github.safe_publish(inputs["summarize"][0], title=inputs["title"]):
+                raise RuntimeError("GitHub 게시 실패")
+            github_url = getattr(github, 'last_discussion_url', None)
+            if github_url:
+                logger.info(f"GitHub Discussion URL: {github_url}")
+                if Config.GH_DISCUSSION_INDEX_ENABLED:
+                    record_published(github, inputs["title"], github_url)
+            return github_url
+        
+        # Discussion 생성은 멱등하지 않으므로 재시도하지 않고, 벽시계 제한도 두지 않음
+        # (시간 초과돼도 스레드는 계속 실행돼 게시가 끝날 수 있으므로 요청별 HTTP timeout에 맡김)
+        pipeline.add("github", publish_github, deps=["summarize", "title"])
+    
+    if args.send_discord:
+        # Compact 버전 사전 생성 (GitHub 게시와 병렬 실행, URL은 자리표시로 두고 나중에 교체)
+        if args.send_github and uses_compact(args.url) and not args.dry_run:
+            pipeline.add(
+                "compact",
+                resumable(
+                    "compact",
+                    lambda inputs: generate_compact(inputs["summarize"][0], args.url),
+                    args.url,
+                    validate=is_complete_summary
+                ),
+                deps=["summarize"],
+                # 시간 초과 시 Discord는 원본으로 발송 (LLM 단계는 retries와 timeout을 함께 쓰지 않음)
+                timeout=600
+            )
+        
+        pipeline.add(
+            "discord_content",
+            lambda inputs: build_discord_content(
+                inputs["summarize"][0],
+                args.url,
+                github_url=inputs.get("github"),
+                compact_content=inputs.get("compact")
+            ),
+            deps=["summarize"],
+            optional_deps=["github", "compact"]
+        )
+        
+        # Discord 콘텐츠를 별도 파일로 저장 (Compact 버전이거나 수정된 경우에만)
+        def save_discord(inputs):
+            if inputs["discord_content"] != inputs["summarize"][0]:
+                return save_discord_variants(args.out, inputs["discord_content"])
+            return None
+        
+        pipeline.add("save_discord", save_discord, deps=["summarize", "discord_content"])
+        
+        def publish_discord(inputs):
+            logger.info("📤 Discord 발송 중...")
+            if args.dry_run:
+                logger.info("[DRY-RUN] Discord 발송 시뮬레이션")
+                return True
+            title = inputs.get("title") or args.title
+            # variant=full 대상용 전체 요약 (Discussion 링크 포함)
+            full_content = inputs["summarize"][0]
+            if inputs.get("github"):
+                full_content += f"\n\n---\n📖 **상세 뉴스레터**: {inputs['github']}"
+            if not DiscordPublisher().safe_publish(
+                inputs["discord_content"],
+                tag=f"**{title}**" if title else "",
+                full_content=full_content
+            ):
+                raise RuntimeError("Discord 발송 실패")
+            return True
+        
+        # 발송 단계는 멱등하지 않아 시간 제한 없음 (429 대기·재시도는 웹훅 발송기가 담당)
+        pipeline.add(
+            "discord", publish_discord,
+            deps=["summarize", "discord_content"], optional_deps=["title", "github"]
+        )
+    
+    # Kakao 발송 (전체 마크다운만 필요)
+    if args.send_kakao:
+        def publish_kakao(inputs):
+            logger.info("📤 카카오톡 발송 중...")
+            if args.dry_run:
+                logger.info("[DRY-RUN] 카카오톡 발송 시뮬레이션")
+                return True
+            if not KakaoPublisher().safe_publish(inputs["summarize"][0]):
+                raise RuntimeError("카카오톡 발송 실패")
+            return True
+        
+        pipeline.add("kakao", publish_kakao, deps=["summarize"])
+    
+    return pipeline
+
+
 def main() -> int:
     """메인 함수"""
     try:
@@ -143,8 +322,16 @@ def main() -> int:
             logger.error(str(e))
             return 1
         
-        # 1. 요약 생성
-        logger.info("📝 요약 생성 중...")
+        # 응답 캐시 설정
+        response_cache = configure_response_cache(
+            enabled=not args.no_cache,
+            refresh=args.refresh
+        )
+        
+        # 발송 원장 설정 (--force면 중복 발송 확인과 단계 재사용 안 함, --refresh면 단계 출력 새로 생성)
+        publish_ledger = configure_publish_ledger(enabled=not args.force)
+        if args.refresh:
+            publish_ledger.clear_stage_outputs(args.url)
         
         # Summarizer 선택 및 생성
         try:
@@ -160,76 +347,11 @@ def main() -> int:
             logger.error(f"Summarizer 생성 실패: {str(e)}")
             return 1
         
-        try:
-            # 메타데이터와 함께 요약 생성 시도
-            metadata = {}
-            if hasattr(summarizer, 'summarize_with_result'):
-                # Weekly Robotics 등 SummarizerResult를 반환하는 경우
-                result = summarizer.summarize_with_result(
-                    args.url,
-                    timeframe=args.timeframe
-                )
-                markdown_content = result.summary  # summary 속성 사용
-                metadata = result.metadata or {}
-                if metadata.get('headline'):
-                    logger.info(f"헤드라인: {metadata['headline']}")
-            elif hasattr(summarizer, 'summarize_with_metadata'):
-                # SmolAI 등 dict를 반환하는 경우
-                result = summarizer.summarize_with_metadata(
-                    args.url,
-                    timeframe=args.timeframe
-                )
-                markdown_content = result.get('markdown', '')
-                metadata = {
-                    'headline': result.get('headline', ''),
-                    'date': result.get('date', '')
-                }
-                if metadata.get('headline'):
-                    logger.info(f"헤드라인: {metadata['headline']}")
-            elif hasattr(summarizer, 'summarize_with_retry'):
-                markdown_content = summarizer.summarize_with_retry(
-                    args.url,
-                    max_retries=3,
-                    timeframe=args.timeframe
-                )
-            else:
-                markdown_content = summarizer.safe_summarize(
-                    args.url,
-                    timeframe=args.timeframe
-                )
-        except Exception as e:
-            logger.error(f"요약 생성 실패: {str(e)}")
-            return 1
-        
-        # 2. 파일 저장
+        # 출력 경로 결정 (스트리밍 모드에서는 요약 중에 이 파일로 기록)
         # 저장 경로 자동 생성 (사용자가 지정하지 않은 경우)
         if not args.out:
-            # 날짜 기반 디렉토리 구조 생성
-            from datetime import datetime
-            now = datetime.now()
-            year_month = now.strftime("%Y/%m")
-            
-            # URL에서 날짜 정보 추출 시도 (SmolAI News의 경우)
-            date_match = re.search(r'(\d{2})-(\d{2})-(\d{2})', args.url)
-            if date_match and 'smol' in args.url.lower():
-                # SmolAI News 형식
-                filename = f"smol_ai_news_20{date_match.group(1)}{date_match.group(2)}{date_match.group(3)}.md"
-            elif 'weeklyrobotics' in args.url.lower():
-                # Weekly Robotics 형식 (issue 번호 추출)
-                issue_match = re.search(r'weekly-robotics-(\d+)', args.url)
-                if issue_match:
-                    filename = f"weekly_robotics_{issue_match.group(1)}_{now.strftime('%Y%m%d')}.md"
-                else:
-                    filename = f"weekly_robotics_{now.strftime('%Y%m%d_%H%M%S')}.md"
-            else:
-                # 일반 형식
-                filename = f"recap_{now.strftime('%Y%m%d_%H%M%S')}.md"
-            
-            # 출력 디렉토리 생성
-            output_dir = os.path.join("outputs", year_month)
-            os.makedirs(output_dir, exist_ok=True)
-            
-            args.out = os.path.join(output_dir, filename)
+            # 날짜 기반 디렉토리 구조 생성 (outputs/YYYY/MM/)
+            args.out = default_output_path(args.url)
             logger.info(f"출력 경로 자동 생성: {args.out}")
         else:
             # 사용자가 지정한 경로의 디렉토리 생성
@@ -237,161 +359,62 @@ def main() -> int:
             if output_dir:
                 os.makedirs(output_dir, exist_ok=True)
         
-        logger.info(f"💾 파일 저장: {args.out}")
-        save_markdown(args.out, markdown_content)
-        logger.info(f"✅ 저장 완료: {os.path.abspath(args.out)}")
+        # 스트리밍 옵션 (섹션 완료 시점에 후속 단계가 시작할 수 있도록 콜백 제공)
+        stream_kwargs = {}
+        if args.stream:
+            def on_section(title: str, section_markdown: str) -> None:
+                logger.info(f"📄 섹션 완료: {title} ({len(section_markdown)}자)")
+            
+            stream_kwargs = {
+                'stream': True,
+                'output_path': args.out,
+                'on_section': on_section
+            }
+            logger.info(f"스트리밍 모드: {args.out}에 실시간 기록")
         
-        # 3. 발송 옵션 처리
+        # 발송 옵션 처리
         if args.send_all:
             args.send_discord = Config.is_discord_enabled()
             args.send_github = Config.is_github_enabled()
             args.send_kakao = Config.is_kakao_enabled()
             logger.info(f"전체 발송 모드: {Config.get_enabled_publishers()}")
         
-        results = []
-        github_url = None
+        # 이미 게시된 이슈면 요약 비용을 쓰기 전에 중단 (Discussion 색인 증분 동기화 후 조회)
+        # 이 URL의 이전 실행 기록이 있으면 중단된 실행의 재시도이므로 발송 원장에 맡기고 계속 진행
+        if publish_ledger.has_source(args.url):
+            logger.info("이전 실행 기록 있음: 완료된 단계와 발송은 건너뛰고 이어서 실행")
+        elif args.send_github and not args.force and Config.GH_DISCUSSION_INDEX_ENABLED:
+            existing = find_published(GitHubPublisher(), url=args.url, title=args.title)
+            if existing:
+                logger.info(f"이미 게시된 이슈, 건너뜀 (--force로 재실행): {existing}")
+                return 0
         
-        # GitHub 발송 (Discord보다 먼저 실행해서 URL 얻기)
-        if args.send_github:
-            # 타이틀 자동 생성 (사용자 지정 타이틀이 없는 경우)
-            if not args.title:
-                if metadata.get('headline') and metadata.get('date'):
-                    # 소스에 따라 다른 타이틀 형식
-                    source = metadata.get('source', '')
-                    if 'Weekly Robotics' in source or 'weeklyrobotics' in args.url.lower():
-                        args.title = f"[Robotics News, {metadata['date']}] {metadata['headline']}"
-                    else:
-                        args.title = f"[AI News, {metadata['date']}] {metadata['headline']}"
-                    logger.info(f"타이틀 자동 생성: {args.title}")
-                else:
-                    # 기본 타이틀
-                    from datetime import datetime
-                    date_str = datetime.now().strftime("%y.%m.%d")
-                    if 'weeklyrobotics' in args.url.lower():
-                        args.title = f"[Robotics News, {date_str}] Weekly Robotics 요약"
-                    else:
-                        args.title = f"[AI News, {date_str}] AI 뉴스 요약"
-                    logger.warning(f"헤드라인 없음, 기본 타이틀 사용: {args.title}")
-            
-            logger.info("📤 GitHub Discussions 게시 중...")
-            if args.dry_run:
-                logger.info("[DRY-RUN] GitHub 게시 시뮬레이션")
-                results.append("GitHub: [DRY-RUN] 성공")
-            else:
-                github = GitHubPublisher()
-                if github.safe_publish(markdown_content, title=args.title):
-                    results.append("GitHub: ✅ 성공")
-                    # GitHub URL 저장
-                    github_url = getattr(github, 'last_discussion_url', None)
-                    if github_url:
-                        logger.info(f"GitHub Discussion URL: {github_url}")
-                else:
-                    results.append("GitHub: ❌ 실패")
+        # 단계 그래프 실행 (독립 단계는 병렬)
+        with llm_context(source_url=args.url), span("run", command="main", url=args.url):
+            run = build_pipeline(args, summarizer, stream_kwargs).run()
         
-        # Discord 발송 (GitHub 이후에 실행해서 URL 포함 가능)
-        if args.send_discord:
-            logger.info("📤 Discord 발송 중...")
-            
-            # SmolAI News는 Compact 버전으로, 다른 소스는 원본 사용
-            discord_content = markdown_content
-            
-            # SmolAI News 또는 Weekly Robotics인 경우 Compact 버전 생성
-            if ('smol' in args.url.lower() or 'weeklyrobotics' in args.url.lower()) and github_url:
-                source_type = "SmolAI News" if 'smol' in args.url.lower() else "Weekly Robotics"
-                logger.info(f"{source_type} - Compact 버전 생성 중...")
-                try:
-                    from src.summarizers.compact import CompactSummarizer
-                    compact = CompactSummarizer()
-                    
-                    # Weekly Robotics의 경우 썸네일 제거
-                    content_for_compact = markdown_content
-                    if 'weeklyrobotics' in args.url.lower():
-                        # 썸네일 이미지 라인 제거
-                        lines = markdown_content.split('\n')
-                        filtered_lines = []
-                        for line in lines:
-                            if not line.startswith('![Weekly Robotics]('):
-                                filtered_lines.append(line)
-                        content_for_compact = '\n'.join(filtered_lines).strip()
-                    
-                    compact_content = compact.summarize(
-                        content=content_for_compact,
-                        github_url=github_url,
-                        style="discord"
-                    )
-                    if compact_content and "요약 생성 실패" not in compact_content:
-                        discord_content = compact_content
-                        logger.info("Compact 버전 생성 완료")
-                    else:
-                        logger.warning("Compact 버전 생성 실패, 원본 사용")
-                        # 썸네일 제거하고 GitHub URL 추가
-                        if 'weeklyrobotics' in args.url.lower():
-                            discord_content = content_for_compact
-                        if github_url:
-                            discord_content += f"\n\n---\n📖 **상세 뉴스레터**: {github_url}"
-                except Exception as e:
-                    logger.warning(f"Compact 버전 생성 중 오류: {e}, 원본 사용")
-                    # 썸네일 제거하고 GitHub URL 추가
-                    if 'weeklyrobotics' in args.url.lower():
-                        lines = markdown_content.split('\n')
-                        filtered_lines = []
-                        for line in lines:
-                            if not line.startswith('![Weekly Robotics]('):
-                                filtered_lines.append(line)
-                        discord_content = '\n'.join(filtered_lines).strip()
-                    if github_url:
-                        discord_content += f"\n\n---\n📖 **상세 뉴스레터**: {github_url}"
-            else:
-                # 다른 소스는 원본에 GitHub URL만 추가
-                if github_url:
-                    discord_content += f"\n\n---\n📖 **상세 뉴스레터**: {github_url}"
-            
-            # Discord 콘텐츠를 별도 파일로 저장 (Compact 버전이 아니어도)
-            if discord_content != markdown_content:
-                # Compact 버전이거나 수정된 경우에만 저장
-                compact_filename = args.out.replace('.md', '_discord.md')
-                logger.info(f"💾 Discord 버전 저장: {compact_filename}")
-                save_markdown(compact_filename, discord_content)
-                logger.info(f"✅ Discord 버전 저장 완료")
-                
-                # 카카오톡용 텍스트 버전 생성 및 저장
-                try:
-                    from src.formatters.kakao import KakaoFormatter, save_kakao_text
-                    
-                    kakao_formatter = KakaoFormatter()
-                    kakao_content = kakao_formatter.format(discord_content)
-                    
-                    kakao_filename = args.out.replace('.md', '_kakao.txt')
-                    save_kakao_text(kakao_filename, kakao_content)
-                    logger.info(f"✅ 카카오톡 버전 저장 완료: {kakao_filename}")
-                except Exception as e:
-                    logger.warning(f"카카오톡 버전 생성 중 오류: {e}")
-            
-            if args.dry_run:
-                logger.info("[DRY-RUN] Discord 발송 시뮬레이션")
-                results.append("Discord: [DRY-RUN] 성공")
-            else:
-                discord = DiscordPublisher()
-                if discord.safe_publish(
-                    discord_content,
-                    tag=f"**{args.title}**" if args.title else ""
-                ):
-                    results.append("Discord: ✅ 성공")
-                else:
-                    results.append("Discord: ❌ 실패")
+        # 실행 전체 트레이스 (출력 .md 옆 _trace.json, Perfetto 등에서 열기)
+        get_tracer().write(trace_path(args.out))
         
-        # Kakao 발송
-        if args.send_kakao:
-            logger.info("📤 카카오톡 발송 중...")
-            if args.dry_run:
-                logger.info("[DRY-RUN] 카카오톡 발송 시뮬레이션")
-                results.append("Kakao: [DRY-RUN] 성공")
-            else:
-                kakao = KakaoPublisher()
-                if kakao.safe_publish(markdown_content):
-                    results.append("Kakao: ✅ 성공")
+        if not run.ok("summarize"):
+            logger.error(f"요약 생성 실패: {run['summarize'].error}")
+            return 1
+        if not run.ok("save"):
+            logger.error(f"파일 저장 실패: {run['save'].error}")
+            return 1
+        
+        metadata = run.output("summarize")[1]
+        results = []
+        publish_failed = False
+        for stage, label in (("github", "GitHub"), ("discord", "Discord"), ("kakao", "Kakao")):
+            if stage in run:
+                if not run.ok(stage):
+                    publish_failed = True
+                    results.append(f"{label}: ❌ 실패")
+                elif args.dry_run:
+                    results.append(f"{label}: [DRY-RUN] 성공")
                 else:
-                    results.append("Kakao: ❌ 실패")
+                    results.append(f"{label}: ✅ 성공")
         
         # 결과 요약
         logger.info("=" * 60)
@@ -404,7 +427,25 @@ def main() -> int:
             for result in results:
                 logger.info(f"    - {result}")
         
+        stream_metrics = metadata.get('stream_metrics')
+        if stream_metrics and stream_metrics.get('time_to_first_section') is not None:
+            logger.info(
+                f"  - 스트리밍: 첫 섹션 {stream_metrics['time_to_first_section']:.1f}초, "
+                f"전체 {stream_metrics['total_seconds']:.1f}초"
+            )
+        
+        if response_cache.enabled:
+            stats = response_cache.stats()
+            logger.info(f"  - 응답 캐시: 적중 {stats['hits']}회, 미스 {stats['misses']}회")
+        
+        # LLM 호출별 토큰/시간 리포트 (출력 .md 옆에 저장)
+        get_usage_ledger().write_report(usage_report_path(args.out), source_url=args.url)
+        
         logger.info("=" * 60)
+        if publish_failed:
+            # 발송 실패도 실행 실패로 보고 (종료 코드와 실행 메트릭에 반영)
+            logger.warning("⚠️ 일부 발송 실패")
+            return 1
         logger.info("✨ 파이프라인 완료")
         
         return 0
@@ -418,4 +459,7 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    exit_code = main()
+    # 실행 결과 메트릭을 node-exporter textfile로 기록 (발송 단계 실패도 실패로 반영된 종료 코드 기준)
+    finish_run("main", exit_code == 0)
+    sys.exit(exit_code)
\ No newline at end of file
@@ -7,8 +7,6 @@
 import os
 import sys
 import argparse
-from datetime import datetime
-import re
 
 # src 디렉토리를 Python 경로에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -19,6 +17,12 @@ from src.publishers.discord import DiscordPublisher
 from src.logger import setup_logger, logger
 from src.config import Config
 from src.markdown_utils import save_markdown
+from src.output_paths import default_output_path
+from src.pipeline import Pipeline
+from src.stages import run_summarizer, make_title
+from src.usage_ledger import get_usage_ledger, usage_report_path, llm_context
+from src.tracing import get_tracer, span, trace_path
+from src.metrics import finish_run
 
 def parse_arguments():
     """명령줄 인자 파싱"""
@@ -73,6 +77,96 @@ def parse_arguments():
     
     return parser.parse_args()
 
+def build_pipeline(args: argparse.Namespace, summarizer) -> Pipeline:
+    """발송 옵션에 맞는 단계 그래프 구성
+    
+    summarize ─┬─ save
+               └─ title ─┬─ github
+                         └─ discord   (GitHub와 Discord는 서로 독립이므로 병렬 발송)
+    """
+    pipeline = Pipeline("publish_news")
+    
+    def summarize(_):
+        logger.info("📝 요약 생성 중...")
+        return run_summarizer(summarizer, args.url, timeframe=args.timeframe)
+    
+    def save(inputs):
+        output_path = default_output_path(args.url)
+        logger.info(f"💾 파일 저장: {output_path}")
+        save_markdown(output_path, inputs["summarize"][0])
+        logger.info(f"✅ 저장 완료: {os.path.abspath(output_path)}")
+        return output_path
+    
+    pipeline.add("summarize", summarize)
+    pipeline.add("save", save, deps=["summarize"])
+    
+    if args.save_only:
+        return pipeline
+    
+    # 타이틀 자동 생성 (GitHub용)
+    pipeline.add(
+        "title",
+        lambda inputs: args.title or make_title(inputs["summarize"][1], args.url),
+        deps=["summarize"]
+    )
+    
+    # GitHub Discussions 발송
+    if not args.discord_only:
+        def publish_github(inputs):
+            markdown_content, title = inputs["summarize"][0], inputs["title"]
+            logger.info("📤 GitHub Discussions 게시 중...")
+            if args.dry_run:
+                logger.info("[DRY-RUN] GitHub 게시 시뮬레이션")
+                logger.info(f"  제목: {title}")
+                logger.info(f"  내용 길이: {len(markdown_content)} 글자")
+                return None
+            
+            github = GitHubPublisher(
+                repo="sudormrf-run/community",
+                category="News"
+            )
+            if not github.validate_config():
+                raise RuntimeError("GitHub 설정이 올바르지 않습니다")
+            # safe_publish는 발송 원장을 확인해 재실행 시 같은 Discussion을 다시 만들지 않음
+            if not github.safe_publish(markdown_content, title=title):
+                raise RuntimeError("GitHub Discussion 게시 실패")
+            
+            url = getattr(github, 'last_discussion_url', None)
+            if url:
+                logger.info(f"✅ GitHub Discussion 생성 완료")
+                logger.info(f"🔗 URL: {url}")
+            return url
+        
+        # Discussion 생성은 멱등하지 않으므로 재시도하지 않고, 벽시계 제한도 두지 않음
+        # (시간 초과돼도 스레드는 계속 실행돼 게시가 끝날 수 있으므로 요청별 HTTP timeout에 맡김)
+        pipeline.add("github", publish_github, deps=["summarize", "title"])
+    
+    # Discord 발송
+    if not args.github_only:
+        def publish_discord(inputs):
+            markdown_content, title = inputs["summarize"][0], inputs["title"]
+            logger.info("📤 Discord 발송 중...")
+            if args.dry_run:
+                logger.info("[DRY-RUN] Discord 발송 시뮬레이션")
+                logger.info(f"  제목: {title}")
+                logger.info(f"  내용 길이: {len(markdown_content)} 글자")
+                return True
+            
+            discord = DiscordPublisher()
+            if not discord.validate_config():
+                raise RuntimeError("Discord 설정이 올바르지 않습니다 (DISCORD_WEBHOOK_URL 확인)")
+            # Discord 발송 시 제목을 태그로 추가
+            if not discord.safe_publish(markdown_content, tag=f"**{title}**\n"):
+                raise RuntimeError("Discord 발송 실패")
+            logger.info("✅ Discord 발송 완료")
+            return True
+        
+        # 발송 단계는 멱등하지 않아 시간 제한 없음 (429 대기·재시도는 웹훅 발송기가 담당)
+        pipeline.add("discord", publish_discord, deps=["summarize", "title"])
+    
+    return pipeline
+
+
 def main():
     """메인 함수"""
     args = parse_arguments()
@@ -93,147 +187,43 @@ def main():
         logger.error(str(e))
         return 1
     
-    # 1. 요약 생성
-    logger.info("📝 요약 생성 중...")
-    
+    # URL에서 Summarizer 자동 감지
     try:
-        # URL에서 Summarizer 자동 감지
         summarizer = SummarizerFactory.create_from_url(args.url)
         logger.info(f"✅ 자동 감지된 소스: {summarizer.name}")
-        
-        # 메타데이터와 함께 요약 생성
-        metadata = {}
-        if hasattr(summarizer, 'summarize_with_metadata'):
-            result = summarizer.summarize_with_metadata(
-                args.url,
-                timeframe=args.timeframe
-            )
-            markdown_content = result.get('markdown', '')
-            metadata = {
-                'headline': result.get('headline', ''),
-                'date': result.get('date', '')
-            }
-            if metadata.get('headline'):
-                logger.info(f"📌 헤드라인: {metadata['headline']}")
-        else:
-            # 기본 요약
-            if hasattr(summarizer, 'summarize_with_retry'):
-                markdown_content = summarizer.summarize_with_retry(
-                    args.url,
-                    max_retries=3,
-                    timeframe=args.timeframe
-                )
-            else:
-                markdown_content = summarizer.safe_summarize(
-                    args.url,
-                    timeframe=args.timeframe
-                )
-            
-    except Exception as e:
+    except ValueError as e:
         logger.error(f"요약 생성 실패: {str(e)}")
         return 1
     
-    # 2. 파일 저장
-    # 날짜 기반 자동 경로 생성
-    now = datetime.now()
-    year_month = now.strftime("%Y/%m")
-    
-    # URL에서 날짜 정보 추출 (SmolAI News의 경우)
-    date_match = re.search(r'(\d{2})-(\d{2})-(\d{2})', args.url)
-    if date_match and 'smol' in args.url.lower():
-        filename = f"smol_ai_news_20{date_match.group(1)}{date_match.group(2)}{date_match.group(3)}.md"
-    else:
-        filename = f"recap_{now.strftime('%Y%m%d_%H%M%S')}.md"
+    with llm_context(source_url=args.url), span("run", command="publish_news", url=args.url):
+        run = build_pipeline(args, summarizer).run()
     
-    output_dir = os.path.join("outputs", year_month)
-    os.makedirs(output_dir, exist_ok=True)
+    if not run.ok("summarize") or not run.ok("save"):
+        get_tracer().write()
+        return 1
     
-    output_path = os.path.join(output_dir, filename)
-    logger.info(f"💾 파일 저장: {output_path}")
-    save_markdown(output_path, markdown_content)
-    logger.info(f"✅ 저장 완료: {os.path.abspath(output_path)}")
+    # LLM 호출별 토큰/시간 리포트와 실행 트레이스 (출력 .md 옆에 저장)
+    get_usage_ledger().write_report(usage_report_path(run.output("save")), source_url=args.url)
+    get_tracer().write(trace_path(run.output("save")))
     
     if args.save_only:
         logger.info("📋 요약만 생성하고 발송하지 않습니다.")
         return 0
     
-    # 3. 발송
+    # 결과 요약
     results = []
-    
-    # 타이틀 자동 생성 (GitHub용)
-    if not args.title:
-        if metadata.get('headline') and metadata.get('date'):
-            args.title = f"[AI News, {metadata['date']}] {metadata['headline']}"
-            logger.info(f"🏷️ 타이틀 자동 생성: {args.title}")
-        else:
-            from datetime import datetime
-            date_str = datetime.now().strftime("%y.%m.%d")
-            args.title = f"[AI News, {date_str}] AI 뉴스 요약"
-            logger.info(f"🏷️ 기본 타이틀 사용: {args.title}")
-    
-    # GitHub Discussions 발송
-    if not args.discord_only:
-        logger.info("\n📤 GitHub Discussions 게시 중...")
-        if args.dry_run:
-            logger.info("[DRY-RUN] GitHub 게시 시뮬레이션")
-            logger.info(f"  제목: {args.title}")
-            logger.info(f"  내용 길이: {len(markdown_content)} 글자")
-            results.append("GitHub: [DRY-RUN] 성공")
+    for stage, label in (("github", "GitHub"), ("discord", "Discord")):
+        if stage not in run:
+            continue
+        if not run.ok(stage):
+            results.append(f"{label}: ❌ 실패 - {str(run[stage].error)[:50]}")
+        elif args.dry_run:
+            results.append(f"{label}: [DRY-RUN] 성공")
+        elif run.output(stage) and stage == "github":
+            results.append(f"{label}: ✅ 성공 - {run.output(stage)}")
         else:
-            try:
-                github = GitHubPublisher(
-                    repo="sudormrf-run/community",
-                    category="News"
-                )
-                if github.validate_config():
-                    result_data = {}
-                    if github.publish(markdown_content, title=args.title, **result_data):
-                        url = result_data.get('discussion_url', '')
-                        if url:
-                            results.append(f"GitHub: ✅ 성공 - {url}")
-                            logger.info(f"✅ GitHub Discussion 생성 완료")
-                            logger.info(f"🔗 URL: {url}")
-                        else:
-                            results.append("GitHub: ✅ 성공")
-                    else:
-                        results.append("GitHub: ❌ 실패")
-                        logger.error("❌ GitHub Discussion 게시 실패")
-                else:
-                    logger.error("❌ GitHub 설정이 올바르지 않습니다")
-                    results.append("GitHub: ❌ 설정 오류")
-            except Exception as e:
-                logger.error(f"GitHub 발송 오류: {str(e)}")
-                results.append(f"GitHub: ❌ 오류 - {str(e)[:50]}")
+            results.append(f"{label}: ✅ 성공")
     
-    # Discord 발송
-    if not args.github_only:
-        logger.info("\n📤 Discord 발송 중...")
-        if args.dry_run:
-            logger.info("[DRY-RUN] Discord 발송 시뮬레이션")
-            logger.info(f"  제목: {args.title}")
-            logger.info(f"  내용 길이: {len(markdown_content)} 글자")
-            results.append("Discord: [DRY-RUN] 성공")
-        else:
-            try:
-                discord = DiscordPublisher()
-                if discord.validate_config():
-                    # Discord 발송 시 제목을 태그로 추가
-                    tag = f"**{args.title}**\n"
-                    if discord.publish(markdown_content, tag=tag):
-                        results.append("Discord: ✅ 성공")
-                        logger.info("✅ Discord 발송 완료")
-                    else:
-                        results.append("Discord: ❌ 실패")
-                        logger.error("❌ Discord 발송 실패")
-                else:
-                    logger.error("❌ Discord 설정이 올바르지 않습니다")
-                    logger.error("DISCORD_WEBHOOK_URL 환경변수를 확인하세요")
-                    results.append("Discord: ❌ 설정 오류")
-            except Exception as e:
-                logger.error(f"Discord 발송 오류: {str(e)}")
-                results.append(f"Discord: ❌ 오류 - {str(e)[:50]}")
-    
-    # 4. 결과 요약
     logger.info("\n" + "=" * 60)
     logger.info("📊 발송 결과:")
     for result in results:
@@ -251,4 +241,7 @@ def main():
         return 1
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit_code = main()
+    # 실행 결과 메트릭을 node-exporter textfile로 기록
+    finish_run("publish_news", exit_code == 0)
+    exit(exit_code)
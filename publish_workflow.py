@@ -10,7 +10,6 @@ import os
 import sys
 import argparse
 from datetime import datetime
-import re
 from typing import Dict, Any, Optional
 
 # src 디렉토리를 Python 경로에 추가
@@ -23,6 +22,11 @@ from src.publishers.discord import DiscordPublisher
 from src.logger import setup_logger, logger
 from src.config import Config
 from src.markdown_utils import save_markdown
+from src.response_cache import configure_response_cache, get_response_cache
+from src.pipeline import Pipeline
+from src.usage_ledger import get_usage_ledger, usage_report_path, llm_context
+from src.tracing import get_tracer, span, trace_path
+from src.metrics import finish_run
 
 
 class PublishWorkflow:
@@ -58,46 +62,32 @@ class PublishWorkflow:
         logger.info(f"📰 URL: {url}")
         logger.info("=" * 60)
         
-        # Phase 1: 원본 요약 생성
-        logger.info("\n=== Phase 1: 원본 요약 생성 ===")
-        full_content, metadata = self._generate_full_summary(url, **options)
-        if not full_content:
+        with llm_context(source_url=url), span("run", command="publish_workflow", url=url):
+            run = self.build_pipeline(url, **options).run()
+        
+        if not run.ok("full"):
+            get_tracer().write()
             return False
+        logger.info(f"📄 Full 버전 저장: {run.output('save_full')}")
         
-        # 파일 저장 (Full 버전)
-        full_path = self._save_content(full_content, metadata, "full")
-        logger.info(f"📄 Full 버전 저장: {full_path}")
+        if run.ok("save_full"):
+            # LLM 호출별 토큰/시간 리포트와 실행 트레이스 (Full 버전 .md 옆에 저장)
+            get_usage_ledger().write_report(usage_report_path(run.output("save_full")), source_url=url)
+            get_tracer().write(trace_path(run.output("save_full")))
         
-        # Phase 2: GitHub Discussions 발송 (Full content)
-        github_url = None
-        if options.get('send_github', True):
-            logger.info("\n=== Phase 2: GitHub Discussions 발송 ===")
-            github_url = self._publish_to_github(full_content, metadata, **options)
-            if github_url:
-                logger.info(f"✅ GitHub URL: {github_url}")
-                self.results.append(f"GitHub: ✅ {github_url}")
+        if "github" in run:
+            if run.ok("github"):
+                logger.info(f"✅ GitHub URL: {run.output('github')}")
+                self.results.append(f"GitHub: ✅ {run.output('github')}")
             else:
                 logger.warning("⚠️ GitHub 발송 실패 또는 건너뜀")
                 self.results.append("GitHub: ❌ 실패")
         
-        # Phase 3: 간결한 재요약 생성
-        logger.info("\n=== Phase 3: 간결한 재요약 생성 ===")
-        compact_content = self._generate_compact_summary(
-            full_content, 
-            github_url=github_url,
-            style=options.get('compact_style', 'discord')
-        )
-        
-        if compact_content:
-            # 파일 저장 (Compact 버전)
-            compact_path = self._save_content(compact_content, metadata, "compact")
-            logger.info(f"📄 Compact 버전 저장: {compact_path}")
+        if run.ok("save_compact"):
+            logger.info(f"📄 Compact 버전 저장: {run.output('save_compact')}")
         
-        # Phase 4: 간결 버전 발송 (Discord 등)
-        if options.get('send_discord', True) and compact_content:
-            logger.info("\n=== Phase 4: Discord 발송 (간결 버전) ===")
-            success = self._publish_to_discord(compact_content, metadata, **options)
-            if success:
+        if "discord" in run and run["discord"].status != "skipped":
+            if run.ok("discord"):
                 logger.info("✅ Discord 발송 성공")
                 self.results.append("Discord: ✅ 성공")
             else:
@@ -109,29 +99,126 @@ class PublishWorkflow:
         
         return all("✅" in r for r in self.results)
     
+    def build_pipeline(self, url: str, **options) -> Pipeline:
+        """워크플로우 단계 그래프 구성
+        
+        full ─┬─ save_full
+              ├─ github ────────┐
+              ├─ compact_draft ─┴─ compact ─┬─ save_compact
+              │                             └─ discord
+        
+        compact_draft는 Discussion URL 자리표시로 GitHub 게시와 병렬 생성하고,
+        compact에서 실제 URL로 교체 (GitHub 실패 시 자리표시 링크만 지워 재사용, 초안이 없을 때만 다시 생성)
+        
+        Args:
+            url: 뉴스 URL
+            **options: execute와 동일
+        
+        Returns:
+            실행 준비된 Pipeline
+        """
+        style = options.get('compact_style', 'discord')
+        pipeline = Pipeline("publish_workflow")
+        
+        # Phase 1: 원본 요약 생성
+        def full(_):
+            logger.info("\n=== Phase 1: 원본 요약 생성 ===")
+            content, metadata = self._generate_full_summary(url, **options)
+            if not content:
+                raise RuntimeError("원본 요약 생성 실패")
+            return content, metadata
+        
+        pipeline.add("full", full)
+        pipeline.add(
+            "save_full",
+            lambda inputs: self._save_content(inputs["full"][0], inputs["full"][1], "full"),
+            deps=["full"]
+        )
+        
+        # Phase 2: GitHub Discussions 발송 (Full content) + 간결 요약 사전 생성
+        if options.get('send_github', True):
+            def github(inputs):
+                logger.info("\n=== Phase 2: GitHub Discussions 발송 ===")
+                github_url = self._publish_to_github(inputs["full"][0], inputs["full"][1], **options)
+                if not github_url:
+                    raise RuntimeError("GitHub 발송 실패 또는 건너뜀")
+                return github_url
+            
+            # Discussion 생성은 멱등하지 않으므로 재시도하지 않고, 벽시계 제한도 두지 않음
+            # (시간 초과돼도 스레드는 계속 실행돼 게시가 끝날 수 있으므로 요청별 HTTP timeout에 맡김)
+            pipeline.add("github", github, deps=["full"])
+            pipeline.add(
+                "compact_draft",
+                lambda inputs: self._generate_compact_summary(
+                    inputs["full"][0],
+                    github_url=CompactSummarizer.DISCUSSION_URL_PLACEHOLDER,
+                    style=style
+                ),
+                deps=["full"],
+                timeout=600
+            )
+        
+        # Phase 3: 간결한 재요약 (사전 생성 결과에 실제 URL 반영)
+        def compact(inputs):
+            github_url = inputs.get("github")
+            draft = inputs.get("compact_draft")
+            if github_url and draft:
+                return CompactSummarizer.fill_discussion_url(draft, github_url)
+            if draft and not CompactSummarizer.is_fallback_summary(draft):
+                # GitHub 실패: LLM을 다시 호출하지 않고 초안에서 Discussion 링크만 제거
+                logger.info("GitHub 게시 실패, 간결 요약 초안에서 Discussion 링크 제거 후 사용")
+                return CompactSummarizer.remove_discussion_url(draft)
+            
+            logger.info("\n=== Phase 3: 간결한 재요약 생성 ===")
+            content = self._generate_compact_summary(inputs["full"][0], github_url=github_url, style=style)
+            if not content:
+                raise RuntimeError("간결 요약 생성 실패")
+            return content
+        
+        pipeline.add("compact", compact, deps=["full"], optional_deps=["github", "compact_draft"])
+        pipeline.add(
+            "save_compact",
+            lambda inputs: self._save_content(inputs["compact"], inputs["full"][1], "compact"),
+            deps=["full", "compact"]
+        )
+        
+        # Phase 4: 간결 버전 발송 (Discord 등)
+        if options.get('send_discord', True):
+            def discord(inputs):
+                logger.info("\n=== Phase 4: Discord 발송 (간결 버전) ===")
+                if not self._publish_to_discord(inputs["compact"], inputs["full"][1], **options):
+                    raise RuntimeError("Discord 발송 실패")
+                return True
+            
+            # 발송 단계는 멱등하지 않아 시간 제한 없음 (429 대기·재시도는 웹훅 발송기가 담당)
+            pipeline.add("discord", discord, deps=["full", "compact"])
+        
+        return pipeline
+    
     def _generate_full_summary(self, url: str, **options) -> tuple[str, Dict[str, Any]]:
         """원본 전체 요약 생성"""
         try:
             summarizer = SummarizerFactory.create_from_url(url)
             logger.info(f"✅ 자동 감지된 소스: {summarizer.name}")
             
-            if hasattr(summarizer, 'summarize_with_metadata'):
-                result = summarizer.summarize_with_metadata(
-                    url,
-                    timeframe=options.get('timeframe')
-                )
-                content = result.get('markdown', '')
-                metadata = {
-                    'headline': result.get('headline', ''),
-                    'date': result.get('date', ''),
-                    'source': summarizer.name
-                }
-            else:
-                content = summarizer.safe_summarize(
-                    url,
-                    timeframe=options.get('timeframe')
-                )
-                metadata = {'source': summarizer.name}
+            with llm_context(stage="summarize", source_url=url):
+                if hasattr(summarizer, 'summarize_with_metadata'):
+                    result = summarizer.summarize_with_metadata(
+                        url,
+                        timeframe=options.get('timeframe')
+                    )
+                    content = result.get('markdown', '')
+                    metadata = {
+                        'headline': result.get('headline', ''),
+                        'date': result.get('date', ''),
+                        'source': summarizer.name
+                    }
+                else:
+                    content = summarizer.safe_summarize(
+                        url,
+                        timeframe=options.get('timeframe')
+                    )
+                    metadata = {'source': summarizer.name}
             
             logger.info(f"✅ 요약 생성 완료 ({len(content)}자)")
             return content, metadata
@@ -192,9 +279,10 @@ class PublishWorkflow:
                 logger.error("GitHub 설정 오류")
                 return None
             
-            result_data = {}
-            if github.publish(content, title=title, **result_data):
-                return result_data.get('discussion_url')
+            # safe_publish는 발송 원장을 확인해 재실행 시 같은 Discussion을 다시 만들지 않음
+            # (execute의 llm_context(source_url=...)가 파이프라인 단계 스레드로 전달됨)
+            if github.safe_publish(content, title=title):
+                return getattr(github, 'last_discussion_url', None)
             
         except Exception as e:
             logger.error(f"GitHub 발송 오류: {str(e)}")
@@ -215,7 +303,7 @@ class PublishWorkflow:
                 return False
             
             # 간결 버전은 한 메시지로 발송 가능
-            return discord.publish(content)
+            return discord.safe_publish(content)
             
         except Exception as e:
             logger.error(f"Discord 발송 오류: {str(e)}")
@@ -248,6 +336,10 @@ class PublishWorkflow:
         logger.info("📊 워크플로우 실행 결과:")
         for result in self.results:
             logger.info(f"  {result}")
+        cache = get_response_cache()
+        if cache.enabled:
+            stats = cache.stats()
+            logger.info(f"  응답 캐시: 적중 {stats['hits']}회, 미스 {stats['misses']}회")
         logger.info("=" * 60)
 
 
@@ -303,6 +395,18 @@ def parse_arguments():
         help="디버그 모드"
     )
     
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="OpenAI 응답 캐시를 사용하지 않음"
+    )
+    
+    parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="캐시된 응답을 무시하고 새로 생성하여 캐시 갱신"
+    )
+    
     return parser.parse_args()
 
 
@@ -317,6 +421,9 @@ def main():
         print(f"설정 오류: {e}")
         return 1
     
+    # 응답 캐시 설정
+    configure_response_cache(enabled=not args.no_cache, refresh=args.refresh)
+    
     # 워크플로우 실행
     workflow = PublishWorkflow(debug=args.debug)
     
@@ -334,4 +441,7 @@ def main():
 
 
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit_code = main()
+    # 실행 결과 메트릭을 node-exporter textfile로 기록
+    finish_run("publish_workflow", exit_code == 0)
+    exit(exit_code)
\ No newline at end of file
@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+과거 이슈 일괄 요약(backfill) 모듈
+이슈 URL 열거 → 기존 출력 건너뛰기 → 배치 요약 → 체크포인트 저장
+"""
+
+import os
+import json
+import time
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, List, Any
+
+from .batch import BatchSummarizer
+from .markdown_utils import save_markdown
+from .output_paths import default_output_path, find_existing_output, OUTPUT_ROOT
+from .usage_ledger import get_usage_ledger, usage_report_path
+from .tracing import span
+from .logger import logger
+
+
+SMOL_AI_ISSUE_URL = "https://news.smol.ai/issues/{slug}"
+WEEKLY_ROBOTICS_ISSUE_URL = "https://www.weeklyrobotics.com/weekly-robotics-{number}"
+
+# 기본 체크포인트 경로
+DEFAULT_CHECKPOINT_PATH = ".cache/backfill_checkpoint.json"
+
+
+def parse_issue_date(value: str) -> date:
+    """smol.ai 이슈 날짜 파싱
+
+    Args:
+        value: 'YY-MM-DD' 또는 'YYYY-MM-DD'
+
+    Returns:
+        date 객체
+    """
+    for fmt in ("%y-%m-%d", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    raise ValueError(f"날짜 형식 오류 (YY-MM-DD 필요): {value}")
+
+
+def smol_ai_issue_urls(start: date, end: date) -> List[str]:
+    """날짜 범위의 smol.ai 이슈 URL 열거 (양 끝 포함)
+
+    Args:
+        start: 시작 날짜
+        end: 종료 날짜
+
+    Returns:
+        URL 리스트 (날짜 오름차순)
+    """
+    if end < start:
+        raise ValueError(f"종료 날짜가 시작 날짜보다 빠릅니다: {start} ~ {end}")
+
+    urls = []
+    current = start
+    while current <= end:
+        urls.append(SMOL_AI_ISSUE_URL.format(slug=current.strftime("%y-%m-%d")))
+        current += timedelta(days=1)
+    return urls
+
+
+def weekly_robotics_issue_urls(first: int, last: int) -> List[str]:
+    """이슈 번호 범위의 Weekly Robotics URL 열거 (양 끝 포함)
+
+    Args:
+        first: 시작 이슈 번호
+        last: 종료 이슈 번호
+
+    Returns:
+        URL 리스트 (번호 오름차순)
+    """
+    if last < first:
+        raise ValueError(f"종료 번호가 시작 번호보다 작습니다: {first} ~ {last}")
+    return [WEEKLY_ROBOTICS_ISSUE_URL.format(number=n) for n in range(first, last + 1)]
+
+
+class BackfillCheckpoint:
+    """완료/실패 URL을 기록하는 JSON 체크포인트"""
+
+    def __init__(self, path: str = DEFAULT_CHECKPOINT_PATH):
+        """
+        Args:
+            path: 체크포인트 파일 경로
+        """
+        self.path = path
+        self.done: Dict[str, str] = {}
+        self.failed: Dict[str, str] = {}
+        self._load()
+
+    def _load(self) -> None:
+        """기존 체크포인트 로드"""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.done = data.get('done', {})
+            self.failed = data.get('failed', {})
+            logger.info(f"체크포인트 로드: 완료 {len(self.done)}건, 실패 {len(self.failed)}건")
+        except (OSError, ValueError) as e:
+            logger.warning(f"체크포인트 로드 실패, 새로 시작: {str(e)}")
+
+    def mark_done(self, url: str, output_path: str) -> None:
+        """완료 기록"""
+        self.done[url] = output_path
+        self.failed.pop(url, None)
+        self.save()
+
+    def mark_failed(self, url: str, error: str) -> None:
+        """실패 기록 (다음 실행에서 재시도)"""
+        self.failed[url] = error
+        self.save()
+
+    def save(self) -> None:
+        """원자적으로 저장 (중간에 종료되어도 파일이 깨지지 않도록)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'done': self.done, 'failed': self.failed}, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class BackfillRunner:
+    """과거 이슈 일괄 요약 실행기"""
+
+    def __init__(
+        self,
+        workers: int = 4,
+        checkpoint: Optional[BackfillCheckpoint] = None,
+        output_root: str = OUTPUT_ROOT,
+        batch: Optional[BatchSummarizer] = None
+    ):
+        """
+        Args:
+            workers: 동시 요약 수
+            checkpoint: 체크포인트 (기본값: DEFAULT_CHECKPOINT_PATH)
+            output_root: 출력 루트 디렉토리
+            batch: 사용할 BatchSummarizer (기본값: workers 기준 생성)
+        """
+        self.workers = workers
+        self.checkpoint = checkpoint or BackfillCheckpoint()
+        self.output_root = output_root
+        self.batch = batch or BatchSummarizer(concurrency=workers, per_model_concurrency=workers)
+
+    def plan(self, urls: List[str]) -> List[str]:
+        """기존 출력/체크포인트 완료 항목을 제외한 대상 URL 반환
+
+        Args:
+            urls: 전체 이슈 URL
+
+        Returns:
+            요약이 필요한 URL 리스트
+        """
+        pending = []
+        for url in urls:
+            if url in self.checkpoint.done:
+                logger.debug(f"체크포인트 완료 항목 건너뜀: {url}")
+                continue
+            existing = find_existing_output(url, root=self.output_root)
+            if existing:
+                logger.debug(f"기존 출력 건너뜀: {url} ({existing})")
+                continue
+            pending.append(url)
+        return pending
+
+    def run(self, urls: List[str], **kwargs) -> Dict[str, Any]:
+        """일괄 요약 실행
+
+        Args:
+            urls: 전체 이슈 URL
+            **kwargs: 요약 추가 인자 (timeframe 등)
+
+        Returns:
+            {
+                'total': 전체 URL 수,
+                'skipped': 건너뛴 수,
+                'succeeded': 성공 수,
+                'failed': 실패 수,
+                'elapsed': 경과 시간(초),
+                'throughput': 분당 처리 건수
+            }
+        """
+        return asyncio.run(self.arun(urls, **kwargs))
+
+    async def arun(self, urls: List[str], **kwargs) -> Dict[str, Any]:
+        """일괄 요약 실행 (async)"""
+        pending = self.plan(urls)
+        skipped = len(urls) - len(pending)
+        logger.info(f"Backfill 대상: 전체 {len(urls)}건, 건너뜀 {skipped}건, 요약 {len(pending)}건")
+
+        succeeded = 0
+        failed = 0
+        started = time.monotonic()
+
+        async for result in self.batch.run(pending, **kwargs):
+            if result.success:
+                output_path = default_output_path(result.url, root=self.output_root)
+                with span("backfill.save", url=result.url):
+                    save_markdown(output_path, result.summary)
+                get_usage_ledger().write_report(usage_report_path(output_path), source_url=result.url)
+                self.checkpoint.mark_done(result.url, output_path)
+                succeeded += 1
+            else:
+                self.checkpoint.mark_failed(result.url, result.error or "")
+                failed += 1
+
+            completed = succeeded + failed
+            logger.info(
+                f"[{completed}/{len(pending)}] {'✅' if result.success else '❌'} {result.url} | "
+                + format_progress(completed, len(pending), time.monotonic() - started)
+            )
+
+        elapsed = time.monotonic() - started
+        return {
+            'total': len(urls),
+            'skipped': skipped,
+            'succeeded': succeeded,
+            'failed': failed,
+            'elapsed': elapsed,
+            'throughput': (succeeded + failed) / elapsed * 60 if elapsed > 0 else 0.0,
+        }
+
+
+def format_progress(completed: int, total: int, elapsed: float) -> str:
+    """처리량/ETA 문자열 생성
+
+    Args:
+        completed: 완료 건수
+        total: 전체 건수
+        elapsed: 경과 시간(초)
+
+    Returns:
+        '처리량 1.5건/분, 경과 02:00, ETA 10:00' 형식 문자열
+    """
+    rate = completed / elapsed if elapsed > 0 else 0.0
+    remaining = (total - completed) / rate if rate > 0 else 0.0
+    return (
+        f"처리량 {rate * 60:.1f}건/분, "
+        f"경과 {format_duration(elapsed)}, ETA {format_duration(remaining)}"
+    )
+
+
+def format_duration(seconds: float) -> str:
+    """초를 MM:SS 또는 H:MM:SS로 변환"""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+비동기 배치 요약 모듈
+여러 URL을 제한된 동시성으로 요약하고 완료 순서대로 결과 반환
+"""
+
+import asyncio
+from typing import Optional, Dict, List, Iterable, AsyncIterator
+
+from .config import Config
+from .summarizer import SummarizerFactory, SourceKey
+from .summarizers.base import BaseSummarizer, SummarizerResult
+from .usage_ledger import llm_context
+from .tracing import span
+from .logger import logger
+
+
+class BatchSummarizer:
+    """AsyncOpenAI 기반 배치 요약 실행기
+
+    - 전체 동시 실행 수 제한 (concurrency)
+    - 모델별 동시 실행 수 제한 (per_model_concurrency, model_limits)
+    - URL별 실패 격리: 실패한 URL은 success=False 결과로 반환
+    """
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        per_model_concurrency: Optional[int] = None,
+        model_limits: Optional[Dict[str, int]] = None,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None
+    ):
+        """
+        Args:
+            concurrency: 전체 동시 요약 수 (기본값: Config.BATCH_CONCURRENCY)
+            per_model_concurrency: 모델별 기본 동시 요약 수 (기본값: Config.BATCH_MODEL_CONCURRENCY)
+            model_limits: 모델별 개별 제한 (예: {'gpt-5': 2})
+            api_key: OpenAI API 키 (선택)
+            model: Summarizer 모델 (선택)
+        """
+        self.concurrency = concurrency or Config.BATCH_CONCURRENCY
+        self.per_model_concurrency = per_model_concurrency or Config.BATCH_MODEL_CONCURRENCY
+        self.model_limits = model_limits or {}
+        self.api_key = api_key
+        self.model = model
+
+        # 소스별 Summarizer 재사용 (클라이언트 커넥션 풀 공유)
+        self._summarizers: Dict[SourceKey, BaseSummarizer] = {}
+        self._model_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def run(self, urls: Iterable[str], **kwargs) -> AsyncIterator[SummarizerResult]:
+        """URL 목록을 요약하고 완료되는 순서대로 결과 반환
+
+        Args:
+            urls: 요약할 URL 목록
+            **kwargs: asummarize_with_metadata에 전달할 추가 인자 (timeframe 등)
+
+        Yields:
+            SummarizerResult (완료 순서)
+        """
+        overall = asyncio.Semaphore(self.concurrency)
+        tasks = [
+            asyncio.ensure_future(self._summarize_one(url, overall, kwargs))
+            for url in urls
+        ]
+        logger.info(
+            f"배치 요약 시작: {len(tasks)}개 URL "
+            f"(동시 {self.concurrency}, 모델별 {self.per_model_concurrency})"
+        )
+
+        try:
+            for future in asyncio.as_completed(tasks):
+                yield await future
+        finally:
+            # 소비자가 중간에 중단한 경우 남은 작업 취소
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    def run_sync(self, urls: Iterable[str], **kwargs) -> List[SummarizerResult]:
+        """동기 코드에서 배치 요약 실행
+
+        Args:
+            urls: 요약할 URL 목록
+            **kwargs: 추가 인자
+
+        Returns:
+            SummarizerResult 리스트 (완료 순서)
+        """
+        async def collect() -> List[SummarizerResult]:
+            return [result async for result in self.run(urls, **kwargs)]
+
+        return asyncio.run(collect())
+
+    async def _summarize_one(
+        self,
+        url: str,
+        overall: asyncio.Semaphore,
+        kwargs: Dict
+    ) -> SummarizerResult:
+        """단일 URL 요약 (예외는 결과로 변환)"""
+        summarizer_name = "Unknown"
+
+        try:
+            summarizer = self._get_summarizer(url)
+            summarizer_name = summarizer.name
+
+            # 모델 슬롯을 먼저 잡고 전체 슬롯을 잡아야, 모델 제한에 걸려 기다리는 작업이
+            # 전체 슬롯을 차지해 다른 모델 URL까지 막는 일이 없음
+            async with self._model_semaphore(summarizer.model or ""), overall:
+                with llm_context(stage="summarize", source_url=url), span("summarize", url=url):
+                    result = await summarizer.asummarize_with_metadata(url, **kwargs)
+
+            markdown = result.pop('markdown', '')
+            if not markdown:
+                raise RuntimeError("요약 생성 실패: 빈 결과")
+
+            logger.info(f"[{summarizer_name}] 배치 요약 완료: {url} ({len(markdown)}자)")
+            return SummarizerResult(
+                summarizer_name=summarizer_name,
+                url=url,
+                success=True,
+                summary=markdown,
+                metadata=result
+            )
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"[{summarizer_name}] 배치 요약 실패: {url} - {str(e)}")
+            return SummarizerResult(
+                summarizer_name=summarizer_name,
+                url=url,
+                success=False,
+                error=str(e)
+            )
+
+    def _get_summarizer(self, url: str) -> BaseSummarizer:
+        """URL에 맞는 Summarizer 반환 (소스별 1회 생성)"""
+        source = SummarizerFactory.find_source(url)
+        if source is None:
+            # 플러그인 로드 및 에러 메시지는 팩토리에 위임
+            return SummarizerFactory.create_from_url(url, api_key=self.api_key, model=self.model)
+
+        if source not in self._summarizers:
+            self._summarizers[source] = SummarizerFactory.create(
+                source, api_key=self.api_key, model=self.model
+            )
+        return self._summarizers[source]
+
+    def _model_semaphore(self, model: str) -> asyncio.Semaphore:
+        """모델별 세마포어 반환 (최초 사용 시 생성)"""
+        if model not in self._model_semaphores:
+            limit = self.model_limits.get(model, self.per_model_concurrency)
+            self._model_semaphores[model] = asyncio.Semaphore(limit)
+        return self._model_semaphores[model]
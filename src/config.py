@@ -16,10 +16,16 @@ class Config:
     # OpenAI 설정
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
     OPENAI_MODEL: str = os.getenv("OPENAI_MODEL", "gpt-4o")
+    OPENAI_BASE_URL: Optional[str] = os.getenv("OPENAI_BASE_URL") or None  # 로컬 대역 서버 등 (기본: 공식 API)
     
     # Discord 설정
     DISCORD_WEBHOOK_URL: Optional[str] = os.getenv("DISCORD_WEBHOOK_URL")
     ERROR_DISCORD_WEBHOOK_URL: Optional[str] = os.getenv("ERROR_DISCORD_WEBHOOK_URL")
+    # 여러 서버 동시 발송: JSON 목록 (URL 문자열 또는 {"url", "name", "tag", "username", "variant": compact|full})
+    DISCORD_WEBHOOKS: Optional[str] = os.getenv("DISCORD_WEBHOOKS") or None
+    DISCORD_DELIVERY_MODE: str = os.getenv("DISCORD_DELIVERY_MODE", "text")  # text / embeds (## 섹션별 임베드)
+    DISCORD_HOST_CONCURRENCY: int = int(os.getenv("DISCORD_HOST_CONCURRENCY", "4"))  # 호스트별 동시 발송 수
+    DISCORD_MAX_RETRIES: int = int(os.getenv("DISCORD_MAX_RETRIES", "5"))  # 429/5xx/연결 오류 재시도 횟수
     
     # GitHub 설정
     GITHUB_TOKEN: Optional[str] = os.getenv("GITHUB_TOKEN")
@@ -27,6 +33,17 @@ class Config:
     GH_ORG: Optional[str] = os.getenv("GH_ORG")  # Organization discussions
     GH_ORG_REPO: Optional[str] = os.getenv("GH_ORG_REPO", "community")  # Organization의 discussion repository 이름
     GH_DISCUSSION_CATEGORY: Optional[str] = os.getenv("GH_DISCUSSION_CATEGORY")
+    GH_GRAPHQL_URL: str = os.getenv("GH_GRAPHQL_URL", "https://api.github.com/graphql")  # 로컬 대역 서버 등
+    GH_ID_CACHE_ENABLED: bool = os.getenv("GH_ID_CACHE_ENABLED", "true").lower() == "true"
+    GH_ID_CACHE_PATH: str = os.getenv("GH_ID_CACHE_PATH", ".cache/github_ids.json")
+    GH_ID_CACHE_TTL: int = int(os.getenv("GH_ID_CACHE_TTL", str(24 * 3600)))  # 초 단위, 0이면 만료 없음
+    GH_DISCUSSION_INDEX_ENABLED: bool = os.getenv("GH_DISCUSSION_INDEX_ENABLED", "true").lower() == "true"
+    GH_DISCUSSION_INDEX_PATH: str = os.getenv("GH_DISCUSSION_INDEX_PATH", ".cache/discussions.sqlite3")
+    GH_MUTATION_BATCH_SIZE: int = int(os.getenv("GH_MUTATION_BATCH_SIZE", "10"))  # 일괄 게시 시 요청당 createDiscussion 수
+    GH_MUTATIONS_PER_MINUTE: int = int(os.getenv("GH_MUTATIONS_PER_MINUTE", "60"))  # 2차 레이트 리밋 회피용 분당 생성 수
+    
+    # URL 단축 (카카오톡 포맷)
+    TINYURL_API_URL: str = os.getenv("TINYURL_API_URL", "http://tinyurl.com/api-create.php")
     
     # Kakao 설정
     KAKAO_BOT_WEBHOOK_URL: Optional[str] = os.getenv("KAKAO_BOT_WEBHOOK_URL")
@@ -35,6 +52,36 @@ class Config:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_DIR: str = os.getenv("LOG_DIR", "logs")
     
+    # 응답 캐시 설정
+    RESPONSE_CACHE_ENABLED: bool = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_PATH: str = os.getenv("RESPONSE_CACHE_PATH", ".cache/responses.sqlite3")
+    RESPONSE_CACHE_TTL: int = int(os.getenv("RESPONSE_CACHE_TTL", str(7 * 24 * 3600)))  # 초 단위, 0이면 만료 없음
+    RESPONSE_CACHE_MAX_BYTES: int = int(os.getenv("RESPONSE_CACHE_MAX_BYTES", str(200 * 1024 * 1024)))  # 200MB
+    
+    # 발송 원장 (재실행 시 중복 발송 방지, 완료된 단계 재사용)
+    PUBLISH_LEDGER_ENABLED: bool = os.getenv("PUBLISH_LEDGER_ENABLED", "true").lower() == "true"
+    PUBLISH_LEDGER_PATH: str = os.getenv("PUBLISH_LEDGER_PATH", ".cache/publish_ledger.sqlite3")
+    
+    # LLM 호출 사용량/지연 원장 (JSONL)
+    LLM_LEDGER_ENABLED: bool = os.getenv("LLM_LEDGER_ENABLED", "true").lower() == "true"
+    LLM_LEDGER_PATH: str = os.getenv("LLM_LEDGER_PATH", os.path.join(LOG_DIR, "llm_usage.jsonl"))
+    
+    # 구조화 트레이싱 (실행별 span을 출력 .md 옆 _trace.json으로 저장)
+    TRACE_ENABLED: bool = os.getenv("TRACE_ENABLED", "true").lower() == "true"
+    TRACE_FORMAT: str = os.getenv("TRACE_FORMAT", "chrome")  # chrome / otlp
+    
+    # Prometheus 메트릭 (실행 종료 시 node-exporter textfile 기록, METRICS_PORT 지정 시 HTTP 제공)
+    METRICS_ENABLED: bool = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    METRICS_TEXTFILE_PATH: str = os.getenv("METRICS_TEXTFILE_PATH", os.path.join(LOG_DIR, "news_bot.prom"))
+    METRICS_PORT: int = int(os.getenv("METRICS_PORT", "0"))  # 0이면 HTTP 서버 비활성화
+    
+    # LLM 입력 링크 압축 (URL → [LINK_0001] placeholder)
+    LINK_COMPRESSION_ENABLED: bool = os.getenv("LINK_COMPRESSION_ENABLED", "true").lower() == "true"
+    
+    # 배치 요약 설정
+    BATCH_CONCURRENCY: int = int(os.getenv("BATCH_CONCURRENCY", "4"))  # 전체 동시 요약 수
+    BATCH_MODEL_CONCURRENCY: int = int(os.getenv("BATCH_MODEL_CONCURRENCY", "2"))  # 모델별 동시 요약 수
+    
     @classmethod
     def validate(cls) -> None:
         """필수 설정값 검증"""
@@ -49,7 +96,7 @@ class Config:
     @classmethod
     def is_discord_enabled(cls) -> bool:
         """Discord 발송 가능 여부"""
-        return bool(cls.DISCORD_WEBHOOK_URL)
+        return bool(cls.DISCORD_WEBHOOK_URL or cls.DISCORD_WEBHOOKS)
     
     @classmethod
     def is_github_enabled(cls) -> bool:
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""
+GitHub Discussion 색인 모듈
+저장소의 Discussion 제목/URL/createdAt을 SQLite에 미러링해 "이미 게시했는가?"를
+요약 전에 API 호출 없이 확인 (정규화 제목, '[라벨, YY.MM.DD]' 날짜 키 인덱스)
+"""
+
+import os
+import re
+import time
+import sqlite3
+import threading
+from typing import Optional, Dict, Any, List
+
+from .config import Config
+from .output_paths import SMOL_DATE_RE
+from .logger import logger
+
+
+# make_title 형식 제목의 '[라벨, YY.MM.DD]' 접두어
+TITLE_DATE_RE = re.compile(r'^\s*\[\s*([^,\]]+?)\s*,\s*(\d{2})\.(\d{2})\.(\d{2})\s*\]')
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 (공백 정리, 소문자)"""
+    return " ".join(title.split()).lower()
+
+
+def title_date_key(title: str) -> Optional[str]:
+    """제목의 '[AI News, 25.09.01]' 접두어 → 'ai news|25.09.01' (형식이 아니면 None)"""
+    match = TITLE_DATE_RE.match(title)
+    if not match:
+        return None
+    return f"{normalize_title(match.group(1))}|{match.group(2)}.{match.group(3)}.{match.group(4)}"
+
+
+def url_date_key(url: str) -> Optional[str]:
+    """요약 전에 URL만으로 알 수 있는 날짜 키 (SmolAI News만, 그 외는 None)"""
+    match = SMOL_DATE_RE.search(url)
+    if match and 'smol' in url.lower():
+        return f"ai news|{match.group(1)}.{match.group(2)}.{match.group(3)}"
+    return None
+
+
+class DiscussionIndex:
+    """저장소별 Discussion 목록 SQLite 미러 (워터마크 기반 증분 동기화)"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: Config.GH_DISCUSSION_INDEX_PATH)
+        """
+        self.path = path or Config.GH_DISCUSSION_INDEX_PATH
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 생성 (최초 1회 스키마 생성)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS discussions (
+                    url TEXT PRIMARY KEY,
+                    repo TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    title_key TEXT NOT NULL,
+                    date_key TEXT,
+                    category TEXT,
+                    created_at TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_title_key ON discussions(repo, title_key)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_date_key ON discussions(repo, date_key)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS sync_state (
+                    repo TEXT PRIMARY KEY,
+                    watermark TEXT,
+                    synced_at REAL NOT NULL
+                )
+                """
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def add(self, repo: str, nodes: List[Dict[str, Any]]) -> None:
+        """Discussion 노드 저장 (같은 URL은 덮어씀)
+
+        Args:
+            repo: owner/repo
+            nodes: {"title", "url", "createdAt", "category": {"name"}} 리스트
+        """
+        rows = [
+            (
+                node["url"], repo, node["title"], normalize_title(node["title"]), title_date_key(node["title"]),
+                (node.get("category") or {}).get("name"), node["createdAt"],
+            )
+            for node in nodes
+        ]
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO discussions "
+                    "(url, repo, title, title_key, date_key, category, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+    def sync(self, publisher, page_size: int = 100) -> int:
+        """워터마크(마지막으로 본 createdAt) 이후 Discussion만 가져와 미러 갱신
+
+        최신순으로 페이지를 넘기다가 워터마크보다 오래된 항목을 만나면 중단하고,
+        끝까지 성공했을 때만 워터마크를 올림 (중간 실패 시 다음 동기화에서 다시 가져옴)
+
+        Args:
+            publisher: list_discussions_page(first, after)와 repo를 가진 GitHubPublisher
+            page_size: 페이지 크기
+
+        Returns:
+            가져온 Discussion 수 (워터마크와 같은 시각의 항목은 다시 가져와 덮어씀)
+        """
+        repo = publisher.repo
+        watermark = self.watermark(repo)
+        newest = watermark
+        fetched = 0
+        after = None
+        while True:
+            page = publisher.list_discussions_page(first=page_size, after=after)
+            # createdAt은 ISO 8601 UTC 문자열이라 문자열 비교로 시간 순서 판단
+            nodes = [node for node in page["nodes"] if not watermark or node["createdAt"] >= watermark]
+            if nodes:
+                self.add(repo, nodes)
+                fetched += len(nodes)
+                newest = max([newest or ""] + [node["createdAt"] for node in nodes])
+            if len(nodes) < len(page["nodes"]) or not page["pageInfo"]["hasNextPage"]:
+                break
+            after = page["pageInfo"]["endCursor"]
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute(
+                    "INSERT OR REPLACE INTO sync_state (repo, watermark, synced_at) VALUES (?, ?, ?)",
+                    (repo, newest, time.time())
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        logger.info(f"Discussion 색인 동기화: {repo} {fetched}건")
+        return fetched
+
+    def watermark(self, repo: str) -> Optional[str]:
+        """마지막 동기화에서 본 가장 최근 createdAt (동기화 이력이 없으면 None)"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                row = conn.execute("SELECT watermark FROM sync_state WHERE repo = ?", (repo,)).fetchone()
+            finally:
+                conn.close()
+        return row[0] if row else None
+
+    def find(self, repo: str, title: Optional[str] = None, date_key: Optional[str] = None) -> Optional[str]:
+        """이미 게시된 Discussion URL 조회 (정규화 제목 또는 날짜 키, 인덱스 조회)
+
+        Args:
+            repo: owner/repo
+            title: 게시할 제목 (정규화해 비교, 날짜 접두어가 있으면 날짜 키로도 비교)
+            date_key: 'ai news|25.09.01' 형식 키 (url_date_key/title_date_key 결과)
+
+        Returns:
+            기존 Discussion URL (없으면 None)
+        """
+        checks = []
+        if title:
+            checks.append(("title_key", normalize_title(title)))
+            date_key = date_key or title_date_key(title)
+        if date_key:
+            checks.append(("date_key", date_key))
+        if not checks:
+            return None
+
+        with self._lock:
+            conn = self._connect()
+            try:
+                for column, value in checks:
+                    row = conn.execute(
+                        f"SELECT url FROM discussions WHERE repo = ? AND {column} = ? LIMIT 1", (repo, value)
+                    ).fetchone()
+                    if row:
+                        return row[0]
+            finally:
+                conn.close()
+        return None
+
+
+_discussion_index: Optional[DiscussionIndex] = None
+
+
+def get_discussion_index() -> DiscussionIndex:
+    """공유 Discussion 색인 반환 (최초 호출 시 생성)"""
+    global _discussion_index
+    if _discussion_index is None:
+        _discussion_index = DiscussionIndex()
+    return _discussion_index
+
+
+def find_published(publisher, url: str = "", title: str = "") -> Optional[str]:
+    """요약 전 중복 게시 확인: 색인을 증분 동기화한 뒤 제목/URL 날짜 키로 조회
+
+    Args:
+        publisher: 게시 대상 GitHubPublisher
+        url: 뉴스 URL (SmolAI News면 날짜 키로 조회)
+        title: 게시할 제목 (지정된 경우)
+
+    Returns:
+        이미 게시된 Discussion URL (없으면 None)
+    """
+    index = get_discussion_index()
+    try:
+        index.sync(publisher)
+    except Exception as e:
+        # 동기화 실패 시에도 로컬 미러로 확인
+        logger.warning(f"Discussion 색인 동기화 실패, 로컬 색인만 사용: {str(e)}")
+    return index.find(publisher.repo, title=title or None, date_key=url_date_key(url))
+
+
+def record_published(publisher, title: str, url: str) -> None:
+    """방금 게시한 Discussion을 색인에 추가 (다음 동기화 전에도 중복 확인 가능)"""
+    created_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+    try:
+        get_discussion_index().add(
+            publisher.repo, [{"title": title, "url": url, "createdAt": created_at}]
+        )
+    except sqlite3.Error as e:
+        logger.warning(f"Discussion 색인 기록 실패: {str(e)}")
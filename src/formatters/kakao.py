@@ -7,15 +7,20 @@ Discord 마크다운을 카카오톡용 플레인 텍스트로 변환
 import re
 import requests
 from typing import Optional
+from ..config import Config
+from ..tracing import span
 from ..logger import logger
 
 
 class KakaoFormatter:
     """카카오톡용 텍스트 포맷터"""
     
-    def __init__(self):
-        """Initialize Kakao Formatter"""
-        self.tinyurl_api = "http://tinyurl.com/api-create.php"
+    def __init__(self, tinyurl_api: Optional[str] = None):
+        """
+        Args:
+            tinyurl_api: URL 단축 API 주소 (기본값: Config.TINYURL_API_URL)
+        """
+        self.tinyurl_api = tinyurl_api or Config.TINYURL_API_URL
     
     def format(self, markdown_content: str) -> str:
         """마크다운을 카카오톡용 플레인 텍스트로 변환
@@ -115,11 +120,13 @@ class KakaoFormatter:
                 return url
             
             # TinyURL API 호출
-            response = requests.get(
-                self.tinyurl_api,
-                params={'url': url},
-                timeout=5
-            )
+            with span("tinyurl.get", url=url, chars_in=len(url)) as s:
+                response = requests.get(
+                    self.tinyurl_api,
+                    params={'url': url},
+                    timeout=5
+                )
+                s.set(http_status=response.status_code, chars_out=len(response.text.strip()))
             
             if response.status_code == 200:
                 short_url = response.text.strip()
@@ -220,8 +227,9 @@ def save_kakao_text(filepath: str, content: str) -> None:
         content: 저장할 텍스트 내용
     """
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with span("file.save", path=filepath, chars_in=len(content)):
+            with open(filepath, 'w', encoding='utf-8') as f:
+                f.write(content)
         logger.info(f"카카오톡 텍스트 저장 완료: {filepath}")
     except Exception as e:
         logger.error(f"카카오톡 텍스트 저장 실패: {str(e)}")
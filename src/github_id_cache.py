@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+GitHub ID 캐시 모듈
+저장소 ID와 Discussion 카테고리 이름 → ID 매핑을 메모리와 JSON 파일에 보관해
+게시마다 반복되는 repository { discussionCategories } 조회를 생략
+"""
+
+import os
+import json
+import time
+import tempfile
+import threading
+from typing import Optional, Dict, Any
+
+from .config import Config
+from .logger import logger
+
+
+class GitHubIdCache:
+    """(GraphQL 엔드포인트, owner/repo)별 저장소·카테고리 ID 캐시 (TTL, 원자적 파일 기록)"""
+
+    def __init__(self, path: Optional[str] = None, ttl: Optional[int] = None, enabled: bool = True):
+        """
+        Args:
+            path: JSON 파일 경로 (기본값: Config.GH_ID_CACHE_PATH)
+            ttl: 항목 유효 시간(초), 0이면 만료 없음 (기본값: Config.GH_ID_CACHE_TTL)
+            enabled: 캐시 사용 여부
+        """
+        self.path = path or Config.GH_ID_CACHE_PATH
+        self.ttl = Config.GH_ID_CACHE_TTL if ttl is None else ttl
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(endpoint: str, repo: str) -> str:
+        """캐시 키 (엔드포인트가 다르면 ID 공간도 다름)"""
+        return f"{endpoint}#{repo}"
+
+    def get(self, endpoint: str, repo: str) -> Optional[Dict[str, Any]]:
+        """캐시 항목 조회
+
+        Args:
+            endpoint: GraphQL 엔드포인트
+            repo: owner/repo
+
+        Returns:
+            {"repository_id", "categories": {이름: ID}, "fetched_at"} (없거나 만료되면 None)
+        """
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._load().get(self.make_key(endpoint, repo))
+            if entry and self.ttl and time.time() - entry.get("fetched_at", 0) > self.ttl:
+                entry = None
+            if entry:
+                self.hits += 1
+            else:
+                self.misses += 1
+            return entry
+
+    def put(self, endpoint: str, repo: str, repository_id: str, categories: Dict[str, str]) -> None:
+        """조회 결과 저장 (메모리 + 파일)"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._load()[self.make_key(endpoint, repo)] = {
+                "repository_id": repository_id,
+                "categories": dict(categories),
+                "fetched_at": time.time(),
+            }
+            self._save()
+
+    def invalidate(self, endpoint: str, repo: str) -> None:
+        """항목 삭제 (ID가 더 이상 유효하지 않을 때)"""
+        with self._lock:
+            if self._load().pop(self.make_key(endpoint, repo), None) is not None:
+                logger.info(f"GitHub ID 캐시 무효화: {repo}")
+                self._save()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """최초 접근 시 파일에서 읽기 (손상된 파일은 무시)"""
+        if self._entries is None:
+            self._entries = {}
+            if os.path.exists(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        data = json.load(f)
+                    if isinstance(data, dict):
+                        self._entries = data
+                except (OSError, ValueError) as e:
+                    logger.warning(f"GitHub ID 캐시 읽기 실패, 새로 만듦: {str(e)}")
+        return self._entries
+
+    def _save(self) -> None:
+        """임시 파일에 쓴 뒤 교체 (동시 실행에도 깨진 파일을 남기지 않음)"""
+        try:
+            directory = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".github_ids.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning(f"GitHub ID 캐시 저장 실패: {str(e)}")
+
+
+_github_id_cache: Optional[GitHubIdCache] = None
+
+
+def get_github_id_cache() -> GitHubIdCache:
+    """공유 GitHub ID 캐시 반환 (최초 호출 시 생성)"""
+    global _github_id_cache
+    if _github_id_cache is None:
+        _github_id_cache = GitHubIdCache(enabled=Config.GH_ID_CACHE_ENABLED)
+    return _github_id_cache
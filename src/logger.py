@@ -124,28 +124,3 @@ def setup_logger(
 # 기본 로거 인스턴스
 logger = setup_logger()
 
-
-def log_execution_time(func):
-    """함수 실행 시간을 로깅하는 데코레이터"""
-    import time
-    from functools import wraps
-    
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        start_time = time.time()
-        logger.info(f"{func.__name__} 실행 시작")
-        
-        try:
-            result = func(*args, **kwargs)
-            elapsed_time = time.time() - start_time
-            logger.info(f"{func.__name__} 완료 (소요시간: {elapsed_time:.2f}초)")
-            return result
-        except Exception as e:
-            elapsed_time = time.time() - start_time
-            logger.error(
-                f"{func.__name__} 실패 (소요시간: {elapsed_time:.2f}초): {str(e)}",
-                exc_info=True
-            )
-            raise
-    
-    return wrapper
\ No newline at end of file
@@ -4,8 +4,10 @@
 """
 
 import re
-from typing import Optional, List, Tuple
+from functools import lru_cache
+from typing import Optional, List, Tuple, Dict
 
+from .tracing import span
 from .logger import logger
 
 
@@ -13,6 +15,155 @@ from .logger import logger
 HEADER_RE = re.compile(r"^(#{1,6})\s*(.+?)\s*$", re.MULTILINE)
 
 
+class MarkdownSection:
+    """헤더 하나로 시작하는 섹션 (문서 텍스트 오프셋 기반 뷰)"""
+    
+    def __init__(self, text: str, index: int, line: int, level: int, title: str, start: int, body_start: int):
+        """
+        Args:
+            text: 문서 전체 텍스트 (복사하지 않고 참조)
+            index: 문서 내 헤더 순번
+            line: 헤더 라인 인덱스
+            level: 헤더 레벨 (1~6)
+            title: 헤더 제목
+            start: 헤더 라인 시작 오프셋
+            body_start: 헤더 다음 라인 시작 오프셋
+        """
+        self._text = text
+        self.index = index
+        self.line = line
+        self.level = level
+        self.title = title
+        self.start = start
+        self.body_start = body_start
+        # 다음 동일/상위 레벨 헤더 시작 (하위 섹션 포함 범위의 끝)
+        self.end = len(text)
+        self.end_line: Optional[int] = None
+        # 다음 헤더(레벨 무관) 시작 (하위 섹션 제외 본문의 끝)
+        self.next_start = len(text)
+        self.parent: Optional["MarkdownSection"] = None
+        self.children: List["MarkdownSection"] = []
+    
+    @property
+    def text(self) -> str:
+        """헤더와 하위 섹션을 포함한 섹션 전체 텍스트"""
+        return self._text[self.start:self.end].strip()
+    
+    @property
+    def body(self) -> str:
+        """헤더를 제외하고 다음 헤더 전까지의 본문"""
+        return self._text[self.body_start:self.next_start].strip()
+    
+    def __repr__(self) -> str:
+        return f"MarkdownSection({'#' * self.level} {self.title!r}, {self.start}:{self.end})"
+
+
+class MarkdownDocument:
+    """한 번의 스캔으로 만든 마크다운 헤더 트리 인덱스
+    
+    - 헤더마다 시작/본문/끝 오프셋과 섹션 끝을 미리 계산 (스택 기반, 문서 길이에 선형)
+    - 제목 조회는 casefold 딕셔너리로 O(1), 부분 일치 검색은 헤더 수 k에 대해 O(k)
+    - 텍스트를 바꾸지 않으므로 같은 실행의 여러 단계에서 재사용 가능 (parse_markdown 참고)
+    """
+    
+    def __init__(self, markdown: str):
+        """
+        Args:
+            markdown: 마크다운 텍스트
+        """
+        self.text = markdown
+        self.sections: List[MarkdownSection] = []
+        self.roots: List[MarkdownSection] = []
+        self.line_count = 0
+        self.today_summary_section: Optional[MarkdownSection] = None
+        self._by_title: Dict[str, MarkdownSection] = {}
+        
+        open_sections: List[MarkdownSection] = []
+        offset = 0
+        for line_idx, raw_line in enumerate(markdown.splitlines(keepends=True)):
+            self.line_count = line_idx + 1
+            line_start = offset
+            offset += len(raw_line)
+            
+            match = HEADER_RE.match(raw_line.rstrip("\r\n"))
+            if not match:
+                continue
+            
+            level = len(match.group(1))
+            section = MarkdownSection(
+                markdown, len(self.sections), line_idx, level, match.group(2).strip(), line_start, offset
+            )
+            
+            if self.sections:
+                self.sections[-1].next_start = line_start
+            # 동일/상위 레벨 헤더를 만나면 열린 섹션 종료
+            while open_sections and open_sections[-1].level >= level:
+                closed = open_sections.pop()
+                closed.end = line_start
+                closed.end_line = line_idx
+            
+            if open_sections:
+                section.parent = open_sections[-1]
+                open_sections[-1].children.append(section)
+            else:
+                self.roots.append(section)
+            open_sections.append(section)
+            self.sections.append(section)
+            
+            self._by_title.setdefault(section.title.casefold(), section)
+            if self.today_summary_section is None and "오늘" in section.title and "요약" in section.title:
+                self.today_summary_section = section
+        
+        for section in open_sections:
+            section.end_line = self.line_count
+    
+    def find(self, title: str) -> Optional[MarkdownSection]:
+        """제목이 정확히 일치하는 첫 섹션 (대소문자 무시)
+        
+        Args:
+            title: 섹션 제목
+        
+        Returns:
+            MarkdownSection (없으면 None)
+        """
+        return self._by_title.get(title.strip().casefold())
+    
+    def search(self, keyword: str) -> Optional[MarkdownSection]:
+        """제목에 keyword가 포함된 첫 섹션 (대소문자 무시)
+        
+        Args:
+            keyword: 찾을 문자열
+        
+        Returns:
+            MarkdownSection (없으면 None)
+        """
+        section = self.find(keyword)
+        needle = keyword.lower()
+        for candidate in self.sections:
+            if section is not None and candidate.index >= section.index:
+                break
+            if needle in candidate.title.lower():
+                return candidate
+        return section
+    
+    def headers(self) -> List[Tuple[int, int, str]]:
+        """(라인 인덱스, 레벨, 제목) 튜플 리스트"""
+        return [(section.line, section.level, section.title) for section in self.sections]
+
+
+@lru_cache(maxsize=8)
+def parse_markdown(markdown: str) -> MarkdownDocument:
+    """마크다운 인덱스 생성 (같은 텍스트는 캐시된 인덱스 재사용)
+    
+    Args:
+        markdown: 마크다운 텍스트
+    
+    Returns:
+        MarkdownDocument
+    """
+    return MarkdownDocument(markdown)
+
+
 def extract_section(markdown: str, section_title: str) -> str:
     """마크다운에서 특정 섹션 추출
     
@@ -23,25 +174,8 @@ def extract_section(markdown: str, section_title: str) -> str:
     Returns:
         추출된 섹션 텍스트 (없으면 빈 문자열)
     """
-    lines = markdown.splitlines()
-    headers = _find_headers(lines)
-    
-    # 섹션 찾기
-    for idx, (line_idx, level, title) in enumerate(headers):
-        if section_title.lower() in title.lower():
-            # 다음 동일/상위 레벨 헤더까지의 범위 찾기
-            end_idx = len(lines)
-            for j in range(idx + 1, len(headers)):
-                next_line_idx, next_level, _ = headers[j]
-                if next_level <= level:
-                    end_idx = next_line_idx
-                    break
-            
-            # 섹션 추출
-            section_lines = lines[line_idx:end_idx]
-            return "\n".join(section_lines).strip()
-    
-    return ""
+    section = parse_markdown(markdown).search(section_title)
+    return section.text if section else ""
 
 
 def extract_today_summary(markdown: str) -> str:
@@ -53,23 +187,10 @@ def extract_today_summary(markdown: str) -> str:
     Returns:
         '오늘의 요약' 섹션 텍스트 (없으면 빈 문자열)
     """
-    # '오늘'과 '요약'이 모두 포함된 섹션 찾기
-    lines = markdown.splitlines()
-    headers = _find_headers(lines)
-    
-    for idx, (line_idx, level, title) in enumerate(headers):
-        if "오늘" in title and "요약" in title:
-            # 다음 동일/상위 레벨 헤더까지의 범위 찾기
-            end_idx = len(lines)
-            for j in range(idx + 1, len(headers)):
-                next_line_idx, next_level, _ = headers[j]
-                if next_level <= level:
-                    end_idx = next_line_idx
-                    break
-            
-            # 섹션 추출
-            section_lines = lines[line_idx:end_idx]
-            return "\n".join(section_lines).strip()
+    # '오늘'과 '요약'이 모두 포함된 섹션 (인덱스 생성 시 미리 찾아둠)
+    section = parse_markdown(markdown).today_summary_section
+    if section:
+        return section.text
     
     logger.debug("'오늘의 요약' 섹션을 찾을 수 없음")
     return ""
@@ -84,14 +205,7 @@ def _find_headers(lines: List[str]) -> List[Tuple[int, int, str]]:
     Returns:
         (라인 인덱스, 레벨, 제목) 튜플 리스트
     """
-    headers = []
-    for i, line in enumerate(lines):
-        match = HEADER_RE.match(line)
-        if match:
-            level = len(match.group(1))
-            title = match.group(2).strip()
-            headers.append((i, level, title))
-    return headers
+    return parse_markdown("\n".join(lines)).headers()
 
 
 def save_markdown(file_path: str, content: str) -> None:
@@ -102,8 +216,9 @@ def save_markdown(file_path: str, content: str) -> None:
         content: 마크다운 내용
     """
     try:
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content.rstrip() + "\n")
+        with span("file.save", path=file_path, chars_in=len(content)):
+            with open(file_path, "w", encoding="utf-8") as f:
+                f.write(content.rstrip() + "\n")
         logger.info(f"마크다운 파일 저장 완료: {file_path}")
     except Exception as e:
         logger.error(f"마크다운 파일 저장 실패: {str(e)}", exc_info=True)
@@ -165,22 +280,12 @@ def split_by_sections(markdown: str) -> dict[str, str]:
     Returns:
         섹션 제목을 키로 하는 딕셔너리
     """
-    lines = markdown.splitlines()
-    headers = _find_headers(lines)
     sections = {}
-    
-    for idx, (line_idx, level, title) in enumerate(headers):
-        # 다음 헤더까지의 범위 찾기
-        end_idx = len(lines)
-        if idx + 1 < len(headers):
-            end_idx = headers[idx + 1][0]
-        
-        # 섹션 내용 추출 (헤더 제외)
-        content_lines = lines[line_idx + 1:end_idx]
-        content = "\n".join(content_lines).strip()
-        
+    for section in parse_markdown(markdown).sections:
+        # 다음 헤더 전까지의 본문 (헤더 제외)
+        content = section.body
         if content:
-            sections[title] = content
+            sections[section.title] = content
     
     return sections
 
@@ -199,8 +304,7 @@ def add_today_summary(markdown: str, summary: str) -> str:
         return markdown
     
     # 이미 '오늘의 요약'이 있는지 확인
-    existing = extract_today_summary(markdown)
-    if existing:
+    if parse_markdown(markdown).today_summary_section:
         logger.warning("'오늘의 요약' 섹션이 이미 존재함")
         return markdown
     
@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+"""
+Prometheus 메트릭 모듈
+실행/발송/LLM 호출 카운터와 단계 소요 시간·LLM 지연·Discord 청크 수 히스토그램을 모아
+실행 종료 시 node-exporter textfile로 원자적으로 기록하거나 HTTP(/metrics)로 제공
+
+cron처럼 실행마다 프로세스가 새로 뜨는 경우를 위해 textfile은 명령별 파일(news_bot_<command>.prom)에
+기록하고, 카운터/히스토그램은 이전 파일 값에 더해 누적 (rate()/increase()가 의미 있도록)
+"""
+
+import os
+import time
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Dict, List, Tuple, Iterable, Sequence
+
+from .config import Config
+from .logger import logger
+
+
+# Prometheus text exposition format 0.0.4
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 기본 히스토그램 버킷 (초)
+DURATION_BUCKETS = (0.1, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+LLM_LATENCY_BUCKETS = (0.5, 1, 2.5, 5, 10, 20, 40, 60, 120, 300)
+CHUNK_BUCKETS = (1, 2, 3, 4, 6, 8, 12, 16)
+
+LabelValues = Tuple[str, ...]
+
+# 프로세스 시작 시각 (실행 소요 시간 게이지용)
+_PROCESS_STARTED = time.time()
+
+
+def _escape(value: str) -> str:
+    """라벨 값 이스케이프 (역슬래시, 따옴표, 줄바꿈)"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """{a="1",b="2"} 형식 라벨 문자열"""
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    """정수는 소수점 없이, +Inf는 Prometheus 표기로"""
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """라벨별 값을 보관하는 메트릭 공통 부분"""
+
+    TYPE = "untyped"
+
+    # 이전 textfile 값과 합칠 때 더하는지 여부 (카운터/히스토그램은 누적, 게이지는 덮어씀)
+    ACCUMULATE = True
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        """
+        Args:
+            name: 메트릭 이름 (news_bot_ 접두사 권장)
+            help_text: HELP 설명
+            labelnames: 라벨 이름 목록
+        """
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        """라벨 딕셔너리 → 값 튜플 (이름이 정확히 일치해야 함)"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name}: 라벨 {self.labelnames} 필요, 받은 라벨 {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self, previous: Optional[Dict[str, float]] = None) -> List[str]:
+        """HELP/TYPE 헤더와 샘플 줄
+
+        Args:
+            previous: 이전 textfile의 '샘플 이름{라벨}' → 값 (주어지면 합쳐서 출력)
+        """
+        series = self._series()
+        if previous:
+            series = self._merge(series, previous)
+        header = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.TYPE}"]
+        return header + [f"{sample} {_format_value(value)}" for sample, value in series]
+
+    def _merge(self, series: List[Tuple[str, float]], previous: Dict[str, float]) -> List[Tuple[str, float]]:
+        """이전 값과 합치기 (이번 실행에 없는 이전 시계열은 그대로 유지)"""
+        merged = [
+            (sample, value + previous.get(sample, 0) if self.ACCUMULATE else value)
+            for sample, value in series
+        ]
+        current = {sample for sample, _ in series}
+        names = self._sample_names()
+        merged.extend(
+            (sample, value) for sample, value in previous.items()
+            if sample not in current and sample.split("{", 1)[0] in names
+        )
+        return merged
+
+    def _sample_names(self) -> Tuple[str, ...]:
+        """이 메트릭이 출력하는 샘플 이름"""
+        return (self.name,)
+
+    def _series(self) -> List[Tuple[str, float]]:
+        """('샘플 이름{라벨}', 값) 목록"""
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    TYPE = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        """카운터 증가
+
+        Args:
+            amount: 증가량 (0 이상)
+            **labels: 라벨 값
+        """
+        if amount < 0:
+            raise ValueError(f"{self.name}: 카운터는 감소할 수 없습니다")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """현재 값 (기록이 없으면 0)"""
+        with self._lock:
+            return self._values.get(self._key(labels), 0)
+
+    def _series(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [(f"{self.name}{_format_labels(self.labelnames, key)}", value) for key, value in items]
+
+
+class Gauge(Counter):
+    """임의로 설정 가능한 게이지 (마지막 실행 시각 등)"""
+
+    TYPE = "gauge"
+    ACCUMULATE = False
+
+    def set(self, value: float, **labels) -> None:
+        """값 설정"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램"""
+
+    TYPE = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS
+    ):
+        """
+        Args:
+            name: 메트릭 이름
+            help_text: HELP 설명
+            labelnames: 라벨 이름 목록
+            buckets: 버킷 상한 (오름차순, +Inf는 자동 추가)
+        """
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        # 라벨 값 → (버킷별 개수, 합계, 개수)
+        self._values: Dict[LabelValues, Tuple[List[int], float, int]] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        """관측값 기록
+
+        Args:
+            value: 관측값 (초, 개수 등)
+            **labels: 라벨 값
+        """
+        key = self._key(labels)
+        with self._lock:
+            counts, total, count = self._values.get(key, ([0] * len(self.buckets), 0.0, 0))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+                    break
+            self._values[key] = (counts, total + value, count + 1)
+
+    def count(self, **labels) -> int:
+        """관측 횟수"""
+        with self._lock:
+            return self._values.get(self._key(labels), ([], 0.0, 0))[2]
+
+    def _sample_names(self) -> Tuple[str, ...]:
+        return (f"{self.name}_bucket", f"{self.name}_sum", f"{self.name}_count")
+
+    def _series(self) -> List[Tuple[str, float]]:
+        with self._lock:
+            items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._values.items())
+        series = []
+        bucket_labels = self.labelnames + ("le",)
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(bucket_labels, key + (_format_value(bound),))
+                series.append((f"{self.name}_bucket{labels}", cumulative))
+            labels = _format_labels(self.labelnames, key)
+            series.append((f"{self.name}_sum{labels}", round(total, 6)))
+            series.append((f"{self.name}_count{labels}", count))
+        return series
+
+
+class MetricsRegistry:
+    """메트릭 모음 (렌더링, textfile 기록)"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"중복된 메트릭 이름: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Counter:
+        """카운터 등록"""
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """게이지 등록"""
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Iterable[str] = (),
+        buckets: Sequence[float] = DURATION_BUCKETS
+    ) -> Histogram:
+        """히스토그램 등록"""
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self, previous: Optional[Dict[str, float]] = None) -> str:
+        """Prometheus text exposition 형식 문자열
+
+        Args:
+            previous: 합칠 이전 샘플 값 (read_textfile 결과)
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render(previous))
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def read_textfile(path: str) -> Dict[str, float]:
+        """기존 textfile의 '샘플 이름{라벨}' → 값 (없거나 읽을 수 없으면 빈 딕셔너리)"""
+        samples: Dict[str, float] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith("#"):
+                        continue
+                    sample, _, value = line.rpartition(" ")
+                    try:
+                        samples[sample] = float(value)
+                    except ValueError:
+                        continue
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"이전 메트릭 textfile 읽기 실패, 이번 실행 값만 기록: {str(e)}")
+        return samples
+
+    def write_textfile(self, path: str, merge: bool = False) -> str:
+        """node-exporter textfile collector용 파일을 원자적으로 기록
+
+        같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체 (수집 중 잘린 파일을 읽지 않도록)
+
+        Args:
+            path: .prom 파일 경로
+            merge: 기존 파일의 카운터/히스토그램 값에 더해 누적할지 여부
+
+        Returns:
+            기록한 경로
+        """
+        previous = self.read_textfile(path) if merge else None
+        directory = os.path.dirname(path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=".news_bot_", suffix=".prom.tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render(previous))
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return path
+
+
+# 기본 레지스트리와 봇 메트릭
+REGISTRY = MetricsRegistry()
+
+RUNS = REGISTRY.counter(
+    "news_bot_runs_total", "실행 횟수", ["command", "status"]
+)
+LAST_RUN = REGISTRY.gauge(
+    "news_bot_last_run_timestamp_seconds", "마지막 실행 종료 시각 (Unix 초)", ["command", "status"]
+)
+LAST_RUN_SUCCESS = REGISTRY.gauge(
+    "news_bot_last_run_success", "마지막 실행 성공 여부 (1: 성공, 0: 실패)", ["command"]
+)
+LAST_RUN_DURATION = REGISTRY.gauge(
+    "news_bot_last_run_duration_seconds", "마지막 실행 소요 시간 (프로세스 시작부터, 초)", ["command"]
+)
+PUBLISHES = REGISTRY.counter(
+    "news_bot_publish_total", "Publisher별 발송 결과", ["publisher", "status"]
+)
+LLM_CALLS = REGISTRY.counter(
+    "news_bot_llm_calls_total", "LLM 호출 수 (캐시 적중 포함)", ["stage", "model", "status"]
+)
+LLM_CACHE_HITS = REGISTRY.counter(
+    "news_bot_llm_cache_hits_total", "응답 캐시 적중 수", ["stage", "model"]
+)
+STAGE_DURATION = REGISTRY.histogram(
+    "news_bot_stage_duration_seconds", "파이프라인 단계 소요 시간 (재시도 포함)",
+    ["pipeline", "stage", "status"], DURATION_BUCKETS
+)
+LLM_LATENCY = REGISTRY.histogram(
+    "news_bot_llm_latency_seconds", "LLM API 호출 지연 (캐시 적중 제외)",
+    ["stage", "model"], LLM_LATENCY_BUCKETS
+)
+DISCORD_CHUNKS = REGISTRY.histogram(
+    "news_bot_discord_message_chunks", "Discord 발송 1회당 메시지 청크 수", [], CHUNK_BUCKETS
+)
+DISCORD_RATE_LIMITED = REGISTRY.counter(
+    "news_bot_discord_rate_limited_total", "Discord 429 응답 수 (자동 재시도됨)"
+)
+
+
+def textfile_path(command: str, base: Optional[str] = None) -> str:
+    """명령별 textfile 경로 (logs/news_bot.prom → logs/news_bot_main.prom)
+
+    명령마다 파일을 나눠 마지막에 실행된 명령이 다른 명령의 시계열을 지우지 않게 함
+
+    Args:
+        command: 실행 명령 이름
+        base: 기준 경로 (기본값: Config.METRICS_TEXTFILE_PATH)
+
+    Returns:
+        .prom 파일 경로
+    """
+    root, ext = os.path.splitext(base or Config.METRICS_TEXTFILE_PATH)
+    return f"{root}_{command}{ext or '.prom'}"
+
+
+def finish_run(command: str, ok: bool, path: Optional[str] = None) -> Optional[str]:
+    """실행 결과를 기록하고 textfile로 저장 (cron 실행 종료 시 호출)
+
+    카운터/히스토그램은 기존 파일 값에 더해 실행 간 누적하고, 이번 실행 결과는
+    news_bot_last_run_* 게이지로 기록
+
+    Args:
+        command: 실행 명령 이름 (main, publish_news, backfill 등)
+        ok: 성공 여부 (발송 단계 결과까지 반영한 값)
+        path: .prom 경로 (기본값: textfile_path(command), METRICS_TEXTFILE_PATH가 비어 있으면 저장하지 않음)
+
+    Returns:
+        기록한 경로 (비활성화/실패 시 None)
+    """
+    status = "success" if ok else "failure"
+    RUNS.inc(command=command, status=status)
+    LAST_RUN.set(time.time(), command=command, status=status)
+    LAST_RUN_SUCCESS.set(1 if ok else 0, command=command)
+    LAST_RUN_DURATION.set(round(time.time() - _PROCESS_STARTED, 3), command=command)
+
+    if path is None:
+        path = textfile_path(command) if Config.METRICS_TEXTFILE_PATH else ""
+    if not Config.METRICS_ENABLED or not path:
+        return None
+    try:
+        REGISTRY.write_textfile(path, merge=True)
+        logger.info(f"📈 메트릭 저장: {path}")
+        return path
+    except OSError as e:
+        logger.warning(f"메트릭 textfile 기록 실패: {str(e)}")
+        return None
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """GET /metrics 핸들러"""
+
+    registry: MetricsRegistry = REGISTRY
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(f"metrics {self.address_string()} {format % args}")
+
+
+class MetricsServer:
+    """데몬/장시간 실행용 /metrics HTTP 서버 (표준 라이브러리, 백그라운드 스레드)"""
+
+    def __init__(self, port: int, host: str = "0.0.0.0", registry: MetricsRegistry = REGISTRY):
+        """
+        Args:
+            port: 리스닝 포트 (0이면 임의 포트)
+            host: 바인드 주소
+            registry: 제공할 레지스트리
+        """
+        handler = type("MetricsHandler", (_MetricsHandler,), {"registry": registry})
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def port(self) -> int:
+        """실제 리스닝 포트"""
+        return self._server.server_address[1]
+
+    def start(self) -> "MetricsServer":
+        """백그라운드 스레드에서 서비스 시작"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"📈 메트릭 서버 시작: http://{self._server.server_address[0]}:{self.port}/metrics")
+        return self
+
+    def stop(self) -> None:
+        """서버 종료"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+출력 파일 경로 규칙 모듈
+outputs/YYYY/MM/ 아래 소스별 파일명 생성 및 기존 출력 탐색
+"""
+
+import os
+import re
+import glob
+from datetime import datetime
+from typing import Optional
+
+
+# 기본 출력 디렉토리
+OUTPUT_ROOT = "outputs"
+
+SMOL_DATE_RE = re.compile(r'(\d{2})-(\d{2})-(\d{2})')
+WEEKLY_ROBOTICS_ISSUE_RE = re.compile(r'weekly-robotics-(\d+)')
+
+
+def output_filename(url: str, now: Optional[datetime] = None) -> str:
+    """URL에 맞는 출력 파일명 생성
+
+    Args:
+        url: 뉴스 URL
+        now: 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        파일명 (예: smol_ai_news_20250901.md, weekly_robotics_315_20250905.md)
+    """
+    now = now or datetime.now()
+
+    # URL에서 날짜 정보 추출 시도 (SmolAI News의 경우)
+    date_match = SMOL_DATE_RE.search(url)
+    if date_match and 'smol' in url.lower():
+        return f"smol_ai_news_20{date_match.group(1)}{date_match.group(2)}{date_match.group(3)}.md"
+
+    if 'weeklyrobotics' in url.lower():
+        # Weekly Robotics 형식 (issue 번호 추출)
+        issue_match = WEEKLY_ROBOTICS_ISSUE_RE.search(url)
+        if issue_match:
+            return f"weekly_robotics_{issue_match.group(1)}_{now.strftime('%Y%m%d')}.md"
+        return f"weekly_robotics_{now.strftime('%Y%m%d_%H%M%S')}.md"
+
+    # 일반 형식
+    return f"recap_{now.strftime('%Y%m%d_%H%M%S')}.md"
+
+
+def default_output_path(
+    url: str,
+    now: Optional[datetime] = None,
+    root: str = OUTPUT_ROOT
+) -> str:
+    """outputs/YYYY/MM/<파일명> 경로 생성 (디렉토리도 생성)
+
+    Args:
+        url: 뉴스 URL
+        now: 기준 시각 (기본값: 현재 시각)
+        root: 출력 루트 디렉토리
+
+    Returns:
+        마크다운 파일 경로
+    """
+    now = now or datetime.now()
+    output_dir = os.path.join(root, now.strftime("%Y/%m"))
+    os.makedirs(output_dir, exist_ok=True)
+    return os.path.join(output_dir, output_filename(url, now))
+
+
+def find_existing_output(url: str, root: str = OUTPUT_ROOT) -> Optional[str]:
+    """URL에 해당하는 기존 출력 파일 탐색
+
+    실행 날짜에 따라 YYYY/MM 디렉토리가 달라지므로 모든 월 디렉토리를 확인
+
+    Args:
+        url: 뉴스 URL
+        root: 출력 루트 디렉토리
+
+    Returns:
+        기존 파일 경로 (없으면 None)
+    """
+    date_match = SMOL_DATE_RE.search(url)
+    if date_match and 'smol' in url.lower():
+        pattern = f"smol_ai_news_20{date_match.group(1)}{date_match.group(2)}{date_match.group(3)}.md"
+    else:
+        issue_match = WEEKLY_ROBOTICS_ISSUE_RE.search(url)
+        if not issue_match:
+            return None
+        pattern = f"weekly_robotics_{issue_match.group(1)}_[0-9]*[0-9].md"
+
+    matches = sorted(glob.glob(os.path.join(root, "[0-9][0-9][0-9][0-9]", "[0-9][0-9]", pattern)))
+    return matches[0] if matches else None
@@ -0,0 +1,359 @@
+# -*- coding: utf-8 -*-
+"""
+단계 그래프(DAG) 파이프라인 실행 모듈
+선언된 의존성에 따라 독립 단계를 스레드 풀에서 병렬 실행
+"""
+
+import time
+import contextvars
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Optional, Dict, List, Any, Callable, Iterable, Tuple
+
+from .tracing import span
+from .metrics import STAGE_DURATION
+from .logger import logger
+
+
+# 단계 함수: {의존 단계 이름: 출력} 딕셔너리를 받아 출력 반환
+StageFunc = Callable[[Dict[str, Any]], Any]
+
+
+class Stage:
+    """파이프라인 단계 정의"""
+
+    def __init__(
+        self,
+        name: str,
+        func: StageFunc,
+        deps: Optional[Iterable[str]] = None,
+        optional_deps: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+        retries: int = 0,
+        retry_delay: float = 1.0
+    ):
+        """
+        Args:
+            name: 단계 이름
+            func: 실행 함수 (의존 단계 출력 딕셔너리를 인자로 받음)
+            deps: 필수 선행 단계 (하나라도 실패/건너뜀이면 이 단계도 건너뜀)
+            optional_deps: 선택 선행 단계 (완료를 기다리되 실패해도 실행, 출력은 None)
+            timeout: 시도당 제한 시간(초), None이면 제한 없음
+            retries: 예외로 실패했을 때 재시도 횟수 (시간 초과된 시도는 스레드가 계속 실행 중이라 재시도하지 않음)
+            retry_delay: 재시도 전 대기 시간(초), 시도마다 2배 증가
+        """
+        self.name = name
+        self.func = func
+        self.deps = list(deps or [])
+        self.optional_deps = list(optional_deps or [])
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+
+
+class StageResult:
+    """단계 실행 결과"""
+
+    SUCCESS = "success"
+    FAILED = "failed"
+    TIMEOUT = "timeout"
+    SKIPPED = "skipped"
+
+    def __init__(
+        self,
+        name: str,
+        status: str,
+        output: Any = None,
+        error: Optional[str] = None,
+        attempts: int = 0,
+        elapsed: float = 0.0
+    ):
+        """
+        Args:
+            name: 단계 이름
+            status: success / failed / timeout / skipped
+            output: 단계 출력
+            error: 에러 메시지
+            attempts: 시도 횟수
+            elapsed: 소요 시간(초, 재시도 포함)
+        """
+        self.name = name
+        self.status = status
+        self.output = output
+        self.error = error
+        self.attempts = attempts
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        """성공 여부"""
+        return self.status == self.SUCCESS
+
+    def __str__(self) -> str:
+        detail = f" ({self.error})" if self.error else ""
+        return f"[{self.name}] {self.status}{detail}"
+
+
+class PipelineResult:
+    """파이프라인 실행 결과"""
+
+    def __init__(self, results: Dict[str, StageResult], elapsed: float):
+        """
+        Args:
+            results: 단계 이름 → StageResult
+            elapsed: 전체 소요 시간(초)
+        """
+        self.results = results
+        self.elapsed = elapsed
+
+    def __getitem__(self, name: str) -> StageResult:
+        return self.results[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.results
+
+    def ok(self, name: str) -> bool:
+        """단계가 그래프에 있고 성공했는지 여부"""
+        return name in self.results and self.results[name].ok
+
+    def output(self, name: str, default: Any = None) -> Any:
+        """성공한 단계의 출력 (없거나 실패 시 default)"""
+        if self.ok(name):
+            return self.results[name].output
+        return default
+
+    @property
+    def succeeded(self) -> bool:
+        """모든 단계 성공 여부"""
+        return all(result.ok for result in self.results.values())
+
+
+class Pipeline:
+    """의존성 그래프 기반 단계 실행기
+
+    - 선행 단계가 모두 끝난 단계부터 스레드 풀에 제출
+    - 단계별 timeout / retries 적용
+    - 시간 초과된 시도는 결과를 버림 (스레드는 강제 종료할 수 없으므로 백그라운드에서 끝까지 실행됨)
+    - 시간 초과는 재시도하지 않음 (같은 LLM 호출/발송이 두 번 동시에 실행되지 않도록)
+    """
+
+    def __init__(self, name: str = "pipeline", max_workers: int = 4):
+        """
+        Args:
+            name: 파이프라인 이름 (로그용)
+            max_workers: 동시 실행 단계 수
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self._stages: Dict[str, Stage] = {}
+
+    def add(self, name: str, func: StageFunc, **options) -> "Pipeline":
+        """단계 추가
+
+        Args:
+            name: 단계 이름
+            func: 실행 함수
+            **options: Stage 옵션 (deps, optional_deps, timeout, retries, retry_delay)
+
+        Returns:
+            self (체이닝용)
+        """
+        if name in self._stages:
+            raise ValueError(f"중복된 단계 이름: {name}")
+        self._stages[name] = Stage(name, func, **options)
+        return self
+
+    @property
+    def stages(self) -> List[str]:
+        """등록된 단계 이름 목록"""
+        return list(self._stages)
+
+    def _validate(self) -> None:
+        """필수 의존성 존재 여부 및 순환 검사"""
+        for stage in self._stages.values():
+            for dep in stage.deps:
+                if dep not in self._stages:
+                    raise ValueError(f"[{stage.name}] 알 수 없는 선행 단계: {dep}")
+
+        # Kahn 알고리즘으로 순환 검사 (그래프에 없는 선택 의존성은 무시)
+        indegree = {
+            name: len([d for d in stage.deps + stage.optional_deps if d in self._stages])
+            for name, stage in self._stages.items()
+        }
+        queue = [name for name, degree in indegree.items() if degree == 0]
+        visited = 0
+        while queue:
+            current = queue.pop()
+            visited += 1
+            for name, stage in self._stages.items():
+                if current in stage.deps or current in stage.optional_deps:
+                    indegree[name] -= 1
+                    if indegree[name] == 0:
+                        queue.append(name)
+        if visited != len(self._stages):
+            raise ValueError(f"{self.name}: 단계 의존성에 순환이 있습니다")
+
+    def run(self) -> PipelineResult:
+        """파이프라인 실행
+
+        Returns:
+            PipelineResult
+        """
+        self._validate()
+
+        with span(f"pipeline.{self.name}", stages=len(self._stages)) as pipeline_span:
+            result = self._run()
+            pipeline_span.set(succeeded=result.succeeded)
+        return result
+
+    def _run(self) -> PipelineResult:
+        """단계 스케줄링 루프 (pipeline span 안에서 실행)"""
+        started = time.monotonic()
+        results: Dict[str, StageResult] = {}
+        pending = dict(self._stages)
+        # future → (단계, 시도 번호, 마감 시각, 입력, 단계 시작 시각)
+        running: Dict[Future, Tuple[Stage, int, Optional[float], Dict[str, Any], float]] = {}
+
+        logger.info(f"[{self.name}] 파이프라인 시작: {len(pending)}개 단계")
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix=self.name)
+        try:
+            while pending or running:
+                progressed = self._schedule(executor, pending, running, results)
+
+                if not running:
+                    if pending and not progressed:
+                        raise RuntimeError(f"{self.name}: 실행할 수 있는 단계가 없습니다: {list(pending)}")
+                    continue
+
+                deadlines = [deadline for _, _, deadline, _, _ in running.values() if deadline]
+                timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    stage, attempt, _, inputs, stage_started = running.pop(future)
+                    try:
+                        output = future.result()
+                    except Exception as e:
+                        self._retry_or_fail(
+                            executor, running, results, stage, attempt, inputs, stage_started,
+                            StageResult.FAILED, str(e)
+                        )
+                        continue
+
+                    elapsed = time.monotonic() - stage_started
+                    results[stage.name] = StageResult(
+                        stage.name, StageResult.SUCCESS, output=output, attempts=attempt, elapsed=elapsed
+                    )
+                    STAGE_DURATION.observe(elapsed, pipeline=self.name, stage=stage.name, status=StageResult.SUCCESS)
+                    logger.info(f"[{self.name}] ✅ {stage.name} 완료 ({elapsed:.1f}초)")
+
+                # 마감 시각이 지난 시도 처리
+                now = time.monotonic()
+                for future, (stage, attempt, deadline, inputs, stage_started) in list(running.items()):
+                    if deadline and now >= deadline and not future.done():
+                        running.pop(future)
+                        self._retry_or_fail(
+                            executor, running, results, stage, attempt, inputs, stage_started,
+                            StageResult.TIMEOUT, f"{stage.timeout}초 초과", retry=False
+                        )
+        finally:
+            # 시간 초과로 버린 시도가 있어도 기다리지 않음
+            executor.shutdown(wait=False)
+
+        elapsed = time.monotonic() - started
+        logger.info(f"[{self.name}] 파이프라인 완료 ({elapsed:.1f}초)")
+        return PipelineResult(results, elapsed)
+
+    def _schedule(
+        self,
+        executor: ThreadPoolExecutor,
+        pending: Dict[str, Stage],
+        running: Dict,
+        results: Dict[str, StageResult]
+    ) -> bool:
+        """실행 가능한 단계 제출, 선행 단계가 실패한 단계는 건너뜀
+
+        Returns:
+            이번 호출에서 제출하거나 건너뛴 단계가 있으면 True
+        """
+        progressed = False
+        for name, stage in list(pending.items()):
+            waiting = [
+                dep for dep in stage.deps + stage.optional_deps
+                if dep in self._stages and dep not in results
+            ]
+            if waiting:
+                continue
+
+            del pending[name]
+            progressed = True
+
+            failed_deps = [dep for dep in stage.deps if not results[dep].ok]
+            if failed_deps:
+                results[name] = StageResult(
+                    name, StageResult.SKIPPED, error=f"선행 단계 실패: {', '.join(failed_deps)}"
+                )
+                logger.warning(f"[{self.name}] ⏭ {name} 건너뜀 (선행 단계 실패: {', '.join(failed_deps)})")
+                continue
+
+            inputs = {
+                dep: results[dep].output if dep in results and results[dep].ok else None
+                for dep in stage.deps + stage.optional_deps
+            }
+            self._submit(executor, running, stage, 1, inputs, time.monotonic(), delay=0.0)
+        return progressed
+
+    def _submit(
+        self,
+        executor: ThreadPoolExecutor,
+        running: Dict,
+        stage: Stage,
+        attempt: int,
+        inputs: Dict[str, Any],
+        stage_started: float,
+        delay: float
+    ) -> None:
+        """단계 시도 제출"""
+        deadline = time.monotonic() + delay + stage.timeout if stage.timeout else None
+        # 호출한 쪽의 contextvars(LLM 사용량 태그, 현재 span 등)를 워커 스레드로 전달
+        context = contextvars.copy_context()
+        future = executor.submit(context.run, self._attempt, stage, attempt, inputs, delay)
+        running[future] = (stage, attempt, deadline, inputs, stage_started)
+        logger.debug(f"[{self.name}] {stage.name} 시작 (시도 {attempt}/{stage.retries + 1})")
+
+    @staticmethod
+    def _attempt(stage: Stage, attempt: int, inputs: Dict[str, Any], delay: float) -> Any:
+        """재시도 대기 후 단계 함수 실행 (워커 스레드, 시도마다 stage span 기록)"""
+        if delay:
+            time.sleep(delay)
+        with span(f"stage.{stage.name}", attempt=attempt):
+            return stage.func(inputs)
+
+    def _retry_or_fail(
+        self,
+        executor: ThreadPoolExecutor,
+        running: Dict,
+        results: Dict[str, StageResult],
+        stage: Stage,
+        attempt: int,
+        inputs: Dict[str, Any],
+        stage_started: float,
+        status: str,
+        error: str,
+        retry: bool = True
+    ) -> None:
+        """재시도 가능하면 다시 제출, 아니면 실패로 기록 (retry=False면 재시도 횟수와 무관하게 실패)"""
+        if retry and attempt <= stage.retries:
+            delay = stage.retry_delay * (2 ** (attempt - 1))
+            logger.warning(
+                f"[{self.name}] {stage.name} 시도 {attempt} {status}: {error} "
+                f"→ {delay:.1f}초 후 재시도"
+            )
+            self._submit(executor, running, stage, attempt + 1, inputs, stage_started, delay=delay)
+            return
+
+        results[stage.name] = StageResult(
+            stage.name, status, error=error, attempts=attempt,
+            elapsed=time.monotonic() - stage_started
+        )
+        STAGE_DURATION.observe(results[stage.name].elapsed, pipeline=self.name, stage=stage.name, status=status)
+        logger.error(f"[{self.name}] ❌ {stage.name} {status}: {error}")
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+발송 원장 모듈
+(소스 URL, 발송 채널)별 콘텐츠 해시·원격 ID(URL)·시각과 (소스 URL, 단계)별 완료된 단계 출력을 SQLite에 기록해
+같은 이슈를 다시 실행해도 같은 콘텐츠는 다시 발송하지 않고, 끝난 단계는 LLM 호출 없이 이어서 실행
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from typing import Optional, Dict, Any, Callable
+
+from .config import Config
+from .logger import logger
+
+
+def content_hash(content: str, **kwargs) -> str:
+    """발송 콘텐츠 해시 (본문 + 제목/태그 등 결과에 영향을 주는 단순 값 인자)
+
+    Args:
+        content: 발송할 콘텐츠
+        **kwargs: publish에 전달되는 인자 (문자열/숫자/불리언/None만 반영)
+
+    Returns:
+        SHA-256 해시 문자열
+    """
+    options = {
+        key: value for key, value in kwargs.items()
+        if value is None or isinstance(value, (str, int, float, bool))
+    }
+    canonical = json.dumps({"content": content, "options": options}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class PublishLedger:
+    """SQLite 기반 발송 원장 + 단계 출력 체크포인트"""
+
+    def __init__(self, path: Optional[str] = None, enabled: bool = True):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: Config.PUBLISH_LEDGER_PATH)
+            enabled: 원장 사용 여부 (False면 조회 결과 없음, 기록하지 않음)
+        """
+        self.path = path or Config.PUBLISH_LEDGER_PATH
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 생성 (최초 1회 스키마 생성)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS publishes (
+                    source_url TEXT NOT NULL,
+                    publisher TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    remote_id TEXT,
+                    published_at REAL NOT NULL,
+                    PRIMARY KEY (source_url, publisher)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS stage_outputs (
+                    source_url TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    output TEXT NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (source_url, stage)
+                )
+                """
+            )
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def _execute(self, sql: str, params: tuple = (), fetch: bool = False) -> Optional[tuple]:
+        """쿼리 실행 (실패해도 발송 흐름을 막지 않도록 경고만 남김)"""
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    cursor = conn.execute(sql, params)
+                    row = cursor.fetchone() if fetch else None
+                    conn.commit()
+                    return row
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"발송 원장 접근 실패: {str(e)}")
+            return None
+
+    def get(self, source_url: str, publisher: str) -> Optional[Dict[str, Any]]:
+        """마지막 발송 기록 조회
+
+        Args:
+            source_url: 요약 대상 URL
+            publisher: 발송 채널 이름 (GitHub, Discord, Kakao)
+
+        Returns:
+            {"content_hash", "remote_id", "published_at"} (없으면 None)
+        """
+        if not self.enabled:
+            return None
+        row = self._execute(
+            "SELECT content_hash, remote_id, published_at FROM publishes WHERE source_url = ? AND publisher = ?",
+            (source_url, publisher), fetch=True
+        )
+        if not row:
+            return None
+        return {"content_hash": row[0], "remote_id": row[1], "published_at": row[2]}
+
+    def record(self, source_url: str, publisher: str, digest: str, remote_id: Optional[str] = None) -> None:
+        """발송 성공 기록 (같은 소스/채널은 덮어씀)"""
+        if not self.enabled:
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO publishes (source_url, publisher, content_hash, remote_id, published_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (source_url, publisher, digest, remote_id, time.time())
+        )
+
+    def has_source(self, source_url: str) -> bool:
+        """이 소스 URL에 대한 이전 실행 기록(발송 또는 단계 출력)이 있는지 여부"""
+        if not self.enabled:
+            return False
+        row = self._execute(
+            "SELECT 1 FROM publishes WHERE source_url = ? UNION ALL "
+            "SELECT 1 FROM stage_outputs WHERE source_url = ? LIMIT 1",
+            (source_url, source_url), fetch=True
+        )
+        return row is not None
+
+    def stage_output(self, source_url: str, stage: str) -> Optional[Any]:
+        """완료된 단계 출력 조회 (튜플은 튜플로 복원, 없으면 None)"""
+        if not self.enabled:
+            return None
+        row = self._execute(
+            "SELECT output FROM stage_outputs WHERE source_url = ? AND stage = ?",
+            (source_url, stage), fetch=True
+        )
+        if not row:
+            return None
+        stored = json.loads(row[0])
+        return tuple(stored["value"]) if stored["tuple"] else stored["value"]
+
+    def save_stage_output(self, source_url: str, stage: str, output: Any) -> None:
+        """단계 출력 저장 (JSON으로 직렬화할 수 없는 값은 문자열로 저장)"""
+        if not self.enabled or output is None:
+            return
+        payload = json.dumps(
+            {"tuple": isinstance(output, tuple), "value": output}, ensure_ascii=False, default=str
+        )
+        self._execute(
+            "INSERT OR REPLACE INTO stage_outputs (source_url, stage, output, updated_at) VALUES (?, ?, ?, ?)",
+            (source_url, stage, payload, time.time())
+        )
+
+    def clear_stage_outputs(self, source_url: str) -> None:
+        """소스 URL의 단계 출력 삭제 (--refresh로 다시 생성할 때)"""
+        self._execute("DELETE FROM stage_outputs WHERE source_url = ?", (source_url,))
+
+
+_publish_ledger: Optional[PublishLedger] = None
+
+
+def get_publish_ledger() -> PublishLedger:
+    """공유 발송 원장 반환 (최초 호출 시 생성)"""
+    global _publish_ledger
+    if _publish_ledger is None:
+        _publish_ledger = PublishLedger(enabled=Config.PUBLISH_LEDGER_ENABLED)
+    return _publish_ledger
+
+
+def configure_publish_ledger(enabled: bool = True) -> PublishLedger:
+    """CLI 옵션에 맞춰 공유 발송 원장 설정
+
+    Args:
+        enabled: 원장 사용 여부 (--force 시 False)
+
+    Returns:
+        설정된 원장 인스턴스
+    """
+    ledger = get_publish_ledger()
+    ledger.enabled = enabled and Config.PUBLISH_LEDGER_ENABLED
+    return ledger
+
+
+def resumable(
+    stage: str,
+    func: Callable[[Dict[str, Any]], Any],
+    source_url: str,
+    validate: Optional[Callable[[Any], bool]] = None
+) -> Callable[[Dict[str, Any]], Any]:
+    """이전 실행에서 완료된 출력이 원장에 있으면 그대로 돌려주는 단계 함수로 감싸기
+
+    Args:
+        stage: 단계 이름
+        func: 원래 단계 함수
+        source_url: 요약 대상 URL
+        validate: 출력 검증 함수 (False면 이번 실행에만 쓰고 저장하지 않아 재시도 시 다시 생성)
+
+    Returns:
+        Pipeline 단계 함수
+    """
+    def run(inputs: Dict[str, Any]) -> Any:
+        ledger = get_publish_ledger()
+        output = ledger.stage_output(source_url, stage)
+        if output is not None:
+            logger.info(f"♻️ 이전 실행의 '{stage}' 단계 출력 재사용")
+            return output
+        output = func(inputs)
+        if validate is not None and not validate(output):
+            logger.warning(f"'{stage}' 단계 출력이 실패 결과라 원장에 저장하지 않음")
+            return output
+        ledger.save_stage_output(source_url, stage, output)
+        return output
+
+    return run
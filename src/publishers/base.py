@@ -6,6 +6,9 @@ Publisher 베이스 클래스
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
 
+from ..metrics import PUBLISHES
+from ..publish_ledger import get_publish_ledger, content_hash
+from ..usage_ledger import current_source_url
 from ..logger import logger
 
 
@@ -18,6 +21,9 @@ class BasePublisher(ABC):
             name: Publisher 이름
         """
         self.name = name
+        
+        # 마지막 발송의 원격 ID/URL (발송 원장에 기록, 없으면 None)
+        self.remote_id: Optional[str] = None
         logger.debug(f"{self.name} Publisher 초기화")
     
     @abstractmethod
@@ -68,6 +74,9 @@ class BasePublisher(ABC):
     def safe_publish(self, content: str, **kwargs) -> bool:
         """에러 처리가 포함된 안전한 발송
         
+        llm_context(source_url=...) 안에서 호출되면 발송 원장을 확인해 같은 소스 URL에 같은 콘텐츠를
+        이미 보낸 경우 다시 보내지 않고 성공으로 처리 (원격 ID는 원장 값으로 복원)
+        
         Args:
             content: 발송할 콘텐츠
             **kwargs: 추가 파라미터
@@ -79,23 +88,39 @@ class BasePublisher(ABC):
             # 설정 검증
             if not self.validate_config():
                 logger.error(f"{self.name}: 설정이 유효하지 않음")
+                PUBLISHES.inc(publisher=self.name, status="failure")
                 return False
             
             # 전처리
             processed_content = self.pre_publish(content)
             
+            # 발송 원장 확인 (재실행 시 중복 발송 방지)
+            source_url = current_source_url()
+            ledger = get_publish_ledger() if source_url else None
+            digest = content_hash(processed_content, **kwargs)
+            entry = ledger.get(source_url, self.name) if ledger else None
+            if entry and entry["content_hash"] == digest:
+                self.remote_id = entry["remote_id"]
+                logger.info(f"{self.name}: 같은 콘텐츠를 이미 발송함, 건너뜀 ({entry['remote_id'] or source_url})")
+                PUBLISHES.inc(publisher=self.name, status="skipped")
+                return True
+            
             # 발송
             logger.info(f"{self.name} 발송 시작...")
             success = self.publish(processed_content, **kwargs)
+            if success and ledger:
+                ledger.record(source_url, self.name, digest, self.remote_id)
             
             # 후처리
             self.post_publish(success, **kwargs)
+            PUBLISHES.inc(publisher=self.name, status="success" if success else "failure")
             
             return success
             
         except Exception as e:
             logger.error(f"{self.name} 발송 중 오류: {str(e)}", exc_info=True)
             self.post_publish(False, error=str(e))
+            PUBLISHES.inc(publisher=self.name, status="failure")
             return False
 
 
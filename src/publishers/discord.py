@@ -4,147 +4,365 @@ Discord 웹훅 Publisher
 """
 
 import re
+import json
+import threading
+import contextvars
 import requests
-from typing import Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, List, Tuple, Any
+from urllib.parse import urlsplit
 
-from .base import BasePublisher
+from .base import BasePublisher, PublisherResult
+from .discord_sender import get_sender
 from ..config import Config
+from ..tracing import span, safe_url
+from ..markdown_utils import parse_markdown
+from ..utils.message_splitter import MarkdownMessageSplitter
+from ..metrics import DISCORD_CHUNKS
+from ..publish_ledger import get_publish_ledger, content_hash
+from ..usage_ledger import current_source_url
 from ..logger import logger
 
 
+class DiscordDestination:
+    """Discord 발송 대상 (웹훅별 태그·봇 이름·콘텐츠 버전)"""
+    
+    VARIANTS = ("compact", "full")
+    MODES = ("text", "embeds")
+    
+    def __init__(
+        self,
+        webhook_url: str,
+        name: Optional[str] = None,
+        tag: Optional[str] = None,
+        username: Optional[str] = None,
+        variant: str = "compact",
+        mode: Optional[str] = None
+    ):
+        """
+        Args:
+            webhook_url: Discord 웹훅 URL
+            name: 결과/로그에 쓸 이름 (기본: 호스트/웹훅 ID, 토큰은 노출하지 않음)
+            tag: 첫 청크 태그 (None이면 publish 호출의 tag 사용, ""이면 태그 없음)
+            username: 봇 이름 (None이면 publish 호출의 username 사용)
+            variant: 콘텐츠 버전 (compact: 기본 콘텐츠, full: full_content)
+            mode: 발송 방식 (text: 일반 메시지, embeds: 섹션별 임베드, None이면 publish 호출의 mode 사용)
+        """
+        if variant not in self.VARIANTS:
+            raise ValueError(f"알 수 없는 Discord 콘텐츠 버전: {variant}")
+        if mode is not None and mode not in self.MODES:
+            raise ValueError(f"알 수 없는 Discord 발송 방식: {mode}")
+        self.webhook_url = webhook_url
+        self.tag = tag
+        self.username = username
+        self.variant = variant
+        self.mode = mode
+        
+        parts = urlsplit(webhook_url)
+        segments = [segment for segment in parts.path.split("/") if segment]
+        self.name = name or (f"{parts.netloc}/{segments[-2]}" if len(segments) >= 2 else parts.netloc)
+    
+    @property
+    def host(self) -> str:
+        return urlsplit(self.webhook_url).netloc
+    
+    @classmethod
+    def from_config(cls) -> List["DiscordDestination"]:
+        """DISCORD_WEBHOOKS(JSON 목록)가 있으면 그 목록, 없으면 DISCORD_WEBHOOK_URL 하나
+        
+        Raises:
+            ValueError: DISCORD_WEBHOOKS 형식 오류
+        """
+        if not Config.DISCORD_WEBHOOKS:
+            return [cls(Config.DISCORD_WEBHOOK_URL)] if Config.DISCORD_WEBHOOK_URL else []
+        
+        entries = json.loads(Config.DISCORD_WEBHOOKS)
+        if not isinstance(entries, list):
+            raise ValueError("DISCORD_WEBHOOKS는 JSON 목록이어야 함")
+        destinations = []
+        for entry in entries:
+            if isinstance(entry, str):
+                destinations.append(cls(entry))
+            else:
+                destinations.append(cls(
+                    entry["url"], name=entry.get("name"), tag=entry.get("tag"),
+                    username=entry.get("username"), variant=entry.get("variant", "compact"),
+                    mode=entry.get("mode")
+                ))
+        return destinations
+
+
 class DiscordPublisher(BasePublisher):
-    """Discord 웹훅으로 메시지를 발송하는 Publisher"""
+    """Discord 웹훅으로 메시지를 발송하는 Publisher (여러 웹훅 동시 발송)"""
+    
+    MAX_MESSAGE_LENGTH = 2000  # Discord 메시지 최대 길이 (태그·페이지 번호 포함)
     
-    MAX_MESSAGE_LENGTH = 1900  # Discord 메시지 최대 길이 (안전 마진)
+    # 임베드 제한 (메시지당 임베드 10개, 임베드 글자 합계 6000자)
+    EMBED_TITLE_LIMIT = 256
+    EMBED_DESCRIPTION_LIMIT = 4096
+    EMBEDS_PER_MESSAGE = 10
+    EMBED_MESSAGE_BUDGET = 6000
+    EMBED_COLOR = 0x5865F2
     
-    def __init__(self, webhook_url: Optional[str] = None):
+    def __init__(
+        self,
+        webhook_url: Optional[str] = None,
+        destinations: Optional[List[DiscordDestination]] = None
+    ):
         """
         Args:
-            webhook_url: Discord 웹훅 URL (기본값: Config.DISCORD_WEBHOOK_URL)
+            webhook_url: Discord 웹훅 URL (지정 시 이 웹훅 하나로만 발송)
+            destinations: 발송 대상 목록 (기본값: DiscordDestination.from_config())
         """
         super().__init__("Discord")
-        self.webhook_url = webhook_url or Config.DISCORD_WEBHOOK_URL
+        if destinations is None:
+            try:
+                destinations = [DiscordDestination(webhook_url)] if webhook_url else DiscordDestination.from_config()
+            except (ValueError, KeyError, TypeError) as e:
+                logger.error(f"DISCORD_WEBHOOKS 설정 오류: {str(e)}")
+                destinations = []
+        self.destinations = destinations
+        self.webhook_url = destinations[0].webhook_url if destinations else None
+        self.last_results: List[PublisherResult] = []
     
     def validate_config(self) -> bool:
         """설정 유효성 검사"""
-        return bool(self.webhook_url)
+        return bool(self.destinations)
     
     def publish(self, content: str, **kwargs) -> bool:
-        """Discord로 메시지 발송
+        """Discord로 메시지 발송 (모든 대상에 동시 발송, 결과는 last_results에 대상별 기록)
+        
+        llm_context(source_url=...) 안에서는 대상별('Discord:<이름>')로 보낸 청크 수를 발송 원장에 기록해
+        일부 대상이나 중간 청크에서 실패한 실행을 다시 돌려도 이미 받은 대상/청크에는 다시 보내지 않음
         
         Args:
-            content: 발송할 콘텐츠
+            content: 발송할 콘텐츠 (compact 버전)
             tag: 메시지 태그 (선택)
             username: 봇 이름 (선택)
+            full_content: full 버전 대상에 보낼 콘텐츠 (선택, 없으면 content)
+            mode: 발송 방식 (text/embeds, 기본값: Config.DISCORD_DELIVERY_MODE)
         
         Returns:
-            발송 성공 여부
+            모든 대상 발송 성공 여부
         """
-        if not self.webhook_url:
+        if not self.destinations:
             logger.error("Discord 웹훅 URL이 설정되지 않음")
             return False
         
         tag = kwargs.get('tag', '')
         username = kwargs.get('username', 'News Bot')
+        mode = kwargs.get('mode') or Config.DISCORD_DELIVERY_MODE
+        variants = {"compact": content, "full": kwargs.get('full_content') or content}
         
-        # 링크 임베드 비활성화 처리
-        content = self._disable_link_embeds(content)
-        
-        # 긴 메시지를 청크로 분할
-        chunks = self._split_message(content, tag)
-        
-        try:
-            for idx, chunk in enumerate(chunks, 1):
-                # 여러 청크인 경우 페이지 번호 추가
-                if len(chunks) > 1:
-                    chunk_suffix = f"\n\n({idx}/{len(chunks)})"
-                    if len(chunk) + len(chunk_suffix) <= self.MAX_MESSAGE_LENGTH:
-                        chunk += chunk_suffix
-                
-                # 첫 번째 청크에만 태그 추가
-                if idx == 1 and tag:
-                    message = f"{tag}\n{chunk}"
+        # 링크 임베드 비활성화·분할은 (버전, 태그, 방식) 조합별로 한 번만 계산해 공유
+        rendered: Dict[Tuple[str, str, str], List[Dict[str, Any]]] = {}
+        jobs = []
+        for destination in self.destinations:
+            destination_tag = tag if destination.tag is None else destination.tag
+            key = (destination.variant, destination_tag, destination.mode or mode)
+            if key not in rendered:
+                if key[2] == "embeds":
+                    rendered[key] = self._build_embed_payloads(variants[destination.variant], destination_tag)
                 else:
-                    message = chunk
-                
-                data = {
-                    "content": message,
-                    "username": username
-                }
-                
-                response = requests.post(
-                    self.webhook_url,
-                    json=data,
-                    timeout=30
+                    rendered[key] = [
+                        {"content": message}
+                        for message in self._build_messages(variants[destination.variant], destination_tag)
+                    ]
+                DISCORD_CHUNKS.observe(len(rendered[key]))
+            jobs.append((destination, rendered[key], destination.username or username))
+        
+        if len(jobs) == 1:
+            self.last_results = [self._publish_to(*jobs[0])]
+        else:
+            # 대상별 동시 발송, 같은 호스트는 DISCORD_HOST_CONCURRENCY개까지만
+            host_limits: Dict[str, threading.BoundedSemaphore] = {}
+            for destination, _, _ in jobs:
+                host_limits.setdefault(
+                    destination.host, threading.BoundedSemaphore(max(1, Config.DISCORD_HOST_CONCURRENCY))
                 )
-                response.raise_for_status()
-                
-                logger.debug(f"Discord 청크 {idx}/{len(chunks)} 발송 완료")
             
-            return True
+            def run(job):
+                with host_limits[job[0].host]:
+                    return self._publish_to(*job)
+            
+            with ThreadPoolExecutor(max_workers=len(jobs), thread_name_prefix="discord") as executor:
+                futures = [executor.submit(contextvars.copy_context().run, run, job) for job in jobs]
+                self.last_results = [future.result() for future in futures]
+        
+        for result in self.last_results:
+            logger.info(str(result))
+        return all(result.success for result in self.last_results)
+    
+    def _publish_to(
+        self, destination: DiscordDestination, payloads: List[Dict[str, Any]], username: str
+    ) -> PublisherResult:
+        """대상 하나에 메시지를 순서대로 발송
+        
+        같은 웹훅 발송기를 잠가 청크 사이에 다른 발송이 끼어들지 않게 함 (429는 발송기가 재시도)
+        
+        Args:
+            destination: 발송 대상
+            payloads: 발송할 웹훅 본문 (content 또는 embeds, username 제외)
+            username: 봇 이름
+        
+        Returns:
+            대상별 발송 결과
+        """
+        publisher_name = f"Discord:{destination.name}"
+        
+        # 대상별 발송 원장: 같은 콘텐츠를 이미 보낸 청크는 건너뛰고 이어서 발송
+        source_url = current_source_url()
+        ledger = get_publish_ledger() if source_url else None
+        digest = content_hash(json.dumps(payloads, ensure_ascii=False, sort_keys=True), username=username)
+        done = self._sent_chunks(ledger.get(source_url, publisher_name) if ledger else None, digest)
+        if done >= len(payloads):
+            logger.info(f"Discord[{destination.name}] 같은 콘텐츠를 이미 발송함, 건너뜀")
+            return PublisherResult(
+                publisher_name, True, "이미 발송함, 건너뜀", {"variant": destination.variant, "chunks": 0, "skipped": done}
+            )
+        if done:
+            logger.info(f"Discord[{destination.name}] 이전 실행에서 {done}개 청크 발송됨, 이어서 발송")
+        
+        sender = get_sender(destination.webhook_url)
+        sent = done
+        try:
+            with sender.lock:
+                for idx, payload in enumerate(payloads[done:], done + 1):
+                    data = dict(payload, username=username)
+                    chars = len(payload.get("content", "")) + sum(
+                        len(embed.get("title", "")) + len(embed.get("description", ""))
+                        for embed in payload.get("embeds", [])
+                    )
+                    with span(
+                        "discord.post", url=safe_url(destination.webhook_url), destination=destination.name,
+                        chunk=idx, chars_in=chars, embeds=len(payload.get("embeds", []))
+                    ) as s:
+                        response = sender.send(data)
+                        s.set(http_status=response.status_code)
+                    sent += 1
+                    if ledger:
+                        ledger.record(source_url, publisher_name, digest, f"{sent}/{len(payloads)}")
+                    logger.debug(f"Discord[{destination.name}] 청크 {idx}/{len(payloads)} 발송 완료")
+            data = {"variant": destination.variant, "chunks": sent - done}
+            if done:
+                data["skipped"] = done
+            return PublisherResult(publisher_name, True, f"{sent - done}개 청크 발송 완료", data)
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Discord 발송 실패: {str(e)}")
-            return False
+            logger.error(f"Discord[{destination.name}] 발송 실패: {str(e)}")
+            message = f"발송 실패: {str(e)}"
         except Exception as e:
-            logger.error(f"Discord 발송 중 예상치 못한 오류: {str(e)}", exc_info=True)
-            return False
+            logger.error(f"Discord[{destination.name}] 발송 중 예상치 못한 오류: {str(e)}", exc_info=True)
+            message = f"발송 중 예상치 못한 오류: {str(e)}"
+        return PublisherResult(
+            publisher_name, False, message,
+            {"variant": destination.variant, "chunks": sent, "total_chunks": len(payloads)}
+        )
+    
+    @staticmethod
+    def _sent_chunks(entry: Optional[Dict[str, Any]], digest: str) -> int:
+        """발송 원장 기록에서 이미 보낸 청크 수 (콘텐츠가 다르거나 기록이 없으면 0)
+        
+        대상별 기록의 remote_id는 웹훅 응답에 메시지 ID가 없어 '보낸 청크 수/전체 청크 수' 형식으로 저장
+        """
+        if not entry or entry["content_hash"] != digest or not entry["remote_id"]:
+            return 0
+        try:
+            return int(entry["remote_id"].split("/", 1)[0])
+        except ValueError:
+            return 0
+    
+    def _build_messages(self, content: str, tag: str) -> List[str]:
+        """링크 임베드 비활성화 → 메시지 분할 (태그·페이지 번호 포함)
+        
+        Args:
+            content: 원본 콘텐츠
+            tag: 첫 메시지에 붙일 태그
+        
+        Returns:
+            발송할 메시지 리스트
+        """
+        return self._split_message(self._disable_link_embeds(content), tag)
+    
+    def _build_embed_payloads(self, content: str, tag: str) -> List[Dict[str, Any]]:
+        """## 섹션마다 임베드를 만들고 메시지당 임베드 10개·6000자 안에서 최소 개수로 묶기
+        
+        - 첫 ## 앞의 머리말(# 제목 등)은 제목 없는 임베드
+        - 4096자를 넘는 섹션은 블록 경계에서 나눠 "(계속)" 임베드로 이어감
+        - 태그는 첫 메시지의 content로 발송
+        
+        Args:
+            content: 원본 마크다운
+            tag: 첫 메시지 content
+        
+        Returns:
+            웹훅 본문 리스트
+        """
+        document = parse_markdown(content)
+        starts = [section for section in document.sections if section.level <= 2]
+        segments = []
+        if not starts or starts[0].start > 0:
+            segments.append(("", content[:starts[0].start] if starts else content))
+        for index, section in enumerate(starts):
+            end = starts[index + 1].start if index + 1 < len(starts) else len(content)
+            if section.level == 2:
+                segments.append((section.title, content[section.body_start:end]))
+            else:
+                segments.append(("", content[section.start:end]))
+        
+        splitter = MarkdownMessageSplitter(self.EMBED_DESCRIPTION_LIMIT)
+        embeds = []
+        for title, body in segments:
+            body = body.strip()
+            if not title and not body:
+                continue
+            for part, description in enumerate(splitter.chunks(body) if body else [""]):
+                part_title = title if part == 0 or not title else f"{title} (계속)"
+                embeds.append(self._build_embed(part_title, description, self.EMBED_COLOR))
+        
+        # 순서를 유지하며 앞에서부터 채우기 (메시지 수 최소)
+        payloads: List[Dict[str, Any]] = []
+        used = 0
+        for embed in embeds:
+            size = len(embed.get("title", "")) + len(embed.get("description", ""))
+            if (not payloads or len(payloads[-1]["embeds"]) >= self.EMBEDS_PER_MESSAGE
+                    or used + size > self.EMBED_MESSAGE_BUDGET):
+                payloads.append({"embeds": []})
+                used = 0
+            payloads[-1]["embeds"].append(embed)
+            used += size
+        if not payloads:
+            payloads.append({"embeds": []})
+        if tag:
+            payloads[0] = {"content": tag[:self.MAX_MESSAGE_LENGTH], **payloads[0]}
+        return payloads
+    
+    def _build_embed(self, title: str, description: str, color: int, **fields) -> Dict[str, Any]:
+        """임베드 객체 (제목/설명은 Discord 제한 길이로 자름)"""
+        embed: Dict[str, Any] = {"color": color}
+        if title:
+            if len(title) > self.EMBED_TITLE_LIMIT:
+                title = title[:self.EMBED_TITLE_LIMIT - 1] + "…"
+            embed["title"] = title
+        if description:
+            embed["description"] = description[:self.EMBED_DESCRIPTION_LIMIT]
+        if fields:
+            embed["fields"] = [{"name": name, "value": str(value), "inline": True} for name, value in fields.items()]
+        return embed
     
     def _split_message(self, content: str, tag: str = '') -> List[str]:
         """긴 메시지를 Discord 제한에 맞게 분할
         
+        섹션/불릿 경계에서 최소 개수로 나누며 링크와 코드 펜스는 자르지 않음 (MarkdownMessageSplitter)
+        
         Args:
             content: 원본 메시지
             tag: 첫 청크에 추가할 태그
         
         Returns:
-            분할된 메시지 리스트
+            태그와 "(i/n)" 페이지 번호가 붙은 메시지 리스트
         """
-        # 태그가 있으면 첫 청크 크기 조정
-        first_chunk_max = self.MAX_MESSAGE_LENGTH
-        if tag:
-            first_chunk_max -= len(tag) - 1  # \n 포함
-        
-        if len(content) <= first_chunk_max:
-            return [content]
-        
-        chunks = []
-        lines = content.split('\n')
-        current_chunk = []
-        current_length = 0
-        
-        for line in lines:
-            # 단일 라인이 너무 긴 경우
-            if len(line) > self.MAX_MESSAGE_LENGTH:
-                # 현재 청크 저장
-                if current_chunk:
-                    chunks.append('\n'.join(current_chunk))
-                    current_chunk = []
-                    current_length = 0
-                
-                # 긴 라인을 강제로 분할
-                for i in range(0, len(line), self.MAX_MESSAGE_LENGTH):
-                    chunks.append(line[i:i+self.MAX_MESSAGE_LENGTH])
-                continue
-            
-            # 현재 청크에 추가 가능한지 확인
-            line_length = len(line) + 1  # \n 포함
-            max_length = first_chunk_max if not chunks else self.MAX_MESSAGE_LENGTH
-            
-            if current_length + line_length > max_length:
-                # 현재 청크 저장
-                chunks.append('\n'.join(current_chunk))
-                current_chunk = [line]
-                current_length = len(line)
-            else:
-                current_chunk.append(line)
-                current_length += line_length
-        
-        # 마지막 청크 저장
-        if current_chunk:
-            chunks.append('\n'.join(current_chunk))
-        
-        return chunks or [content[:self.MAX_MESSAGE_LENGTH]]
+        return MarkdownMessageSplitter(self.MAX_MESSAGE_LENGTH).split(content, tag)
     
     def _disable_link_embeds(self, content: str) -> str:
         """마크다운 링크를 Discord 임베드가 비활성화되도록 변환
@@ -193,19 +411,7 @@ class DiscordPublisher(BasePublisher):
         if not self.webhook_url:
             return False
         
-        embed = {
-            "title": title,
-            "description": description,
-            "color": color,
-            "fields": []
-        }
-        
-        for name, value in fields.items():
-            embed["fields"].append({
-                "name": name,
-                "value": str(value),
-                "inline": True
-            })
+        embed = self._build_embed(title, description, color, **fields)
         
         data = {
             "embeds": [embed],
@@ -213,12 +419,9 @@ class DiscordPublisher(BasePublisher):
         }
         
         try:
-            response = requests.post(
-                self.webhook_url,
-                json=data,
-                timeout=30
-            )
-            response.raise_for_status()
+            with span("discord.post_embed", url=safe_url(self.webhook_url)) as s:
+                response = get_sender(self.webhook_url).send(data)
+                s.set(http_status=response.status_code)
             return True
         except Exception as e:
             logger.error(f"Discord Embed 발송 실패: {str(e)}")
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Discord 웹훅 발송기
+웹훅별 keep-alive 세션과 응답 헤더(X-RateLimit-Remaining/Reset-After) 기반 토큰 버킷으로
+한도 안에서 최대한 빠르게 보내고, 429는 retry_after만큼 기다려 자동 재시도
+"""
+
+import time
+import threading
+import requests
+from typing import Optional, Dict, Any
+
+from ..config import Config
+from ..metrics import DISCORD_RATE_LIMITED
+from ..logger import logger
+
+
+class DiscordWebhookSender:
+    """웹훅 하나에 대한 순차 발송기 (스레드 안전, 호출 순서 보장)"""
+
+    RETRY_STATUS = {500, 502, 503, 504}
+
+    def __init__(
+        self,
+        webhook_url: str,
+        session: Optional[requests.Session] = None,
+        max_retries: Optional[int] = None,
+        timeout: float = 30
+    ):
+        """
+        Args:
+            webhook_url: Discord 웹훅 URL
+            session: 재사용할 HTTP 세션 (기본: 새 keep-alive 세션)
+            max_retries: 요청당 최대 재시도 횟수 (기본값: Config.DISCORD_MAX_RETRIES)
+            timeout: 요청 타임아웃(초)
+        """
+        self.webhook_url = webhook_url
+        self.session = session or requests.Session()
+        self.max_retries = Config.DISCORD_MAX_RETRIES if max_retries is None else max_retries
+        self.timeout = timeout
+
+        # 토큰 버킷 상태 (응답 헤더로 갱신, None이면 아직 모름)
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+
+        # 여러 메시지를 다른 스레드의 발송이 끼어들지 않게 보내려면 with sender.lock: 안에서 send 호출
+        self.lock = threading.RLock()
+
+    def send(self, payload: Dict[str, Any]) -> requests.Response:
+        """메시지 하나 발송 (레이트 리밋 대기 및 429/5xx 재시도 포함)
+
+        Args:
+            payload: 웹훅 JSON 본문
+
+        Returns:
+            성공 응답
+
+        Raises:
+            requests.exceptions.RequestException: 재시도 후에도 실패한 경우
+        """
+        with self.lock:
+            attempt = 0
+            while True:
+                self._wait_for_token()
+                try:
+                    response = self.session.post(self.webhook_url, json=payload, timeout=self.timeout)
+                except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                    if attempt >= self.max_retries:
+                        raise
+                    reason, delay = f"연결 실패({type(e).__name__})", self._backoff(attempt)
+                else:
+                    self._update_bucket(response)
+                    if response.status_code == 429:
+                        DISCORD_RATE_LIMITED.inc()
+                        reason, delay = "레이트 리밋", self._retry_after(response)
+                    elif response.status_code in self.RETRY_STATUS:
+                        reason, delay = f"서버 오류 {response.status_code}", self._backoff(attempt)
+                    else:
+                        response.raise_for_status()
+                        return response
+                    if attempt >= self.max_retries:
+                        response.raise_for_status()
+
+                attempt += 1
+                logger.warning(f"Discord {reason}, {delay:.2f}초 후 재시도 ({attempt}/{self.max_retries})")
+                time.sleep(delay)
+
+    def _wait_for_token(self) -> None:
+        """남은 요청 수가 0이면 버킷이 리셋될 때까지 대기"""
+        if self.remaining is not None and self.remaining <= 0:
+            delay = self.reset_at - time.monotonic()
+            if delay > 0:
+                logger.debug(f"Discord 레이트 리밋 버킷 소진, {delay:.2f}초 대기")
+                time.sleep(delay)
+            self.remaining = None
+
+    def _update_bucket(self, response: requests.Response) -> None:
+        """X-RateLimit-Remaining / X-RateLimit-Reset-After 헤더로 버킷 갱신"""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        reset_after = response.headers.get("X-RateLimit-Reset-After")
+        try:
+            if remaining is not None:
+                self.remaining = int(remaining)
+            if reset_after is not None:
+                self.reset_at = time.monotonic() + float(reset_after)
+        except ValueError:
+            self.remaining = None
+
+    @staticmethod
+    def _retry_after(response: requests.Response) -> float:
+        """429 응답의 대기 시간(초): 본문 retry_after → Retry-After 헤더 → 1초"""
+        try:
+            return max(0.0, float(response.json()["retry_after"]))
+        except (ValueError, KeyError, TypeError):
+            pass
+        try:
+            return max(0.0, float(response.headers.get("Retry-After", "1")))
+        except ValueError:
+            return 1.0
+
+    @staticmethod
+    def _backoff(attempt: int) -> float:
+        return min(0.5 * 2 ** attempt, 8.0)
+
+
+_senders: Dict[str, DiscordWebhookSender] = {}
+_senders_lock = threading.Lock()
+
+
+def get_sender(webhook_url: str) -> DiscordWebhookSender:
+    """웹훅 URL별 공유 발송기 (같은 웹훅은 세션·레이트 리밋 버킷 공유)"""
+    with _senders_lock:
+        sender = _senders.get(webhook_url)
+        if sender is None:
+            sender = _senders[webhook_url] = DiscordWebhookSender(webhook_url)
+        return sender
@@ -3,25 +3,50 @@
 GitHub Discussions Publisher
 """
 
+import time
 import requests
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 from .base import BasePublisher
 from ..config import Config
+from ..github_id_cache import get_github_id_cache
+from ..tracing import span
 from ..logger import logger
 
 
+class GitHubGraphQLError(RuntimeError):
+    """GraphQL 응답의 errors 항목 (type 등 원본 오류 정보 보존)"""
+
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        messages = [err.get("message", "Unknown error") for err in errors]
+        super().__init__(f"GitHub GraphQL 오류: {'; '.join(messages)}")
+
+    @property
+    def is_not_found(self) -> bool:
+        """존재하지 않는 노드 ID를 참조한 오류인지 여부"""
+        return any(
+            err.get("type") == "NOT_FOUND" or "Could not resolve to a node" in err.get("message", "")
+            for err in self.errors
+        )
+
+
 class GitHubPublisher(BasePublisher):
     """GitHub Discussions에 게시하는 Publisher"""
     
-    GRAPHQL_URL = "https://api.github.com/graphql"
+    # 일괄 생성 요청 하나에 담을 제목+본문 최대 글자 수 (요청 크기/처리 시간 제한 대비)
+    BATCH_MAX_CHARS = 500_000
+    
+    # 레이트 리밋(403/429) 응답 시 배치 재시도 횟수
+    BATCH_RETRIES = 3
     
     def __init__(
         self,
         token: Optional[str] = None,
         repo: Optional[str] = None,
         org: Optional[str] = None,
-        category: Optional[str] = None
+        category: Optional[str] = None,
+        graphql_url: Optional[str] = None
     ):
         """
         Args:
@@ -29,12 +54,17 @@ class GitHubPublisher(BasePublisher):
             repo: 저장소 (owner/name 형식) - Repository discussions용
             org: Organization 이름 - Organization discussions용 (.github repo 사용)
             category: Discussion 카테고리 이름
+            graphql_url: GraphQL 엔드포인트 (기본값: Config.GH_GRAPHQL_URL)
         """
         super().__init__("GitHub")
         self.token = token or Config.GITHUB_TOKEN
         self.repo = repo or Config.GH_REPO
         self.org = org or Config.GH_ORG
         self.category = category or Config.GH_DISCUSSION_CATEGORY
+        self.graphql_url = graphql_url or Config.GH_GRAPHQL_URL
+        
+        # 마지막 응답의 X-RateLimit-* 헤더 (limit, remaining, used, resetAt(epoch 초))
+        self.rate_limit: Dict[str, Any] = {}
         
         # Organization 모드인지 Repository 모드인지 확인
         # repo가 직접 지정되면 그걸 사용, org만 있으면 org 모드
@@ -45,6 +75,15 @@ class GitHubPublisher(BasePublisher):
             org_repo = Config.GH_ORG_REPO or "community"
             self.repo = f"{self.org}/{org_repo}"
     
+    @property
+    def last_discussion_url(self) -> Optional[str]:
+        """마지막으로 생성(또는 발송 원장에서 복원)한 Discussion URL"""
+        return self.remote_id
+    
+    @last_discussion_url.setter
+    def last_discussion_url(self, url: Optional[str]) -> None:
+        self.remote_id = url
+    
     def validate_config(self) -> bool:
         """설정 유효성 검사"""
         return all([self.token, self.repo or self.org, self.category])
@@ -88,24 +127,6 @@ class GitHubPublisher(BasePublisher):
         Returns:
             생성된 Discussion URL (실패 시 None)
         """
-        if self.is_org_mode:
-            # Organization discussions
-            org_id, category_id = self._get_org_and_category_ids(self.org)
-            if not org_id or not category_id:
-                return None
-            target_id = org_id
-        else:
-            # Repository discussions
-            if '/' not in self.repo:
-                logger.error(f"잘못된 저장소 형식: {self.repo}")
-                return None
-            
-            owner, name = self.repo.split('/', 1)
-            repo_id, category_id = self._get_repo_and_category_ids(owner, name)
-            if not repo_id or not category_id:
-                return None
-            target_id = repo_id
-        
         # Discussion 생성
         mutation = """
         mutation($targetId: ID!, $categoryId: ID!, $title: String!, $body: String!) {
@@ -122,19 +143,226 @@ class GitHubPublisher(BasePublisher):
         }
         """
         
-        variables = {
-            "targetId": target_id,
-            "categoryId": category_id,
-            "title": title,
-            "body": body
-        }
+        # 캐시된 ID가 무효(저장소 이전, 카테고리 재생성 등)면 캐시를 비우고 다시 조회해 한 번 재시도
+        for attempt in range(2):
+            target_id, category_id = self._resolve_target_ids()
+            if not target_id or not category_id:
+                return None
+            
+            variables = {
+                "targetId": target_id,
+                "categoryId": category_id,
+                "title": title,
+                "body": body
+            }
+            
+            try:
+                data = self._graphql_request(mutation, variables)
+                return data["createDiscussion"]["discussion"]["url"]
+            except GitHubGraphQLError as e:
+                if attempt == 0 and e.is_not_found:
+                    logger.warning(f"저장소/카테고리 ID가 유효하지 않음, 다시 조회: {str(e)}")
+                    get_github_id_cache().invalidate(self.graphql_url, self.repo)
+                    continue
+                logger.error(f"Discussion 생성 실패: {str(e)}")
+                return None
+            except Exception as e:
+                logger.error(f"Discussion 생성 실패: {str(e)}")
+                return None
+        return None
+    
+    def publish_many(self, items: List[Tuple[str, str]], batch_size: Optional[int] = None) -> List[Optional[str]]:
+        """여러 Discussion을 별칭(d0, d1, ...) createDiscussion 묶음 요청으로 일괄 생성
         
-        try:
-            data = self._graphql_request(mutation, variables)
-            return data["createDiscussion"]["discussion"]["url"]
-        except Exception as e:
-            logger.error(f"Discussion 생성 실패: {str(e)}")
+        요청 사이에는 분당 생성 한도(Config.GH_MUTATIONS_PER_MINUTE)와 응답의 남은 포인트를 보고 대기함
+        
+        Args:
+            items: (제목, 본문) 리스트
+            batch_size: 요청당 최대 뮤테이션 수 (기본값: Config.GH_MUTATION_BATCH_SIZE)
+        
+        Returns:
+            입력 순서대로 생성된 Discussion URL 리스트 (실패한 항목은 None)
+        """
+        urls: List[Optional[str]] = [None] * len(items)
+        batches = self._plan_batches(items, batch_size or Config.GH_MUTATION_BATCH_SIZE)
+        
+        for number, indices in enumerate(batches):
+            started = time.monotonic()
+            batch_urls = self._create_batch([items[i] for i in indices])
+            for index, url in zip(indices, batch_urls):
+                urls[index] = url
+            if number + 1 < len(batches):
+                self._pace(started, len(indices), len(batches[number + 1]))
+        
+        created = [url for url in urls if url]
+        if created:
+            self.last_discussion_url = created[-1]
+        logger.info(f"GitHub Discussion 일괄 생성: {len(created)}/{len(items)}건 (요청 {len(batches)}회)")
+        return urls
+    
+    def _plan_batches(self, items: List[Tuple[str, str]], batch_size: int) -> List[List[int]]:
+        """순서를 유지한 채 개수(batch_size)와 글자 수(BATCH_MAX_CHARS) 한도로 묶기"""
+        batches: List[List[int]] = []
+        current: List[int] = []
+        size = 0
+        for index, (title, body) in enumerate(items):
+            chars = len(title) + len(body)
+            if current and (len(current) >= batch_size or size + chars > self.BATCH_MAX_CHARS):
+                batches.append(current)
+                current, size = [], 0
+            current.append(index)
+            size += chars
+        if current:
+            batches.append(current)
+        return batches
+    
+    @staticmethod
+    def _build_batch_mutation(target_id: str, category_id: str, batch: List[Tuple[str, str]]) -> Tuple[str, Dict[str, Any]]:
+        """별칭 createDiscussion 뮤테이션과 변수 생성 (저장소/카테고리 ID는 변수 하나로 공유)"""
+        params = ["$repositoryId: ID!", "$categoryId: ID!"]
+        fields = []
+        variables: Dict[str, Any] = {"repositoryId": target_id, "categoryId": category_id}
+        for n, (title, body) in enumerate(batch):
+            params += [f"$title{n}: String!", f"$body{n}: String!"]
+            fields.append(
+                f"d{n}: createDiscussion(input: {{repositoryId: $repositoryId, categoryId: $categoryId, "
+                f"title: $title{n}, body: $body{n}}}) {{ discussion {{ url }} }}"
+            )
+            variables[f"title{n}"] = title
+            variables[f"body{n}"] = body
+        mutation = f"mutation({', '.join(params)}) {{\n" + "\n".join(fields) + "\n}"
+        return mutation, variables
+    
+    def _create_batch(self, batch: List[Tuple[str, str]]) -> List[Optional[str]]:
+        """묶음 요청 하나 실행 후 별칭별 결과/오류를 입력 항목에 대응
+        
+        Args:
+            batch: (제목, 본문) 리스트
+        
+        Returns:
+            항목별 Discussion URL (실패한 항목은 None)
+        """
+        failed: List[Optional[str]] = [None] * len(batch)
+        stale_retried = False
+        attempt = 0
+        while True:
+            target_id, category_id = self._resolve_target_ids()
+            if not target_id or not category_id:
+                return failed
+            
+            mutation, variables = self._build_batch_mutation(target_id, category_id, batch)
+            try:
+                result = self._graphql_post(mutation, variables)
+            except requests.exceptions.HTTPError as e:
+                delay = self._rate_limited_delay(e.response)
+                if delay is None or attempt >= self.BATCH_RETRIES:
+                    logger.error(f"Discussion 일괄 생성 실패 ({len(batch)}건): {str(e)}")
+                    return failed
+                attempt += 1
+                logger.warning(f"GitHub 레이트 리밋, {delay:.1f}초 후 재시도 ({attempt}/{self.BATCH_RETRIES})")
+                time.sleep(delay)
+                continue
+            except requests.exceptions.RequestException as e:
+                logger.error(f"Discussion 일괄 생성 실패 ({len(batch)}건): {str(e)}")
+                return failed
+            
+            data = result.get("data") or {}
+            urls = [
+                ((data.get(f"d{n}") or {}).get("discussion") or {}).get("url")
+                for n in range(len(batch))
+            ]
+            errors = result.get("errors") or []
+            
+            # 전부 NOT_FOUND면 캐시된 ID가 무효 → 캐시를 비우고 한 번 재시도
+            if errors and not any(urls) and not stale_retried and GitHubGraphQLError(errors).is_not_found:
+                logger.warning("저장소/카테고리 ID가 유효하지 않음, 다시 조회")
+                get_github_id_cache().invalidate(self.graphql_url, self.repo)
+                stale_retried = True
+                continue
+            
+            # 오류 path의 첫 요소(별칭)로 항목에 대응, 대응하지 않는 오류는 실패한 모든 항목에 표시
+            aliases = {f"d{n}" for n in range(len(batch))}
+            by_alias: Dict[str, List[Dict[str, Any]]] = {}
+            unmapped = []
+            for err in errors:
+                path = err.get("path") or []
+                if path and path[0] in aliases:
+                    by_alias.setdefault(path[0], []).append(err)
+                else:
+                    unmapped.append(err)
+            for n, url in enumerate(urls):
+                if not url:
+                    reason = by_alias.get(f"d{n}") or unmapped or [{"message": "응답에 Discussion URL 없음"}]
+                    logger.error(f"Discussion 생성 실패 ({batch[n][0]}): {GitHubGraphQLError(reason)}")
+            return urls
+    
+    def _pace(self, started: float, created: int, next_size: int) -> None:
+        """배치 사이 대기
+        
+        - 2차 한도: 분당 생성 수가 Config.GH_MUTATIONS_PER_MINUTE를 넘지 않게 간격 유지
+        - 1차 한도: 남은 포인트가 다음 배치 뮤테이션 수보다 적으면 리셋 시각까지 대기
+        """
+        delay = created * 60.0 / Config.GH_MUTATIONS_PER_MINUTE - (time.monotonic() - started)
+        remaining = self.rate_limit.get("remaining")
+        if remaining is not None and remaining < next_size:
+            delay = max(delay, self.rate_limit.get("resetAt", 0) - time.time())
+            logger.warning(f"GitHub 레이트 리밋 포인트 부족({remaining}), 리셋까지 {delay:.0f}초 대기")
+        if delay > 0:
+            time.sleep(delay)
+    
+    @staticmethod
+    def _rate_limited_delay(response: Optional[requests.Response]) -> Optional[float]:
+        """레이트 리밋 응답(403/429)이면 대기 시간(초), 아니면 None
+        
+        Retry-After 헤더 → 남은 포인트 0이면 X-RateLimit-Reset까지 → 2차 한도 메시지면 60초
+        """
+        if response is None or response.status_code not in (403, 429):
             return None
+        try:
+            if response.headers.get("Retry-After"):
+                return max(0.0, float(response.headers["Retry-After"]))
+            if response.headers.get("X-RateLimit-Remaining") == "0":
+                return max(0.0, float(response.headers.get("X-RateLimit-Reset", "0")) - time.time())
+        except ValueError:
+            pass
+        if response.status_code == 429 or "rate limit" in response.text.lower():
+            return 60.0
+        return None
+    
+    def _resolve_target_ids(self) -> tuple[Optional[str], Optional[str]]:
+        """게시 대상 (저장소 ID, 카테고리 ID) 조회
+        
+        Returns:
+            (저장소 ID, 카테고리 ID) 튜플 (실패 시 None 포함)
+        """
+        if self.is_org_mode:
+            # Organization discussions
+            return self._get_org_and_category_ids(self.org)
+        
+        # Repository discussions
+        if '/' not in self.repo:
+            logger.error(f"잘못된 저장소 형식: {self.repo}")
+            return None, None
+        
+        owner, name = self.repo.split('/', 1)
+        return self._get_repo_and_category_ids(owner, name)
+    
+    def _cached_ids(self, owner: str, name: str) -> Optional[tuple[str, str]]:
+        """ID 캐시에서 (저장소 ID, 카테고리 ID) 조회 (없거나 카테고리가 없으면 None)"""
+        entry = get_github_id_cache().get(self.graphql_url, f"{owner}/{name}")
+        if entry and self.category in entry["categories"]:
+            logger.debug(f"저장소/카테고리 ID 캐시 사용: {owner}/{name}")
+            return entry["repository_id"], entry["categories"][self.category]
+        return None
+    
+    def _remember_ids(self, owner: str, name: str, repo_id: str, categories: List[Dict[str, str]]) -> None:
+        """조회한 저장소 ID와 전체 카테고리 매핑을 ID 캐시에 저장"""
+        get_github_id_cache().put(
+            self.graphql_url,
+            f"{owner}/{name}",
+            repo_id,
+            {cat["name"]: cat["id"] for cat in categories}
+        )
     
     def _get_org_and_category_ids(self, org_login: str) -> tuple[Optional[str], Optional[str]]:
         """Organization의 .github repository ID와 카테고리 ID 조회
@@ -166,6 +394,10 @@ class GitHubPublisher(BasePublisher):
         else:
             owner, name = org_login, Config.GH_ORG_REPO or ".github"
         
+        cached = self._cached_ids(owner, name)
+        if cached:
+            return cached
+        
         variables = {
             "owner": owner,
             "name": name
@@ -177,6 +409,7 @@ class GitHubPublisher(BasePublisher):
             
             # 카테고리 찾기
             categories = data["repository"]["discussionCategories"]["nodes"]
+            self._remember_ids(owner, name, repo_id, categories)
             category_id = None
             
             for cat in categories:
@@ -219,6 +452,10 @@ class GitHubPublisher(BasePublisher):
         }
         """
         
+        cached = self._cached_ids(owner, name)
+        if cached:
+            return cached
+        
         variables = {
             "owner": owner,
             "name": name
@@ -230,6 +467,7 @@ class GitHubPublisher(BasePublisher):
             
             # 카테고리 찾기
             categories = data["repository"]["discussionCategories"]["nodes"]
+            self._remember_ids(owner, name, repo_id, categories)
             category_id = None
             
             for cat in categories:
@@ -259,7 +497,28 @@ class GitHubPublisher(BasePublisher):
             응답 데이터
         
         Raises:
-            RuntimeError: API 오류 시
+            GitHubGraphQLError: 응답에 errors가 있을 때
+            requests.exceptions.RequestException: HTTP 오류 시
+        """
+        result = self._graphql_post(query, variables)
+        
+        if "errors" in result:
+            raise GitHubGraphQLError(result["errors"])
+        
+        return result.get("data", {})
+    
+    def _graphql_post(self, query: str, variables: Dict[str, Any]) -> Dict[str, Any]:
+        """GraphQL 요청 후 응답 JSON 전체 반환 (부분 실패의 data/errors를 함께 보기 위함)
+        
+        Args:
+            query: GraphQL 쿼리/뮤테이션
+            variables: 변수
+        
+        Returns:
+            응답 JSON ({"data": ..., "errors": [...]})
+        
+        Raises:
+            requests.exceptions.RequestException: HTTP 오류 시
         """
         headers = {
             "Authorization": f"Bearer {self.token}",
@@ -271,21 +530,79 @@ class GitHubPublisher(BasePublisher):
             "variables": variables
         }
         
-        response = requests.post(
-            self.GRAPHQL_URL,
-            headers=headers,
-            json=payload,
-            timeout=60
-        )
+        operation_type = query.strip().split("(", 1)[0].split("{", 1)[0].strip() or "query"
+        with span("github.graphql", url=self.graphql_url, operation_type=operation_type) as s:
+            response = requests.post(
+                self.graphql_url,
+                headers=headers,
+                json=payload,
+                timeout=60
+            )
+            s.set(http_status=response.status_code, chars_out=len(response.content))
+            self._update_rate_limit(response)
+            response.raise_for_status()
+        return response.json()
+    
+    def _update_rate_limit(self, response: requests.Response) -> None:
+        """X-RateLimit-* 헤더로 남은 포인트/리셋 시각 갱신"""
+        headers = response.headers
+        try:
+            if "X-RateLimit-Remaining" in headers:
+                self.rate_limit = {
+                    "limit": int(headers.get("X-RateLimit-Limit", 0)),
+                    "remaining": int(headers["X-RateLimit-Remaining"]),
+                    "used": int(headers.get("X-RateLimit-Used", 0)),
+                    "resetAt": float(headers.get("X-RateLimit-Reset", 0)),
+                }
+        except (TypeError, ValueError):
+            pass
+    
+    def list_discussions_page(self, first: int = 100, after: Optional[str] = None) -> Dict[str, Any]:
+        """Discussion 목록 한 페이지 조회 (최신순, 커서 기반)
         
-        response.raise_for_status()
-        result = response.json()
+        Args:
+            first: 페이지 크기 (GitHub 최대 100)
+            after: 이전 페이지의 endCursor (None이면 첫 페이지)
         
-        if "errors" in result:
-            error_messages = [err.get("message", "Unknown error") for err in result["errors"]]
-            raise RuntimeError(f"GitHub GraphQL 오류: {'; '.join(error_messages)}")
+        Returns:
+            {"nodes": [...], "pageInfo": {"hasNextPage", "endCursor"}, "totalCount"}
         
-        return result.get("data", {})
+        Raises:
+            GitHubGraphQLError: GraphQL 오류 시
+            requests.exceptions.RequestException: HTTP 오류 시
+        """
+        query = """
+        query($owner: String!, $name: String!, $first: Int!, $after: String) {
+            repository(owner: $owner, name: $name) {
+                discussions(first: $first, after: $after, orderBy: {field: CREATED_AT, direction: DESC}) {
+                    totalCount
+                    pageInfo {
+                        hasNextPage
+                        endCursor
+                    }
+                    nodes {
+                        title
+                        url
+                        createdAt
+                        category {
+                            name
+                        }
+                    }
+                }
+            }
+        }
+        """
+        
+        owner, name = self.repo.split('/', 1)
+        variables = {
+            "owner": owner,
+            "name": name,
+            "first": min(first, 100),
+            "after": after
+        }
+        
+        data = self._graphql_request(query, variables)
+        return data["repository"]["discussions"]
     
     def list_discussions(self, limit: int = 10) -> list[Dict[str, Any]]:
         """최근 Discussion 목록 조회
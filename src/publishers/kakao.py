@@ -8,6 +8,7 @@ from typing import Optional
 
 from .base import BasePublisher
 from ..config import Config
+from ..tracing import span, safe_url
 from ..logger import logger
 from ..markdown_utils import extract_today_summary
 
@@ -64,12 +65,14 @@ class KakaoPublisher(BasePublisher):
                 "text": text
             }
             
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
+            with span("kakao.post", url=safe_url(self.webhook_url), chars_in=len(text)) as s:
+                response = requests.post(
+                    self.webhook_url,
+                    json=payload,
+                    timeout=30
+                )
+                s.set(http_status=response.status_code)
+                response.raise_for_status()
             
             logger.info("카카오톡 봇 발송 완료")
             return True
@@ -188,12 +191,14 @@ class KakaoPublisher(BasePublisher):
                 "text": message
             }
             
-            response = requests.post(
-                self.webhook_url,
-                json=payload,
-                timeout=30
-            )
-            response.raise_for_status()
+            with span("kakao.post", url=safe_url(self.webhook_url), chars_in=len(message)) as s:
+                response = requests.post(
+                    self.webhook_url,
+                    json=payload,
+                    timeout=30
+                )
+                s.set(http_status=response.status_code)
+                response.raise_for_status()
             return True
             
         except Exception as e:
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+"""
+OpenAI Responses API 응답 캐시 모듈
+(model, reasoning effort, tools, 입력 메시지) 해시를 키로 응답을 디스크에 보관
+"""
+
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from types import SimpleNamespace
+from typing import Optional, Dict, Any
+
+from .config import Config
+from .logger import logger
+from .usage_ledger import record_llm_call
+
+
+# 캐시 키 계산에서 제외하는 파라미터 (응답 내용에 영향 없음)
+_NON_SEMANTIC_PARAMS = ("timeout", "extra_headers")
+
+
+class ResponseCache:
+    """SQLite 기반 응답 캐시 (TTL + LRU 크기 제한)"""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        enabled: bool = True,
+        refresh: bool = False
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로 (기본값: Config.RESPONSE_CACHE_PATH)
+            ttl: 항목 유효 시간(초), 0이면 만료 없음 (기본값: Config.RESPONSE_CACHE_TTL)
+            max_bytes: 캐시 최대 크기(바이트) (기본값: Config.RESPONSE_CACHE_MAX_BYTES)
+            enabled: 캐시 사용 여부
+            refresh: True면 캐시를 읽지 않고 새 응답으로 덮어씀
+        """
+        self.path = path or Config.RESPONSE_CACHE_PATH
+        self.ttl = Config.RESPONSE_CACHE_TTL if ttl is None else ttl
+        self.max_bytes = Config.RESPONSE_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.enabled = enabled
+        self.refresh = refresh
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    @staticmethod
+    def make_key(params: Dict[str, Any]) -> str:
+        """요청 파라미터로 캐시 키 생성
+
+        Args:
+            params: responses.create에 전달되는 파라미터
+
+        Returns:
+            SHA-256 해시 문자열
+        """
+        semantic = {k: v for k, v in params.items() if k not in _NON_SEMANTIC_PARAMS}
+        canonical = json.dumps(semantic, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        """SQLite 연결 생성 (최초 1회 스키마 생성)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        conn = sqlite3.connect(self.path, timeout=30)
+        if not self._initialized:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    payload TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_access REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses(last_access)")
+            conn.commit()
+            self._initialized = True
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        """캐시된 응답 조회
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            복원된 응답 객체 (없거나 만료되면 None)
+        """
+        if not self.enabled or self.refresh:
+            return None
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    row = conn.execute(
+                        "SELECT payload, created_at FROM responses WHERE key = ?", (key,)
+                    ).fetchone()
+
+                    if row and self.ttl and now - row[1] > self.ttl:
+                        conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                        conn.commit()
+                        row = None
+
+                    if row:
+                        conn.execute(
+                            "UPDATE responses SET last_access = ? WHERE key = ?", (now, key)
+                        )
+                        conn.commit()
+                finally:
+                    conn.close()
+                # 병렬 요약 스레드에서 동시에 조회하므로 통계도 잠금 안에서 갱신
+                if row:
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        except sqlite3.Error as e:
+            logger.warning(f"응답 캐시 조회 실패: {str(e)}")
+            return None
+
+        if not row:
+            return None
+        return _deserialize_response(row[0])
+
+    def set(self, key: str, response: Any, model: str = "") -> None:
+        """응답 저장 후 크기 제한 초과 시 LRU 방식으로 정리
+
+        Args:
+            key: 캐시 키
+            response: OpenAI 응답 객체
+            model: 모델 이름 (조회용)
+        """
+        if not self.enabled:
+            return
+        if not is_cacheable_response(response):
+            # 미완료/실패/빈 응답을 저장하면 TTL 동안 재실행해도 실패가 재생됨
+            logger.info(f"응답 캐시 저장 생략 (상태: {getattr(response, 'status', None)}, 키: {key[:12]})")
+            return
+
+        payload = _serialize_response(response)
+        if payload is None:
+            return
+
+        now = time.time()
+        size = len(payload.encode("utf-8"))
+        try:
+            with self._lock:
+                conn = self._connect()
+                try:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO responses "
+                        "(key, model, payload, size, created_at, last_access) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (key, model, payload, size, now, now)
+                    )
+                    self.writes += 1
+                    self._evict(conn)
+                    conn.commit()
+                finally:
+                    conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"응답 캐시 저장 실패: {str(e)}")
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """만료 항목과 크기 초과분(가장 오래 사용하지 않은 항목부터) 제거"""
+        if self.ttl:
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE created_at < ?", (time.time() - self.ttl,)
+            )
+            self.evictions += max(cursor.rowcount, 0)
+
+        if not self.max_bytes:
+            return
+
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        for key, size in conn.execute(
+            "SELECT key, size FROM responses ORDER BY last_access ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+            finally:
+                conn.close()
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계
+
+        Returns:
+            hits, misses, writes, evictions 딕셔너리
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "evictions": self.evictions,
+        }
+
+
+def is_cacheable_response(response: Any) -> bool:
+    """완료 상태이고 출력 텍스트가 있는 응답만 캐시 대상 (status가 없는 객체는 텍스트만 확인)"""
+    if getattr(response, "status", None) not in (None, "completed"):
+        return False
+    return bool((getattr(response, "output_text", "") or "").strip())
+
+
+def _serialize_response(response: Any) -> Optional[str]:
+    """응답 객체를 JSON 문자열로 직렬화"""
+    try:
+        if hasattr(response, "model_dump_json"):
+            return response.model_dump_json()
+        return json.dumps(
+            {"output_text": getattr(response, "output_text", "") or "", "output": []},
+            ensure_ascii=False
+        )
+    except Exception as e:
+        logger.warning(f"응답 직렬화 실패, 캐시하지 않음: {str(e)}")
+        return None
+
+
+def _deserialize_response(payload: str) -> Any:
+    """JSON 문자열에서 응답 객체 복원
+
+    SDK의 Response 모델로 복원하고, 실패하면 output_text만 가진 객체로 대체
+    """
+    try:
+        from openai.types.responses import Response
+        return Response.model_validate_json(payload)
+    except Exception:
+        data = json.loads(payload)
+        output_text = data.get("output_text") or ""
+        if not output_text:
+            chunks = []
+            for item in data.get("output") or []:
+                if item.get("type") == "message":
+                    for content in item.get("content") or []:
+                        if content.get("type") == "output_text":
+                            chunks.append(content.get("text", ""))
+            output_text = "\n".join(chunks).strip()
+        return SimpleNamespace(output_text=output_text, output=[], usage=data.get("usage"))
+
+
+# 실행 전체에서 공유하는 캐시 인스턴스
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """공유 응답 캐시 반환 (최초 호출 시 생성)"""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache(enabled=Config.RESPONSE_CACHE_ENABLED)
+    return _response_cache
+
+
+def configure_response_cache(enabled: bool = True, refresh: bool = False) -> ResponseCache:
+    """CLI 옵션에 맞춰 공유 응답 캐시 설정
+
+    Args:
+        enabled: 캐시 사용 여부 (--no-cache 시 False)
+        refresh: 캐시 무시 후 새로 저장 (--refresh)
+
+    Returns:
+        설정된 캐시 인스턴스
+    """
+    cache = get_response_cache()
+    cache.enabled = enabled and Config.RESPONSE_CACHE_ENABLED
+    cache.refresh = refresh
+    return cache
+
+
+class _CachedCall:
+    """cached_create/acached_create 공통 처리 (키 계산, 조회, 저장, LLM 사용 기록)
+
+    동기/비동기 버전은 실제 responses.create 호출만 다름
+    """
+
+    def __init__(self, params: Dict[str, Any]):
+        """
+        Args:
+            params: responses.create 파라미터
+        """
+        self.params = params
+        self.started = time.monotonic()
+        self.cache = get_response_cache()
+        self.key = self.cache.make_key(params)
+        self.cached = self.cache.get(self.key)
+        if self.cached is not None:
+            logger.info(f"응답 캐시 적중 (모델: {params.get('model')}, 키: {self.key[:12]})")
+            record_llm_call(params, self.started, response=self.cached, cache_hit=True)
+
+    def fail(self, error: Exception) -> None:
+        """API 호출 실패 기록"""
+        record_llm_call(self.params, self.started, error=str(error))
+
+    def store(self, response: Any) -> Any:
+        """API 응답 기록 후 캐시에 저장"""
+        record_llm_call(self.params, self.started, response=response)
+        self.cache.set(self.key, response, model=self.params.get("model", ""))
+        return response
+
+
+def cached_create(client: Any, **params) -> Any:
+    """캐시를 거치는 client.responses.create 호출
+
+    Args:
+        client: OpenAI 클라이언트
+        **params: responses.create 파라미터
+
+    Returns:
+        OpenAI 응답 객체 (캐시 적중 시 복원된 객체)
+    """
+    call = _CachedCall(params)
+    if call.cached is not None:
+        return call.cached
+    try:
+        response = client.responses.create(**params)
+    except Exception as e:
+        call.fail(e)
+        raise
+    return call.store(response)
+
+
+async def acached_create(client: Any, **params) -> Any:
+    """캐시를 거치는 AsyncOpenAI client.responses.create 호출
+
+    Args:
+        client: AsyncOpenAI 클라이언트
+        **params: responses.create 파라미터
+
+    Returns:
+        OpenAI 응답 객체 (캐시 적중 시 복원된 객체)
+    """
+    call = _CachedCall(params)
+    if call.cached is not None:
+        return call.cached
+    try:
+        response = await client.responses.create(**params)
+    except Exception as e:
+        call.fail(e)
+        raise
+    return call.store(response)
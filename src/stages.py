@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+"""
+파이프라인 공용 단계 함수 모듈
+main.py / publish_news.py 그래프 정의에서 공유하는 요약·제목·Discord 변환 로직
+"""
+
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple
+
+from .summarizers.base import BaseSummarizer
+from .summarizers.compact import CompactSummarizer
+from .markdown_utils import save_markdown
+from .usage_ledger import llm_context
+from .tracing import span
+from .logger import logger
+
+
+def run_summarizer(
+    summarizer: BaseSummarizer,
+    url: str,
+    timeframe: Optional[str] = None,
+    **kwargs
+) -> Tuple[str, Dict[str, Any]]:
+    """Summarizer가 지원하는 가장 풍부한 API로 요약 생성
+
+    Args:
+        summarizer: Summarizer 인스턴스
+        url: 뉴스 URL
+        timeframe: 기간 정보 (선택)
+        **kwargs: 스트리밍 옵션 등 추가 인자
+
+    Returns:
+        (마크다운, 메타데이터) 튜플
+
+    Raises:
+        RuntimeError: 요약 결과가 비어 있는 경우
+    """
+    with llm_context(stage="summarize", source_url=url), span("summarize", url=url) as summarize_span:
+        metadata: Dict[str, Any] = {}
+        if hasattr(summarizer, 'summarize_with_result'):
+            # Weekly Robotics 등 SummarizerResult를 반환하는 경우
+            result = summarizer.summarize_with_result(url, timeframe=timeframe, **kwargs)
+            markdown_content = result.summary  # summary 속성 사용
+            metadata = result.metadata or {}
+        elif hasattr(summarizer, 'summarize_with_metadata'):
+            # SmolAI 등 dict를 반환하는 경우
+            result = summarizer.summarize_with_metadata(url, timeframe=timeframe, **kwargs)
+            markdown_content = result.get('markdown', '')
+            metadata = {
+                'headline': result.get('headline', ''),
+                'date': result.get('date', ''),
+                'stream_metrics': result.get('stream_metrics')
+            }
+        elif hasattr(summarizer, 'summarize_with_retry'):
+            markdown_content = summarizer.summarize_with_retry(url, max_retries=3, timeframe=timeframe)
+        else:
+            markdown_content = summarizer.safe_summarize(url, timeframe=timeframe)
+        summarize_span.set(summarizer=summarizer.name, chars_out=len(markdown_content or ""))
+
+    if not markdown_content:
+        raise RuntimeError("요약 생성 실패: 빈 결과")
+
+    metadata.setdefault('source', summarizer.name)
+    if metadata.get('headline'):
+        logger.info(f"헤드라인: {metadata['headline']}")
+    return markdown_content, metadata
+
+
+def is_complete_summary(output: Any) -> bool:
+    """실패 문구나 기본 요약이 아닌 정상 결과인지 여부 (발송 원장에 단계 출력 저장 전 검증)
+
+    Args:
+        output: 마크다운 문자열 또는 (마크다운, 메타데이터) 튜플
+
+    Returns:
+        다시 실행했을 때 그대로 재사용해도 되는 결과면 True
+    """
+    markdown = output[0] if isinstance(output, tuple) else output
+    if not isinstance(markdown, str) or not markdown.strip():
+        return False
+    return "요약 생성 실패" not in markdown[:200] and not CompactSummarizer.is_fallback_summary(markdown)
+
+
+def make_title(metadata: Dict[str, Any], url: str) -> str:
+    """GitHub Discussion 제목 자동 생성
+
+    Args:
+        metadata: 요약 메타데이터 (headline, date, source)
+        url: 뉴스 URL
+
+    Returns:
+        '[AI News, YY.MM.DD] 헤드라인' 형식 제목
+    """
+    is_robotics = 'Weekly Robotics' in metadata.get('source', '') or 'weeklyrobotics' in url.lower()
+    label = "Robotics News" if is_robotics else "AI News"
+
+    if metadata.get('headline') and metadata.get('date'):
+        title = f"[{label}, {metadata['date']}] {metadata['headline']}"
+        logger.info(f"타이틀 자동 생성: {title}")
+        return title
+
+    # 기본 타이틀
+    date_str = datetime.now().strftime("%y.%m.%d")
+    if is_robotics:
+        title = f"[{label}, {date_str}] Weekly Robotics 요약"
+    else:
+        title = f"[{label}, {date_str}] AI 뉴스 요약"
+    logger.warning(f"헤드라인 없음, 기본 타이틀 사용: {title}")
+    return title
+
+
+def uses_compact(url: str) -> bool:
+    """Discord에 Compact 버전을 보내는 소스인지 여부 (SmolAI News, Weekly Robotics)"""
+    return 'smol' in url.lower() or 'weeklyrobotics' in url.lower()
+
+
+def strip_thumbnail(markdown: str, url: str) -> str:
+    """Weekly Robotics 요약에서 썸네일 이미지 라인 제거
+
+    Args:
+        markdown: 요약 마크다운
+        url: 뉴스 URL (Weekly Robotics가 아니면 그대로 반환)
+
+    Returns:
+        썸네일이 제거된 마크다운
+    """
+    if 'weeklyrobotics' not in url.lower():
+        return markdown
+
+    lines = markdown.split('\n')
+    filtered_lines = [line for line in lines if not line.startswith('![Weekly Robotics](')]
+    return '\n'.join(filtered_lines).strip()
+
+
+def generate_compact(markdown: str, url: str) -> str:
+    """GitHub Discussion URL 자리표시로 Compact 버전 생성 (GitHub 게시와 병렬 실행용)
+
+    Args:
+        markdown: 전체 요약 마크다운
+        url: 뉴스 URL
+
+    Returns:
+        CompactSummarizer.DISCUSSION_URL_PLACEHOLDER가 들어간 간결 요약
+    """
+    compact = CompactSummarizer()
+    with llm_context(source_url=url):
+        return compact.summarize(
+            content=strip_thumbnail(markdown, url),
+            github_url=CompactSummarizer.DISCUSSION_URL_PLACEHOLDER,
+            style="discord"
+        )
+
+
+def build_discord_content(
+    markdown: str,
+    url: str,
+    github_url: Optional[str] = None,
+    compact_content: Optional[str] = None
+) -> str:
+    """Discord 발송용 콘텐츠 구성
+
+    Compact 버전이 있으면 실제 Discussion URL을 채워 사용하고 (GitHub 게시가 실패했으면 링크만 제거),
+    없거나 실패했으면 원본(썸네일 제거)에 GitHub URL만 추가
+
+    Args:
+        markdown: 전체 요약 마크다운
+        url: 뉴스 URL
+        github_url: GitHub Discussion URL (선택)
+        compact_content: 사전 생성한 Compact 버전 (선택)
+
+    Returns:
+        Discord 발송용 마크다운
+    """
+    if compact_content and uses_compact(url) and is_complete_summary(compact_content):
+        if not github_url:
+            # GitHub 게시 실패: 초안을 다시 생성하지 않고 자리표시 링크만 제거해 사용
+            logger.info("Compact 버전 사용 (GitHub 링크 제외)")
+            return CompactSummarizer.remove_discussion_url(compact_content)
+        logger.info("Compact 버전 사용")
+        return CompactSummarizer.fill_discussion_url(compact_content, github_url)
+    if github_url and uses_compact(url):
+        logger.warning("Compact 버전 생성 실패, 원본 사용")
+        # 썸네일 제거하고 GitHub URL 추가
+        markdown = strip_thumbnail(markdown, url)
+
+    if github_url:
+        markdown += f"\n\n---\n📖 **상세 뉴스레터**: {github_url}"
+    return markdown
+
+
+def save_discord_variants(out_path: str, discord_content: str) -> Optional[str]:
+    """Discord 버전(_discord.md)과 카카오톡 텍스트 버전(_kakao.txt) 저장
+
+    Args:
+        out_path: 원본 마크다운 경로
+        discord_content: Discord 발송용 콘텐츠
+
+    Returns:
+        Discord 버전 파일 경로
+    """
+    discord_path = out_path.replace('.md', '_discord.md')
+    logger.info(f"💾 Discord 버전 저장: {discord_path}")
+    save_markdown(discord_path, discord_content)
+
+    # 카카오톡용 텍스트 버전 생성 및 저장
+    try:
+        from .formatters.kakao import KakaoFormatter, save_kakao_text
+
+        kakao_content = KakaoFormatter().format(discord_content)
+        kakao_path = out_path.replace('.md', '_kakao.txt')
+        save_kakao_text(kakao_path, kakao_content)
+        logger.info(f"✅ 카카오톡 버전 저장 완료: {kakao_path}")
+    except Exception as e:
+        logger.warning(f"카카오톡 버전 생성 중 오류: {e}")
+
+    return discord_path
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+스트리밍 요약 모듈
+Responses API 스트림의 텍스트 델타를 파일에 즉시 기록하고 섹션 완료 이벤트 발생
+"""
+
+import os
+import re
+import time
+from typing import Optional, Callable, Dict, Any, List
+
+from .response_cache import get_response_cache
+from .utils.message_splitter import FENCE_RE
+from .usage_ledger import record_llm_call
+from .logger import logger
+
+
+# 섹션 경계로 취급하는 헤더 (# / ## 수준)
+SECTION_HEADER_RE = re.compile(r"^#{1,2}\s+(.+?)\s*$")
+
+# 섹션 완료 콜백: (섹션 제목, 섹션 마크다운)
+SectionCallback = Callable[[str, str], None]
+
+
+class StreamingMarkdownWriter:
+    """텍스트 델타를 파일에 이어 쓰고 섹션 완료를 감지하는 Writer
+
+    - 델타가 도착할 때마다 파일에 append + flush
+    - 새 섹션 헤더가 시작되면 직전 섹션 완료 콜백 호출
+    - 첫 토큰/첫 섹션까지 걸린 시간 기록
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        on_section: Optional[SectionCallback] = None
+    ):
+        """
+        Args:
+            path: 델타를 기록할 마크다운 파일 경로 (None이면 파일 기록 안 함)
+            on_section: 섹션 완료 콜백
+        """
+        self.path = path
+        self.on_section = on_section
+
+        self.started_at = time.monotonic()
+        self.first_token_seconds: Optional[float] = None
+        self.first_section_seconds: Optional[float] = None
+        self.total_seconds: Optional[float] = None
+        self.sections: List[str] = []
+
+        self._chunks: List[str] = []
+        self._pending_line = ""
+        self._section_title = ""
+        self._section_lines: List[str] = []
+        self._fence: Optional[str] = None  # 열린 코드 펜스 (``` 또는 ~~~)
+        self._file = None
+
+        if path:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._file = open(path, 'w', encoding='utf-8')
+
+    @property
+    def text(self) -> str:
+        """지금까지 수신한 전체 텍스트"""
+        return "".join(self._chunks)
+
+    def write(self, delta: str) -> None:
+        """텍스트 델타 기록
+
+        Args:
+            delta: 스트림에서 받은 텍스트 조각
+        """
+        if not delta:
+            return
+
+        if self.first_token_seconds is None:
+            self.first_token_seconds = time.monotonic() - self.started_at
+            logger.info(f"첫 토큰 수신 ({self.first_token_seconds:.1f}초)")
+
+        self._chunks.append(delta)
+        if self._file:
+            self._file.write(delta)
+            self._file.flush()
+
+        # 완성된 줄 단위로 섹션 경계 검사
+        lines = (self._pending_line + delta).split('\n')
+        self._pending_line = lines.pop()
+        for line in lines:
+            self._feed_line(line)
+
+    def close(self) -> Dict[str, Any]:
+        """스트림 종료 처리 (마지막 섹션 완료 이벤트 포함)
+
+        Returns:
+            스트리밍 지표 딕셔너리
+        """
+        if self._pending_line:
+            self._feed_line(self._pending_line)
+            self._pending_line = ""
+        self._emit_section()
+
+        if self._file:
+            self._file.close()
+            self._file = None
+
+        self.total_seconds = time.monotonic() - self.started_at
+        metrics = self.metrics()
+        if self.first_section_seconds is not None:
+            logger.info(
+                f"스트리밍 완료: 첫 섹션 {self.first_section_seconds:.1f}초, "
+                f"전체 {self.total_seconds:.1f}초, 섹션 {len(self.sections)}개"
+            )
+        return metrics
+
+    def metrics(self) -> Dict[str, Any]:
+        """스트리밍 지표
+
+        Returns:
+            first_token_seconds, time_to_first_section, total_seconds, section_count
+        """
+        return {
+            'first_token_seconds': self.first_token_seconds,
+            'time_to_first_section': self.first_section_seconds,
+            'total_seconds': self.total_seconds,
+            'section_count': len(self.sections),
+        }
+
+    def _feed_line(self, line: str) -> None:
+        """한 줄 처리 (섹션 헤더면 직전 섹션 완료, 코드 펜스 안의 '#' 줄은 헤더로 보지 않음)"""
+        if self._fence:
+            if line.strip().startswith(self._fence):
+                self._fence = None
+            self._section_lines.append(line)
+            return
+
+        fence = FENCE_RE.match(line)
+        if fence:
+            self._fence = fence.group(1)
+        else:
+            match = SECTION_HEADER_RE.match(line)
+            if match:
+                self._emit_section()
+                self._section_title = match.group(1)
+        self._section_lines.append(line)
+
+    def _emit_section(self) -> None:
+        """현재 섹션을 완료 처리하고 콜백 호출"""
+        body = "\n".join(self._section_lines).strip()
+        title = self._section_title
+        self._section_lines = []
+        self._section_title = ""
+
+        # 헤더 없는 머리말(헤드라인 등 내부용 라인)은 섹션으로 취급하지 않음
+        if not body or not title:
+            return
+
+        if self.first_section_seconds is None:
+            self.first_section_seconds = time.monotonic() - self.started_at
+            logger.info(f"첫 섹션 완료: {title} ({self.first_section_seconds:.1f}초)")
+        self.sections.append(title)
+
+        if self.on_section:
+            try:
+                self.on_section(title, body)
+            except Exception as e:
+                logger.warning(f"섹션 완료 콜백 실패 ({title}): {str(e)}")
+
+
+def streamed_create(client: Any, writer: StreamingMarkdownWriter, **params) -> Any:
+    """stream=True로 responses.create를 호출하며 델타를 writer에 전달
+
+    응답 캐시와 같은 키를 사용하므로 캐시 적중 시 저장된 텍스트를 한 번에 전달
+
+    Args:
+        client: OpenAI 클라이언트
+        writer: 델타를 받을 StreamingMarkdownWriter
+        **params: responses.create 파라미터 (stream 제외)
+
+    Returns:
+        최종 응답 객체 (response.completed 이벤트의 response)
+
+    Raises:
+        RuntimeError: 스트림이 실패하거나 완료 이벤트 없이 끝난 경우
+    """
+    started = time.monotonic()
+    cache = get_response_cache()
+    key = cache.make_key(params)
+
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"응답 캐시 적중 (모델: {params.get('model')}, 키: {key[:12]})")
+        writer.write(getattr(cached, "output_text", "") or "")
+        record_llm_call(params, started, response=cached, cache_hit=True, streamed=True)
+        return cached
+
+    final_response = None
+    try:
+        stream = client.responses.create(stream=True, **params)
+        for event in stream:
+            event_type = getattr(event, "type", "")
+            if event_type == "response.output_text.delta":
+                writer.write(getattr(event, "delta", ""))
+            elif event_type == "response.completed":
+                final_response = event.response
+            elif event_type in ("response.failed", "error"):
+                error = getattr(getattr(event, "response", None), "error", None) or getattr(event, "message", "")
+                raise RuntimeError(f"스트리밍 응답 실패: {error}")
+
+        if final_response is None:
+            raise RuntimeError("스트림이 완료 이벤트 없이 종료되었습니다.")
+    except Exception as e:
+        record_llm_call(params, started, streamed=True, error=str(e))
+        raise
+
+    record_llm_call(params, started, response=final_response, streamed=True)
+    cache.set(key, final_response, model=params.get("model", ""))
+    return final_response
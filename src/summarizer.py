@@ -4,7 +4,8 @@ Summarizer Factory 모듈
 적절한 Summarizer를 선택하고 생성하는 팩토리 패턴 구현
 """
 
-from typing import Optional, Dict, Type
+from typing import Optional, Dict, Type, List, Tuple, Union
+from urllib.parse import urlsplit
 from enum import Enum
 
 from .summarizers.base import BaseSummarizer
@@ -13,6 +14,10 @@ from .summarizers.weekly_robotics import WeeklyRoboticsSummarizer
 from .logger import logger
 
 
+# 플러그인 Summarizer entry point 그룹
+PLUGIN_ENTRY_POINT_GROUP = "news_bot.summarizers"
+
+
 class NewsSource(Enum):
     """지원하는 뉴스 소스"""
     SMOL_AI_NEWS = "smol_ai_news"
@@ -23,26 +28,41 @@ class NewsSource(Enum):
     # THE_VERGE = "the_verge"
 
 
+# 내장 소스는 NewsSource, 플러그인 소스는 entry point 이름(str)
+SourceKey = Union[NewsSource, str]
+
+
+def _source_name(source: SourceKey) -> str:
+    """소스 키의 문자열 이름"""
+    return source.value if isinstance(source, NewsSource) else source
+
+
 class SummarizerFactory:
     """Summarizer 생성을 담당하는 팩토리 클래스"""
     
     # 등록된 Summarizer 매핑
-    _summarizers: Dict[NewsSource, Type[BaseSummarizer]] = {
+    _summarizers: Dict[SourceKey, Type[BaseSummarizer]] = {
         NewsSource.SMOL_AI_NEWS: SmolAINewsSummarizer,
         NewsSource.WEEKLY_ROBOTICS: WeeklyRoboticsSummarizer,
     }
     
+    # host → [(path prefix, 소스)] 라우팅 인덱스 (최초 조회 시 생성)
+    _domain_index: Optional[Dict[str, List[Tuple[str, SourceKey]]]] = None
+    
+    # entry point 플러그인 로드 여부
+    _plugins_loaded: bool = False
+    
     @classmethod
     def create(
         cls,
-        source: NewsSource,
+        source: SourceKey,
         api_key: Optional[str] = None,
         model: Optional[str] = None
     ) -> BaseSummarizer:
         """지정된 소스에 맞는 Summarizer 생성
         
         Args:
-            source: 뉴스 소스 타입
+            source: 뉴스 소스 타입 (플러그인은 entry point 이름)
             api_key: API 키 (선택)
             model: 사용할 모델 (선택)
         
@@ -53,10 +73,13 @@ class SummarizerFactory:
             ValueError: 지원하지 않는 소스인 경우
         """
         if source not in cls._summarizers:
-            raise ValueError(f"지원하지 않는 뉴스 소스: {source.value}")
+            cls._load_plugins()
+        
+        if source not in cls._summarizers:
+            raise ValueError(f"지원하지 않는 뉴스 소스: {_source_name(source)}")
         
         summarizer_class = cls._summarizers[source]
-        logger.info(f"{source.value} Summarizer 생성 중...")
+        logger.info(f"{_source_name(source)} Summarizer 생성 중...")
         
         return summarizer_class(api_key=api_key, model=model)
     
@@ -69,6 +92,8 @@ class SummarizerFactory:
     ) -> BaseSummarizer:
         """URL을 분석하여 적절한 Summarizer 생성
         
+        도메인 인덱스 조회로 소스를 찾은 뒤 해당 Summarizer만 생성
+        
         Args:
             url: 요약할 콘텐츠 URL
             api_key: API 키 (선택)
@@ -80,24 +105,97 @@ class SummarizerFactory:
         Raises:
             ValueError: URL을 처리할 수 있는 Summarizer가 없는 경우
         """
-        # 각 Summarizer가 URL을 처리할 수 있는지 확인
-        for source, summarizer_class in cls._summarizers.items():
-            # 임시 인스턴스 생성하여 지원 도메인 확인
-            temp_instance = summarizer_class(api_key=api_key, model=model)
-            if temp_instance.can_handle(url):
-                logger.info(f"URL에 맞는 Summarizer 찾음: {source.value}")
-                return temp_instance
-        
-        # 지원하는 Summarizer가 없는 경우
-        supported_domains = []
-        for summarizer_class in cls._summarizers.values():
-            temp_instance = summarizer_class()
-            supported_domains.extend(temp_instance.get_supported_domains())
+        source = cls.find_source(url)
         
-        raise ValueError(
-            f"URL을 처리할 수 있는 Summarizer가 없습니다: {url}\n"
-            f"지원하는 도메인: {', '.join(supported_domains)}"
-        )
+        # 내장 소스로 처리할 수 없으면 플러그인 로드 후 재시도
+        if source is None and not cls._plugins_loaded:
+            cls._load_plugins()
+            source = cls.find_source(url)
+        
+        if source is None:
+            raise ValueError(
+                f"URL을 처리할 수 있는 Summarizer가 없습니다: {url}\n"
+                f"지원하는 도메인: {', '.join(cls.list_domains())}"
+            )
+        
+        logger.info(f"URL에 맞는 Summarizer 찾음: {_source_name(source)}")
+        return cls._summarizers[source](api_key=api_key, model=model)
+    
+    @classmethod
+    def find_source(cls, url: str) -> Optional[SourceKey]:
+        """URL을 처리할 소스 조회 (인스턴스 생성 없음)
+        
+        host와 상위 도메인 순서로 인덱스를 조회하고, 가장 긴 path prefix가 일치하는 소스 반환
+        
+        Args:
+            url: 확인할 URL
+        
+        Returns:
+            소스 키 (없으면 None)
+        """
+        parts = urlsplit(url if "://" in url else f"//{url}")
+        host = (parts.hostname or "").lower()
+        path = parts.path or "/"
+        
+        index = cls._get_domain_index()
+        labels = host.split(".")
+        
+        # news.smol.ai → news.smol.ai, smol.ai, ai 순으로 조회
+        for i in range(len(labels)):
+            for prefix, source in index.get(".".join(labels[i:]), ()):
+                if path.startswith(prefix):
+                    return source
+        
+        return None
+    
+    @classmethod
+    def _get_domain_index(cls) -> Dict[str, List[Tuple[str, SourceKey]]]:
+        """클래스 레벨 SUPPORTED_DOMAINS로 도메인 인덱스 생성"""
+        if cls._domain_index is None:
+            index: Dict[str, List[Tuple[str, SourceKey]]] = {}
+            for source, summarizer_class in cls._summarizers.items():
+                for domain in summarizer_class.SUPPORTED_DOMAINS:
+                    host, _, path = domain.lower().partition("/")
+                    index.setdefault(host, []).append(("/" + path, source))
+            
+            # 긴 path prefix가 먼저 매칭되도록 정렬
+            for entries in index.values():
+                entries.sort(key=lambda entry: len(entry[0]), reverse=True)
+            
+            cls._domain_index = index
+        
+        return cls._domain_index
+    
+    @classmethod
+    def _load_plugins(cls) -> None:
+        """entry point로 등록된 플러그인 Summarizer 로드 (최초 1회)
+        
+        pyproject.toml 예시:
+            [project.entry-points."news_bot.summarizers"]
+            hacker_news = "news_bot_hn:HackerNewsSummarizer"
+        """
+        if cls._plugins_loaded:
+            return
+        cls._plugins_loaded = True
+        
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:
+            return
+        
+        try:
+            plugins = entry_points(group=PLUGIN_ENTRY_POINT_GROUP)
+        except TypeError:
+            # Python 3.9 이하
+            plugins = entry_points().get(PLUGIN_ENTRY_POINT_GROUP, [])
+        
+        for entry_point in plugins:
+            try:
+                summarizer_class = entry_point.load()
+            except Exception as e:
+                logger.warning(f"플러그인 Summarizer 로드 실패 ({entry_point.name}): {str(e)}")
+                continue
+            cls.register(entry_point.name, summarizer_class)
     
     @classmethod
     def list_sources(cls) -> list[str]:
@@ -106,18 +204,31 @@ class SummarizerFactory:
         Returns:
             뉴스 소스 이름 리스트
         """
-        return [source.value for source in cls._summarizers.keys()]
+        return [_source_name(source) for source in cls._summarizers.keys()]
+    
+    @classmethod
+    def list_domains(cls) -> list[str]:
+        """등록된 모든 Summarizer의 지원 도메인 목록
+        
+        Returns:
+            도메인 리스트
+        """
+        domains = []
+        for summarizer_class in cls._summarizers.values():
+            domains.extend(summarizer_class.SUPPORTED_DOMAINS)
+        return domains
     
     @classmethod
-    def register(cls, source: NewsSource, summarizer_class: Type[BaseSummarizer]):
+    def register(cls, source: SourceKey, summarizer_class: Type[BaseSummarizer]):
         """새로운 Summarizer 등록
         
         Args:
-            source: 뉴스 소스 타입
+            source: 뉴스 소스 타입 (플러그인은 문자열 이름)
             summarizer_class: Summarizer 클래스
         """
         cls._summarizers[source] = summarizer_class
-        logger.info(f"새로운 Summarizer 등록: {source.value}")
+        cls._domain_index = None
+        logger.info(f"새로운 Summarizer 등록: {_source_name(source)}")
 
 
 # 하위 호환성을 위한 별칭 (기존 코드와의 호환성)
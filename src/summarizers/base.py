@@ -3,15 +3,22 @@
 Summarizer 베이스 클래스
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
+from ..response_cache import cached_create
+from ..streaming import StreamingMarkdownWriter, streamed_create
 from ..logger import logger
 
 
 class BaseSummarizer(ABC):
     """모든 Summarizer가 상속받는 추상 클래스"""
     
+    # 지원하는 도메인 목록 (클래스 레벨 선언, 'host' 또는 'host/path' 형식)
+    # SummarizerFactory가 인스턴스 생성 없이 URL 라우팅 인덱스를 만드는 데 사용
+    SUPPORTED_DOMAINS: List[str] = []
+    
     def __init__(self, name: str, api_key: Optional[str] = None, model: Optional[str] = None):
         """
         Args:
@@ -37,6 +44,67 @@ class BaseSummarizer(ABC):
         """
         pass
     
+    async def asummarize(self, url: str, **kwargs) -> str:
+        """summarize의 비동기 버전
+        
+        Args:
+            url: 요약할 콘텐츠 URL
+            **kwargs: 추가 파라미터
+        
+        Returns:
+            마크다운 형식의 요약
+        """
+        result = await self.asummarize_with_metadata(url, **kwargs)
+        return result['markdown']
+    
+    async def asummarize_with_metadata(self, url: str, **kwargs) -> Dict[str, Any]:
+        """요약과 메타데이터를 비동기로 생성
+        
+        기본 구현은 동기 summarize를 스레드에서 실행. AsyncOpenAI를 쓰는
+        Summarizer는 이 메서드를 오버라이드
+        
+        Args:
+            url: 요약할 콘텐츠 URL
+            **kwargs: 추가 파라미터
+        
+        Returns:
+            {'markdown': 요약, ...메타데이터} 딕셔너리
+        """
+        markdown = await asyncio.to_thread(self.summarize, url, **kwargs)
+        return {'markdown': markdown}
+    
+    def _create_response(
+        self,
+        params: Dict[str, Any],
+        stream: bool = False,
+        output_path: Optional[str] = None,
+        on_section=None,
+        **kwargs
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Responses API 호출 (stream=True면 델타를 파일에 즉시 기록)
+        
+        self.client (OpenAI 클라이언트)가 있는 Summarizer에서 사용
+        
+        Args:
+            params: responses.create 파라미터
+            stream: 스트리밍 모드 사용 여부
+            output_path: 스트리밍 델타를 기록할 .md 경로 (선택)
+            on_section: 섹션 완료 콜백 (title, markdown) (선택)
+            **kwargs: 무시 (summarize 인자 그대로 전달 가능하도록)
+        
+        Returns:
+            (응답 객체, 스트리밍 지표 또는 None) 튜플
+        """
+        if not stream:
+            return cached_create(self.client, **params), None
+        
+        writer = StreamingMarkdownWriter(output_path, on_section=on_section)
+        try:
+            response = streamed_create(self.client, writer, **params)
+        finally:
+            metrics = writer.close()
+        return response, metrics
+    
     @abstractmethod
     def validate_config(self) -> bool:
         """설정 유효성 검사
@@ -46,14 +114,13 @@ class BaseSummarizer(ABC):
         """
         pass
     
-    @abstractmethod
     def get_supported_domains(self) -> list[str]:
         """지원하는 도메인 목록
         
         Returns:
             도메인 리스트 (예: ['news.smol.ai', 'smol.ai'])
         """
-        pass
+        return list(self.SUPPORTED_DOMAINS)
     
     def can_handle(self, url: str) -> bool:
         """이 Summarizer가 해당 URL을 처리할 수 있는지 확인
@@ -9,12 +9,25 @@ from openai import OpenAI
 
 from .base import BaseSummarizer
 from ..config import Config
+from ..response_cache import cached_create
+from ..usage_ledger import llm_context
+from ..tracing import span
+from ..utils.link_compression import LinkCompressor
 from ..logger import logger
 
 
 class CompactSummarizer(BaseSummarizer):
     """전체 요약을 간결하게 재요약하는 Summarizer"""
     
+    # 지원 도메인 없음 (콘텐츠 직접 처리)
+    SUPPORTED_DOMAINS = []
+    
+    # GitHub Discussion URL이 정해지기 전에 사전 생성할 때 사용하는 자리표시 URL
+    DISCUSSION_URL_PLACEHOLDER = "https://github.com/discussions/__DISCUSSION_URL__"
+    
+    # LLM 호출 실패 시 돌려주는 기본 요약의 첫 줄 (실패 여부 판별용)
+    FALLBACK_HEADER = "AI 뉴스 요약이 생성되었습니다."
+    
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         """
         Args:
@@ -26,7 +39,7 @@ class CompactSummarizer(BaseSummarizer):
         super().__init__("Compact Summarizer", self.api_key, self.model)
         
         if self.api_key:
-            self.client = OpenAI(api_key=self.api_key, timeout=6000.0)
+            self.client = OpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL, timeout=6000.0)
         else:
             self.client = None
     
@@ -57,7 +70,8 @@ class CompactSummarizer(BaseSummarizer):
             {
                 'markdown': 간결한 요약,
                 'char_count': 글자수,
-                'style': 스타일
+                'style': 스타일,
+                'link_compression': 링크 압축 리포트 (절약 토큰, 복원 실패/임의 placeholder)
             }
         """
         import re
@@ -159,6 +173,10 @@ class CompactSummarizer(BaseSummarizer):
 ---
 📖 상세 뉴스레터: [GitHub Discussion 링크](https://github.com/orgs/sudormrf-run/discussions/4)"""
         
+        # 원본 요약의 URL을 placeholder로 압축 (응답에서 복원)
+        compressor = LinkCompressor("compact", enabled=Config.LINK_COMPRESSION_ENABLED)
+        compressed_content = compressor.compress(content)
+        
         news_type = "로보틱스" if is_robotics else "AI"
         user_prompt = f"""다음 {news_type} 뉴스 요약을 위 형식에 맞춰 Discord용으로 간결하게 재요약해주세요.
 
@@ -169,8 +187,10 @@ GitHub Discussion URL: {github_url if github_url else 'https://github.com/sudorm
 ---
 📖 상세 뉴스레터: {github_url if github_url else 'GitHub Discussion 링크'}
 
+링크 규칙: 원본 요약의 링크는 [LINK_0001] 같은 placeholder로 되어 있습니다. 링크에는 원본의 placeholder를 그대로 사용하고, 새 placeholder를 만들지 마세요.
+
 원본 요약:
-{content}"""
+{compressed_content}"""
         
         try:
             if not self.client:
@@ -188,28 +208,27 @@ GitHub Discussion URL: {github_url if github_url else 'https://github.com/sudorm
                     {"role": "user", "content": [{"type": "input_text", "text": user_prompt}]}
                 ]
                 
-                response = self.client.responses.create(
-                    model=self.model,
-                    input=input_messages,
-                    reasoning={"effort": "low"}  # 빠른 응답을 위해 low 설정
-                )
-                
-                # 응답에서 텍스트 추출
-                compact_summary = self._extract_text_from_response(response)
+                with llm_context(stage="compact"), span("compact", chars_in=len(content)) as compact_span:
+                    response = cached_create(
+                        self.client,
+                        model=self.model,
+                        input=input_messages,
+                        reasoning={"effort": "low"}  # 빠른 응답을 위해 low 설정
+                    )
+                    
+                    # 응답에서 텍스트 추출
+                    compact_summary = compressor.restore(self._extract_text_from_response(response))
+                    compact_span.set(chars_out=len(compact_summary), links=compressor.report.link_count)
                 logger.info(f"OpenAI Responses API 응답 수신 완료")
                 
                 # GitHub URL이 없으면 추가
-                if github_url and github_url not in compact_summary:
-                    if not compact_summary.strip().endswith(github_url):
-                        compact_summary = compact_summary.rstrip()
-                        if "---" not in compact_summary[-100:]:  # 마지막 100자 내에 구분선이 없으면
-                            compact_summary += "\n\n---"
-                        compact_summary += f"\n📖 상세 뉴스레터: {github_url}"
+                compact_summary = self._ensure_footer(compact_summary, github_url)
             
             result = {
                 'markdown': compact_summary,
                 'char_count': len(compact_summary),
-                'style': style
+                'style': style,
+                'link_compression': compressor.report.to_dict()
             }
             
             logger.info(f"간결한 요약 생성 완료 ({result['char_count']}자)")
@@ -224,6 +243,48 @@ GitHub Discussion URL: {github_url if github_url else 'https://github.com/sudorm
                 'style': style
             }
     
+    @classmethod
+    def fill_discussion_url(cls, compact_summary: str, github_url: str) -> str:
+        """사전 생성한 요약의 자리표시 URL을 실제 GitHub Discussion URL로 교체
+        
+        Args:
+            compact_summary: DISCUSSION_URL_PLACEHOLDER로 생성한 간결 요약
+            github_url: 게시 후 확정된 GitHub Discussion URL
+        
+        Returns:
+            실제 URL이 들어간 간결 요약
+        """
+        filled = compact_summary.replace(cls.DISCUSSION_URL_PLACEHOLDER, github_url)
+        return cls._ensure_footer(filled, github_url)
+    
+    @classmethod
+    def remove_discussion_url(cls, compact_summary: str) -> str:
+        """GitHub 게시가 실패했을 때 사전 생성한 요약에서 자리표시 URL 줄과 남는 구분선 제거
+        
+        Args:
+            compact_summary: DISCUSSION_URL_PLACEHOLDER로 생성한 간결 요약
+        
+        Returns:
+            Discussion 링크 없이 발송할 수 있는 간결 요약
+        """
+        lines = [line for line in compact_summary.split("\n") if cls.DISCUSSION_URL_PLACEHOLDER not in line]
+        stripped = "\n".join(lines).rstrip()
+        if stripped.endswith("---"):
+            stripped = stripped[:-3].rstrip()
+        return stripped
+    
+    @staticmethod
+    def _ensure_footer(compact_summary: str, github_url: str) -> str:
+        """GitHub URL이 본문에 없으면 마지막에 상세 뉴스레터 링크 추가"""
+        if not github_url or github_url in compact_summary:
+            return compact_summary
+        
+        compact_summary = compact_summary.rstrip()
+        if "---" not in compact_summary[-100:]:  # 마지막 100자 내에 구분선이 없으면
+            compact_summary += "\n\n---"
+        compact_summary += f"\n📖 상세 뉴스레터: {github_url}"
+        return compact_summary
+    
     def _create_template_summary(self, content: str, github_url: str, style: str) -> str:
         """템플릿 기반 임시 요약 생성"""
         # TODO: 실제 LLM 호출로 대체
@@ -244,7 +305,12 @@ GitHub Discussion URL: {github_url if github_url else 'https://github.com/sudorm
     
     def _create_fallback_summary(self, github_url: str) -> str:
         """오류 시 기본 요약"""
-        return f"AI 뉴스 요약이 생성되었습니다.\n\n📖 자세히 보기: {github_url}"
+        return f"{self.FALLBACK_HEADER}\n\n📖 자세히 보기: {github_url}"
+    
+    @classmethod
+    def is_fallback_summary(cls, compact_summary: str) -> bool:
+        """LLM 호출 실패로 만든 기본 요약인지 여부"""
+        return compact_summary.startswith(cls.FALLBACK_HEADER)
     
     def _extract_text_from_response(self, response) -> str:
         """Responses API 응답에서 텍스트 추출
@@ -272,7 +338,3 @@ GitHub Discussion URL: {github_url if github_url else 'https://github.com/sudorm
     def validate_config(self) -> bool:
         """설정 검증"""
         return bool(self.api_key)
-    
-    def get_supported_domains(self) -> list[str]:
-        """지원 도메인 (해당 없음 - 콘텐츠 직접 처리)"""
-        return []
\ No newline at end of file
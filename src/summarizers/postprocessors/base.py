@@ -5,7 +5,7 @@ PostProcessor 베이스 클래스
 
 from abc import ABC, abstractmethod
 from typing import Optional, Dict, Any
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 import json
 
 from ...config import Config
@@ -26,11 +26,20 @@ class BasePostProcessor(ABC):
         self.api_key = api_key or Config.OPENAI_API_KEY
         self.model = model or "gpt-5"
         
+        self._async_client: Optional[AsyncOpenAI] = None
+        
         if self.api_key:
-            self.client = OpenAI(api_key=self.api_key, timeout=6000.0)
+            self.client = OpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL, timeout=6000.0)
         
         logger.debug(f"{self.name} PostProcessor 초기화 (모델: {self.model})")
     
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """비동기 OpenAI 클라이언트 (최초 사용 시 생성)"""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL, timeout=6000.0)
+        return self._async_client
+    
     @abstractmethod
     def process(self, markdown: str, original_source_url: Optional[str] = None) -> str:
         """마크다운 텍스트 후처리
@@ -4,61 +4,55 @@ SmolAI News 전용 PostProcessor
 중복된 출처 표기를 제거합니다.
 """
 
-from typing import Optional, Tuple
+from typing import Optional, Tuple, Dict, Any
+from urllib.parse import urlparse
 from ...logger import logger
+from ...markdown_utils import extract_today_summary, parse_markdown
+from ...response_cache import cached_create, acached_create
+from ...usage_ledger import llm_context
+from ...tracing import span
+from ...config import Config
+from ...utils.link_dedupe import LinkDeduplicator
+from ...utils.link_compression import LinkCompressor
 from .base import BasePostProcessor
 
 
 class SmolAIPostProcessor(BasePostProcessor):
-    """SmolAI News 요약의 중복 출처를 제거하는 PostProcessor"""
-    
-    # 후처리용 프롬프트
-    SYSTEM_PROMPT = """역할: AI 뉴스 큐레이터 및 마크다운 정리 전문가
+    """SmolAI News 요약의 중복 출처를 제거하는 PostProcessor
 
-목표: 
-1. 입력된 마크다운 텍스트에서 중복된 출처 표기를 제거하고, 정확하지 않은 링크를 보완
-2. 가장 중요하거나 흥미로운 뉴스를 선정하여 헤드라인 생성
+    중복 링크 제거는 LinkDeduplicator로 로컬에서 결정적으로 처리하고,
+    모델에는 '오늘의 요약' 섹션만 보내 헤드라인을 생성
+    """
+    
+    EMPTY_TODAY_SUMMARY = "오늘은 AI 분야에 특별히 주목할 만한 이벤트가 없었습니다"
+    
+    # 헤드라인 생성용 프롬프트
+    HEADLINE_PROMPT = """역할: AI 뉴스 큐레이터
 
-규칙:
-1. 각 문단/불릿에서 동일한 출처가 반복되면 한 번만 남기기
-2. 연속된 문장에서 같은 링크가 반복되면 첫 번째만 남기기
-3. 마지막 "출처:" 부분은 반드시 있어야 함.
-4. 내용은 변경하지 말고 중복 링크만 제거
-5. 원문의 구조와 의미를 100% 보존
-6. URL 은 하위 링크까지 정확하게 작성
-7. 최상단 '오늘의 요약' 섹션이 비어있거나 내용이 없다면 '오늘은 AI 분야에 특별히 주목할 만한 이벤트가 없었습니다'로 명시
+목표: 입력된 '오늘의 요약'에서 가장 중요하거나 흥미로운 뉴스를 골라 헤드라인 작성
 
 헤드라인 선정 기준:
 - 가장 혁신적이거나 영향력 있는 뉴스 우선
 - 대중의 관심을 끌 만한 흥미로운 소식 선택
 - 간결하고 임팩트 있는 표현 사용
-- 15자 이내로 핵심만 전달"""
+- 15자 이내로 핵심만 전달
 
-    DEVELOPER_PROMPT = """작업:
-1. 동일한 URL이 한 문단/불릿 내에서 2번 이상 나타나면 첫 번째만 남기고 제거
-2. "(news.smol.ai)" 같은 괄호 출처가 각 불릿 끝마다 반복되면 제거
-3. 마지막 "출처:" 줄은 반드시 있어야하고, 간결하게 원출처 링크만 표시.
-4. 링크 텍스트와 URL의 매칭 관계는 유지
-5. web_search로 원본 소스를 확인하고, 현재 문서의 URL이 부정확하면 원본의 정확한 URL로 교체
-6. 특히 x.com/twitter.com 링크는 트윗 ID까지 포함된 전체 URL로 교체
-7. '오늘의 요약' 섹션이 비어있거나 무의미한 경우, '오늘은 AI 분야에 특별히 주목할 만한 이벤트가 없었습니다'로 명시
-
-출력 형식 (JSON):
-{
-  "headline": "가장 중요하거나 흥미로운 뉴스의 핵심 (15자 이내)",
-  "cleaned_markdown": "정리된 전체 마크다운 문서"
-}"""
+출력: 헤드라인 한 줄만 (따옴표, 마크다운, 설명 없이)"""
+    
+    # 헤드라인 입력 최대 길이 ('오늘의 요약' 섹션이 없을 때 문서 앞부분 사용)
+    HEADLINE_INPUT_CHARS = 2000
     
     def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None):
         """
         Args:
             api_key: OpenAI API 키
-            model: 사용할 모델 (기본값: gpt-5)
+            model: 헤드라인 생성 모델 (기본값: gpt-5)
         """
         super().__init__("SmolAI PostProcessor", api_key, model or "gpt-5")
+        self.last_compression: Optional[LinkCompressor] = None
     
     def process(self, markdown: str, original_source_url: Optional[str] = None) -> str:
-        """SmolAI News 마크다운의 중복 출처 제거
+        """SmolAI News 마크다운의 중복 출처 제거 (API 호출 없음)
         
         Args:
             markdown: 원본 마크다운 텍스트
@@ -67,8 +61,28 @@ class SmolAIPostProcessor(BasePostProcessor):
         Returns:
             중복 제거된 마크다운 텍스트
         """
-        cleaned_md, _ = self.process_with_headline(markdown, original_source_url)
-        return cleaned_md
+        return self.clean(markdown, original_source_url)
+    
+    def clean(self, markdown: str, original_source_url: Optional[str] = None) -> str:
+        """중복 링크/반복 괄호 출처 제거, 출처 줄 및 빈 '오늘의 요약' 보완
+        
+        같은 입력에는 항상 같은 결과를 반환 (모델 호출 없음)
+        
+        Args:
+            markdown: 원본 마크다운 텍스트
+            original_source_url: 원본 소스 URL (선택적)
+        
+        Returns:
+            정리된 마크다운 텍스트
+        """
+        with span("postprocess.clean", chars_in=len(markdown)) as clean_span:
+            deduplicator = LinkDeduplicator(original_source_url)
+            cleaned = deduplicator.dedupe(markdown)
+            cleaned = self._fill_empty_today_summary(cleaned)
+            cleaned = self._ensure_source_line(cleaned, original_source_url)
+            clean_span.set(chars_out=len(cleaned), links_removed=deduplicator.removed)
+        logger.debug(f"SmolAI 중복 출처 로컬 제거 완료 ({deduplicator.removed}건 제거)")
+        return cleaned
     
     def process_with_headline(self, markdown: str, original_source_url: Optional[str] = None) -> Tuple[str, str]:
         """SmolAI News 마크다운의 중복 출처 제거 및 헤드라인 추출
@@ -80,55 +94,115 @@ class SmolAIPostProcessor(BasePostProcessor):
         Returns:
             (중복 제거된 마크다운 텍스트, 헤드라인) 튜플
         """
-        # 메시지 구성
-        user_prompt = f"""다음 마크다운에서:
-1. 중복된 출처 표기를 제거하고, 부정확한 링크를 보완
-2. 가장 중요하거나 흥미로운 뉴스를 선정하여 헤드라인 생성 (15자 이내)
-
-{markdown}"""
+        cleaned_md = self.clean(markdown, original_source_url)
+        try:
+            logger.debug(f"SmolAI 헤드라인 생성 시작 (모델: {self.model}, reasoning: low)")
+            compressor = self._new_compressor()
+            with llm_context(stage="postprocess"), span("postprocess.headline") as headline_span:
+                resp = cached_create(self.client, **self._build_headline_request(cleaned_md, compressor))
+                headline = compressor.restore(self._parse_headline(resp))
+                headline_span.set(chars_out=len(headline))
+            return cleaned_md, headline
+        except Exception as e:
+            logger.warning(f"SmolAI 헤드라인 생성 중 오류 발생: {str(e)}, 헤드라인 없이 진행")
+            return cleaned_md, ""
+    
+    async def aprocess_with_headline(self, markdown: str, original_source_url: Optional[str] = None) -> Tuple[str, str]:
+        """process_with_headline의 비동기 버전 (AsyncOpenAI 사용)
         
-        if original_source_url:
-            user_prompt += f"\n\n원본 소스 URL: {original_source_url}"
+        Args:
+            markdown: 원본 마크다운 텍스트
+            original_source_url: 원본 소스 URL (선택적)
+        
+        Returns:
+            (중복 제거된 마크다운 텍스트, 헤드라인) 튜플
+        """
+        cleaned_md = self.clean(markdown, original_source_url)
+        try:
+            logger.debug(f"SmolAI 헤드라인 비동기 생성 시작 (모델: {self.model}, reasoning: low)")
+            compressor = self._new_compressor()
+            with llm_context(stage="postprocess"), span("postprocess.headline") as headline_span:
+                resp = await acached_create(
+                    self.async_client, **self._build_headline_request(cleaned_md, compressor)
+                )
+                headline = compressor.restore(self._parse_headline(resp))
+                headline_span.set(chars_out=len(headline))
+            return cleaned_md, headline
+        except Exception as e:
+            logger.warning(f"SmolAI 헤드라인 생성 중 오류 발생: {str(e)}, 헤드라인 없이 진행")
+            return cleaned_md, ""
+    
+    def _new_compressor(self) -> LinkCompressor:
+        """헤드라인 호출용 링크 압축기 생성 (마지막 리포트는 last_compression으로 노출)"""
+        compressor = LinkCompressor("headline", enabled=Config.LINK_COMPRESSION_ENABLED)
+        self.last_compression = compressor
+        return compressor
+    
+    def _build_headline_request(self, markdown: str, compressor: Optional[LinkCompressor] = None) -> Dict[str, Any]:
+        """헤드라인 요청 파라미터 구성 ('오늘의 요약' 섹션만 전송)
+        
+        Args:
+            markdown: 정리된 마크다운 텍스트
+            compressor: 링크 압축기 (주어지면 URL을 placeholder로 바꿔 전송)
+        
+        Returns:
+            responses.create 파라미터
+        """
+        summary = extract_today_summary(markdown) or markdown[:self.HEADLINE_INPUT_CHARS]
+        if compressor:
+            summary = compressor.compress(summary)
         
         input_messages = [
-            {"role": "system", "content": [{"type": "input_text", "text": self.SYSTEM_PROMPT}]},
-            {"role": "developer", "content": [{"type": "input_text", "text": self.DEVELOPER_PROMPT}]},
-            {"role": "user", "content": [{"type": "input_text", "text": user_prompt}]},
+            {"role": "system", "content": [{"type": "input_text", "text": self.HEADLINE_PROMPT}]},
+            {"role": "user", "content": [{"type": "input_text", "text": summary}]},
         ]
         
-        try:
-            logger.debug(f"SmolAI 중복 출처 제거 시작 (모델: {self.model}, reasoning: low)")
-            if original_source_url:
-                logger.debug(f"원본 소스로 URL 검증: {original_source_url}")
-            
-            # GPT-5 사용, reasoning effort는 low로 설정, web_search 도구 추가
-            resp = self.client.responses.create(
-                model=self.model,
-                input=input_messages,
-                tools=[{"type": "web_search"}] if original_source_url else [],
-                reasoning={"effort": "low"},  # 단순 정리 작업이므로 low
-            )
-            
-            # 응답에서 JSON 추출
-            result = self._extract_json(resp)
-            
-            if result and isinstance(result, dict):
-                cleaned_md = result.get('cleaned_markdown', markdown)
-                headline = result.get('headline', '')
-                
-                if cleaned_md:
-                    logger.debug(f"SmolAI 후처리 완료 - 헤드라인: {headline}")
-                    return cleaned_md, headline
-            
-            # JSON 파싱 실패 시 마크다운만 추출 시도
-            cleaned_md = self._extract_markdown(resp)
-            if cleaned_md:
-                logger.debug("SmolAI 중복 출처 제거 완료 (헤드라인 없음)")
-                return cleaned_md, ""
-            
-            logger.warning("후처리 결과가 비어있음, 원본 반환")
-            return markdown, ""
-                
-        except Exception as e:
-            logger.warning(f"SmolAI 후처리 중 오류 발생: {str(e)}, 원본 반환")
-            return markdown, ""
\ No newline at end of file
+        return {
+            "model": self.model,
+            "input": input_messages,
+            "reasoning": {"effort": "low"},  # 짧은 헤드라인 생성이므로 low
+        }
+    
+    def _parse_headline(self, resp) -> str:
+        """헤드라인 응답에서 첫 줄 추출
+        
+        Args:
+            resp: OpenAI API 응답 객체
+        
+        Returns:
+            헤드라인 (없으면 빈 문자열)
+        """
+        text = self._extract_markdown(resp) or ""
+        for line in text.splitlines():
+            headline = line.strip().strip('#*"\'“”').strip()
+            if headline:
+                logger.debug(f"SmolAI 헤드라인: {headline}")
+                return headline
+        return ""
+    
+    @classmethod
+    def _fill_empty_today_summary(cls, markdown: str) -> str:
+        """'오늘의 요약' 섹션 본문이 비어 있으면 기본 문구 채우기"""
+        section = parse_markdown(markdown).today_summary_section
+        if not section or section.body or section.children:
+            return markdown
+        
+        # 헤더만 있는 섹션 → 헤더 뒤에 기본 문구 삽입
+        head = markdown[:section.body_start].rstrip("\r\n")
+        rest = markdown[section.body_start:].lstrip("\r\n")
+        return f"{head}\n\n{cls.EMPTY_TODAY_SUMMARY}\n" + (f"\n{rest}" if rest else "")
+    
+    @staticmethod
+    def _ensure_source_line(markdown: str, original_source_url: Optional[str] = None) -> str:
+        """마지막 '출처:' 줄이 없으면 원출처 링크 추가"""
+        if not original_source_url:
+            return markdown
+        
+        for line in reversed(markdown.rstrip().splitlines()):
+            if line.strip():
+                if "출처" in line:
+                    return markdown
+                break
+        
+        host = urlparse(original_source_url).netloc or original_source_url
+        return f"{markdown.rstrip()}\n\n---\n출처: [{host}]({original_source_url})"
@@ -4,19 +4,25 @@ Smol AI News Summarizer
 https://news.smol.ai 전용 요약 생성기
 """
 
+import re
+from datetime import datetime
 from typing import Optional, List, Dict, Any
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 
 from .base import BaseSummarizer
 from .postprocessors import SmolAIPostProcessor
 from ..utils.link_preserver import LinkPreserver
 from ..config import Config
-from ..logger import logger, log_execution_time
+from ..response_cache import acached_create
+from ..tracing import traced
+from ..logger import logger
 
 
 class SmolAINewsSummarizer(BaseSummarizer):
     """Smol AI News 전용 Summarizer"""
     
+    SUPPORTED_DOMAINS = ['news.smol.ai', 'smol.ai/issues']
+    
     # Smol AI News 전용 프롬프트
     SYSTEM_PROMPT = """역할: 당신은 기술 뉴스레터 편집자입니다. 입력으로 제공된 뉴스레터 본문에서 AI Twitter Recap, AI Reddit Recap, AI Discord Recap 섹션만 다룹니다. 추가로 그날의 요약 섹션이 최상단에 있다면 그 내용도 다룹니다.
 
@@ -63,20 +69,31 @@ class SmolAINewsSummarizer(BaseSummarizer):
         self.api_key = api_key or Config.OPENAI_API_KEY
         self.model = model or Config.OPENAI_MODEL
         
+        self._postprocessor: Optional[SmolAIPostProcessor] = None
+        self._async_client: Optional[AsyncOpenAI] = None
+        
         if self.api_key:
-            self.client = OpenAI(api_key=self.api_key, timeout=6000.0)
-            # SmolAI 전용 PostProcessor 초기화
-            self.postprocessor = SmolAIPostProcessor(api_key=self.api_key, model="gpt-5")
+            self.client = OpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL, timeout=6000.0)
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """비동기 OpenAI 클라이언트 (최초 사용 시 생성)"""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL, timeout=6000.0)
+        return self._async_client
+    
+    @property
+    def postprocessor(self) -> SmolAIPostProcessor:
+        """SmolAI 전용 PostProcessor (최초 사용 시 생성)"""
+        if self._postprocessor is None:
+            self._postprocessor = SmolAIPostProcessor(api_key=self.api_key, model="gpt-5")
+        return self._postprocessor
     
     def validate_config(self) -> bool:
         """설정 유효성 검사"""
         return bool(self.api_key)
     
-    def get_supported_domains(self) -> list[str]:
-        """지원하는 도메인 목록"""
-        return ['news.smol.ai', 'smol.ai/issues']
-    
-    @log_execution_time
+    @traced("summarizer.smol_ai.summarize")
     def summarize(self, url: str, **kwargs) -> str:
         """Smol AI News 이슈 요약 생성
         
@@ -90,107 +107,179 @@ class SmolAINewsSummarizer(BaseSummarizer):
         result = self.summarize_with_metadata(url, **kwargs)
         return result['markdown']
     
-    @log_execution_time
+    @traced("summarizer.smol_ai.summarize_with_metadata")
     def summarize_with_metadata(self, url: str, **kwargs) -> Dict[str, Any]:
         """Smol AI News 요약과 메타데이터 생성
         
         Args:
             url: Smol AI News 이슈 URL
             timeframe: 기간 정보 (선택)
+            stream: True면 응답을 스트리밍으로 받아 output_path에 즉시 기록 (선택)
+            output_path: 스트리밍 델타를 기록할 .md 경로 (선택)
+            on_section: 섹션 완료 콜백 (title, markdown) (선택)
         
         Returns:
             {
                 'markdown': 마크다운 형식의 요약,
                 'headline': 추출된 헤드라인,
-                'date': 날짜 정보
+                'date': 날짜 정보,
+                'stream_metrics': 스트리밍 지표 (스트리밍 모드에서만)
             }
         """
-        timeframe = kwargs.get('timeframe')
-        
-        # 사용자 프롬프트 구성
-        user_text = (
-            f"요약 대상 URL: {url}\n"
-            "요청: 상기 페이지에서 'AI Twitter Recap', 'AI Reddit Recap', 'AI Discord Recap' "
-            "세 섹션만 인용·요약하고, 원문 링크/앵커를 그대로 보존하여 한국어 마크다운으로 출력해 주세요. "
-            "중요: 모든 링크 placeholder ([LINK_0001] 형태)는 절대 변경하지 말고 그대로 유지하세요. "
-            + (f"기간 힌트: {timeframe}" if timeframe else "")
-        )
-        
-        # API 메시지 구성
-        input_messages = [
-            {"role": "system", "content": [{"type": "input_text", "text": self.SYSTEM_PROMPT}]},
-            {"role": "developer", "content": [{"type": "input_text", "text": self.DEVELOPER_PROMPT}]},
-            {"role": "user", "content": [{"type": "input_text", "text": user_text}]},
-        ]
-        
         try:
-            # LinkPreserver 초기화
-            link_preserver = LinkPreserver()
-            
             # OpenAI Responses API 호출
             logger.debug("Smol AI News 요약을 위한 OpenAI API 호출 중...")
-            resp = self.client.responses.create(
-                model=self.model,
-                input=input_messages,
-                tools=[{"type": "web_search"}],
-                reasoning={"effort": "high"},
-                #service_tier="flex"
+            resp, stream_metrics = self._create_response(
+                self._build_request(url, kwargs.get('timeframe')), **kwargs
             )
             
-            # 응답에서 마크다운 추출
-            md = self._extract_markdown(resp)
-            
-            if not md:
-                raise RuntimeError("모델이 유효한 마크다운을 반환하지 않았습니다.")
-            
-            # 원본 마크다운에서 링크 추출 및 보존
-            original_links = link_preserver.extract_links(md)
-            logger.info(f"원본에서 {len(original_links)}개 링크 발견")
-            
-            # 중간 결과 로깅 (후처리 전)
-            logger.info(f"=== 후처리 전 마크다운 (길이: {len(md)}자) ===")
-            logger.debug(f"원본 마크다운:\n{md[:500]}..." if len(md) > 500 else f"원본 마크다운:\n{md}")
+            md = self._prepare_markdown(resp)
             
             # 후처리: SmolAI 전용 PostProcessor 사용 (원본 URL 전달)
             logger.debug("중복 출처 제거 및 헤드라인 추출 시작...")
             cleaned_md, headline = self.postprocessor.process_with_headline(md.strip(), original_source_url=url)
             
-            # 링크 검증 및 복구
-            processed_links = link_preserver.extract_links(cleaned_md)
-            logger.info(f"후처리 후 {len(processed_links)}개 링크 존재")
+            result = self._build_result(url, md, cleaned_md, headline)
+            if stream_metrics:
+                result['stream_metrics'] = stream_metrics
+            return result
             
-            # 원본 링크와 비교하여 누락된 링크 확인
-            validation_result = link_preserver.validate_links(md, cleaned_md)
-            if validation_result['missing']:
-                logger.warning(f"링크 {len(validation_result['missing'])}개 누락됨, 복구 시도...")
-                # TODO: 누락된 링크 복구 로직 구현 필요
+        except Exception as e:
+            logger.error(f"Smol AI News 요약 생성 실패: {str(e)}", exc_info=True)
+            raise
+    
+    async def asummarize_with_metadata(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Smol AI News 요약과 메타데이터 생성 (AsyncOpenAI 사용)
+        
+        Args:
+            url: Smol AI News 이슈 URL
+            timeframe: 기간 정보 (선택)
+        
+        Returns:
+            summarize_with_metadata와 동일한 딕셔너리
+        """
+        try:
+            logger.debug("Smol AI News 요약을 위한 OpenAI API 비동기 호출 중...")
+            resp = await acached_create(self.async_client, **self._build_request(url, kwargs.get('timeframe')))
             
-            # 최종 결과 로깅
-            logger.info(f"=== 후처리 후 마크다운 (길이: {len(cleaned_md)}자) ===")
-            if headline:
-                logger.info(f"=== 추출된 헤드라인: {headline} ===")
-            logger.debug(f"정리된 마크다운:\n{cleaned_md[:500]}..." if len(cleaned_md) > 500 else f"정리된 마크다운:\n{cleaned_md}")
+            md = self._prepare_markdown(resp)
             
-            # URL에서 날짜 추출 시도
-            import re
-            date_match = re.search(r'(\d{2})-(\d{2})-(\d{2})', url)
-            if date_match:
-                date_str = f"{date_match.group(1)}.{date_match.group(2)}.{date_match.group(3)}"
-            else:
-                # 기본값
-                from datetime import datetime
-                date_str = datetime.now().strftime("%y.%m.%d")
+            cleaned_md, headline = await self.postprocessor.aprocess_with_headline(
+                md.strip(), original_source_url=url
+            )
             
-            return {
-                'markdown': cleaned_md.strip(),
-                'headline': headline or "",
-                'date': date_str
-            }
+            return self._build_result(url, md, cleaned_md, headline)
             
         except Exception as e:
-            logger.error(f"Smol AI News 요약 생성 실패: {str(e)}", exc_info=True)
+            logger.error(f"Smol AI News 비동기 요약 생성 실패: {str(e)}", exc_info=True)
             raise
     
+    def _build_request(self, url: str, timeframe: Optional[str] = None) -> Dict[str, Any]:
+        """요약 요청 파라미터 구성
+        
+        Args:
+            url: Smol AI News 이슈 URL
+            timeframe: 기간 정보 (선택)
+        
+        Returns:
+            responses.create 파라미터
+        """
+        # 사용자 프롬프트 구성
+        user_text = (
+            f"요약 대상 URL: {url}\n"
+            "요청: 상기 페이지에서 'AI Twitter Recap', 'AI Reddit Recap', 'AI Discord Recap' "
+            "세 섹션만 인용·요약하고, 원문 링크/앵커를 그대로 보존하여 한국어 마크다운으로 출력해 주세요. "
+            "중요: 모든 링크 placeholder ([LINK_0001] 형태)는 절대 변경하지 말고 그대로 유지하세요. "
+            + (f"기간 힌트: {timeframe}" if timeframe else "")
+        )
+        
+        # API 메시지 구성
+        input_messages = [
+            {"role": "system", "content": [{"type": "input_text", "text": self.SYSTEM_PROMPT}]},
+            {"role": "developer", "content": [{"type": "input_text", "text": self.DEVELOPER_PROMPT}]},
+            {"role": "user", "content": [{"type": "input_text", "text": user_text}]},
+        ]
+        
+        return {
+            "model": self.model,
+            "input": input_messages,
+            "tools": [{"type": "web_search"}],
+            "reasoning": {"effort": "high"},
+            #"service_tier": "flex",
+        }
+    
+    def _prepare_markdown(self, resp) -> str:
+        """응답에서 후처리 전 마크다운 추출
+        
+        Args:
+            resp: OpenAI API 응답 객체
+        
+        Returns:
+            후처리 전 마크다운
+        
+        Raises:
+            RuntimeError: 응답에 마크다운이 없는 경우
+        """
+        # 응답에서 마크다운 추출
+        md = self._extract_markdown(resp)
+        
+        if not md:
+            raise RuntimeError("모델이 유효한 마크다운을 반환하지 않았습니다.")
+        
+        # 원본 마크다운에서 링크 추출
+        original_links = LinkPreserver().extract_links(md)
+        logger.info(f"원본에서 {len(original_links)}개 링크 발견")
+        
+        # 중간 결과 로깅 (후처리 전)
+        logger.info(f"=== 후처리 전 마크다운 (길이: {len(md)}자) ===")
+        logger.debug(f"원본 마크다운:\n{md[:500]}..." if len(md) > 500 else f"원본 마크다운:\n{md}")
+        
+        return md
+    
+    def _build_result(self, url: str, md: str, cleaned_md: str, headline: str) -> Dict[str, Any]:
+        """후처리 결과 검증 및 메타데이터 구성
+        
+        Args:
+            url: Smol AI News 이슈 URL
+            md: 후처리 전 마크다운
+            cleaned_md: 후처리 후 마크다운
+            headline: 추출된 헤드라인
+        
+        Returns:
+            {'markdown', 'headline', 'date'} 딕셔너리
+        """
+        link_preserver = LinkPreserver()
+        
+        # 링크 검증 및 복구
+        processed_links = link_preserver.extract_links(cleaned_md)
+        logger.info(f"후처리 후 {len(processed_links)}개 링크 존재")
+        
+        # 원본 링크와 비교하여 누락된 링크 확인
+        validation_result = link_preserver.validate_links(md, cleaned_md)
+        if validation_result['missing']:
+            logger.warning(f"링크 {len(validation_result['missing'])}개 누락됨, 복구 시도...")
+            # TODO: 누락된 링크 복구 로직 구현 필요
+        
+        # 최종 결과 로깅
+        logger.info(f"=== 후처리 후 마크다운 (길이: {len(cleaned_md)}자) ===")
+        if headline:
+            logger.info(f"=== 추출된 헤드라인: {headline} ===")
+        logger.debug(f"정리된 마크다운:\n{cleaned_md[:500]}..." if len(cleaned_md) > 500 else f"정리된 마크다운:\n{cleaned_md}")
+        
+        # URL에서 날짜 추출 시도
+        date_match = re.search(r'(\d{2})-(\d{2})-(\d{2})', url)
+        if date_match:
+            date_str = f"{date_match.group(1)}.{date_match.group(2)}.{date_match.group(3)}"
+        else:
+            # 기본값
+            date_str = datetime.now().strftime("%y.%m.%d")
+        
+        return {
+            'markdown': cleaned_md.strip(),
+            'headline': headline or "",
+            'date': date_str
+        }
+    
     def _extract_markdown(self, response) -> str:
         """API 응답에서 마크다운 텍스트 추출
         
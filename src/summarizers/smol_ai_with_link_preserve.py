@@ -12,7 +12,9 @@ from .base import BaseSummarizer
 from .postprocessors import SmolAIPostProcessor
 from ..utils.link_preserver import LinkPreserver
 from ..config import Config
-from ..logger import logger, log_execution_time
+from ..response_cache import cached_create
+from ..tracing import traced
+from ..logger import logger
 
 
 class SmolAINewsWithLinkPreserveSummarizer(BaseSummarizer):
@@ -49,7 +51,7 @@ class SmolAINewsWithLinkPreserveSummarizer(BaseSummarizer):
         self.model = model or Config.OPENAI_MODEL
         
         if self.api_key:
-            self.client = OpenAI(api_key=self.api_key, timeout=6000.0)
+            self.client = OpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL, timeout=6000.0)
             self.postprocessor = SmolAIPostProcessor(api_key=self.api_key, model="gpt-5")
             self.link_preserver = LinkPreserver()
     
@@ -78,7 +80,7 @@ class SmolAINewsWithLinkPreserveSummarizer(BaseSummarizer):
         
         return response, link_map
     
-    @log_execution_time
+    @traced("summarizer.smol_ai_link_preserve.summarize_with_metadata")
     def summarize_with_metadata(self, url: str, **kwargs) -> Dict[str, Any]:
         """링크 보존 기능이 있는 요약 생성"""
         timeframe = kwargs.get('timeframe')
@@ -101,7 +103,8 @@ class SmolAINewsWithLinkPreserveSummarizer(BaseSummarizer):
         try:
             # OpenAI API 호출
             logger.debug("링크 보존 SmolAI 요약 시작...")
-            resp = self.client.responses.create(
+            resp = cached_create(
+                self.client,
                 model=self.model,
                 input=input_messages,
                 tools=[{"type": "web_search"}],
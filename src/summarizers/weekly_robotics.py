@@ -4,18 +4,22 @@ Weekly Robotics Newsletter Summarizer
 https://www.weeklyrobotics.com 전용 요약 생성기
 """
 
-from typing import Optional, List, Dict, Any
-from openai import OpenAI
+from typing import Optional, List, Dict, Any, Tuple
+from openai import OpenAI, AsyncOpenAI
 import re
 
 from .base import BaseSummarizer, SummarizerResult
 from ..config import Config
-from ..logger import logger, log_execution_time
+from ..response_cache import acached_create
+from ..tracing import traced
+from ..logger import logger
 
 
 class WeeklyRoboticsSummarizer(BaseSummarizer):
     """Weekly Robotics 뉴스레터 전용 Summarizer"""
     
+    SUPPORTED_DOMAINS = ['weeklyrobotics.com', 'www.weeklyrobotics.com']
+    
     # Weekly Robotics 전용 프롬프트
     SYSTEM_PROMPT = """역할: 당신은 로보틱스 기술 전문 편집자입니다. Weekly Robotics 뉴스레터를 한국어로 요약합니다.
 
@@ -70,7 +74,15 @@ class WeeklyRoboticsSummarizer(BaseSummarizer):
         self.model = model or Config.OPENAI_MODEL
         
         super().__init__("Weekly Robotics", self.api_key, self.model)
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = OpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL)
+        self._async_client: Optional[AsyncOpenAI] = None
+    
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """비동기 OpenAI 클라이언트 (최초 사용 시 생성)"""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=Config.OPENAI_BASE_URL)
+        return self._async_client
         
     def validate_config(self) -> bool:
         """설정 유효성 검사
@@ -80,10 +92,6 @@ class WeeklyRoboticsSummarizer(BaseSummarizer):
         """
         return bool(self.api_key and self.model)
         
-    def get_supported_domains(self) -> List[str]:
-        """지원하는 도메인 목록"""
-        return ['weeklyrobotics.com', 'www.weeklyrobotics.com']
-    
     def extract_issue_info(self, content: str, url: str) -> tuple[str, str]:
         """URL과 콘텐츠에서 이슈 번호와 날짜 추출
         
@@ -118,13 +126,16 @@ class WeeklyRoboticsSummarizer(BaseSummarizer):
             
         return issue_number, date_str
     
-    @log_execution_time
+    @traced("summarizer.weekly_robotics.summarize")
     def summarize(self, url: str, **kwargs) -> str:
         """Weekly Robotics 뉴스레터 요약 생성
         
         Args:
             url: Weekly Robotics 뉴스레터 URL
             **kwargs: 추가 파라미터
+                - stream: True면 응답을 스트리밍으로 받아 output_path에 즉시 기록
+                - output_path: 스트리밍 델타를 기록할 .md 경로
+                - on_section: 섹션 완료 콜백 (title, markdown)
             
         Returns:
             요약된 마크다운 콘텐츠
@@ -132,55 +143,13 @@ class WeeklyRoboticsSummarizer(BaseSummarizer):
         try:
             logger.info(f"Weekly Robotics 요약 시작: {url}")
             
-            # GPT-5 Responses API 사용 (web_search tool 포함)
-            input_messages = [
-                {"role": "system", "content": [{"type": "input_text", "text": self.SYSTEM_PROMPT}]},
-                {"role": "developer", "content": [{"type": "input_text", "text": self.DEVELOPER_PROMPT}]},
-                {"role": "user", "content": [{"type": "input_text", "text": f"다음 Weekly Robotics 뉴스레터를 요약해주세요: {url}"}]},
-            ]
-            
-            completion = self.client.responses.create(
-                model=self.model,
-                input=input_messages,
-                tools=[{"type": "web_search"}],
-                reasoning={"effort": "medium"},
-                timeout=600  # 10분 timeout
-            )
-            
-            # 응답에서 마크다운 콘텐츠 추출
-            logger.debug(f"Completion: {completion}")
-            markdown = self._extract_markdown(completion)
-            
-            # 헤드라인 추출
-            headline = self._extract_headline(markdown)
-            if headline:
-                logger.info(f"추출된 헤드라인: {headline}")
-            
-            # 썸네일 추출
-            thumbnail = self._extract_thumbnail(markdown)
-            if thumbnail:
-                logger.info(f"추출된 썸네일: {thumbnail}")
-            
-            # 마크다운에서 헤드라인과 썸네일 라인 제거
-            lines = markdown.split('\n')
-            filtered_lines = []
-            for line in lines:
-                if not line.startswith('**헤드라인:') and not line.startswith('**썸네일:'):
-                    filtered_lines.append(line)
-            markdown = '\n'.join(filtered_lines).strip()
-            
-            # 썸네일이 있으면 최상단에 추가
-            if thumbnail:
-                markdown = f"![Weekly Robotics]({thumbnail})\n\n{markdown}"
-            
-            # 출처 URL이 없으면 추가
-            if f"출처: [Weekly Robotics" not in markdown:
-                issue_number, date_str = self.extract_issue_info(markdown, url)
-                markdown = f"{markdown}\n\n---\n📖 출처: [Weekly Robotics #{issue_number}]({url})"
+            completion, stream_metrics = self._create_response(self._build_request(url), **kwargs)
+            markdown, headline, thumbnail = self._finalize_markdown(completion, url)
             
             # 헤드라인과 썸네일 저장 (메타데이터로 활용)
             self._last_headline = headline
             self._last_thumbnail = thumbnail
+            self._last_stream_metrics = stream_metrics
             
             logger.info("Weekly Robotics 요약 완료")
             return markdown
@@ -189,6 +158,126 @@ class WeeklyRoboticsSummarizer(BaseSummarizer):
             logger.error(f"Weekly Robotics 요약 실패: {str(e)}", exc_info=True)
             raise
     
+    async def asummarize_with_metadata(self, url: str, **kwargs) -> Dict[str, Any]:
+        """Weekly Robotics 요약과 메타데이터 생성 (AsyncOpenAI 사용)
+        
+        인스턴스 상태(_last_headline 등)를 사용하지 않으므로 동시 호출에 안전
+        
+        Args:
+            url: Weekly Robotics 뉴스레터 URL
+            **kwargs: 추가 파라미터
+            
+        Returns:
+            {'markdown', 'headline', 'date', 'issue_number', 'source', 'url', 'thumbnail'} 딕셔너리
+        """
+        try:
+            logger.info(f"Weekly Robotics 비동기 요약 시작: {url}")
+            
+            completion = await acached_create(self.async_client, **self._build_request(url))
+            markdown, headline, thumbnail = self._finalize_markdown(completion, url)
+            
+            logger.info("Weekly Robotics 비동기 요약 완료")
+            return {'markdown': markdown, **self._build_metadata(markdown, url, headline, thumbnail)}
+            
+        except Exception as e:
+            logger.error(f"Weekly Robotics 비동기 요약 실패: {str(e)}", exc_info=True)
+            raise
+    
+    def _build_request(self, url: str) -> Dict[str, Any]:
+        """요약 요청 파라미터 구성
+        
+        Args:
+            url: Weekly Robotics 뉴스레터 URL
+            
+        Returns:
+            responses.create 파라미터
+        """
+        # GPT-5 Responses API 사용 (web_search tool 포함)
+        input_messages = [
+            {"role": "system", "content": [{"type": "input_text", "text": self.SYSTEM_PROMPT}]},
+            {"role": "developer", "content": [{"type": "input_text", "text": self.DEVELOPER_PROMPT}]},
+            {"role": "user", "content": [{"type": "input_text", "text": f"다음 Weekly Robotics 뉴스레터를 요약해주세요: {url}"}]},
+        ]
+        
+        return {
+            "model": self.model,
+            "input": input_messages,
+            "tools": [{"type": "web_search"}],
+            "reasoning": {"effort": "medium"},
+            "timeout": 600,  # 10분 timeout
+        }
+    
+    def _finalize_markdown(self, completion, url: str) -> Tuple[str, Optional[str], Optional[str]]:
+        """응답에서 마크다운을 추출하고 헤드라인/썸네일/출처 정리
+        
+        Args:
+            completion: OpenAI Responses API 응답
+            url: Weekly Robotics 뉴스레터 URL
+            
+        Returns:
+            (마크다운, 헤드라인, 썸네일 URL) 튜플
+        """
+        # 응답에서 마크다운 콘텐츠 추출
+        logger.debug(f"Completion: {completion}")
+        markdown = self._extract_markdown(completion)
+        
+        # 헤드라인 추출
+        headline = self._extract_headline(markdown)
+        if headline:
+            logger.info(f"추출된 헤드라인: {headline}")
+        
+        # 썸네일 추출
+        thumbnail = self._extract_thumbnail(markdown)
+        if thumbnail:
+            logger.info(f"추출된 썸네일: {thumbnail}")
+        
+        # 마크다운에서 헤드라인과 썸네일 라인 제거
+        lines = markdown.split('\n')
+        filtered_lines = []
+        for line in lines:
+            if not line.startswith('**헤드라인:') and not line.startswith('**썸네일:'):
+                filtered_lines.append(line)
+        markdown = '\n'.join(filtered_lines).strip()
+        
+        # 썸네일이 있으면 최상단에 추가
+        if thumbnail:
+            markdown = f"![Weekly Robotics]({thumbnail})\n\n{markdown}"
+        
+        # 출처 URL이 없으면 추가
+        if f"출처: [Weekly Robotics" not in markdown:
+            issue_number, date_str = self.extract_issue_info(markdown, url)
+            markdown = f"{markdown}\n\n---\n📖 출처: [Weekly Robotics #{issue_number}]({url})"
+        
+        return markdown, headline, thumbnail
+    
+    def _build_metadata(
+        self,
+        markdown: str,
+        url: str,
+        headline: Optional[str],
+        thumbnail: Optional[str]
+    ) -> Dict[str, Any]:
+        """요약 결과의 메타데이터 구성
+        
+        Args:
+            markdown: 요약된 마크다운
+            url: 뉴스레터 URL
+            headline: 추출된 헤드라인 (없으면 기본값 사용)
+            thumbnail: 썸네일 URL
+            
+        Returns:
+            메타데이터 딕셔너리
+        """
+        issue_number, date_str = self.extract_issue_info(markdown, url)
+        return {
+            'headline': headline or f"Weekly Robotics #{issue_number}",
+            'date': date_str,
+            'issue_number': issue_number,
+            'source': 'Weekly Robotics',
+            'url': url,
+            'thumbnail': thumbnail
+        }
+    
     def _extract_markdown(self, response) -> str:
         """Responses API 응답에서 마크다운 콘텐츠 추출 (SmolAI와 동일한 방식)
         
@@ -270,12 +359,16 @@ class WeeklyRoboticsSummarizer(BaseSummarizer):
             # 요약 생성
             markdown = self.summarize(url, **kwargs)
             
-            # 메타데이터 추출
-            issue_number, date_str = self.extract_issue_info(markdown, url)
-            
             # 헤드라인과 썸네일 사용 (저장된 값 또는 기본값)
-            headline = getattr(self, '_last_headline', None) or f"Weekly Robotics #{issue_number}"
-            thumbnail = getattr(self, '_last_thumbnail', None)
+            metadata = self._build_metadata(
+                markdown,
+                url,
+                getattr(self, '_last_headline', None),
+                getattr(self, '_last_thumbnail', None)
+            )
+            stream_metrics = getattr(self, '_last_stream_metrics', None)
+            if stream_metrics:
+                metadata['stream_metrics'] = stream_metrics
             
             return SummarizerResult(
                 summarizer_name=self.name,
@@ -283,14 +376,7 @@ class WeeklyRoboticsSummarizer(BaseSummarizer):
                 success=True,
                 summary=markdown,
                 error=None,
-                metadata={
-                    'headline': headline,
-                    'date': date_str,
-                    'issue_number': issue_number,
-                    'source': 'Weekly Robotics',
-                    'url': url,
-                    'thumbnail': thumbnail
-                }
+                metadata=metadata
             )
             
         except Exception as e:
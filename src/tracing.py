@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+"""
+구조화 트레이싱 모듈
+실행 전체에 하나의 trace ID를 두고 중첩 span(요약, 후처리, 파일 저장, HTTP 호출 등)을 기록해
+Chrome trace(Perfetto, chrome://tracing) 또는 OTLP-JSON 형식 파일로 내보냄
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Optional, Dict, List, Any, Iterator, Callable
+from urllib.parse import urlsplit
+
+from .config import Config
+from .logger import logger
+
+
+# 트레이스 파일 형식
+FORMAT_CHROME = "chrome"
+FORMAT_OTLP = "otlp"
+
+# OTLP status code (UNSET=0, OK=1, ERROR=2)
+OTLP_STATUS_OK = 1
+OTLP_STATUS_ERROR = 2
+
+
+class Span:
+    """시작/종료 시각과 속성을 가진 작업 구간"""
+
+    __slots__ = (
+        "name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns",
+        "attributes", "error", "thread_id", "thread_name",
+    )
+
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str] = None, **attributes):
+        """
+        Args:
+            name: span 이름 (summarize, discord.post 등)
+            trace_id: 실행 전체 trace ID
+            parent_id: 부모 span ID (최상위면 None)
+            **attributes: 속성 (url, chars_in, chars_out, http_status 등)
+        """
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = uuid.uuid4().hex[:16]
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = {k: v for k, v in attributes.items() if v is not None}
+        self.error: Optional[str] = None
+        thread = threading.current_thread()
+        self.thread_id = thread.ident or 0
+        self.thread_name = thread.name
+
+    def set(self, **attributes) -> "Span":
+        """속성 추가 (None 값은 무시)"""
+        self.attributes.update({k: v for k, v in attributes.items() if v is not None})
+        return self
+
+    @property
+    def duration(self) -> float:
+        """소요 시간(초, 종료 전이면 현재까지)"""
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1e9
+
+    def to_chrome_event(self, pid: int) -> Dict[str, Any]:
+        """Chrome trace 'X'(complete) 이벤트"""
+        args = dict(self.attributes)
+        args.update(span_id=self.span_id, parent_id=self.parent_id)
+        if self.error:
+            args["error"] = self.error
+        return {
+            "name": self.name,
+            "cat": self.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": self.start_ns / 1000,
+            "dur": ((self.end_ns or self.start_ns) - self.start_ns) / 1000,
+            "pid": pid,
+            "tid": self.thread_id,
+            "args": args,
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP-JSON span"""
+        span: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [_otlp_attribute(k, v) for k, v in self.attributes.items()],
+            "status": (
+                {"code": OTLP_STATUS_ERROR, "message": self.error} if self.error
+                else {"code": OTLP_STATUS_OK}
+            ),
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _otlp_attribute(key: str, value: Any) -> Dict[str, Any]:
+    """OTLP KeyValue 변환 (bool은 int보다 먼저 검사)"""
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+
+# 현재 실행 중인 span (asyncio 태스크별 분리, Pipeline 단계 스레드에는 제출 시점 값이 전달됨)
+_current_span: ContextVar[Optional[Span]] = ContextVar("trace_span", default=None)
+
+
+def trace_path(markdown_path: str) -> str:
+    """출력 마크다운 옆에 둘 트레이스 파일 경로 (xxx.md → xxx_trace.json)"""
+    root, _ = os.path.splitext(markdown_path)
+    return f"{root}_trace.json"
+
+
+def safe_url(url: str) -> str:
+    """span 속성용 URL (웹훅 토큰이 들어가는 경로/쿼리는 제외하고 scheme://host만 남김)"""
+    parts = urlsplit(url or "")
+    return f"{parts.scheme}://{parts.netloc}" if parts.netloc else ""
+
+
+class Tracer:
+    """실행 단위 span 수집기"""
+
+    def __init__(self, enabled: bool = True, service: str = "news_bot", trace_id: Optional[str] = None):
+        """
+        Args:
+            enabled: span 기록 여부 (False면 span은 만들되 보관하지 않음)
+            service: OTLP resource의 service.name
+            trace_id: 실행 전체 trace ID (기본값: 임의 32자리 hex)
+        """
+        self.enabled = enabled
+        self.service = service
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, **attributes) -> Iterator[Span]:
+        """현재 span의 자식 span 생성 (블록 종료 시 기록, 예외는 error로 남기고 다시 발생)
+
+        Args:
+            name: span 이름
+            **attributes: 시작 시점 속성
+
+        Yields:
+            Span (블록 안에서 set()으로 결과 속성 추가)
+        """
+        parent = _current_span.get()
+        span = Span(name, self.trace_id, parent.span_id if parent else None, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            _current_span.reset(token)
+            self._finish(span)
+
+    def add_completed(self, name: str, seconds: float, error: Optional[str] = None, **attributes) -> Span:
+        """방금 끝난 작업을 span으로 기록 (소요 시간만 아는 경우, 예: LLM 호출 원장)
+
+        Args:
+            name: span 이름
+            seconds: 소요 시간(초)
+            error: 실패 시 에러 메시지
+            **attributes: 속성
+
+        Returns:
+            기록된 Span
+        """
+        parent = _current_span.get()
+        span = Span(name, self.trace_id, parent.span_id if parent else None, **attributes)
+        span.end_ns = span.start_ns
+        span.start_ns -= int(seconds * 1e9)
+        span.error = error
+        self._finish(span)
+        return span
+
+    def _finish(self, span: Span) -> None:
+        """span 종료 시각 기록 및 보관"""
+        if span.end_ns is None:
+            span.end_ns = time.time_ns()
+        if not self.enabled:
+            return
+        with self._lock:
+            self.spans.append(span)
+        logger.debug(f"span [{span.name}] {span.duration:.3f}초{' (error)' if span.error else ''}")
+
+    def to_chrome(self) -> Dict[str, Any]:
+        """Chrome trace 형식 (Perfetto / chrome://tracing에서 열기)"""
+        pid = os.getpid()
+        with self._lock:
+            spans = list(self.spans)
+        events: List[Dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "args": {"name": self.service}}
+        ]
+        for thread_id, thread_name in dict((s.thread_id, s.thread_name) for s in spans).items():
+            events.append({
+                "name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id, "args": {"name": thread_name}
+            })
+        events.extend(span.to_chrome_event(pid) for span in sorted(spans, key=lambda s: s.start_ns))
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"trace_id": self.trace_id, "service": self.service},
+        }
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """OTLP-JSON 형식 (ExportTraceServiceRequest, Jaeger/Tempo 등으로 가져오기)"""
+        with self._lock:
+            spans = list(self.spans)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service)]},
+                "scopeSpans": [{
+                    "scope": {"name": "news_bot.tracing"},
+                    "spans": [span.to_otlp() for span in sorted(spans, key=lambda s: s.start_ns)],
+                }],
+            }]
+        }
+
+    def write(self, path: Optional[str] = None, fmt: Optional[str] = None) -> Optional[str]:
+        """트레이스 파일 저장
+
+        Args:
+            path: 저장 경로 (기본값: LOG_DIR/trace_<trace_id>.json, 보통 trace_path(출력 .md))
+            fmt: chrome / otlp (기본값: Config.TRACE_FORMAT)
+
+        Returns:
+            저장 경로 (비활성화거나 span이 없으면 None)
+        """
+        if not self.enabled or not self.spans:
+            return None
+
+        fmt = (fmt or Config.TRACE_FORMAT).lower()
+        if fmt not in (FORMAT_CHROME, FORMAT_OTLP):
+            raise ValueError(f"지원하지 않는 트레이스 형식: {fmt}")
+
+        path = path or os.path.join(Config.LOG_DIR, f"trace_{self.trace_id}.json")
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = self.to_chrome() if fmt == FORMAT_CHROME else self.to_otlp()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+        logger.info(f"🧭 트레이스 저장 ({fmt}, span {len(self.spans)}개): {path}")
+        return path
+
+
+# 실행 전체에서 공유하는 트레이서 인스턴스
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """공유 트레이서 반환 (최초 호출 시 생성)"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer(enabled=Config.TRACE_ENABLED)
+    return _tracer
+
+
+def span(name: str, **attributes):
+    """공유 트레이서의 span 컨텍스트 매니저
+
+    사용 예:
+        with span("discord.post", url=safe_url(webhook_url)) as s:
+            response = requests.post(...)
+            s.set(http_status=response.status_code)
+    """
+    return get_tracer().span(name, **attributes)
+
+
+def current_span() -> Optional[Span]:
+    """현재 span (없으면 None)"""
+    return _current_span.get()
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """함수 실행을 span으로 기록하고 시작/완료/실패를 로깅하는 데코레이터
+
+    Args:
+        name: span 이름 (기본값: 함수 이름)
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            logger.info(f"{span_name} 실행 시작")
+            try:
+                with span(span_name) as s:
+                    result = func(*args, **kwargs)
+            except Exception as e:
+                logger.error(f"{span_name} 실패 (소요시간: {s.duration:.2f}초): {str(e)}", exc_info=True)
+                raise
+            if isinstance(result, str):
+                s.set(chars_out=len(result))
+            logger.info(f"{span_name} 완료 (소요시간: {s.duration:.2f}초)")
+            return result
+
+        return wrapper
+
+    return decorator
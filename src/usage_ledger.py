@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+"""
+LLM 호출 사용량/지연 원장 모듈
+responses.create 호출마다 토큰 사용량, 모델, reasoning effort, 도구 호출, 소요 시간을
+실행 ID·단계·소스 URL과 함께 JSONL 원장에 기록하고 실행별 리포트 생성
+"""
+
+import os
+import json
+import time
+import uuid
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Optional, Dict, List, Any, Iterator
+
+from .config import Config
+from .tracing import get_tracer
+from .metrics import LLM_CALLS, LLM_CACHE_HITS, LLM_LATENCY
+from .logger import logger
+
+
+# 호출 위치 태그 (asyncio 태스크별로 분리, Pipeline 단계 스레드에는 제출 시점 값이 전달됨)
+_stage: ContextVar[Optional[str]] = ContextVar("llm_stage", default=None)
+_source_url: ContextVar[Optional[str]] = ContextVar("llm_source_url", default=None)
+
+# 리포트 합계 항목
+TOKEN_FIELDS = ("input_tokens", "cached_tokens", "output_tokens", "reasoning_tokens")
+
+
+@contextmanager
+def llm_context(stage: Optional[str] = None, source_url: Optional[str] = None) -> Iterator[None]:
+    """블록 안의 LLM 호출에 단계/소스 URL 태그 지정 (None이면 바깥 값 유지)
+
+    Args:
+        stage: 단계 이름 (summarize, postprocess, compact 등)
+        source_url: 요약 대상 URL
+    """
+    tokens = []
+    if stage is not None:
+        tokens.append((_stage, _stage.set(stage)))
+    if source_url is not None:
+        tokens.append((_source_url, _source_url.set(source_url)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def current_source_url() -> Optional[str]:
+    """현재 컨텍스트의 소스 URL (llm_context 밖이면 None)"""
+    return _source_url.get()
+
+
+def _field(obj: Any, name: str) -> Any:
+    """SDK 객체/딕셔너리 공통 필드 조회 (캐시 복원 응답은 usage가 dict)"""
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+def usage_report_path(markdown_path: str) -> str:
+    """출력 마크다운 옆에 둘 사용량 리포트 경로 (xxx.md → xxx_usage.json)"""
+    root, _ = os.path.splitext(markdown_path)
+    return f"{root}_usage.json"
+
+
+class UsageLedger:
+    """LLM 호출 원장 (JSONL append + 실행 중 기록 보관)"""
+
+    def __init__(self, path: Optional[str] = None, enabled: bool = True, run_id: Optional[str] = None):
+        """
+        Args:
+            path: JSONL 원장 경로 (기본값: Config.LLM_LEDGER_PATH)
+            enabled: 원장 기록 여부
+            run_id: 실행 ID (기본값: 시각 + 임의 접미사)
+        """
+        self.path = path or Config.LLM_LEDGER_PATH
+        self.enabled = enabled
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        self.records: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        params: Dict[str, Any],
+        response: Any = None,
+        wall_seconds: float = 0.0,
+        cache_hit: bool = False,
+        streamed: bool = False,
+        error: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """LLM 호출 한 건 기록
+
+        Args:
+            params: responses.create 파라미터
+            response: 응답 객체 (실패 시 None)
+            wall_seconds: 호출 소요 시간(초)
+            cache_hit: 응답 캐시 적중 여부
+            streamed: 스트리밍 호출 여부
+            error: 실패 시 에러 메시지
+
+        Returns:
+            기록된 레코드 (비활성화 시 None)
+        """
+        if not self.enabled:
+            return None
+
+        usage = _field(response, "usage")
+        output_items = _field(response, "output") or []
+        record = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "run_id": self.run_id,
+            "stage": _stage.get() or "llm",
+            "source_url": _source_url.get(),
+            "model": params.get("model", ""),
+            "effort": (params.get("reasoning") or {}).get("effort"),
+            "tools": [tool.get("type") for tool in params.get("tools") or [] if isinstance(tool, dict)],
+            "tool_calls": sum(
+                1 for item in output_items if str(_field(item, "type") or "").endswith("_call")
+            ),
+            "input_tokens": _field(usage, "input_tokens") or 0,
+            "cached_tokens": _field(_field(usage, "input_tokens_details"), "cached_tokens") or 0,
+            "output_tokens": _field(usage, "output_tokens") or 0,
+            "reasoning_tokens": _field(_field(usage, "output_tokens_details"), "reasoning_tokens") or 0,
+            "wall_seconds": round(wall_seconds, 3),
+            "cache_hit": cache_hit,
+            "streamed": streamed,
+            "status": "error" if error else "ok",
+            "error": error,
+        }
+
+        with self._lock:
+            self.records.append(record)
+            try:
+                directory = os.path.dirname(self.path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            except OSError as e:
+                logger.warning(f"LLM 사용량 원장 기록 실패: {str(e)}")
+
+        logger.debug(
+            f"LLM 호출 기록 [{record['stage']}] {record['model']}: "
+            f"입력 {record['input_tokens']} / 출력 {record['output_tokens']} 토큰, "
+            f"{record['wall_seconds']:.1f}초{' (캐시)' if cache_hit else ''}"
+        )
+        return record
+
+    def report(self, source_url: Optional[str] = None) -> Dict[str, Any]:
+        """이번 실행의 사용량 리포트
+
+        토큰 합계는 실제 API 호출만 집계 (캐시 적중 호출은 calls/cache_hits/시간에만 반영)
+
+        Args:
+            source_url: 지정 시 해당 URL 호출만 집계
+
+        Returns:
+            {'run_id', 'source_url', 'totals', 'by_stage', 'calls'} 딕셔너리
+        """
+        with self._lock:
+            records = [
+                record for record in self.records
+                if source_url is None or record["source_url"] == source_url
+            ]
+
+        totals = self._aggregate(records)
+        by_stage: Dict[str, Dict[str, Any]] = {}
+        for stage in dict.fromkeys(record["stage"] for record in records):
+            by_stage[stage] = self._aggregate([r for r in records if r["stage"] == stage])
+
+        return {
+            "run_id": self.run_id,
+            "source_url": source_url,
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "totals": totals,
+            "by_stage": by_stage,
+            "calls": records,
+        }
+
+    @staticmethod
+    def _aggregate(records: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """레코드 합계 (토큰은 캐시 적중 제외)"""
+        billed = [record for record in records if not record["cache_hit"]]
+        totals: Dict[str, Any] = {
+            "calls": len(records),
+            "cache_hits": len(records) - len(billed),
+            "errors": sum(1 for record in records if record["status"] == "error"),
+            "wall_seconds": round(sum(record["wall_seconds"] for record in records), 3),
+        }
+        for field in TOKEN_FIELDS:
+            totals[field] = sum(record[field] for record in billed)
+        return totals
+
+    def write_report(self, path: str, source_url: Optional[str] = None) -> Optional[str]:
+        """실행 리포트를 JSON 파일로 저장하고 요약 로그 출력
+
+        Args:
+            path: 저장 경로 (보통 usage_report_path(출력 .md))
+            source_url: 지정 시 해당 URL 호출만 집계
+
+        Returns:
+            저장 경로 (기록이 없거나 비활성화면 None)
+        """
+        if not self.enabled:
+            return None
+
+        report = self.report(source_url)
+        if not report["calls"]:
+            return None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+        for stage, totals in report["by_stage"].items():
+            logger.info(
+                f"  - LLM [{stage}]: {totals['calls']}회 (캐시 {totals['cache_hits']}), "
+                f"입력 {totals['input_tokens']} (캐시 {totals['cached_tokens']}) / "
+                f"출력 {totals['output_tokens']} (추론 {totals['reasoning_tokens']}) 토큰, "
+                f"{totals['wall_seconds']:.1f}초"
+            )
+        logger.info(f"💾 LLM 사용량 리포트 저장: {path}")
+        return path
+
+
+# 실행 전체에서 공유하는 원장 인스턴스
+_usage_ledger: Optional[UsageLedger] = None
+
+
+def get_usage_ledger() -> UsageLedger:
+    """공유 사용량 원장 반환 (최초 호출 시 생성)"""
+    global _usage_ledger
+    if _usage_ledger is None:
+        _usage_ledger = UsageLedger(enabled=Config.LLM_LEDGER_ENABLED)
+    return _usage_ledger
+
+
+def record_llm_call(params: Dict[str, Any], started: float, **kwargs) -> None:
+    """호출 시작 시각(time.monotonic)부터의 소요 시간과 함께 공유 원장에 기록
+
+    같은 호출을 현재 span 아래 llm.<단계> span과 LLM 호출/지연 메트릭으로도 기록
+
+    Args:
+        params: responses.create 파라미터
+        started: 호출 시작 시각 (time.monotonic())
+        **kwargs: UsageLedger.record 인자 (response, cache_hit, streamed, error)
+    """
+    wall_seconds = time.monotonic() - started
+    record = get_usage_ledger().record(params, wall_seconds=wall_seconds, **kwargs)
+
+    stage = _stage.get() or "llm"
+    model = params.get("model", "")
+    LLM_CALLS.inc(stage=stage, model=model, status="error" if kwargs.get("error") else "ok")
+    if kwargs.get("cache_hit"):
+        LLM_CACHE_HITS.inc(stage=stage, model=model)
+    elif not kwargs.get("error"):
+        LLM_LATENCY.observe(wall_seconds, stage=stage, model=model)
+
+    # 원장 비활성화 시 토큰 속성 없이 기록
+    record = record or {}
+    get_tracer().add_completed(
+        f"llm.{stage}",
+        wall_seconds,
+        error=kwargs.get("error"),
+        model=model,
+        cache_hit=kwargs.get("cache_hit", False),
+        streamed=kwargs.get("streamed", False),
+        input_tokens=record.get("input_tokens"),
+        output_tokens=record.get("output_tokens"),
+    )
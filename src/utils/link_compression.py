@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Link Compression
+LLM 입력의 URL을 짧은 placeholder로 바꿔 입력 토큰을 줄이고, 응답에서 복원하는 유틸리티
+"""
+
+import re
+from typing import Dict, List, Any, Optional
+
+from .link_preserver import LinkPreserver, PLACEHOLDER_RE
+from ..logger import logger
+
+try:
+    import tiktoken
+except ImportError:  # 선택 의존성, 없으면 추정치 사용
+    tiktoken = None
+
+# tiktoken 인코딩 (최초 사용 시 로드, 실패하면 False)
+_encoding = None
+
+
+# 복원 후에도 남은 placeholder 흔적 (LINK_12, [LINK-0001], LINK 0001 등 변형 포함)
+PLACEHOLDER_TRACE_RE = re.compile(r"\[?LINK[_\- ]?\d+\]?")
+
+
+def estimate_tokens(text: str) -> int:
+    """입력 토큰 수 추정
+
+    tiktoken이 있으면 o200k_base로 계산, 없으면 ASCII 4자당 1토큰 + 비ASCII 1자당 1토큰으로 추정
+
+    Args:
+        text: 텍스트
+
+    Returns:
+        토큰 수
+    """
+    global _encoding
+    if not text:
+        return 0
+    if _encoding is None:
+        try:
+            _encoding = tiktoken.get_encoding("o200k_base") if tiktoken else False
+        except Exception:
+            _encoding = False
+    if _encoding:
+        return len(_encoding.encode(text))
+    non_ascii = sum(1 for ch in text if ord(ch) > 127)
+    return (len(text) - non_ascii + 3) // 4 + non_ascii
+
+
+class CompressionReport:
+    """한 번의 LLM 호출에 대한 링크 압축 결과"""
+
+    def __init__(self, label: str, link_count: int, original_tokens: int, compressed_tokens: int):
+        """
+        Args:
+            label: 호출 이름 (로그용)
+            link_count: placeholder로 바꾼 링크 수
+            original_tokens: 압축 전 입력 토큰 수 (추정)
+            compressed_tokens: 압축 후 입력 토큰 수 (추정)
+        """
+        self.label = label
+        self.link_count = link_count
+        self.original_tokens = original_tokens
+        self.compressed_tokens = compressed_tokens
+        self.restored = 0
+        # 응답에 남아 복원하지 못한 placeholder (형식이 깨진 경우 등)
+        self.unrestored: List[str] = []
+        # 입력에 없던 placeholder (모델이 만들어낸 경우)
+        self.invented: List[str] = []
+
+    @property
+    def tokens_saved(self) -> int:
+        """절약한 입력 토큰 수 (추정)"""
+        return self.original_tokens - self.compressed_tokens
+
+    @property
+    def ok(self) -> bool:
+        """복원 문제 없음 여부"""
+        return not self.unrestored and not self.invented
+
+    def to_dict(self) -> Dict[str, Any]:
+        """메타데이터/리포트용 딕셔너리"""
+        return {
+            'link_count': self.link_count,
+            'original_tokens': self.original_tokens,
+            'compressed_tokens': self.compressed_tokens,
+            'tokens_saved': self.tokens_saved,
+            'restored': self.restored,
+            'unrestored': self.unrestored,
+            'invented': self.invented,
+        }
+
+
+class LinkCompressor:
+    """LLM 호출 한 번 단위의 링크 압축기
+
+    사용 예:
+        compressor = LinkCompressor("compact")
+        short = compressor.compress(markdown)
+        ... responses.create(... short ...)
+        text = compressor.restore(output_text)
+        compressor.report.tokens_saved
+    """
+
+    def __init__(self, label: str = "llm", enabled: bool = True):
+        """
+        Args:
+            label: 호출 이름 (로그용)
+            enabled: False면 원문 그대로 전달 (리포트만 생성)
+        """
+        self.label = label
+        self.enabled = enabled
+        self.preserver = LinkPreserver()
+        self.link_map: Dict[str, str] = {}
+        self.report: Optional[CompressionReport] = None
+
+    def compress(self, text: str) -> str:
+        """텍스트의 모든 URL을 placeholder로 치환
+
+        Args:
+            text: LLM에 보낼 원문
+
+        Returns:
+            URL이 placeholder로 바뀐 텍스트
+        """
+        original_tokens = estimate_tokens(text)
+        if self.enabled:
+            compressed, self.link_map = self.preserver.preserve_links(text)
+        else:
+            compressed, self.link_map = text, {}
+
+        self.report = CompressionReport(
+            self.label, len(self.link_map), original_tokens, estimate_tokens(compressed)
+        )
+        if self.link_map:
+            logger.info(
+                f"[{self.label}] 링크 압축: URL {self.report.link_count}개 → placeholder, "
+                f"입력 토큰 약 {self.report.tokens_saved}개 절약 "
+                f"({self.report.original_tokens} → {self.report.compressed_tokens})"
+            )
+        return compressed
+
+    def restore(self, text: str) -> str:
+        """LLM 응답의 placeholder를 원본 URL로 복원하고 이상 placeholder 표시
+
+        Args:
+            text: LLM 응답 텍스트
+
+        Returns:
+            URL이 복원된 텍스트
+        """
+        if self.report is None:
+            raise RuntimeError("compress()를 먼저 호출해야 합니다")
+        if not text:
+            return text
+
+        if self.link_map:
+            restored = self.preserver.restore_links(text, self.link_map)
+            invented = list(self.preserver.unknown_placeholders)
+        else:
+            restored = text
+            invented = [match.group(0) for match in PLACEHOLDER_RE.finditer(text)]
+
+        self.report.restored = len(set(re.findall(r"LINK_\d{4,}", text)) & self.link_map.keys())
+        self.report.invented = invented
+        invented_set = set(invented)
+        self.report.unrestored = [
+            trace for trace in PLACEHOLDER_TRACE_RE.findall(restored) if trace not in invented_set
+        ]
+
+        if self.report.invented:
+            logger.warning(f"[{self.label}] 입력에 없던 placeholder: {self.report.invented[:5]}")
+        if self.report.unrestored:
+            logger.warning(f"[{self.label}] 복원되지 않은 placeholder: {self.report.unrestored[:5]}")
+        return restored
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""
+Link Deduplicator
+요약 마크다운의 중복 링크/반복 출처 표기를 결정적으로 제거하는 유틸리티
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Set, Pattern
+from urllib.parse import urlparse
+
+
+# 블록(문단/불릿) 시작 라인: 불릿, 번호 목록, 헤더, 인용
+BLOCK_START_RE = re.compile(r"^\s*(?:[-*+•]\s|\d+[.)]\s|#{1,6}\s|>)")
+
+# 링크 자체를 설명하지 않는 앵커 텍스트 (중복 시 텍스트까지 제거)
+GENERIC_ANCHORS = {
+    "링크", "출처", "원문", "자세히", "자세히 보기", "더보기", "source", "link", "here", "tweet", "post",
+}
+
+DEFAULT_SOURCE_HOST = "news.smol.ai"
+
+
+@lru_cache(maxsize=16)
+def _token_pattern(source_host: str) -> Pattern:
+    """출처 호스트별 토큰 정규식 (한 번의 스캔으로 인용/링크/URL 매칭)"""
+    host = re.escape(source_host)
+    return re.compile(
+        # 1) 반복되는 괄호 출처: (news.smol.ai), ([news.smol.ai](https://news.smol.ai/...))
+        rf"(?P<citation>[ \t]*\(\s*(?:\[[^\]\n]*\]\(\s*https?://(?:www\.)?{host}[^)\s]*\s*\)"
+        rf"|(?:https?://)?(?:www\.)?{host}(?:/[^)\s]*)?)\s*\))"
+        # 2) 마크다운 링크: [텍스트](URL)
+        r"|(?P<link>\[(?P<text>[^\]\n]*)\]\(\s*(?P<url>[^)\s]+)(?:\s+\"[^\"]*\")?\s*\))"
+        # 3) 일반 URL
+        r"|(?P<bare>https?://[^\s)\]<>\"]+)"
+    )
+
+
+def normalize_url(url: str) -> str:
+    """비교용 URL 정규화 (스킴/www/끝 슬래시/프래그먼트 무시, twitter.com → x.com)"""
+    url = url.strip().strip("<>")
+    url = url.split("#", 1)[0]
+    url = re.sub(r"^https?://", "", url, flags=re.IGNORECASE)
+    url = re.sub(r"^www\.", "", url, flags=re.IGNORECASE)
+    url = re.sub(r"^(?:mobile\.)?twitter\.com/", "x.com/", url, flags=re.IGNORECASE)
+    return url.rstrip("/").lower()
+
+
+class LinkDeduplicator:
+    """중복 링크 제거기
+
+    라인을 한 번만 훑으며 다음 규칙을 적용 (입력 길이에 선형):
+    1. 같은 문단/불릿 안에서 같은 URL이 다시 나오면 두 번째부터 제거
+       (앵커 텍스트가 의미 있으면 텍스트만 남기고 링크 제거, 다른 블록의 같은 URL은 유지)
+    2. 본문의 "(news.smol.ai)" 같은 반복 괄호 출처 제거
+    3. 마지막 "출처:" 줄과 코드 블록은 그대로 유지
+    """
+
+    def __init__(self, source_url: Optional[str] = None):
+        """
+        Args:
+            source_url: 원문 뉴스레터 URL (괄호 출처 판별용, 기본: news.smol.ai)
+        """
+        self.source_url = source_url
+        host = urlparse(source_url).netloc if source_url else ""
+        self.source_host = (host[4:] if host.startswith("www.") else host) or DEFAULT_SOURCE_HOST
+        self.removed = 0
+
+    def dedupe(self, markdown: str) -> str:
+        """마크다운의 중복 링크 제거
+
+        Args:
+            markdown: 원본 마크다운
+
+        Returns:
+            중복이 제거된 마크다운
+        """
+        pattern = _token_pattern(self.source_host)
+        self.removed = 0
+
+        out_lines = []
+        block_urls: Set[str] = set()
+        in_code = False
+
+        for line in markdown.split("\n"):
+            stripped = line.strip()
+
+            # 코드 블록은 건드리지 않음
+            if stripped.startswith("```"):
+                in_code = not in_code
+                out_lines.append(line)
+                continue
+            if in_code:
+                out_lines.append(line)
+                continue
+
+            # 블록 경계에서 블록 내 URL 집합 초기화 (블록마다 자기 출처 링크를 유지)
+            if not stripped or BLOCK_START_RE.match(line) or stripped == "---":
+                block_urls = set()
+
+            # 출처 줄은 원문 그대로 보존
+            if stripped.lstrip("📖 *").startswith("출처"):
+                out_lines.append(line)
+                continue
+
+            def replace(match: "re.Match") -> str:
+                if match.group("citation"):
+                    self.removed += 1
+                    return ""
+
+                url = match.group("url")
+                trailing = ""
+                if url is None:
+                    # 일반 URL 뒤에 붙은 문장 부호는 URL이 아님 ("https://e.com/x." → "https://e.com/x")
+                    bare = match.group("bare")
+                    url = bare.rstrip(".,;:!?)")
+                    trailing = bare[len(url):]
+                key = normalize_url(url)
+                if key not in block_urls:
+                    block_urls.add(key)
+                    return match.group(0)
+
+                # 중복 링크 제거 (문장 부호는 남김)
+                self.removed += 1
+                text = (match.group("text") or "").strip()
+                if not text or self._is_generic_anchor(text):
+                    return trailing
+                return text
+
+            new_line = pattern.sub(replace, line)
+            if new_line != line:
+                new_line = self._tidy(new_line)
+                # 링크만 있던 줄이 비면 줄 자체 제거
+                if not new_line.strip() and stripped:
+                    continue
+            out_lines.append(new_line)
+
+        return "\n".join(out_lines)
+
+    def _is_generic_anchor(self, text: str) -> bool:
+        """앵커 텍스트가 URL/도메인/일반 라벨인지 여부"""
+        lowered = text.lower().strip("[]() ")
+        if lowered in GENERIC_ANCHORS:
+            return True
+        if lowered.startswith(("http://", "https://", "www.")):
+            return True
+        # 도메인 형태 (예: x.com, github.com)
+        return bool(re.fullmatch(r"[\w.-]+\.[a-z]{2,}(?:/\S*)?", lowered))
+
+    @staticmethod
+    def _tidy(line: str) -> str:
+        """제거 후 남은 빈 괄호/구분자/이중 공백 정리"""
+        line = re.sub(r"\(\s*[,;·]?\s*\)", "", line)
+        line = re.sub(r"[ \t]+([,.;:])(?=\s|$)", r"\1", line)
+        line = re.sub(r"\s*[,;·]\s*$", "", line)
+        line = re.sub(r"(?<=\S) {2,}", " ", line)
+        return line.rstrip()
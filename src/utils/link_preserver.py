@@ -5,16 +5,51 @@ AI 요약 중 링크가 변경되지 않도록 보호하는 유틸리티
 """
 
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
 from ..logger import logger
 
 
+# 마크다운 링크 [텍스트](URL) 또는 일반 URL (한 번의 스캔으로 매칭)
+LINK_TOKEN_RE = re.compile(r'\[([^\]]+)\]\(([^\)]+)\)|https?://[^\s\)\]\[<>"]+')
+
+# 일반 URL 패턴 (http/https로 시작하는 URL)
+PLAIN_URL_RE = re.compile(r'https?://[^\s\)\]<>"]+')
+
+# [LINK_0001] 또는 LINK_0001 형태의 placeholder
+PLACEHOLDER_RE = re.compile(r'\[(LINK_\d{4,})\]|(?<![\w])(LINK_\d{4,})(?!\d)')
+
+
+class LinkRecord:
+    """치환된 링크 정보 (placeholder, 앵커 텍스트, URL, 원본 위치)"""
+    
+    __slots__ = ("placeholder", "anchor", "url", "position")
+    
+    def __init__(self, placeholder: str, anchor: Optional[str], url: str, position: int):
+        """
+        Args:
+            placeholder: LINK_0001 형태의 placeholder
+            anchor: 마크다운 링크 텍스트 (일반 URL이면 None)
+            url: 원본 URL
+            position: 원본 콘텐츠에서의 시작 위치
+        """
+        self.placeholder = placeholder
+        self.anchor = anchor
+        self.url = url
+        self.position = position
+    
+    def __repr__(self) -> str:
+        return f"LinkRecord({self.placeholder}, {self.url!r})"
+
+
 class LinkPreserver:
     """링크를 placeholder로 치환하고 복원하는 클래스"""
     
     def __init__(self):
         """Initialize Link Preserver"""
         self.link_map: Dict[str, str] = {}
+        self.records: List[LinkRecord] = []
+        # 마지막 restore_links에서 매핑에 없던 placeholder
+        self.unknown_placeholders: List[str] = []
         self.placeholder_pattern = r'\[LINK_(\d{4})\]'
         
     def preserve_links(self, content: str) -> Tuple[str, Dict[str, str]]:
@@ -27,69 +62,29 @@ class LinkPreserver:
             (처리된 콘텐츠, 링크 매핑 딕셔너리)
         """
         self.link_map = {}
-        link_counter = 1
+        self.records = []
         
-        # 마크다운 링크 패턴: [텍스트](URL)
-        markdown_link_pattern = r'\[([^\]]+)\]\(([^\)]+)\)'
-        
-        # 일반 URL 패턴 (http/https로 시작하는 URL)
-        url_pattern = r'https?://[^\s\)\]<>"]+'
-        
-        def replace_markdown_link(match):
-            """마크다운 링크를 placeholder로 치환"""
-            nonlocal link_counter
-            link_text = match.group(1)
-            url = match.group(2)
+        def replace_link(match):
+            """마크다운 링크는 URL 부분만, 일반 URL은 전체를 placeholder로 치환"""
+            link_text, url = match.group(1), match.group(2)
+            if url is None:
+                url = match.group(0)
             
-            # URL 부분만 placeholder로 치환
-            placeholder = f"LINK_{link_counter:04d}"
+            placeholder = f"LINK_{len(self.records) + 1:04d}"
+            self.records.append(LinkRecord(placeholder, link_text, url, match.start()))
             self.link_map[placeholder] = url
-            link_counter += 1
             
+            if link_text is None:
+                return f"[{placeholder}]"
             return f"[{link_text}]([{placeholder}])"
         
-        def replace_plain_url(match):
-            """일반 URL을 placeholder로 치환"""
-            nonlocal link_counter
-            url = match.group(0)
-            
-            # 이미 placeholder인 경우 스킵
-            if url.startswith('[LINK_') and url.endswith(']'):
-                return url
-                
-            placeholder = f"LINK_{link_counter:04d}"
-            self.link_map[placeholder] = url
-            link_counter += 1
-            
-            return f"[{placeholder}]"
-        
-        # 1. 먼저 마크다운 링크 처리
-        processed = re.sub(markdown_link_pattern, replace_markdown_link, content)
-        
-        # 2. 남은 일반 URL 처리 (마크다운 링크 내부가 아닌 것만)
-        # 마크다운 링크를 임시로 보호
-        temp_protected = []
-        for match in re.finditer(r'\[([^\]]+)\]\(\[LINK_\d{4}\]\)', processed):
-            temp_protected.append(match.group(0))
-            
-        # 마크다운 링크를 임시 마커로 치환
-        for i, protected in enumerate(temp_protected):
-            processed = processed.replace(protected, f"<<<PROTECTED_{i}>>>")
-            
-        # 일반 URL 처리
-        processed = re.sub(url_pattern, replace_plain_url, processed)
-        
-        # 보호된 마크다운 링크 복원
-        for i, protected in enumerate(temp_protected):
-            processed = processed.replace(f"<<<PROTECTED_{i}>>>", protected)
+        processed = LINK_TOKEN_RE.sub(replace_link, content)
         
         logger.info(f"링크 보존: {len(self.link_map)}개 링크를 placeholder로 치환")
         
         # 디버그: 몇 개 링크 샘플 출력
-        if self.link_map:
-            samples = list(self.link_map.items())[:3]
-            for placeholder, url in samples:
-                logger.debug(f"  {placeholder} → {url[:50]}...")
+        for record in self.records[:3]:
+            logger.debug(f"  {record.placeholder} → {record.url[:50]}...")
         
         return processed, self.link_map.copy()
     
@@ -106,43 +101,39 @@ class LinkPreserver:
         if link_map is None:
             link_map = self.link_map
             
+        self.unknown_placeholders = []
         if not link_map:
             logger.warning("링크 매핑이 비어있음")
             return content
-            
-        restored = content
-        restore_count = 0
-        
-        # placeholder를 원본 링크로 복원
-        for placeholder, url in link_map.items():
-            # [LINK_0001] 형태와 LINK_0001 형태 모두 처리
-            patterns = [
-                f"\\[{placeholder}\\]",  # [LINK_0001]
-                placeholder  # LINK_0001
-            ]
-            
-            for pattern in patterns:
-                if re.search(pattern, restored):
-                    restored = re.sub(pattern, url, restored)
-                    restore_count += 1
-                    break
         
-        logger.info(f"링크 복원: {restore_count}개 placeholder를 원본 링크로 복원")
+        restored_placeholders = set()
+        unknown: List[str] = []
+        
+        def replace_placeholder(match):
+            """[LINK_0001] / LINK_0001 → 원본 URL (모르는 placeholder는 유지)"""
+            placeholder = match.group(1) or match.group(2)
+            url = link_map.get(placeholder)
+            if url is None:
+                unknown.append(match.group(0))
+                return match.group(0)
+            restored_placeholders.add(placeholder)
+            return url
+        
+        restored = PLACEHOLDER_RE.sub(replace_placeholder, content)
+        self.unknown_placeholders = unknown
+        
+        logger.info(f"링크 복원: {len(restored_placeholders)}개 placeholder를 원본 링크로 복원")
         
         # 복원되지 않은 placeholder 확인
-        remaining = re.findall(r'\[?LINK_\d{4}\]?', restored)
-        if remaining:
-            logger.warning(f"복원되지 않은 placeholder: {remaining[:5]}")
-            # 복원되지 않은 것들을 빈 문자열로 치환 (또는 원본 유지)
-            for placeholder in remaining:
-                if placeholder in link_map or placeholder.strip('[]') in link_map:
-                    continue
+        if unknown:
+            logger.warning(f"복원되지 않은 placeholder: {unknown[:5]}")
+            for placeholder in unknown[:5]:
                 logger.warning(f"  알 수 없는 placeholder: {placeholder}")
         
         return restored
     
     def extract_links(self, content: str) -> List[str]:
-        """콘텐츠에서 모든 링크 추출
+        """콘텐츠에서 모든 링크 추출 (중복 제거, 등장 순서 유지)
         
         Args:
             content: 콘텐츠
@@ -150,21 +141,20 @@ class LinkPreserver:
         Returns:
             링크 URL 리스트
         """
-        links = []
+        # dict를 순서 있는 집합으로 사용
+        links: Dict[str, None] = {}
         
         # 마크다운 링크에서 URL 추출
-        markdown_links = re.findall(r'\[([^\]]+)\]\(([^\)]+)\)', content)
-        for _, url in markdown_links:
-            if not url.startswith('[LINK_'):  # placeholder가 아닌 경우만
-                links.append(url)
+        for match in LINK_TOKEN_RE.finditer(content):
+            url = match.group(2)
+            if url is not None and not url.startswith('[LINK_'):  # placeholder가 아닌 경우만
+                links.setdefault(url)
         
         # 일반 URL 추출 (마크다운 링크에 포함되지 않은 것)
-        plain_urls = re.findall(r'https?://[^\s\)\]<>"]+', content)
-        for url in plain_urls:
-            if url not in links:  # 중복 제거
-                links.append(url)
+        for url in PLAIN_URL_RE.findall(content):
+            links.setdefault(url)
         
-        return links
+        return list(links)
     
     def validate_links(self, original_content: str, processed_content: str) -> Dict[str, any]:
         """원본과 처리된 콘텐츠의 링크 비교 검증
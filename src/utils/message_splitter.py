@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Markdown Message Splitter
+긴 마크다운을 메시지 길이 제한(Discord 2000자)에 맞게 최소 개수의 메시지로 나누는 유틸리티
+
+- 헤더/구분선(섹션), 불릿·문단(블록) 경계에서만 나누고 링크·인라인 코드·코드 펜스는 자르지 않음
+- 태그와 "(i/n)" 페이지 표시까지 포함해 제한 안에 들어가도록 계산
+- 블록 순서를 유지한 채 앞에서부터 최대한 채우는 방식으로 메시지 수를 최소화하고,
+  같은 메시지 수를 유지하는 범위에서 섹션 경계를 우선해 자름 (입력 길이에 선형)
+"""
+
+import re
+from bisect import bisect_right
+from typing import List, Tuple
+
+
+# 코드 펜스 시작/끝 (``` 또는 ~~~)
+FENCE_RE = re.compile(r"^\s*(`{3,}|~{3,})")
+
+# 섹션 경계: 헤더, 구분선
+SECTION_RE = re.compile(r"^(?:#{1,6}\s|(?:-{3,}|\*{3,}|_{3,})\s*$)")
+
+# 블록 시작: 최상위 불릿, 번호 목록, 인용
+BLOCK_RE = re.compile(r"^(?:[-*+•]\s|\d+[.)]\s|>)")
+
+# 한 줄 안에서 자르면 안 되는 구간: 마크다운 링크, <URL>, 맨 URL, 인라인 코드
+ATOMIC_RE = re.compile(r"!?\[[^\]\n]*\]\([^)\n]*\)|<https?://[^>\s]*>|https?://\S+|`[^`\n]*`")
+
+# 분할 우선순위
+SECTION, BLOCK, INNER = 2, 1, 0
+
+
+class MarkdownMessageSplitter:
+    """마크다운 블록 경계 기반 메시지 분할기"""
+
+    def __init__(self, limit: int = 2000):
+        """
+        Args:
+            limit: 메시지 최대 길이 (태그·페이지 표시 포함)
+        """
+        self.limit = limit
+
+    def split(self, content: str, tag: str = "") -> List[str]:
+        """콘텐츠를 발송할 메시지 목록으로 분할
+
+        Args:
+            content: 원본 마크다운
+            tag: 첫 메시지 앞에 붙일 태그 ("{tag}\\n{본문}")
+
+        Returns:
+            태그와 "(i/n)" 페이지 표시가 붙은 메시지 리스트
+        """
+        head = f"{tag}\n" if tag else ""
+        if len(head) + len(content) <= self.limit or not content.strip():
+            return [head + content]
+
+        # 페이지 표시 자릿수를 가정해 분할하고, 메시지 수가 가정을 넘으면 다시 계산
+        digits = 1
+        while True:
+            reserve = len("\n\n()") + 2 * digits + 1
+            first_cap = self.limit - reserve - len(head)
+            cap = self.limit - reserve
+            if first_cap < 1:
+                raise ValueError(f"태그가 너무 김: {len(tag)}자")
+            units = self._units(content, first_cap)
+            bodies = self._pack(units, first_cap, cap)
+            if len(str(len(bodies))) <= digits:
+                break
+            digits = len(str(len(bodies)))
+
+        total = len(bodies)
+        return [
+            (head if i == 1 else "") + body + f"\n\n({i}/{total})"
+            for i, body in enumerate(bodies, 1)
+        ]
+
+    def chunks(self, content: str) -> List[str]:
+        """태그/페이지 표시 없이 limit 이하 조각으로만 분할 (임베드 설명 등)
+
+        Args:
+            content: 원본 마크다운
+
+        Returns:
+            분할된 본문 리스트
+        """
+        if len(content) <= self.limit:
+            return [content]
+        return self._pack(self._units(content, self.limit), self.limit, self.limit)
+
+    def _units(self, content: str, max_size: int) -> List[Tuple[str, int]]:
+        """콘텐츠를 (텍스트, 앞쪽 경계 우선순위) 블록으로 나누고 max_size보다 큰 블록은 잘게 분할"""
+        blocks: List[Tuple[List[str], int, bool]] = []  # (라인들, 우선순위, 코드 펜스 여부)
+        fence = None
+        previous_blank = True
+        for line in content.split("\n"):
+            if fence:
+                blocks[-1][0].append(line)
+                if line.strip().startswith(fence):
+                    fence = None
+                continue
+            match = FENCE_RE.match(line)
+            if match:
+                fence = match.group(1)
+                blocks.append(([line], BLOCK, True))
+            elif not line.strip():
+                if blocks and blocks[-1][2]:
+                    # 닫힌 코드 펜스 뒤 빈 줄은 펜스 블록에 붙이지 않음 (마지막 줄이 닫는 펜스여야 함)
+                    blocks.append(([line], BLOCK, False))
+                elif blocks:
+                    blocks[-1][0].append(line)
+                else:
+                    blocks.append(([line], BLOCK, False))
+            elif SECTION_RE.match(line):
+                blocks.append(([line], SECTION, False))
+            elif BLOCK_RE.match(line) or previous_blank or (blocks and blocks[-1][2]):
+                blocks.append(([line], BLOCK, False))
+            else:
+                blocks[-1][0].append(line)
+            previous_blank = not line.strip()
+
+        units: List[Tuple[str, int]] = []
+        for lines, strength, is_fence in blocks:
+            text = "\n".join(lines)
+            if len(text) <= max_size:
+                units.append((text, strength))
+            elif is_fence:
+                units.extend(self._split_fence(lines, strength, max_size))
+            else:
+                units.extend(self._split_lines(lines, strength, max_size))
+        return units
+
+    def _split_lines(self, lines: List[str], strength: int, max_size: int) -> List[Tuple[str, int]]:
+        """큰 블록을 줄 단위로, 그래도 긴 줄은 링크를 피해 공백 위치에서 분할"""
+        pieces: List[str] = []
+        for line in lines:
+            if len(line) <= max_size:
+                pieces.append(line)
+            else:
+                pieces.extend(self._split_line(line, max_size))
+
+        units: List[Tuple[str, int]] = []
+        current: List[str] = []
+        size = -1
+        for piece in pieces:
+            if current and size + 1 + len(piece) > max_size:
+                units.append(("\n".join(current), strength if not units else INNER))
+                current, size = [], -1
+            current.append(piece)
+            size += 1 + len(piece)
+        if current:
+            units.append(("\n".join(current), strength if not units else INNER))
+        return units
+
+    @staticmethod
+    def _split_line(line: str, max_size: int) -> List[str]:
+        """긴 한 줄을 max_size 이하 조각으로 분할 (링크/URL/인라인 코드 내부는 피함)"""
+        spans = [(m.start(), m.end()) for m in ATOMIC_RE.finditer(line)]
+        starts = [start for start, _ in spans]
+
+        def containing(position: int):
+            index = bisect_right(starts, position) - 1
+            if index >= 0 and spans[index][0] < position < spans[index][1]:
+                return spans[index]
+            return None
+
+        pieces = []
+        pos = 0
+        while len(line) - pos > max_size:
+            limit = pos + max_size
+            cut = line.rfind(" ", pos + 1, limit + 1)
+            while cut > pos and containing(cut):
+                cut = line.rfind(" ", pos + 1, containing(cut)[0])
+            if cut <= pos:
+                # 공백이 없으면 자르면 안 되는 구간 바로 앞, 그것도 없으면 강제로 자름
+                span = containing(limit)
+                cut = span[0] if span and span[0] > pos else limit
+            pieces.append(line[pos:cut].rstrip())
+            pos = cut + 1 if cut < len(line) and line[cut] == " " else cut
+        pieces.append(line[pos:])
+        return [piece for piece in pieces if piece]
+
+    @staticmethod
+    def _split_fence(lines: List[str], strength: int, max_size: int) -> List[Tuple[str, int]]:
+        """큰 코드 블록을 각 조각마다 펜스를 다시 열고 닫아 분할"""
+        opener = lines[0]
+        fence = FENCE_RE.match(opener).group(1)
+        closed = len(lines) > 1 and lines[-1].strip().startswith(fence)
+        body = lines[1:-1] if closed else lines[1:]
+        trailer = lines[-1] if closed else fence
+        room = max_size - len(opener) - len(trailer) - 2
+
+        units: List[Tuple[str, int]] = []
+        current: List[str] = []
+        size = -1
+        for line in body:
+            chunks = [line[i:i + room] for i in range(0, len(line), room)] or [""]
+            for chunk in chunks:
+                if current and size + 1 + len(chunk) > room:
+                    units.append(("\n".join([opener, *current, trailer]), strength if not units else INNER))
+                    current, size = [], -1
+                current.append(chunk)
+                size += 1 + len(chunk)
+        units.append(("\n".join([opener, *current, trailer]), strength if not units else INNER))
+        return units
+
+    @staticmethod
+    def _pack(units: List[Tuple[str, int]], first_cap: int, cap: int) -> List[str]:
+        """순서를 유지한 채 최소 개수의 메시지로 묶기
+
+        앞에서부터 최대한 채우면 메시지 수가 최소가 되고, 뒤에서부터 채운 결과로 각 분할 지점의
+        가장 이른 위치를 구해 그 범위 안에서 섹션 경계 > 블록 경계 순으로 가장 늦은 지점을 고름
+        """
+        n = len(units)
+        prefix = [0] * (n + 1)
+        for i, (text, _) in enumerate(units):
+            prefix[i + 1] = prefix[i] + len(text) + 1
+
+        def size(a: int, b: int) -> int:
+            return prefix[b] - prefix[a] - 1
+
+        # 1) 앞에서부터 채운 메시지 수
+        count, start = 0, 0
+        while start < n:
+            limit = first_cap if count == 0 else cap
+            end = start + 1
+            while end < n and size(start, end + 1) <= limit:
+                end += 1
+            count += 1
+            start = end
+
+        # 2) 뒤에서부터 채워 k번째 분할 지점의 가장 이른 위치(earliest[k])
+        earliest = [0] * (count + 1)
+        earliest[count] = n
+        end = n
+        for k in range(count - 1, 0, -1):
+            start = end - 1
+            while start > 0 and size(start - 1, end) <= cap:
+                start -= 1
+            earliest[k] = start
+            end = start
+
+        # 3) 앞에서부터 허용 범위 안의 가장 좋은 경계에서 자르기
+        bodies = []
+        start = 0
+        for k in range(1, count + 1):
+            if k == count:
+                cut = n
+            else:
+                limit = first_cap if k == 1 else cap
+                reach = start + 1
+                while reach < n and size(start, reach + 1) <= limit:
+                    reach += 1
+                reach = min(reach, n - 1)
+                cut = reach
+                best = -1
+                for position in range(reach, max(earliest[k], start + 1) - 1, -1):
+                    if units[position][1] > best:
+                        best, cut = units[position][1], position
+                        if best == SECTION:
+                            break
+            bodies.append("\n".join(text for text, _ in units[start:cut]).strip("\n"))
+            start = cut
+        return bodies
@@ -0,0 +1,87 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Backfill 테스트
+실제 API 호출 없이 URL 열거, 기존 출력 건너뛰기, 체크포인트 재개 확인
+"""
+
+import os
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.backfill import (
+    BackfillRunner,
+    BackfillCheckpoint,
+    smol_ai_issue_urls,
+    weekly_robotics_issue_urls,
+)
+from src.summarizers.base import SummarizerResult
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class FakeBatch:
+    """요청된 URL을 기록하고 'fail'이 포함된 URL만 실패시키는 BatchSummarizer 대체"""
+    
+    def __init__(self, fail_urls=()):
+        self.fail_urls = set(fail_urls)
+        self.requested = []
+    
+    async def run(self, urls, **kwargs):
+        for url in urls:
+            self.requested.append(url)
+            if url in self.fail_urls:
+                yield SummarizerResult("Fake", url, False, error="의도된 실패")
+            else:
+                yield SummarizerResult("Fake", url, True, summary=f"# 요약\n{url}")
+
+
+def test_backfill():
+    """Backfill 테스트"""
+    urls = smol_ai_issue_urls(date(2025, 8, 30), date(2025, 9, 2))
+    assert urls[0] == "https://news.smol.ai/issues/25-08-30"
+    assert len(urls) == 4
+    robotics = weekly_robotics_issue_urls(314, 316)
+    assert robotics[-1] == "https://www.weeklyrobotics.com/weekly-robotics-316"
+    print("  ✓ 이슈 URL 열거 확인")
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        root = os.path.join(tmp, "outputs")
+        checkpoint_path = os.path.join(tmp, "checkpoint.json")
+        
+        # 이미 생성된 출력 (다른 달 디렉토리에 있어도 건너뜀)
+        os.makedirs(os.path.join(root, "2025", "09"))
+        Path(root, "2025", "09", "smol_ai_news_20250831.md").write_text("기존", encoding="utf-8")
+        Path(root, "2025", "09", "weekly_robotics_314_20250905.md").write_text("기존", encoding="utf-8")
+        
+        all_urls = urls + robotics
+        batch = FakeBatch(fail_urls={urls[2]})
+        runner = BackfillRunner(checkpoint=BackfillCheckpoint(checkpoint_path), output_root=root, batch=batch)
+        report = runner.run(all_urls)
+        
+        assert report['skipped'] == 2
+        assert report['succeeded'] == 4 and report['failed'] == 1
+        assert urls[1] not in batch.requested
+        assert robotics[0] not in batch.requested
+        assert os.path.basename(runner.checkpoint.done[urls[0]]) == "smol_ai_news_20250830.md"
+        assert os.path.exists(runner.checkpoint.done[urls[0]])
+        print("  ✓ 기존 출력 건너뛰기 및 main.py 파일명 규칙 확인")
+        
+        # 재실행: 체크포인트 완료 항목은 건너뛰고 실패 항목만 재시도
+        batch = FakeBatch()
+        runner = BackfillRunner(checkpoint=BackfillCheckpoint(checkpoint_path), output_root=root, batch=batch)
+        report = runner.run(all_urls)
+        assert batch.requested == [urls[2]]
+        assert report['succeeded'] == 1 and not runner.checkpoint.failed
+        print("  ✓ 체크포인트 재개 확인")
+
+
+if __name__ == "__main__":
+    test_backfill()
+    print("✅ 테스트 완료")
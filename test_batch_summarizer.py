@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+BatchSummarizer 테스트
+실제 API 호출 없이 동시성 제한과 URL별 실패 격리 확인
+"""
+
+import sys
+import asyncio
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.batch import BatchSummarizer
+from src.summarizer import SummarizerFactory
+from src.summarizers.base import BaseSummarizer
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class SleepySummarizer(BaseSummarizer):
+    """동시 실행 수를 기록하는 테스트용 Summarizer"""
+    
+    SUPPORTED_DOMAINS = ['batch.test']
+    active = 0
+    peak = 0
+    
+    def __init__(self, api_key=None, model=None):
+        super().__init__("Sleepy", api_key, model or "fake-model")
+    
+    def summarize(self, url: str, **kwargs) -> str:
+        return ""
+    
+    def validate_config(self) -> bool:
+        return True
+    
+    async def asummarize_with_metadata(self, url: str, **kwargs):
+        SleepySummarizer.active += 1
+        SleepySummarizer.peak = max(SleepySummarizer.peak, SleepySummarizer.active)
+        try:
+            await asyncio.sleep(0.05)
+            if url.endswith("fail"):
+                raise RuntimeError("의도된 실패")
+            return {'markdown': f"## 요약\n{url}", 'headline': url[-1]}
+        finally:
+            SleepySummarizer.active -= 1
+
+
+class SlowSummarizer(SleepySummarizer):
+    """모델별 제한이 걸린 느린 테스트용 Summarizer"""
+    
+    SUPPORTED_DOMAINS = ['slow.test']
+    active = 0
+    
+    def __init__(self, api_key=None, model=None):
+        BaseSummarizer.__init__(self, "Slow", api_key, "gpt-5")
+    
+    async def asummarize_with_metadata(self, url: str, **kwargs):
+        SlowSummarizer.active += 1
+        try:
+            await asyncio.sleep(0.3)
+            return {'markdown': f"## 요약\n{url}"}
+        finally:
+            SlowSummarizer.active -= 1
+
+
+def test_batch_summarizer():
+    """BatchSummarizer 테스트"""
+    SummarizerFactory.register("sleepy", SleepySummarizer)
+    try:
+        urls = [f"https://batch.test/issue-{i}" for i in range(6)]
+        urls.append("https://batch.test/issue-fail")
+        urls.append("https://unknown.test/issue")
+        
+        runner = BatchSummarizer(concurrency=4, per_model_concurrency=2)
+        results = runner.run_sync(urls)
+        
+        assert len(results) == len(urls)
+        succeeded = [r for r in results if r.success]
+        failed = [r for r in results if not r.success]
+        assert len(succeeded) == 6
+        assert {r.url for r in failed} == {urls[-2], urls[-1]}
+        assert all(r.metadata.get('headline') for r in succeeded)
+        print("  ✓ URL별 실패 격리 확인")
+        
+        assert SleepySummarizer.peak == 2, SleepySummarizer.peak
+        print("  ✓ 모델별 동시성 제한 확인")
+        
+        # 모델 제한으로 기다리는 URL이 전체 슬롯을 차지하지 않아야 함
+        SummarizerFactory.register("slow", SlowSummarizer)
+        SummarizerFactory._domain_index = None
+        SleepySummarizer.peak = 0
+        mixed = [f"https://slow.test/issue-{i}" for i in range(3)]
+        mixed += [f"https://batch.test/mixed-{i}" for i in range(6)]
+        runner = BatchSummarizer(concurrency=4, per_model_concurrency=4, model_limits={'gpt-5': 1})
+        results = runner.run_sync(mixed)
+        assert all(r.success for r in results)
+        # gpt-5는 1개만 실행되고 나머지 전체 슬롯(4 - 1)은 다른 모델이 모두 사용
+        assert SleepySummarizer.peak == 3, SleepySummarizer.peak
+        print("  ✓ 모델 제한 대기 중인 URL이 다른 모델의 전체 동시성을 막지 않음")
+    finally:
+        SummarizerFactory._summarizers.pop("sleepy", None)
+        SummarizerFactory._summarizers.pop("slow", None)
+        SummarizerFactory._domain_index = None
+
+
+if __name__ == "__main__":
+    test_batch_summarizer()
+    print("✅ 테스트 완료")
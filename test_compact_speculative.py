@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Compact 사전 생성 테스트
+실제 API 호출 없이 GitHub 게시와 간결 요약 생성이 병렬로 실행되는지, GitHub 실패 시 초안을 재사용하는지 확인
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import tracing
+from src.tracing import Tracer
+from src.summarizers.compact import CompactSummarizer
+from src.stages import build_discord_content
+from publish_workflow import PublishWorkflow
+
+PLACEHOLDER = CompactSummarizer.DISCUSSION_URL_PLACEHOLDER
+REAL_URL = "https://github.com/orgs/sudormrf-run/discussions/42"
+
+
+class FakeWorkflow(PublishWorkflow):
+    """LLM/GitHub/Discord 호출을 지연 시간만 흉내내는 워크플로우"""
+    
+    def __init__(self, github_ok: bool = True):
+        super().__init__()
+        self.github_ok = github_ok
+        self.compact_urls = []
+        self.sent = []
+    
+    def _generate_full_summary(self, url, **options):
+        return "## 요약\n- 항목", {'headline': '테스트', 'date': '25.09.01'}
+    
+    def _generate_compact_summary(self, full_content, github_url=None, style='discord'):
+        self.compact_urls.append(github_url)
+        time.sleep(0.3)
+        return f"# AI News\n---\n📖 상세 뉴스레터: [GitHub Discussion 링크]({github_url})"
+    
+    def _publish_to_github(self, content, metadata, **options):
+        time.sleep(0.3)
+        return REAL_URL if self.github_ok else None
+    
+    def _publish_to_discord(self, content, metadata, **options):
+        self.sent.append(content)
+        return True
+    
+    def _save_content(self, content, metadata, version):
+        return f"<{version}>"
+
+
+def test_compact_speculative():
+    """Compact 사전 생성 테스트"""
+    filled = CompactSummarizer.fill_discussion_url(f"본문\n📖 [링크]({PLACEHOLDER})", REAL_URL)
+    assert PLACEHOLDER not in filled and REAL_URL in filled
+    filled = CompactSummarizer.fill_discussion_url("URL이 빠진 본문", REAL_URL)
+    assert filled.endswith(f"📖 상세 뉴스레터: {REAL_URL}")
+    draft = f"# AI News\n• 항목\n\n---\n📖 상세 뉴스레터: [GitHub Discussion 링크]({PLACEHOLDER})\n"
+    assert CompactSummarizer.remove_discussion_url(draft) == "# AI News\n• 항목"
+    print("  ✓ 자리표시 URL 교체/제거 확인")
+    
+    # 가짜 저장 경로(<full>) 옆에 트레이스 파일이 생기지 않도록 비활성화
+    tracing._tracer = Tracer(enabled=False)
+    workflow = FakeWorkflow()
+    started = time.monotonic()
+    assert workflow.execute("https://news.smol.ai/issues/25-09-01")
+    elapsed = time.monotonic() - started
+    assert elapsed < 0.55, f"병렬 실행되지 않음: {elapsed:.2f}초"
+    assert workflow.compact_urls == [PLACEHOLDER]
+    assert REAL_URL in workflow.sent[0] and PLACEHOLDER not in workflow.sent[0]
+    print(f"  ✓ GitHub 게시와 병렬 생성 확인 ({elapsed:.2f}초)")
+    
+    workflow = FakeWorkflow(github_ok=False)
+    workflow.execute("https://news.smol.ai/issues/25-09-01")
+    assert workflow.compact_urls == [PLACEHOLDER]
+    assert workflow.sent == ["# AI News"]
+    print("  ✓ GitHub 실패 시 다시 생성하지 않고 초안에서 링크만 제거")
+    tracing._tracer = None
+    
+    # main.py 경로: discord_content 단계가 build_discord_content로 초안을 사용
+    url = "https://news.smol.ai/issues/25-09-01"
+    original = "## 요약\n- 항목"
+    assert build_discord_content(original, url, github_url=REAL_URL, compact_content=draft).endswith(REAL_URL + ")\n")
+    assert build_discord_content(original, url, github_url=None, compact_content=draft) == "# AI News\n• 항목"
+    fallback = CompactSummarizer()._create_fallback_summary(PLACEHOLDER)
+    assert build_discord_content(original, url, github_url=None, compact_content=fallback) == original
+    assert build_discord_content(original, url, github_url=None, compact_content=None) == original
+    print("  ✓ main.py도 GitHub 실패 시 초안에서 링크만 제거 (기본 요약/초안 없음은 원본)")
+
+
+if __name__ == "__main__":
+    test_compact_speculative()
+    print("✅ 테스트 완료")
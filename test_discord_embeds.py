@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Discord 임베드 묶음 발송 테스트
+로컬 발송 대역 서버로 섹션별 임베드 구성, 메시지당 10개·6000자 묶기, 텍스트 방식 대비 요청 수 감소 확인
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src.publishers.discord import DiscordPublisher, DiscordDestination
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def make_full_summary(sections: int, bullets: int) -> str:
+    parts = ["# AI 뉴스 25-09-01", "", "머리말 문단입니다.", ""]
+    for s in range(sections):
+        parts.append(f"## 섹션 {s}")
+        parts.extend(
+            f"- 항목 {s}.{b}: 긴 설명 문장 " + "가" * 60 + f" [출처](https://example.com/{s}/{b})"
+            for b in range(bullets)
+        )
+        parts.append("")
+    return "\n".join(parts)
+
+
+def test_discord_embeds():
+    """Discord 임베드 묶음 발송 테스트"""
+    publisher = DiscordPublisher(webhook_url="https://discord.example/api/webhooks/1/x")
+    summary = make_full_summary(12, 14)
+    payloads = publisher._build_embed_payloads(summary, "**제목**")
+    embeds = [embed for payload in payloads for embed in payload["embeds"]]
+    assert payloads[0]["content"] == "**제목**"
+    assert "title" not in embeds[0] and embeds[0]["description"].startswith("# AI 뉴스")
+    assert [e["title"] for e in embeds[1:3]] == ["섹션 0", "섹션 1"]
+    assert "(https://example.com/0/0)" in embeds[1]["description"]  # 임베드에서는 링크 그대로
+    for payload in payloads:
+        assert len(payload["embeds"]) <= 10
+        assert sum(len(e.get("title", "")) + len(e.get("description", "")) for e in payload["embeds"]) <= 6000
+    print(f"  ✓ ## 섹션별 임베드 {len(embeds)}개 → 메시지 {len(payloads)}개 (10개·6000자 제한)")
+
+    huge = "## 큰 섹션\n" + "\n".join(f"- 줄 {i} " + "나" * 90 for i in range(120))
+    parts = [e for p in publisher._build_embed_payloads(huge, "") for e in p["embeds"]]
+    assert len(parts) > 1 and parts[1]["title"] == "큰 섹션 (계속)"
+    assert all(len(e["description"]) <= 4096 for e in parts)
+    print("  ✓ 4096자 초과 섹션은 (계속) 임베드로 분할")
+
+    sink = LocalSink(discord_limit=0).start()
+    try:
+        base = sink.base_url
+        fanout = DiscordPublisher(destinations=[
+            DiscordDestination(f"{base}/api/webhooks/1/text", mode="text"),
+            DiscordDestination(f"{base}/api/webhooks/2/embeds", mode="embeds"),
+        ])
+        assert fanout.publish(summary, tag="**제목**")
+        text_calls = sink.count("/api/webhooks/1/text", status=204)
+        embed_calls = sink.count("/api/webhooks/2/embeds", status=204)
+        assert sink.count("/api/webhooks/2/embeds") == embed_calls  # 400 없음
+        assert embed_calls * 2 <= text_calls, (text_calls, embed_calls)
+        print(f"  ✓ 웹훅 호출 수: 텍스트 {text_calls}회 → 임베드 {embed_calls}회")
+
+        assert DiscordPublisher(webhook_url=f"{base}/api/webhooks/3/e").send_embed("상태", "정상", 실행="1")
+        embed = sink.payloads("/api/webhooks/3/e")[0]["embeds"][0]
+        assert embed["fields"] == [{"name": "실행", "value": "1", "inline": True}]
+        print("  ✓ send_embed 단일 임베드")
+    finally:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    test_discord_embeds()
+    print("✅ 테스트 완료")
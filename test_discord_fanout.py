@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Discord 다중 웹훅 발송 테스트
+로컬 발송 대역 서버로 대상별 태그/봇 이름/콘텐츠 버전, 렌더링 공유, 호스트별 동시성 제한, 대상별 결과 확인
+"""
+
+import sys
+import json
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src.config import Config
+from src.publishers.discord import DiscordPublisher, DiscordDestination
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class CountingPublisher(DiscordPublisher):
+    """청크 분할 호출 횟수를 세는 Publisher"""
+
+    splits = 0
+
+    def _split_message(self, content, tag=''):
+        CountingPublisher.splits += 1
+        return super()._split_message(content, tag)
+
+
+def test_discord_fanout():
+    """Discord 다중 웹훅 발송 테스트"""
+    sink = LocalSink(discord_limit=0).start()
+    base = sink.base_url
+    try:
+        destinations = [
+            DiscordDestination(f"{base}/api/webhooks/1/a"),
+            DiscordDestination(f"{base}/api/webhooks/2/b", username="미러 봇"),
+            DiscordDestination(f"{base}/api/webhooks/3/c", name="archive", tag="", variant="full"),
+        ]
+        publisher = CountingPublisher(destinations=destinations)
+        full = "\n".join(f"전체 {i} " + "나" * 80 for i in range(60))
+        assert publisher.publish("간결 요약", tag="**제목**", full_content=full)
+        assert CountingPublisher.splits == 2  # (compact, 태그) + (full, 태그 없음)
+
+        first = sink.payloads("/api/webhooks/1/a")
+        second = sink.payloads("/api/webhooks/2/b")
+        archive = [p["content"] for p in sink.payloads("/api/webhooks/3/c")]
+        assert first[0]["content"] == "**제목**\n간결 요약" and first[0]["username"] == "News Bot"
+        assert second[0]["content"] == first[0]["content"] and second[0]["username"] == "미러 봇"
+        assert len(archive) > 1 and archive[0].startswith("전체 0")
+        assert archive[-1].endswith(f"({len(archive)}/{len(archive)})")
+        host = base.split("//", 1)[1]
+        names = [r.publisher_name for r in publisher.last_results]
+        assert names == [f"Discord:{host}/1", f"Discord:{host}/2", "Discord:archive"]
+        assert publisher.last_results[2].data == {"variant": "full", "chunks": len(archive)}
+        print("  ✓ 대상별 태그/봇 이름/콘텐츠 버전, 렌더링은 조합별 한 번")
+
+        broken = DiscordPublisher(destinations=[
+            DiscordDestination(f"{base}/api/webhooks/4/d"), DiscordDestination(f"{base}/missing/5/e"),
+        ])
+        assert not broken.publish("부분 실패")
+        assert [r.success for r in broken.last_results] == [True, False]
+        assert sink.count("/api/webhooks/4/d", status=204) == 1
+        print("  ✓ 대상별 결과 보고 (한 곳 실패해도 나머지는 발송)")
+
+        sink.latency = 0.2
+        many = [DiscordDestination(f"{base}/api/webhooks/{i}/x") for i in range(10, 13)]
+        for limit, fast in ((1, False), (3, True)):
+            with patch.object(Config, "DISCORD_HOST_CONCURRENCY", limit):
+                started = time.perf_counter()
+                assert DiscordPublisher(destinations=many).publish("동시성")
+                elapsed = time.perf_counter() - started
+            assert (elapsed < 0.5) if fast else (elapsed >= 0.6), (limit, elapsed)
+        sink.latency = 0.0
+        print("  ✓ 호스트별 동시 발송 수 제한")
+
+        settings = json.dumps([f"{base}/api/webhooks/20/y", {"url": f"{base}/api/webhooks/21/z", "variant": "full"}])
+        with patch.object(Config, "DISCORD_WEBHOOKS", settings):
+            configured = DiscordPublisher()
+            assert [d.variant for d in configured.destinations] == ["compact", "full"]
+            assert Config.is_discord_enabled()
+        with patch.object(Config, "DISCORD_WEBHOOKS", '{"url": "x"}'):
+            assert not DiscordPublisher().validate_config()
+        assert DiscordPublisher(webhook_url=f"{base}/discord").destinations[0].webhook_url == f"{base}/discord"
+        print("  ✓ DISCORD_WEBHOOKS 설정 파싱")
+    finally:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    test_discord_fanout()
+    print("✅ 테스트 완료")
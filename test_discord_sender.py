@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Discord 웹훅 발송기 테스트
+로컬 발송 대역 서버로 레이트 리밋 헤더 기반 대기, 429 자동 재시도, 청크 순서 보장 확인
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import requests
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src.metrics import DISCORD_RATE_LIMITED
+from src.publishers.discord import DiscordPublisher
+from src.publishers.discord_sender import DiscordWebhookSender, get_sender
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def test_discord_sender():
+    """Discord 웹훅 발송기 테스트"""
+    sink = LocalSink(discord_limit=2, discord_window=0.3).start()
+    try:
+        webhook = f"{sink.base_url}/api/webhooks/1/bucket"
+        content = "\n".join(f"줄 {i} " + "가" * 80 for i in range(120))
+        assert DiscordPublisher(webhook_url=webhook).publish(content)
+        sent = [payload["content"] for payload in sink.payloads("/api/webhooks/1/bucket")]
+        total = len(sent)
+        assert total > 2 and all(text.endswith(f"({i}/{total})") for i, text in enumerate(sent, 1))
+        assert sink.count("/api/webhooks/1/bucket", status=429) == 0
+        assert get_sender(webhook) is get_sender(webhook)
+        print(f"  ✓ 헤더 기반 대기로 429 없이 {total}개 청크 순서대로 발송")
+
+        webhook = f"{sink.base_url}/api/webhooks/2/retry"
+        for _ in range(2):  # 다른 클라이언트가 버킷을 소진
+            requests.post(webhook, json={"content": "선점"}, timeout=5)
+        limited_before = DISCORD_RATE_LIMITED.get()
+        response = DiscordWebhookSender(webhook).send({"content": "재시도"})
+        assert response.status_code == 204
+        assert sink.count("/api/webhooks/2/retry", status=429) == 1
+        assert DISCORD_RATE_LIMITED.get() == limited_before + 1
+        print("  ✓ 429 retry_after 대기 후 자동 재시도")
+
+        webhook = f"{sink.base_url}/api/webhooks/3/order"
+        publishers = [DiscordPublisher(webhook_url=webhook) for _ in range(2)]
+        threads = [
+            threading.Thread(target=publisher.publish, args=(f"[{name}]\n" + content,))
+            for name, publisher in zip("AB", publishers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        owners = ["A" if "[A]" in p["content"] else "B" if "[B]" in p["content"] else None
+                  for p in sink.payloads("/api/webhooks/3/order")]
+        firsts = [i for i, owner in enumerate(owners) if owner]
+        assert len(firsts) == 2 and firsts[1] == len(owners) // 2  # 한 게시물의 청크가 연속
+        print("  ✓ 동시 발송 시 게시물별 청크가 섞이지 않음")
+
+        try:
+            DiscordWebhookSender(f"{sink.base_url}/api/webhooks/4/x", max_retries=0).send({"content": "x" * 2001})
+            assert False, "400은 재시도 없이 실패해야 함"
+        except requests.exceptions.HTTPError:
+            pass
+        print("  ✓ 검증 오류(400)는 즉시 실패")
+    finally:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    test_discord_sender()
+    print("✅ 테스트 완료")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+GitHub Discussion 색인 테스트
+로컬 발송 대역 서버로 커서 페이지네이션 동기화, 워터마크 이후 증분 동기화, 제목/날짜 키 중복 확인
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src import discussion_index, github_id_cache
+from src.config import Config
+from src.discussion_index import (
+    DiscussionIndex, find_published, record_published, normalize_title, title_date_key, url_date_key,
+)
+from src.github_id_cache import GitHubIdCache
+from src.publishers.github import GitHubPublisher
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def test_keys():
+    """정규화 제목과 날짜 키"""
+    print("\n🧪 중복 확인 키 테스트")
+
+    assert normalize_title("  [AI News, 25.09.01]   GPT-5  출시 ") == "[ai news, 25.09.01] gpt-5 출시"
+    assert title_date_key("[AI News, 25.09.01] 헤드라인") == "ai news|25.09.01"
+    assert title_date_key("[Robotics News, 25.09.05] 로봇") == "robotics news|25.09.05"
+    assert title_date_key("날짜 없는 제목") is None
+    assert url_date_key("https://news.smol.ai/issues/25-09-01") == "ai news|25.09.01"
+    assert url_date_key("https://www.weeklyrobotics.com/weekly-robotics-315") is None
+    print("  ✓ 제목/URL에서 같은 날짜 키 생성")
+
+
+def test_sync_and_find():
+    """페이지네이션 동기화, 증분 동기화, 조회"""
+    print("\n🧪 Discussion 색인 동기화 테스트")
+
+    sink = LocalSink().start()
+    with tempfile.TemporaryDirectory() as tmp:
+        github_id_cache._github_id_cache = GitHubIdCache(path=os.path.join(tmp, "ids.json"))
+        discussion_index._discussion_index = DiscussionIndex(path=os.path.join(tmp, "discussions.sqlite3"))
+        try:
+            github = GitHubPublisher(
+                token="t", repo="bench/news", category=LocalSink.CATEGORY, graphql_url=f"{sink.base_url}/graphql"
+            )
+
+            def post(days):
+                with patch.object(Config, "GH_MUTATIONS_PER_MINUTE", 100000):
+                    urls = github.publish_many([(f"[AI News, 25.09.{day:02d}] 헤드라인 {day}", "본문") for day in days])
+                # createdAt은 초 단위라 테스트에서는 날짜별로 구분되게 지정
+                for discussion, day in zip(sink.discussions[-len(days):], days):
+                    discussion["createdAt"] = f"2025-09-{day:02d}T00:00:00Z"
+                return urls
+
+            urls = post(range(1, 6))
+            index = discussion_index.get_discussion_index()
+            before = sink.count("/graphql")
+            assert index.sync(github, page_size=2) == 5
+            assert sink.count("/graphql") - before == 3
+            assert index.watermark("bench/news") == "2025-09-05T00:00:00Z"
+            print("  ✓ 첫 동기화는 커서로 전체 페이지 순회 (5건, 3페이지)")
+
+            assert index.find("bench/news", date_key=url_date_key("https://news.smol.ai/issues/25-09-03")) == urls[2]
+            assert index.find("bench/news", title="[ai news, 25.09.04]   헤드라인 4") == urls[3]
+            assert index.find("bench/news", title="[AI News, 25.09.02] 다른 헤드라인") == urls[1]
+            assert index.find("bench/news", date_key="ai news|25.09.09") is None
+            assert index.find("other/repo", date_key="ai news|25.09.03") is None
+            print("  ✓ 날짜 키/정규화 제목으로 조회, 저장소별 분리")
+
+            new_urls = post([6, 7])
+            before = sink.count("/graphql")
+            assert index.sync(github, page_size=2) == 3  # 새 2건 + 워터마크와 같은 시각 1건
+            assert sink.count("/graphql") - before == 2
+            assert index.watermark("bench/news") == "2025-09-07T00:00:00Z"
+            assert index.find("bench/news", date_key="ai news|25.09.07") == new_urls[1]
+            before = sink.count("/graphql")
+            assert index.sync(github, page_size=2) == 1
+            assert sink.count("/graphql") - before == 1
+            print("  ✓ 이후 동기화는 워터마크 이후 페이지만 조회")
+
+            assert find_published(github, url="https://news.smol.ai/issues/25-09-06") == new_urls[0]
+            assert find_published(github, url="https://news.smol.ai/issues/25-09-08") is None
+            record_published(github, "[AI News, 25.09.08] 방금 게시", "https://github.com/bench/news/discussions/99")
+            assert find_published(github, url="https://news.smol.ai/issues/25-09-08").endswith("/99")
+            print("  ✓ 요약 전 중복 확인과 게시 직후 기록")
+
+            broken = GitHubPublisher(token="t", repo="bench/news", category="News", graphql_url="http://127.0.0.1:9/graphql")
+            assert find_published(broken, url="https://news.smol.ai/issues/25-09-01") == urls[0]
+            print("  ✓ 동기화 실패 시 로컬 색인으로 확인")
+        finally:
+            github_id_cache._github_id_cache = None
+            discussion_index._discussion_index = None
+            sink.stop()
+
+
+if __name__ == "__main__":
+    test_keys()
+    test_sync_and_find()
+    print("✅ 테스트 완료")
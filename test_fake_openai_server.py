@@ -0,0 +1,99 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 OpenAI Responses API 대역 서버 테스트
+실제 openai SDK로 일반/스트리밍 응답, 429 주입·재시도, OPENAI_BASE_URL 연결 확인
+"""
+
+import os
+import sys
+import json
+import tempfile
+import urllib.request
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+import openai
+from openai import OpenAI
+
+from fake_openai_server import DEFAULT_FIXTURE, FakeResponsesServer, LatencyModel
+from src import response_cache, usage_ledger
+from src.config import Config
+from src.response_cache import ResponseCache
+from src.usage_ledger import UsageLedger
+from src.streaming import StreamingMarkdownWriter, streamed_create
+from src.summarizers.compact import CompactSummarizer
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def test_fake_openai_server():
+    """로컬 OpenAI Responses API 대역 서버 테스트"""
+    fixture = json.loads(DEFAULT_FIXTURE.read_text(encoding="utf-8"))
+    recording = next(r for r in fixture["recordings"] if r["kind"] == "summarize")
+
+    assert LatencyModel("0.25").sample() == 0.25
+    assert 0.1 <= LatencyModel("uniform:0.1,0.2", seed=1).sample() <= 0.2
+    assert LatencyModel("lognormal:0,0.5", seed=1).sample() > 0
+    try:
+        LatencyModel("pareto:1")
+        assert False, "알 수 없는 분포는 거부되어야 함"
+    except ValueError:
+        pass
+    print("  ✓ 지연 분포 파싱")
+
+    server = FakeResponsesServer(fixture=str(DEFAULT_FIXTURE), chunk_chars=50).start_in_thread()
+    with tempfile.TemporaryDirectory() as tmp:
+        response_cache._response_cache = ResponseCache(path=os.path.join(tmp, "cache.sqlite3"))
+        usage_ledger._usage_ledger = UsageLedger(path=os.path.join(tmp, "llm_usage.jsonl"))
+        try:
+            client = OpenAI(api_key="local", base_url=server.base_url, max_retries=0)
+            response = client.responses.create(
+                model="gpt-5", input=f"{recording['match']} https://news.smol.ai/issues/25-09-01",
+                tools=[{"type": "web_search"}],
+            )
+            assert response.output_text == recording["response"]["output_text"]
+            assert response.usage.input_tokens == recording["response"]["usage"]["input_tokens"]
+            assert [item.type for item in response.output] == ["web_search_call", "message"]
+            print("  ✓ 일반 응답 (output_text, usage, web_search_call)")
+
+            writer = StreamingMarkdownWriter(os.path.join(tmp, "stream.md"))
+            final = streamed_create(client, writer, model="gpt-5", input="스트리밍 요청")
+            assert writer.text == final.output_text and final.usage.output_tokens > 0
+            assert Path(tmp, "stream.md").read_text(encoding="utf-8") == writer.text
+            print("  ✓ SSE 스트리밍 응답 (델타 → response.completed)")
+
+            with patch.object(Config, "OPENAI_BASE_URL", server.base_url):
+                summarizer = CompactSummarizer(api_key="local")
+            compact = summarizer.summarize("# 전체 요약\n- 항목", github_url="https://github.com/o/r/discussions/1")
+            assert compact
+            print("  ✓ OPENAI_BASE_URL로 요약기 연결")
+        finally:
+            server.stop()
+            response_cache._response_cache = None
+            usage_ledger._usage_ledger = None
+
+    flaky = FakeResponsesServer(rate_429=1.0, retry_after=0).start_in_thread()
+    try:
+        client = OpenAI(api_key="local", base_url=flaky.base_url, max_retries=2)
+        try:
+            client.responses.create(model="gpt-5", input="안녕")
+            assert False, "429가 발생해야 함"
+        except openai.RateLimitError:
+            pass
+        with urllib.request.urlopen(f"http://127.0.0.1:{flaky.port}/stats", timeout=5) as reply:
+            stats = json.loads(reply.read())
+        assert stats["status"]["429"] == 3 and stats["requests"] == 3  # 최초 + SDK 재시도 2회
+        print("  ✓ 429 주입과 SDK 재시도, /stats 통계")
+    finally:
+        flaky.stop()
+
+
+if __name__ == "__main__":
+    test_fake_openai_server()
+    print("✅ 테스트 완료")
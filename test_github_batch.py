@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+GitHub Discussion 일괄 생성 테스트
+로컬 발송 대역 서버로 별칭 createDiscussion 묶음 요청, 부분 실패 대응, 무효 ID 복구, 레이트 리밋 간격 조절 확인
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src import github_id_cache
+from src.config import Config
+from src.github_id_cache import GitHubIdCache
+from src.publishers.github import GitHubPublisher
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def make_publisher(sink: LocalSink) -> GitHubPublisher:
+    return GitHubPublisher(
+        token="t", repo="bench/news", category=LocalSink.CATEGORY, graphql_url=f"{sink.base_url}/graphql"
+    )
+
+
+def test_batch_create():
+    """묶음 요청과 부분 실패"""
+    print("\n🧪 Discussion 일괄 생성 테스트")
+
+    sink = LocalSink().start()
+    with tempfile.TemporaryDirectory() as tmp:
+        github_id_cache._github_id_cache = GitHubIdCache(path=os.path.join(tmp, "ids.json"))
+        try:
+            github = make_publisher(sink)
+            items = [(f"글 {i}", f"본문 {i}") for i in range(25)]
+            with patch.object(Config, "GH_MUTATIONS_PER_MINUTE", 100000):
+                urls = github.publish_many(items, batch_size=10)
+            assert urls == [f"https://github.com/bench/news/discussions/{i}" for i in range(1, 26)]
+            assert [d["title"] for d in sink.discussions] == [title for title, _ in items]
+            assert sink.count("/graphql") == 4
+            query = sink.payloads("/graphql")[1]["query"]
+            assert "d0: createDiscussion" in query and "d9: createDiscussion" in query
+            assert github.last_discussion_url == urls[-1] and github.rate_limit["remaining"] == 4996
+            print("  ✓ 25건을 조회 1 + 묶음 요청 3회로 생성, 입력 순서 유지")
+
+            items = [("정상 1", "본문"), ("  ", "제목 없음"), ("정상 2", "본문")]
+            urls = github.publish_many(items)
+            assert urls[0] and urls[1] is None and urls[2]
+            assert sink.count("/graphql") == 5
+            print("  ✓ 부분 실패는 해당 항목만 None")
+
+            with patch.object(GitHubPublisher, "BATCH_MAX_CHARS", 400):
+                assert len(github._plan_batches([("a", "x" * 300), ("b", "y" * 300), ("c", "z")], 10)) == 2
+            print("  ✓ 글자 수 한도로 묶음 분리")
+
+            github_id_cache._github_id_cache.put(
+                f"{sink.base_url}/graphql", "bench/news", "R_stale", {LocalSink.CATEGORY: "DIC_stale"}
+            )
+            before = sink.count("/graphql")
+            assert all(github.publish_many([("복구 1", "본문"), ("복구 2", "본문")]))
+            assert sink.count("/graphql") == before + 3
+            print("  ✓ 무효 ID는 캐시 무효화 후 재조회하고 묶음 재시도")
+        finally:
+            github_id_cache._github_id_cache = None
+            sink.stop()
+
+
+def test_batch_pacing():
+    """분당 상한과 남은 포인트 기반 대기, 레이트 리밋 응답 재시도"""
+    print("\n🧪 일괄 생성 간격 조절 테스트")
+
+    sink = LocalSink(graphql_limit=2).start()
+    with tempfile.TemporaryDirectory() as tmp:
+        github_id_cache._github_id_cache = GitHubIdCache(path=os.path.join(tmp, "ids.json"))
+        delays = []
+
+        def fake_sleep(delay):
+            delays.append(delay)
+            sink.graphql_limit = 100  # 리셋 시각이 지난 것처럼 포인트 복구
+
+        try:
+            github = make_publisher(sink)
+            with patch.object(Config, "GH_MUTATIONS_PER_MINUTE", 60), \
+                    patch("src.publishers.github.time.sleep", side_effect=fake_sleep):
+                urls = github.publish_many([(f"글 {i}", "본문") for i in range(2)], batch_size=1)
+            assert all(urls)
+            assert len(delays) == 1 and 3000 < delays[0] <= 3600
+            print("  ✓ 남은 포인트가 부족하면 X-RateLimit-Reset까지 대기")
+
+            delays.clear()
+            with patch.object(Config, "GH_MUTATIONS_PER_MINUTE", 60), \
+                    patch("src.publishers.github.time.sleep", side_effect=fake_sleep):
+                assert all(github.publish_many([(f"글 {i}", "본문") for i in range(3)], batch_size=2))
+            assert len(delays) == 1 and 1.5 < delays[0] <= 2.0
+            print("  ✓ 분당 생성 상한에 맞춰 배치 간격 유지")
+
+            sink.graphql_limit = sink.count("/graphql")
+            delays.clear()
+            with patch("src.publishers.github.time.sleep", side_effect=fake_sleep):
+                assert all(github.publish_many([("한도 초과 후", "본문")]))
+            assert len(delays) == 1 and sink.count("/graphql", status=403) == 1
+            print("  ✓ 403 레이트 리밋 응답은 리셋까지 기다려 재시도")
+        finally:
+            github_id_cache._github_id_cache = None
+            sink.stop()
+
+
+if __name__ == "__main__":
+    test_batch_create()
+    test_batch_pacing()
+    print("✅ 테스트 완료")
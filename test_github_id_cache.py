@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+GitHub ID 캐시 테스트
+로컬 발송 대역 서버로 N건 게시 시 GraphQL 호출 수(N+1), 디스크 재사용, TTL 만료, 무효 ID 자동 복구 확인
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src import github_id_cache
+from src.github_id_cache import GitHubIdCache
+from src.publishers.github import GitHubPublisher
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def test_github_id_cache():
+    """저장소/카테고리 ID 캐시"""
+    print("\n🧪 GitHub ID 캐시 테스트")
+
+    sink = LocalSink().start()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "github_ids.json")
+        try:
+            graphql_url = f"{sink.base_url}/graphql"
+            github_id_cache._github_id_cache = GitHubIdCache(path=path, ttl=3600)
+
+            def publisher() -> GitHubPublisher:
+                return GitHubPublisher(
+                    token="t", repo="bench/news", category=LocalSink.CATEGORY, graphql_url=graphql_url
+                )
+
+            github = publisher()
+            for i in range(3):
+                assert github.publish("본문", title=f"글 {i}")
+            assert sink.count("/graphql") == 4
+            print("  ✓ 3건 게시에 GraphQL 4회 (조회 1 + 생성 3)")
+
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)[GitHubIdCache.make_key(graphql_url, "bench/news")]
+            assert entry["repository_id"] == LocalSink.REPOSITORY_ID
+            assert entry["categories"] == {LocalSink.CATEGORY: LocalSink.CATEGORY_ID}
+
+            # 새 프로세스처럼 파일에서 다시 읽어도 조회 생략
+            github_id_cache._github_id_cache = GitHubIdCache(path=path, ttl=3600)
+            assert publisher().publish("본문", title="재시작 후")
+            assert sink.count("/graphql") == 5
+            print("  ✓ 디스크 캐시 재사용")
+
+            # 만료된 항목은 다시 조회
+            cache = GitHubIdCache(path=path, ttl=3600)
+            cache.get(graphql_url, "bench/news")["fetched_at"] -= 7200
+            github_id_cache._github_id_cache = cache
+            assert publisher().publish("본문", title="만료 후")
+            assert sink.count("/graphql") == 7
+            print("  ✓ TTL 만료 시 재조회")
+
+            # 무효 ID는 NOT_FOUND → 캐시 무효화 → 재조회 → 재시도
+            cache = GitHubIdCache(path=path, ttl=3600)
+            cache.put(graphql_url, "bench/news", "R_stale", {LocalSink.CATEGORY: "DIC_stale"})
+            github_id_cache._github_id_cache = cache
+            assert publisher().publish("본문", title="무효 ID 복구")
+            assert sink.count("/graphql") == 10
+            assert cache.get(graphql_url, "bench/news")["repository_id"] == LocalSink.REPOSITORY_ID
+            assert len(sink.discussions) == 6
+            print("  ✓ 무효 ID는 캐시 무효화 후 한 번 재시도")
+
+            # 캐시에 없는 카테고리는 다시 조회
+            assert not GitHubPublisher(
+                token="t", repo="bench/news", category="없음", graphql_url=graphql_url
+            ).publish("본문", title="x")
+            assert sink.count("/graphql") == 11
+            print("  ✓ 캐시에 없는 카테고리 재조회")
+        finally:
+            github_id_cache._github_id_cache = None
+            sink.stop()
+
+
+if __name__ == "__main__":
+    test_github_id_cache()
+    print("✅ 테스트 완료")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LLM 입력 링크 압축 테스트
+실제 API 호출 없이 URL placeholder 치환, 응답 복원, 절약 토큰/이상 placeholder 리포트 확인
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import response_cache
+from src.response_cache import ResponseCache
+from src.utils.link_compression import LinkCompressor
+from src.summarizers.compact import CompactSummarizer
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+TWEET = "https://x.com/openai/status/1961129789944627207"
+BLOG = "https://openai.com/index/introducing-gpt-realtime/"
+
+CONTENT = f"""## 오늘의 요약
+
+- OpenAI가 gpt-realtime을 출시했습니다. [발표]({BLOG}), [트윗]({TWEET})
+- 같은 소식 재인용: {TWEET}
+"""
+
+
+class FakeResponses:
+    """placeholder가 포함된 응답을 돌려주는 가짜 responses 엔드포인트"""
+
+    def __init__(self, output_text):
+        self.output_text = output_text
+        self.requests = []
+
+    def create(self, **params):
+        self.requests.append(params)
+        return SimpleNamespace(output_text=self.output_text, output=[])
+
+
+def test_link_compression():
+    """LLM 입력 링크 압축 테스트"""
+    compressor = LinkCompressor("test")
+    compressed = compressor.compress(CONTENT)
+
+    assert TWEET not in compressed and BLOG not in compressed
+    assert "[발표]([LINK_0001])" in compressed and "[LINK_0003]" in compressed
+    report = compressor.report
+    assert report.link_count == 3
+    assert report.tokens_saved > 0 and report.compressed_tokens < report.original_tokens
+    print(f"  ✓ URL 3개 압축, 입력 토큰 약 {report.tokens_saved}개 절약")
+
+    restored = compressor.restore("[자세히 보기]([LINK_0002]) / [LINK_0042] / LINK_7")
+    assert restored.startswith(f"[자세히 보기]({TWEET})")
+    assert report.restored == 1
+    assert report.invented == ["[LINK_0042]"]
+    assert report.unrestored == ["LINK_7"]
+    assert not report.ok
+    print("  ✓ 복원 및 임의/깨진 placeholder 표시")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        response_cache._response_cache = ResponseCache(path=os.path.join(tmp, "cache.sqlite3"))
+        summarizer = CompactSummarizer(api_key="test-key")
+        summarizer.client = SimpleNamespace(responses=FakeResponses(
+            "# AI News 25.09.04\n\n## 🔥 핵심 뉴스\n"
+            "• **gpt-realtime 출시**: 음성 모델. [자세히 보기]([LINK_0001])"
+        ))
+
+        result = summarizer.summarize_with_metadata(CONTENT, github_url="https://github.com/o/r/discussions/1")
+        sent = summarizer.client.responses.requests[0]["input"][-1]["content"][0]["text"]
+        assert TWEET not in sent and "[LINK_0002]" in sent
+        assert f"[자세히 보기]({BLOG})" in result['markdown']
+        assert result['link_compression']['tokens_saved'] > 0
+        assert result['link_compression']['invented'] == []
+        print("  ✓ CompactSummarizer 압축 전송 후 복원")
+
+        response_cache._response_cache = None
+
+
+if __name__ == "__main__":
+    test_link_compression()
+    print("✅ 테스트 완료")
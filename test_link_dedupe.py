@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+중복 링크 로컬 제거 테스트
+실제 API 호출 없이 중복 링크/괄호 출처 제거, 재현성, 헤드라인 전용 요청 확인
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import response_cache
+from src.response_cache import ResponseCache
+from src.utils.link_dedupe import LinkDeduplicator
+from src.summarizers.postprocessors import SmolAIPostProcessor
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+SOURCE_URL = "https://news.smol.ai/issues/25-08-05"
+
+MARKDOWN = """## 오늘의 요약
+
+OpenAI가 [gpt-oss](https://openai.com/gpt-oss)를 공개했습니다.
+
+## AI Twitter Recap
+
+- [gpt-oss](https://openai.com/gpt-oss) 공개, 자세한 내용은 [gpt-oss](https://openai.com/gpt-oss/) 참고 (news.smol.ai)
+- Claude 4.1 출시 ([링크](https://x.com/a/status/1)) ([링크](https://twitter.com/a/status/1)) ([news.smol.ai](https://news.smol.ai/issues/25-08-05))
+- 새 벤치마크 [x.com](https://x.com/b/status/2)
+- 같은 트윗 재인용 [x.com](https://x.com/b/status/2)
+
+```
+https://example.com https://example.com
+```
+"""
+
+
+class FakeResponses:
+    """요청 파라미터를 기록하는 가짜 responses 엔드포인트"""
+
+    def __init__(self):
+        self.requests = []
+
+    def create(self, **params):
+        self.requests.append(params)
+        return SimpleNamespace(output_text='"gpt-oss 공개"\n', output=[])
+
+
+def test_link_dedupe():
+    """중복 링크 로컬 제거 테스트"""
+    deduplicator = LinkDeduplicator(SOURCE_URL)
+    cleaned = deduplicator.dedupe(MARKDOWN)
+    lines = cleaned.splitlines()
+
+    bullet = next(line for line in lines if line.startswith("- [gpt-oss]"))
+    assert bullet == "- [gpt-oss](https://openai.com/gpt-oss) 공개, 자세한 내용은 gpt-oss 참고", bullet
+    print("  ✓ 불릿 내 중복 URL 제거 (의미 있는 앵커 텍스트 유지)")
+
+    claude = next(line for line in lines if "Claude" in line)
+    assert claude == "- Claude 4.1 출시 ([링크](https://x.com/a/status/1))", claude
+    assert "(news.smol.ai)" not in cleaned
+    print("  ✓ twitter.com/x.com 동일 링크 및 괄호 출처 제거")
+
+    # 다른 불릿의 같은 URL은 연속이어도 유지 (블록마다 출처 링크 보존)
+    assert "- 새 벤치마크 [x.com](https://x.com/b/status/2)" in lines
+    assert "- 같은 트윗 재인용 [x.com](https://x.com/b/status/2)" in lines
+    assert "https://example.com https://example.com" in lines
+    consecutive = "- A [글](https://x.com/a/status/1)\n- B [글](https://x.com/a/status/1)"
+    assert LinkDeduplicator(SOURCE_URL).dedupe(consecutive) == consecutive
+    print("  ✓ 다른 블록의 같은 링크 유지 및 코드 블록 보존")
+
+    # 일반 URL 끝의 문장 부호는 URL에서 제외하고 본문에 남김
+    assert LinkDeduplicator(SOURCE_URL).dedupe("https://e.com/x 그리고 https://e.com/x.") == "https://e.com/x 그리고."
+    assert LinkDeduplicator(SOURCE_URL).dedupe("https://e.com/x. 다시 https://e.com/x") == "https://e.com/x. 다시"
+    print("  ✓ 일반 URL 뒤 문장 부호 처리")
+
+    # 같은 입력은 바이트 단위로 같은 결과, 재적용해도 변화 없음
+    assert LinkDeduplicator(SOURCE_URL).dedupe(MARKDOWN) == cleaned
+    assert LinkDeduplicator(SOURCE_URL).dedupe(cleaned) == cleaned
+    print("  ✓ 재현성/멱등성 확인")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        response_cache._response_cache = ResponseCache(path=os.path.join(tmp, "cache.sqlite3"))
+        processor = SmolAIPostProcessor(api_key="test-key")
+        processor.client = SimpleNamespace(responses=FakeResponses())
+
+        result, headline = processor.process_with_headline(MARKDOWN, original_source_url=SOURCE_URL)
+        assert headline == "gpt-oss 공개"
+        assert result.startswith(cleaned.rstrip())
+        assert result.endswith(f"출처: [news.smol.ai]({SOURCE_URL})")
+
+        request = processor.client.responses.requests[0]
+        sent = request["input"][-1]["content"][0]["text"]
+        assert "AI Twitter Recap" not in sent and "오늘의 요약" in sent
+        assert request["reasoning"] == {"effort": "low"} and "tools" not in request
+        print("  ✓ 헤드라인 요청에는 '오늘의 요약' 섹션만 전송")
+
+        empty, _ = processor.process_with_headline("## 오늘의 요약\n\n## 기타\n- 항목")
+        assert SmolAIPostProcessor.EMPTY_TODAY_SUMMARY in empty
+        print("  ✓ 빈 '오늘의 요약' 기본 문구 채움")
+
+        response_cache._response_cache = None
+
+
+if __name__ == "__main__":
+    test_link_dedupe()
+    print("✅ 테스트 완료")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LinkPreserver 단일 스캔 치환/복원 테스트
+링크 기록, placeholder 복원, 순서 유지 중복 제거 확인
+"""
+
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils.link_preserver import LinkPreserver
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+CONTENT = """- [트윗](https://x.com/a/status/1) 참고, 원문 https://example.com/post
+- 다시 [트윗](https://x.com/a/status/1)"""
+
+
+def test_link_preserver_linear():
+    """LinkPreserver 단일 스캔 테스트"""
+    preserver = LinkPreserver()
+    processed, link_map = preserver.preserve_links(CONTENT)
+
+    assert processed == (
+        "- [트윗]([LINK_0001]) 참고, 원문 [LINK_0002]\n"
+        "- 다시 [트윗]([LINK_0003])"
+    )
+    assert [(r.placeholder, r.anchor, r.url) for r in preserver.records] == [
+        ("LINK_0001", "트윗", "https://x.com/a/status/1"),
+        ("LINK_0002", None, "https://example.com/post"),
+        ("LINK_0003", "트윗", "https://x.com/a/status/1"),
+    ]
+    assert CONTENT[preserver.records[1].position:].startswith("https://example.com/post")
+    print("  ✓ 링크 기록 (placeholder, 앵커, URL, 위치)")
+
+    assert preserver.restore_links(processed, link_map) == CONTENT
+    # 모델이 대괄호를 떼거나 모르는 placeholder를 만든 경우
+    assert preserver.restore_links("LINK_0002 / [LINK_0099]") == "https://example.com/post / [LINK_0099]"
+    print("  ✓ [LINK_xxxx]/LINK_xxxx 복원, 모르는 placeholder 유지")
+
+    assert preserver.extract_links(CONTENT) == ["https://x.com/a/status/1", "https://example.com/post"]
+    print("  ✓ 등장 순서를 유지한 중복 제거")
+
+
+if __name__ == "__main__":
+    test_link_preserver_linear()
+    print("✅ 테스트 완료")
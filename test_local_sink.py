@@ -0,0 +1,78 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+로컬 발송 대역 서버 테스트
+실제 웹훅/API 호출 없이 Discord 검증·레이트 리밋 헤더, Kakao 페이로드, GitHub GraphQL 흐름, 설정 가능한 발송 주소 확인
+"""
+
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src.config import Config
+from src.publishers.discord import DiscordPublisher
+from src.publishers.kakao import KakaoPublisher
+from src.publishers.github import GitHubPublisher
+from src.formatters.kakao import KakaoFormatter
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def test_local_sink():
+    """로컬 발송 대역 서버 테스트"""
+    sink = LocalSink(discord_limit=2, discord_window=0.5).start()
+    webhook = f"{sink.base_url}/api/webhooks/1/token"
+    try:
+        response = requests.post(webhook, json={"content": "x" * 2001}, timeout=5)
+        assert response.status_code == 400 and response.json()["code"] == 50035
+        assert "content" in response.json()["errors"]
+        response = requests.post(f"{webhook}?wait=true", json={"content": "안녕"}, timeout=5)
+        assert response.status_code == 200 and response.json()["content"] == "안녕"
+        assert response.headers["X-RateLimit-Remaining"] == "0"
+        response = requests.post(webhook, json={"content": "초과"}, timeout=5)
+        assert response.status_code == 429 and response.headers["X-RateLimit-Scope"] == "user"
+        assert 0 < response.json()["retry_after"] <= 0.5 and response.json()["global"] is False
+        time.sleep(response.json()["retry_after"] + 0.05)
+        response = requests.post(webhook, json={"embeds": [{"title": "t" * 257}]}, timeout=5)
+        assert response.status_code == 400 and "embeds" in response.json()["errors"]
+        assert response.headers["X-RateLimit-Limit"] == "2"
+        print("  ✓ Discord 2000자/임베드 검증, X-RateLimit-* 헤더, 429 retry_after")
+
+        assert DiscordPublisher(webhook_url=f"{sink.base_url}/discord").publish("짧은 메시지")
+        assert sink.payloads("/discord")[0]["content"] == "짧은 메시지"
+        assert KakaoPublisher(webhook_url=f"{sink.base_url}/kakao").send_simple_message("카톡")
+        assert requests.post(f"{sink.base_url}/kakao", json={"message": "x"}, timeout=5).status_code == 400
+        assert sink.payloads("/kakao") == [{"text": "카톡"}]
+        print("  ✓ 발송 요청 본문 기록")
+
+        with patch.object(Config, "GH_GRAPHQL_URL", f"{sink.base_url}/graphql"):
+            github = GitHubPublisher(token="t", repo="bench/news", category=LocalSink.CATEGORY)
+        assert github.publish("본문", title="첫 글") and github.publish("본문", title="둘째 글")
+        assert github.last_discussion_url == "https://github.com/bench/news/discussions/2"
+        assert [d["title"] for d in github.list_discussions(limit=5)] == ["둘째 글", "첫 글"]
+        assert not GitHubPublisher(
+            token="t", repo="bench/news", category="없음", graphql_url=f"{sink.base_url}/graphql"
+        ).publish("본문", title="x")
+        assert requests.post(f"{sink.base_url}/graphql", json={"query": "{ viewer }"}, timeout=5).status_code == 401
+        print("  ✓ GitHub GraphQL 카테고리 조회, createDiscussion, discussions 목록")
+
+        with patch.object(Config, "TINYURL_API_URL", f"{sink.base_url}/tinyurl"):
+            text = KakaoFormatter().format("[링크](https://example.com/articles/2025/09/long-path)")
+        assert "https://tinyurl.com/b" in text and sink.count("/tinyurl", status=200) == 1
+        print("  ✓ 설정으로 바꾼 GraphQL/TinyURL 주소 사용")
+    finally:
+        sink.stop()
+
+
+if __name__ == "__main__":
+    test_local_sink()
+    print("✅ 테스트 완료")
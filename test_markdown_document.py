@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+마크다운 섹션 인덱스 테스트
+MarkdownDocument 헤더 트리/오프셋과 기존 헬퍼의 결과 확인
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.markdown_utils import (
+    MarkdownDocument,
+    parse_markdown,
+    extract_section,
+    extract_today_summary,
+    split_by_sections,
+    add_today_summary,
+)
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+MARKDOWN = """# AI News
+
+## 오늘의 요약
+
+- 모델 A 출시
+
+## AI Twitter Recap
+
+### 모델
+
+- 항목 1
+
+### 도구
+
+- 항목 2
+
+## AI Reddit Recap
+
+- 항목 3
+"""
+
+
+def test_markdown_document():
+    """마크다운 섹션 인덱스 테스트"""
+    doc = MarkdownDocument(MARKDOWN)
+
+    assert [s.title for s in doc.sections] == [
+        "AI News", "오늘의 요약", "AI Twitter Recap", "모델", "도구", "AI Reddit Recap"
+    ]
+    assert [s.title for s in doc.roots] == ["AI News"]
+    twitter = doc.find("ai twitter recap")
+    assert [c.title for c in twitter.children] == ["모델", "도구"]
+    assert twitter.parent.title == "AI News"
+    assert MARKDOWN[twitter.start:].startswith("## AI Twitter Recap")
+    assert MARKDOWN[twitter.end:].startswith("## AI Reddit Recap")
+    print("  ✓ 헤더 트리/오프셋/대소문자 무시 조회")
+
+    assert extract_section(MARKDOWN, "twitter") == (
+        "## AI Twitter Recap\n\n### 모델\n\n- 항목 1\n\n### 도구\n\n- 항목 2"
+    )
+    assert extract_section(MARKDOWN, "없는 섹션") == ""
+    assert extract_today_summary(MARKDOWN) == "## 오늘의 요약\n\n- 모델 A 출시"
+    assert split_by_sections(MARKDOWN) == {
+        "오늘의 요약": "- 모델 A 출시",
+        "모델": "- 항목 1",
+        "도구": "- 항목 2",
+        "AI Reddit Recap": "- 항목 3",
+    }
+    assert add_today_summary(MARKDOWN, "중복") == MARKDOWN
+    assert add_today_summary("# 제목", "요약").endswith("## 오늘의 요약\n\n요약")
+    print("  ✓ 기존 헬퍼 결과 유지")
+
+    # 같은 텍스트는 인덱스 재사용
+    assert parse_markdown(MARKDOWN) is parse_markdown(MARKDOWN)
+    print("  ✓ 인덱스 캐시 재사용")
+
+    # 헤더가 많아도 선형 시간 (헤더 2만 개)
+    big = "\n".join(f"## 섹션 {i}\n### 하위 {i}\n내용" for i in range(20000))
+    started = time.perf_counter()
+    big_doc = MarkdownDocument(big)
+    elapsed = time.perf_counter() - started
+    assert len(big_doc.sections) == 40000
+    assert big_doc.find("섹션 19999").children[0].title == "하위 19999"
+    assert elapsed < 2.0, elapsed
+    print(f"  ✓ 헤더 4만 개 인덱싱 {elapsed:.2f}초")
+
+
+if __name__ == "__main__":
+    test_markdown_document()
+    print("✅ 테스트 완료")
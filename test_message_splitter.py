@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+마크다운 메시지 분할 테스트
+링크/코드 펜스 보존, 2000자 제한(태그·페이지 번호 포함), 최소 메시지 수, 섹션 경계 우선, 선형 시간 확인
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.utils.message_splitter import MarkdownMessageSplitter
+from src.publishers.discord import DiscordPublisher
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+LINK_RE = re.compile(r"\[[^\]\n]*\]\(<[^>\n]*>\)")
+
+
+def make_digest(sections: int, bullets: int) -> str:
+    parts = []
+    for s in range(sections):
+        parts.append(f"## 섹션 {s}\n")
+        for b in range(bullets):
+            parts.append(
+                f"- **항목 {s}.{b}**: 설명 문장이 이어집니다 "
+                f"([출처](<https://example.com/{s}/{b}/article-with-a-long-slug>)) 그리고 추가 설명."
+            )
+        parts.append("")
+    return "\n".join(parts)
+
+
+def strip_page(message: str) -> str:
+    return re.sub(r"\n\n\(\d+/\d+\)$", "", message)
+
+
+def test_message_splitter():
+    """마크다운 메시지 분할 테스트"""
+    splitter = MarkdownMessageSplitter(2000)
+    assert splitter.split("짧은 글", tag="**제목**") == ["**제목**\n짧은 글"]
+
+    digest = make_digest(8, 12)
+    tag = "**AI 뉴스 25-09-01**"
+    messages = splitter.split(digest, tag=tag)
+    assert all(len(m) <= 2000 for m in messages)
+    assert messages[0].startswith(tag + "\n") and messages[-1].endswith(f"({len(messages)}/{len(messages)})")
+    total_links = len(LINK_RE.findall(digest))
+    assert sum(len(LINK_RE.findall(m)) for m in messages) == total_links
+    bodies = [strip_page(m) for m in messages]
+    bodies[0] = bodies[0][len(tag) + 1:]
+    assert "\n".join(bodies).replace("\n", "") == digest.replace("\n", "")
+    lower_bound = -(-len(digest) // 2000)
+    assert len(messages) <= lower_bound + 1, (len(messages), lower_bound)
+    print(f"  ✓ {len(digest)}자 → {len(messages)}개 메시지 (2000자 이하, 링크 {total_links}개 보존)")
+
+    relaxed = splitter.split(make_digest(6, 6))
+    assert len(relaxed) == 2 and all(m.startswith("## 섹션") for m in relaxed)
+    assert relaxed[1].startswith("## 섹션 3")  # 가득 채우면 섹션 중간에서 잘림
+    print("  ✓ 메시지 수를 늘리지 않는 범위에서 섹션 경계 우선")
+
+    code = "\n".join(f"print({i})  # " + "x" * 60 for i in range(80))
+    fenced = f"## 코드\n```python\n{code}\n```\n끝"
+    for message in splitter.split(fenced):
+        assert strip_page(message).count("```") % 2 == 0
+    print("  ✓ 큰 코드 펜스는 조각마다 다시 열고 닫음")
+
+    trailing = "intro\n\n```\n" + "\n".join("y" * 160 for _ in range(30)) + "\n```\n\nafter"
+    for pieces in (splitter.split(trailing), MarkdownMessageSplitter(1000).chunks(trailing)):
+        assert all(strip_page(piece).count("```") % 2 == 0 for piece in pieces)
+        assert strip_page(pieces[-1]).endswith("```\n\nafter") or strip_page(pieces[-1]) == "after"
+    print("  ✓ 큰 코드 펜스 뒤 빈 줄이 있어도 펜스 균형 유지")
+
+    long_line = " ".join(f"[링크{i}](<https://example.com/{i}/{'p' * 40}>)" for i in range(120))
+    pieces = splitter.split(long_line)
+    assert all(len(m) <= 2000 for m in pieces)
+    assert sum(len(LINK_RE.findall(m)) for m in pieces) == 120
+    print("  ✓ 긴 한 줄도 링크 중간에서 자르지 않음")
+
+    publisher = DiscordPublisher(webhook_url="https://discord.example/api/webhooks/1/x")
+    built = publisher._build_messages("[a](https://example.com/x)\n" * 400, "**제목**")
+    assert all(len(m) <= 2000 for m in built) and "(<https://example.com/x>)" in built[0]
+    print("  ✓ DiscordPublisher 메시지 구성")
+
+    big = make_digest(60, 25)
+    started = time.perf_counter()
+    small_result = splitter.split(big[: len(big) // 2])
+    half_time = time.perf_counter() - started
+    started = time.perf_counter()
+    result = splitter.split(big)
+    full_time = time.perf_counter() - started
+    assert len(big) > 100_000 and full_time < 1.0 and len(result) > len(small_result)
+    print(f"  ✓ {len(big) // 1000}KB 분할 {full_time * 1000:.1f}ms (절반 {half_time * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    test_message_splitter()
+    print("✅ 테스트 완료")
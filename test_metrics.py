@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Prometheus 메트릭 테스트
+실제 API/웹훅 호출 없이 카운터·히스토그램 기록, textfile 원자적 저장/실행 간 누적, /metrics HTTP 제공 확인
+"""
+
+import os
+import re
+import sys
+import tempfile
+import urllib.request
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import response_cache, usage_ledger
+from src.response_cache import ResponseCache, cached_create
+from src.usage_ledger import UsageLedger, llm_context
+from src.metrics import (
+    REGISTRY, MetricsRegistry, MetricsServer, finish_run, textfile_path,
+    RUNS, PUBLISHES, LLM_CALLS, LLM_CACHE_HITS, LLM_LATENCY, STAGE_DURATION, DISCORD_CHUNKS,
+)
+from src.pipeline import Pipeline
+from src.publishers.discord import DiscordPublisher
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class FakeResponses:
+    def create(self, **params):
+        return SimpleNamespace(output_text="요약", output=[], usage=None)
+
+
+def test_metrics():
+    """Prometheus 메트릭 테스트"""
+    registry = MetricsRegistry()
+    calls = registry.counter("t_calls_total", "호출 수", ["kind"])
+    latency = registry.histogram("t_latency_seconds", "지연", ["kind"], buckets=(1, 5))
+    calls.inc(kind='a"b')
+    calls.inc(2, kind="plain")
+    for value in (0.5, 3, 7):
+        latency.observe(value, kind="x")
+    text = registry.render()
+    assert "# TYPE t_calls_total counter" in text
+    assert 't_calls_total{kind="a\\"b"} 1' in text and 't_calls_total{kind="plain"} 2' in text
+    assert 't_latency_seconds_bucket{kind="x",le="1"} 1' in text
+    assert 't_latency_seconds_bucket{kind="x",le="5"} 2' in text
+    assert 't_latency_seconds_bucket{kind="x",le="+Inf"} 3' in text
+    assert 't_latency_seconds_sum{kind="x"} 10.5' in text and 't_latency_seconds_count{kind="x"} 3' in text
+    try:
+        calls.inc(kind="a", extra="b")
+        assert False, "잘못된 라벨은 거부되어야 함"
+    except ValueError:
+        pass
+    print("  ✓ 카운터/누적 히스토그램 exposition 형식")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        response_cache._response_cache = ResponseCache(path=os.path.join(tmp, "cache.sqlite3"))
+        usage_ledger._usage_ledger = UsageLedger(path=os.path.join(tmp, "llm_usage.jsonl"))
+        client = SimpleNamespace(responses=FakeResponses())
+
+        def summarize(_):
+            with llm_context(stage="metrics_test"):
+                cached_create(client, model="gpt-5", input="요약해줘")
+                cached_create(client, model="gpt-5", input="요약해줘")  # 캐시 적중
+            return "요약"
+
+        def publish(_):
+            with patch("src.publishers.discord_sender.requests.Session.post") as post:
+                post.return_value = SimpleNamespace(status_code=204, headers={}, raise_for_status=lambda: None)
+                return DiscordPublisher(webhook_url="https://discord.example/hook").safe_publish("줄\n" * 1200)
+
+        chunks_before = DISCORD_CHUNKS.count()
+        pipeline = Pipeline("metrics_test")
+        pipeline.add("summarize", summarize)
+        pipeline.add("discord", publish, deps=["summarize"])
+        pipeline.add("broken", lambda _: 1 / 0)
+        pipeline.run()
+
+        assert LLM_CALLS.get(stage="metrics_test", model="gpt-5", status="ok") == 2
+        assert LLM_CACHE_HITS.get(stage="metrics_test", model="gpt-5") == 1
+        assert LLM_LATENCY.count(stage="metrics_test", model="gpt-5") == 1
+        assert STAGE_DURATION.count(pipeline="metrics_test", stage="summarize", status="success") == 1
+        assert STAGE_DURATION.count(pipeline="metrics_test", stage="broken", status="failed") == 1
+        assert PUBLISHES.get(publisher="Discord", status="success") >= 1
+        assert DISCORD_CHUNKS.count() == chunks_before + 1
+        print("  ✓ LLM 호출/캐시/지연, 단계 시간, 발송 결과, Discord 청크 수 기록")
+
+        prom_path = os.path.join(tmp, "textfile", "news_bot.prom")
+        assert finish_run("metrics_test", True, path=prom_path) == prom_path
+        assert RUNS.get(command="metrics_test", status="success") == 1
+        content = Path(prom_path).read_text(encoding="utf-8")
+        assert 'news_bot_runs_total{command="metrics_test",status="success"} 1' in content
+        assert 'news_bot_discord_message_chunks_bucket{le="+Inf"}' in content
+        assert os.listdir(os.path.dirname(prom_path)) == ["news_bot.prom"]  # 임시 파일 없음
+        print("  ✓ node-exporter textfile 원자적 기록")
+
+        # 다음 실행(새 프로세스)처럼 이번 실행 값만 있는 레지스트리로 같은 파일에 다시 기록
+        rerun = MetricsRegistry()
+        rerun.counter("news_bot_runs_total", "실행 횟수", ["command", "status"]).inc(command="metrics_test", status="failure")
+        rerun.gauge("news_bot_last_run_success", "마지막 실행 성공 여부", ["command"]).set(0, command="metrics_test")
+        rerun.histogram("news_bot_discord_message_chunks", "청크 수", buckets=(1, 5)).observe(3)
+        rerun.write_textfile(prom_path, merge=True)
+        content = Path(prom_path).read_text(encoding="utf-8")
+        assert 'news_bot_runs_total{command="metrics_test",status="success"} 1' in content
+        assert 'news_bot_runs_total{command="metrics_test",status="failure"} 1' in content
+        assert 'news_bot_last_run_success{command="metrics_test"} 0' in content
+        chunk_count = re.search(r"news_bot_discord_message_chunks_count (\d+)", content).group(1)
+        assert int(chunk_count) == DISCORD_CHUNKS.count() + 1
+        rerun.write_textfile(prom_path, merge=True)
+        assert 'news_bot_runs_total{command="metrics_test",status="failure"} 2' in Path(prom_path).read_text()
+        print("  ✓ 카운터/히스토그램은 이전 실행 값에 누적, 게이지는 이번 실행 값으로 기록")
+
+        assert 'news_bot_last_run_duration_seconds{command="metrics_test"}' in REGISTRY.render()
+        assert textfile_path("main", base="logs/news_bot.prom") == "logs/news_bot_main.prom"
+        assert textfile_path("backfill", base="/var/lib/textfile/news_bot") == "/var/lib/textfile/news_bot_backfill.prom"
+        print("  ✓ 명령별 textfile 경로와 실행 결과 게이지")
+
+        server = MetricsServer(0, host="127.0.0.1").start()
+        try:
+            with urllib.request.urlopen(f"http://127.0.0.1:{server.port}/metrics", timeout=5) as response:
+                assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+                body = response.read().decode("utf-8")
+            assert "news_bot_llm_calls_total" in body
+        finally:
+            server.stop()
+        print("  ✓ /metrics HTTP 제공")
+
+        response_cache._response_cache = None
+        usage_ledger._usage_ledger = None
+
+
+if __name__ == "__main__":
+    test_metrics()
+    print("✅ 테스트 완료")
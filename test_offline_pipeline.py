@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+오프라인 end-to-end 파이프라인 테스트
+녹화된 Responses 페이로드와 로컬 발송 싱크로 main.py 단계 그래프 전체가 성공하는지 확인
+"""
+
+import sys
+import json
+from pathlib import Path
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from bench_pipeline import DEFAULT_FIXTURE, run_once, summarize_runs, compare
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def test_offline_pipeline():
+    """오프라인 end-to-end 파이프라인 테스트"""
+    fixture = json.loads(DEFAULT_FIXTURE.read_text(encoding="utf-8"))
+    latencies = {recording["kind"]: 0.0 for recording in fixture["recordings"]}
+
+    run = run_once(fixture, latencies, sink_latency=0.0)
+    assert run["failed"] == {}, run["failed"]
+    assert run["llm_calls"] == ["summarize", "headline", "compact"]
+    assert run["sink_requests"]["/discord"] >= 1 and run["sink_requests"]["/kakao"] == 1
+    assert run["sink_requests"]["/graphql"] == 2  # 저장소 조회 + Discussion 생성
+    assert {"summarize", "save", "github", "compact", "discord", "kakao"} <= set(run["stages"])
+    assert run["spans"]["llm.summarize"]["count"] == 1
+    print(f"  ✓ 전체 단계 성공 ({run['wall_seconds']:.2f}초), 발송 요청 {run['sink_requests']}")
+
+    summary = summarize_runs([run])
+    slower = dict(summary, wall_seconds=summary["wall_seconds"] + 1.0)
+    assert compare(summary, summary, tolerance=0.25, noise=0.05) == []
+    assert compare(slower, summary, tolerance=0.25, noise=0.05)[0].startswith("wall:")
+    print("  ✓ 기준 결과 비교")
+
+
+if __name__ == "__main__":
+    test_offline_pipeline()
+    print("✅ 테스트 완료")
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Pipeline (단계 그래프 실행기) 테스트
+병렬 실행, 의존성 전달, 실패 전파, 재시도, 시간 초과 확인
+"""
+
+import sys
+import time
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.pipeline import Pipeline, StageResult
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+def sleeper(seconds, value):
+    """seconds만큼 대기 후 value 반환하는 단계 함수"""
+    def run(inputs):
+        time.sleep(seconds)
+        return value
+    return run
+
+
+def test_pipeline():
+    """Pipeline 테스트"""
+    # 독립 단계 병렬 실행 + 입력 전달
+    pipeline = Pipeline("test", max_workers=4)
+    pipeline.add("source", lambda _: "md")
+    pipeline.add("a", sleeper(0.3, "A"), deps=["source"])
+    pipeline.add("b", sleeper(0.3, "B"), deps=["source"])
+    pipeline.add("join", lambda inputs: inputs["source"] + inputs["a"] + inputs["b"], deps=["source", "a", "b"])
+    
+    started = time.monotonic()
+    run = pipeline.run()
+    elapsed = time.monotonic() - started
+    assert run.output("join") == "mdAB"
+    assert elapsed < 0.55, f"병렬 실행되지 않음: {elapsed:.2f}초"
+    print(f"  ✓ 독립 단계 병렬 실행 및 입력 전달 확인 ({elapsed:.2f}초)")
+    
+    # 필수 의존성 실패 시 건너뜀, 선택 의존성은 None으로 실행
+    def boom(_):
+        raise RuntimeError("실패")
+    
+    pipeline = Pipeline("test")
+    pipeline.add("fails", boom)
+    pipeline.add("needs", lambda _: "x", deps=["fails"])
+    pipeline.add("optional", lambda inputs: inputs["fails"] is None, optional_deps=["fails", "absent"])
+    run = pipeline.run()
+    assert run["fails"].status == StageResult.FAILED
+    assert run["needs"].status == StageResult.SKIPPED
+    assert run.output("optional") is True
+    assert not run.succeeded
+    print("  ✓ 실패 전파 및 선택 의존성 확인")
+    
+    # 재시도 및 시간 초과
+    attempts = []
+    
+    def flaky(_):
+        attempts.append(1)
+        if len(attempts) < 2:
+            raise RuntimeError("일시적 오류")
+        return "ok"
+    
+    pipeline = Pipeline("test")
+    pipeline.add("flaky", flaky, retries=2, retry_delay=0.01)
+    pipeline.add("slow", sleeper(1.0, "late"), timeout=0.1, retries=1, retry_delay=0.01)
+    started = time.monotonic()
+    run = pipeline.run()
+    assert run.output("flaky") == "ok" and run["flaky"].attempts == 2
+    # 시간 초과된 시도는 스레드가 계속 실행 중이므로 retries가 있어도 다시 시작하지 않음
+    assert run["slow"].status == StageResult.TIMEOUT and run["slow"].attempts == 1
+    assert time.monotonic() - started < 0.8
+    print("  ✓ 재시도 및 시간 초과 확인 (시간 초과는 재시도 안 함)")
+    
+    # 순환 의존성 검출
+    pipeline = Pipeline("test")
+    pipeline.add("x", lambda _: 1, deps=["y"])
+    pipeline.add("y", lambda _: 2, deps=["x"])
+    try:
+        pipeline.run()
+        assert False, "순환이 검출되지 않음"
+    except ValueError:
+        print("  ✓ 순환 의존성 검출 확인")
+
+
+if __name__ == "__main__":
+    test_pipeline()
+    print("✅ 테스트 완료")
@@ -0,0 +1,268 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+발송 원장 테스트
+같은 소스 URL/채널/콘텐츠 해시 재발송 방지, 원격 ID 복원, Discord 대상/청크별 이어서 발송, 완료된 단계 출력 재사용(중단된 실행 재시도) 확인
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import requests
+
+# 프로젝트 루트와 benchmarks 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent / "benchmarks"))
+
+from local_sink import LocalSink
+from src import publish_ledger, github_id_cache
+from src.publish_ledger import PublishLedger, content_hash, configure_publish_ledger, resumable
+from src.config import Config
+from src.github_id_cache import GitHubIdCache
+from src.pipeline import Pipeline
+from src.stages import is_complete_summary
+from src.summarizers.compact import CompactSummarizer
+from src.publishers.base import BasePublisher
+from src.publishers.discord import DiscordPublisher, DiscordDestination
+from src.publishers.discord_sender import DiscordWebhookSender
+from src.publishers.github import GitHubPublisher
+from src.usage_ledger import llm_context
+from src.logger import setup_logger
+from publish_workflow import PublishWorkflow
+
+setup_logger(level="INFO")
+
+URL = "https://news.smol.ai/issues/25-09-01"
+
+
+class CountingPublisher(BasePublisher):
+    """발송 횟수만 세는 Publisher"""
+
+    def __init__(self):
+        super().__init__("Counting")
+        self.sent = []
+
+    def validate_config(self) -> bool:
+        return True
+
+    def publish(self, content: str, **kwargs) -> bool:
+        self.sent.append(content)
+        self.remote_id = f"msg-{len(self.sent)}"
+        return True
+
+
+def test_content_hash():
+    """콘텐츠 해시"""
+    print("\n🧪 콘텐츠 해시 테스트")
+
+    assert content_hash("본문", title="제목") == content_hash("본문", title="제목")
+    assert content_hash("본문", title="제목") != content_hash("본문", title="다른 제목")
+    assert content_hash("본문") != content_hash("본문 ")
+    assert content_hash("본문", session=object()) == content_hash("본문")
+    print("  ✓ 본문과 단순 값 인자만 해시에 반영")
+
+
+def test_safe_publish_skips_duplicates():
+    """safe_publish 중복 발송 방지"""
+    print("\n🧪 중복 발송 방지 테스트")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        publish_ledger._publish_ledger = PublishLedger(path=os.path.join(tmp, "ledger.sqlite3"))
+        try:
+            publisher = CountingPublisher()
+            with llm_context(source_url=URL):
+                assert publisher.safe_publish("본문", tag="**제목**")
+                assert CountingPublisher().safe_publish("본문", tag="**제목**")
+                assert len(publisher.sent) == 1
+                entry = publish_ledger.get_publish_ledger().get(URL, "Counting")
+                assert entry["remote_id"] == "msg-1" and entry["content_hash"] == content_hash("본문", tag="**제목**")
+                print("  ✓ 같은 소스/채널/콘텐츠는 다시 보내지 않음")
+
+                restored = CountingPublisher()
+                assert restored.safe_publish("본문", tag="**제목**") and restored.remote_id == "msg-1"
+                print("  ✓ 건너뛸 때 원격 ID 복원")
+
+                assert publisher.safe_publish("수정된 본문", tag="**제목**")
+                assert publisher.sent == ["본문", "수정된 본문"]
+                print("  ✓ 콘텐츠가 바뀌면 다시 발송")
+
+            with llm_context(source_url="https://news.smol.ai/issues/25-09-02"):
+                assert publisher.safe_publish("본문", tag="**제목**")
+            assert publisher.safe_publish("본문", tag="**제목**")
+            assert len(publisher.sent) == 4
+            print("  ✓ 소스 URL이 다르거나 없으면 원장 미적용")
+
+            configure_publish_ledger(enabled=False)
+            with llm_context(source_url=URL):
+                assert publisher.safe_publish("수정된 본문", tag="**제목**")
+            assert len(publisher.sent) == 5
+            print("  ✓ --force(원장 비활성화) 시 다시 발송")
+        finally:
+            publish_ledger._publish_ledger = None
+
+
+def test_github_publish_once():
+    """GitHub Discussion 재실행 시 한 번만 생성"""
+    print("\n🧪 GitHub 재발송 방지 테스트")
+
+    sink = LocalSink().start()
+    with tempfile.TemporaryDirectory() as tmp:
+        publish_ledger._publish_ledger = PublishLedger(path=os.path.join(tmp, "ledger.sqlite3"))
+        github_id_cache._github_id_cache = GitHubIdCache(path=os.path.join(tmp, "ids.json"))
+        try:
+            def publisher() -> GitHubPublisher:
+                return GitHubPublisher(
+                    token="t", repo="bench/news", category=LocalSink.CATEGORY, graphql_url=f"{sink.base_url}/graphql"
+                )
+
+            with llm_context(source_url=URL):
+                first = publisher()
+                assert first.safe_publish("본문", title="[AI News, 25.09.01] 헤드라인")
+                second = publisher()
+                assert second.safe_publish("본문", title="[AI News, 25.09.01] 헤드라인")
+            assert len(sink.discussions) == 1
+            assert second.last_discussion_url == first.last_discussion_url == sink.discussions[0]["url"]
+            print("  ✓ 재실행 시 Discussion을 다시 만들지 않고 URL 복원")
+        finally:
+            publish_ledger._publish_ledger = None
+            github_id_cache._github_id_cache = None
+            sink.stop()
+
+
+def test_discord_partial_failure():
+    """Discord 대상/청크별 재시도"""
+    print("\n🧪 Discord 부분 실패 재시도 테스트")
+
+    sink = LocalSink(discord_limit=0).start()
+    base = sink.base_url
+    with tempfile.TemporaryDirectory() as tmp:
+        publish_ledger._publish_ledger = PublishLedger(path=os.path.join(tmp, "ledger.sqlite3"))
+        try:
+            with llm_context(source_url=URL):
+                first = DiscordPublisher(destinations=[
+                    DiscordDestination(f"{base}/api/webhooks/1/a", name="a"),
+                    DiscordDestination(f"{base}/missing/2/b", name="b"),
+                ])
+                assert not first.safe_publish("본문", tag="**제목**")
+                retry = DiscordPublisher(destinations=[
+                    DiscordDestination(f"{base}/api/webhooks/1/a", name="a"),
+                    DiscordDestination(f"{base}/api/webhooks/2/b", name="b"),
+                ])
+                assert retry.safe_publish("본문", tag="**제목**")
+                assert sink.count("/api/webhooks/1/a", status=204) == 1
+                assert sink.count("/api/webhooks/2/b", status=204) == 1
+                assert retry.last_results[0].data["skipped"] == 1
+                print("  ✓ 한 대상만 실패하면 재시도 시 그 대상에만 발송")
+
+                long_content = "\n\n".join(f"문단 {i} " + "가" * 900 for i in range(10))
+                original_send = DiscordWebhookSender.send
+                sends = {"count": 0}
+
+                def flaky_send(sender, payload):
+                    sends["count"] += 1
+                    if sends["count"] == 3:
+                        raise requests.exceptions.ConnectionError("연결 끊김")
+                    return original_send(sender, payload)
+
+                chunked = DiscordPublisher(destinations=[DiscordDestination(f"{base}/api/webhooks/3/c", name="c")])
+                with patch.object(DiscordWebhookSender, "send", flaky_send):
+                    assert not chunked.safe_publish(long_content)
+                    assert chunked.safe_publish(long_content)
+                total = len(chunked._build_messages(long_content, ""))
+                assert total > 3 and sink.count("/api/webhooks/3/c", status=204) == total
+                print(f"  ✓ 중간 청크에서 실패하면 보낸 청크(2/{total}) 다음부터 이어서 발송")
+        finally:
+            publish_ledger._publish_ledger = None
+            sink.stop()
+
+
+def test_publish_workflow_uses_ledger():
+    """publish_workflow 발송 단계의 원장 적용"""
+    print("\n🧪 publish_workflow 재발송 방지 테스트")
+
+    sink = LocalSink().start()
+    with tempfile.TemporaryDirectory() as tmp:
+        publish_ledger._publish_ledger = PublishLedger(path=os.path.join(tmp, "ledger.sqlite3"))
+        github_id_cache._github_id_cache = GitHubIdCache(path=os.path.join(tmp, "ids.json"))
+        try:
+            workflow = PublishWorkflow()
+            metadata = {"headline": "헤드라인", "date": "25.09.01"}
+            with patch.object(Config, "GITHUB_TOKEN", "t"), \
+                    patch.object(Config, "GH_GRAPHQL_URL", f"{sink.base_url}/graphql"), \
+                    llm_context(source_url=URL):
+                first = workflow._publish_to_github("본문", metadata)
+                assert workflow._publish_to_github("본문", metadata) == first
+            assert len(sink.discussions) == 1 and first == sink.discussions[0]["url"]
+            print("  ✓ 재실행해도 Discussion을 다시 만들지 않고 URL 복원")
+        finally:
+            publish_ledger._publish_ledger = None
+            github_id_cache._github_id_cache = None
+            sink.stop()
+
+
+def test_resume_crashed_run():
+    """완료된 단계 출력 재사용"""
+    print("\n🧪 중단된 실행 재시도 테스트")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        publish_ledger._publish_ledger = PublishLedger(path=os.path.join(tmp, "ledger.sqlite3"))
+        try:
+            calls = {"summarize": 0, "publish": 0}
+            publisher = CountingPublisher()
+
+            def summarize(_):
+                calls["summarize"] += 1
+                return "# 요약", {"headline": "헤드라인"}
+
+            def publish(inputs):
+                calls["publish"] += 1
+                if calls["publish"] == 1:
+                    raise RuntimeError("발송 중 중단")
+                return publisher.safe_publish(inputs["summarize"][0])
+
+            def build() -> Pipeline:
+                pipeline = Pipeline("resume")
+                pipeline.add("summarize", resumable("summarize", summarize, URL))
+                pipeline.add("publish", publish, deps=["summarize"])
+                return pipeline
+
+            with llm_context(source_url=URL):
+                run = build().run()
+                assert run.ok("summarize") and not run.ok("publish")
+                assert publish_ledger.get_publish_ledger().has_source(URL)
+
+                run = build().run()
+                assert run.ok("publish") and calls["summarize"] == 1
+                assert run.output("summarize") == ("# 요약", {"headline": "헤드라인"})
+                print("  ✓ 재시도 시 요약은 재사용하고 실패한 발송만 다시 실행")
+
+                build().run()
+                assert calls["summarize"] == 1 and publisher.sent == ["# 요약"]
+                print("  ✓ 모두 끝난 실행을 다시 돌려도 LLM 호출/발송 없음")
+
+                publish_ledger.get_publish_ledger().clear_stage_outputs(URL)
+                build().run()
+                assert calls["summarize"] == 2
+                print("  ✓ --refresh(단계 출력 삭제) 시 다시 요약")
+
+                fallback = CompactSummarizer()._create_fallback_summary(CompactSummarizer.DISCUSSION_URL_PLACEHOLDER)
+                outputs = iter([fallback, "요약 생성 실패: 응답에서 콘텐츠를 찾을 수 없습니다.", "# 간결 요약"])
+                compact = resumable("compact", lambda _: next(outputs), URL, validate=is_complete_summary)
+                assert compact({}) == fallback and compact({}).startswith("요약 생성 실패")
+                assert compact({}) == "# 간결 요약" and compact({}) == "# 간결 요약"
+                print("  ✓ 기본 요약/실패 문구는 저장하지 않아 재시도 시 다시 생성")
+        finally:
+            publish_ledger._publish_ledger = None
+
+
+if __name__ == "__main__":
+    test_content_hash()
+    test_safe_publish_skips_duplicates()
+    test_github_publish_once()
+    test_discord_partial_failure()
+    test_publish_workflow_uses_ledger()
+    test_resume_crashed_run()
+    print("✅ 테스트 완료")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ResponseCache 테스트
+실제 API 호출 없이 캐시 적중/만료/LRU 정리 확인
+"""
+
+import os
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.response_cache import ResponseCache
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class FakeResponses:
+    """호출 횟수만 세는 가짜 responses 엔드포인트"""
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def create(self, **params):
+        self.calls += 1
+        return SimpleNamespace(output_text=f"응답 {self.calls}: {params['model']}")
+
+
+def test_response_cache():
+    """ResponseCache 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = ResponseCache(path=os.path.join(tmp, "responses.sqlite3"), ttl=0, max_bytes=0)
+        client = SimpleNamespace(responses=FakeResponses())
+        
+        params = {
+            "model": "gpt-5",
+            "input": [{"role": "user", "content": [{"type": "input_text", "text": "요약"}]}],
+            "reasoning": {"effort": "low"},
+        }
+        key = cache.make_key(params)
+        
+        # timeout은 캐시 키에 영향 없음
+        assert key == cache.make_key(dict(params, timeout=600))
+        # reasoning effort가 다르면 다른 키
+        assert key != cache.make_key(dict(params, reasoning={"effort": "high"}))
+        
+        assert cache.get(key) is None
+        response = client.responses.create(**params)
+        cache.set(key, response, model="gpt-5")
+        
+        cached = cache.get(key)
+        assert cached is not None
+        assert cached.output_text == response.output_text
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        print("  ✓ 캐시 적중/미스 확인")
+        
+        # refresh 모드에서는 읽지 않음
+        cache.refresh = True
+        assert cache.get(key) is None
+        cache.refresh = False
+        print("  ✓ refresh 모드 확인")
+
+        # 여러 스레드에서 동시에 조회해도 적중/미스 통계가 빠지지 않음
+        before = cache.stats()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: cache.get(key if i % 2 else f"missing-{i}"), range(200)))
+        after = cache.stats()
+        assert after["hits"] - before["hits"] == 100 and after["misses"] - before["misses"] == 100
+        print("  ✓ 동시 조회 통계 확인")
+
+        # 미완료/빈 응답은 저장하지 않아 재실행 시 다시 호출
+        failed_key = cache.make_key(dict(params, input="실패"))
+        cache.set(failed_key, SimpleNamespace(status="incomplete", output_text="잘린 응답"))
+        cache.set(failed_key, SimpleNamespace(status="completed", output_text="  "))
+        cache.set(failed_key, SimpleNamespace(status="failed", output_text=""))
+        assert cache.get(failed_key) is None
+        cache.set(failed_key, SimpleNamespace(status="completed", output_text="정상 응답"))
+        assert cache.get(failed_key).output_text == "정상 응답"
+        print("  ✓ 실패/미완료/빈 응답은 캐시하지 않음")
+
+        # LRU 크기 제한: 가장 오래 사용하지 않은 항목부터 정리
+        small = ResponseCache(path=os.path.join(tmp, "small.sqlite3"), ttl=0, max_bytes=150)
+        for i in range(3):
+            small.set(f"k{i}", SimpleNamespace(output_text="x" * 60))
+        assert small.get("k0") is None
+        assert small.get("k2") is not None
+        assert small.stats()["evictions"] >= 1
+        print("  ✓ LRU 크기 제한 확인")
+
+
+if __name__ == "__main__":
+    test_response_cache()
+    print("✅ 테스트 완료")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+스트리밍 요약 테스트
+실제 API 호출 없이 델타 파일 기록, 섹션 완료 콜백, 캐시 재사용 확인
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import response_cache
+from src.response_cache import ResponseCache
+from src.streaming import StreamingMarkdownWriter, streamed_create
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+MARKDOWN = """**헤드라인: 테스트**
+## AI Twitter Recap
+- 항목 1
+## AI Reddit Recap
+- 항목 2
+"""
+
+
+class FakeStreamingResponses:
+    """델타를 여러 조각으로 나눠 보내는 가짜 responses 엔드포인트"""
+    
+    def __init__(self, path_to_check):
+        self.calls = 0
+        self.path_to_check = path_to_check
+        self.sizes_seen = []
+    
+    def create(self, stream=False, **params):
+        assert stream, "stream=True로 호출되어야 함"
+        self.calls += 1
+        return self._events()
+    
+    def _events(self):
+        for i in range(0, len(MARKDOWN), 7):
+            yield SimpleNamespace(type="response.output_text.delta", delta=MARKDOWN[i:i + 7])
+            # 델타가 도착할 때마다 파일에 기록되는지 확인
+            self.sizes_seen.append(os.path.getsize(self.path_to_check))
+        yield SimpleNamespace(
+            type="response.completed",
+            response=SimpleNamespace(output_text=MARKDOWN, output=[])
+        )
+
+
+def test_streaming():
+    """스트리밍 요약 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        response_cache._response_cache = ResponseCache(path=os.path.join(tmp, "cache.sqlite3"))
+        out_path = os.path.join(tmp, "out", "summary.md")
+        client = SimpleNamespace(responses=FakeStreamingResponses(out_path))
+        params = {"model": "gpt-5", "input": "요약"}
+        
+        sections = []
+        writer = StreamingMarkdownWriter(out_path, on_section=lambda title, md: sections.append((title, md)))
+        response = streamed_create(client, writer, **params)
+        metrics = writer.close()
+        
+        assert response.output_text == MARKDOWN
+        assert Path(out_path).read_text(encoding="utf-8") == MARKDOWN
+        assert client.responses.sizes_seen == sorted(client.responses.sizes_seen)
+        assert client.responses.sizes_seen[-1] > 0
+        print("  ✓ 델타 실시간 파일 기록 확인")
+        
+        assert [title for title, _ in sections] == ["AI Twitter Recap", "AI Reddit Recap"]
+        assert sections[0][1] == "## AI Twitter Recap\n- 항목 1"
+        assert metrics['section_count'] == 2
+        assert metrics['time_to_first_section'] is not None
+        print("  ✓ 섹션 완료 콜백 및 첫 섹션 시간 기록 확인")
+        
+        # 코드 펜스 안의 '#' 주석/셸 프롬프트는 섹션 헤더가 아님
+        fenced_sections = []
+        writer = StreamingMarkdownWriter(None, on_section=lambda title, md: fenced_sections.append(title))
+        for delta in ["## 코드\n```bash\n# 설치\npip install x\n", "```\n~~~\n## 출력\n~~~\n## 다음\n- 항목\n"]:
+            writer.write(delta)
+        writer.close()
+        assert fenced_sections == ["코드", "다음"], fenced_sections
+        print("  ✓ 코드 펜스 안의 헤더 형태 줄 무시")
+        
+        # 같은 요청은 캐시에서 재생
+        sections.clear()
+        writer = StreamingMarkdownWriter(None, on_section=lambda title, md: sections.append((title, md)))
+        streamed_create(client, writer, **params)
+        writer.close()
+        assert client.responses.calls == 1
+        assert writer.text == MARKDOWN and len(sections) == 2
+        print("  ✓ 캐시 적중 시 재생 확인")
+        
+        response_cache._response_cache = None
+
+
+if __name__ == "__main__":
+    test_streaming()
+    print("✅ 테스트 완료")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+SummarizerFactory 라우팅 테스트
+도메인 인덱스로 URL을 라우팅하고 일치한 Summarizer만 생성하는지 확인
+"""
+
+import sys
+from pathlib import Path
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src.summarizer import SummarizerFactory, NewsSource
+from src.summarizers.base import BaseSummarizer
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class CountingSummarizer(BaseSummarizer):
+    """생성 횟수를 세는 테스트용 Summarizer"""
+    
+    SUPPORTED_DOMAINS = ['example.org/news']
+    instances = 0
+    
+    def __init__(self, api_key=None, model=None):
+        CountingSummarizer.instances += 1
+        super().__init__("Counting", api_key, model)
+    
+    def summarize(self, url: str, **kwargs) -> str:
+        return ""
+    
+    def validate_config(self) -> bool:
+        return True
+
+
+def test_summarizer_factory():
+    """SummarizerFactory 테스트"""
+    cases = {
+        "https://news.smol.ai/issues/25-09-01-not-much": NewsSource.SMOL_AI_NEWS,
+        "https://smol.ai/issues/25-09-01": NewsSource.SMOL_AI_NEWS,
+        "https://www.weeklyrobotics.com/weekly-robotics-315": NewsSource.WEEKLY_ROBOTICS,
+        "https://weeklyrobotics.com/weekly-robotics-316": NewsSource.WEEKLY_ROBOTICS,
+        "https://smol.ai/blog": None,
+        "https://example.com/news": None,
+    }
+    for url, expected in cases.items():
+        assert SummarizerFactory.find_source(url) == expected, url
+    print("  ✓ 도메인 인덱스 라우팅 확인")
+    
+    SummarizerFactory.register("counting", CountingSummarizer)
+    try:
+        assert SummarizerFactory.find_source("https://sub.example.org/news/1") == "counting"
+        assert CountingSummarizer.instances == 0
+        
+        summarizer = SummarizerFactory.create_from_url("https://example.org/news/1")
+        assert isinstance(summarizer, CountingSummarizer)
+        assert CountingSummarizer.instances == 1
+        print("  ✓ 일치한 Summarizer만 생성 확인")
+        
+        try:
+            SummarizerFactory.create_from_url("https://example.org/other")
+            assert False, "ValueError 발생해야 함"
+        except ValueError:
+            pass
+        assert CountingSummarizer.instances == 1
+        print("  ✓ 미지원 URL 에러 경로에서 인스턴스 생성 없음 확인")
+    finally:
+        SummarizerFactory._summarizers.pop("counting", None)
+        SummarizerFactory._domain_index = None
+
+
+if __name__ == "__main__":
+    test_summarizer_factory()
+    print("✅ 테스트 완료")
@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+구조화 트레이싱 테스트
+실제 API/웹훅 호출 없이 중첩 span, Pipeline 스레드 전파, LLM/HTTP span, Chrome/OTLP 내보내기 확인
+"""
+
+import os
+import sys
+import json
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import response_cache, usage_ledger, tracing
+from src.response_cache import ResponseCache, cached_create
+from src.usage_ledger import UsageLedger, llm_context
+from src.tracing import Tracer, span, trace_path, safe_url
+from src.pipeline import Pipeline
+from src.markdown_utils import save_markdown
+from src.publishers.discord import DiscordPublisher
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class FakeResponses:
+    def create(self, **params):
+        return SimpleNamespace(output_text="요약", output=[], usage=None)
+
+
+def test_tracing():
+    """구조화 트레이싱 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        response_cache._response_cache = ResponseCache(path=os.path.join(tmp, "cache.sqlite3"))
+        usage_ledger._usage_ledger = UsageLedger(path=os.path.join(tmp, "llm_usage.jsonl"))
+        tracer = tracing._tracer = Tracer(trace_id="ab" * 16)
+        client = SimpleNamespace(responses=FakeResponses())
+        md_path = os.path.join(tmp, "smol_ai_news_20250805.md")
+
+        def summarize(_):
+            with llm_context(stage="summarize"):
+                cached_create(client, model="gpt-5", input="요약해줘")
+            return "# 요약"
+
+        def publish(inputs):
+            with patch("src.publishers.discord_sender.requests.Session.post") as post:
+                post.return_value = SimpleNamespace(status_code=204, headers={}, raise_for_status=lambda: None)
+                return DiscordPublisher(webhook_url="https://discord.com/api/webhooks/1/secret").publish(
+                    inputs["summarize"]
+                )
+
+        pipeline = Pipeline("trace_test")
+        pipeline.add("summarize", summarize)
+        pipeline.add("save", lambda inputs: save_markdown(md_path, inputs["summarize"]), deps=["summarize"])
+        pipeline.add("discord", publish, deps=["summarize"])
+        with span("run", url="https://news.smol.ai/issues/25-08-05"):
+            assert pipeline.run().succeeded
+
+        by_name = {s.name: s for s in tracer.spans}
+        assert {s.trace_id for s in tracer.spans} == {"ab" * 16}
+        assert by_name["pipeline.trace_test"].parent_id == by_name["run"].span_id
+        for stage in ("summarize", "save", "discord"):
+            assert by_name[f"stage.{stage}"].parent_id == by_name["pipeline.trace_test"].span_id
+        print("  ✓ 실행 trace ID 하나로 run → pipeline → stage 중첩 (워커 스레드 포함)")
+
+        llm = by_name["llm.summarize"]
+        assert llm.parent_id == by_name["stage.summarize"].span_id
+        assert llm.attributes["model"] == "gpt-5" and llm.end_ns >= llm.start_ns
+        assert by_name["file.save"].attributes["chars_in"] == len("# 요약")
+        post = by_name["discord.post"]
+        assert post.attributes["http_status"] == 204
+        assert post.attributes["url"] == "https://discord.com"  # 웹훅 토큰 제외
+        assert post.parent_id == by_name["stage.discord"].span_id
+        print("  ✓ LLM 호출 / 파일 저장 / HTTP 상태 span 속성")
+
+        try:
+            with span("failing"):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+        assert tracer.spans[-1].error == "ValueError: boom"
+
+        saved = tracer.write(trace_path(md_path), fmt="chrome")
+        assert saved.endswith("smol_ai_news_20250805_trace.json")
+        chrome = json.loads(Path(saved).read_text(encoding="utf-8"))
+        complete = [e for e in chrome["traceEvents"] if e["ph"] == "X"]
+        assert len(complete) == len(tracer.spans)
+        assert all(e["dur"] >= 0 for e in complete)
+        assert any(e["ph"] == "M" and e["name"] == "thread_name" for e in chrome["traceEvents"])
+        print("  ✓ Chrome trace 내보내기")
+
+        otlp = tracer.to_otlp()
+        spans = otlp["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        failing = next(s for s in spans if s["name"] == "failing")
+        assert failing["status"]["code"] == 2 and len(failing["traceId"]) == 32
+        stage = next(s for s in spans if s["name"] == "stage.discord")
+        assert stage["parentSpanId"] == by_name["pipeline.trace_test"].span_id
+        assert {"key": "attempt", "value": {"intValue": "1"}} in stage["attributes"]
+        print("  ✓ OTLP-JSON 내보내기")
+
+        assert safe_url("https://kakao.example/hook?token=x") == "https://kakao.example"
+
+        response_cache._response_cache = None
+        usage_ledger._usage_ledger = None
+        tracing._tracer = None
+
+
+if __name__ == "__main__":
+    test_tracing()
+    print("✅ 테스트 완료")
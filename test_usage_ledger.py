@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+LLM 사용량 원장 테스트
+실제 API 호출 없이 호출별 토큰/시간 기록, 단계/URL 태그, 실행 리포트 확인
+"""
+
+import os
+import sys
+import json
+import asyncio
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+# src 디렉토리를 Python 경로에 추가
+sys.path.insert(0, str(Path(__file__).parent))
+
+from src import response_cache, usage_ledger
+from src.response_cache import ResponseCache, cached_create, acached_create
+from src.usage_ledger import UsageLedger, llm_context, usage_report_path
+from src.pipeline import Pipeline
+from src.logger import setup_logger
+
+setup_logger(level="INFO")
+
+
+class FakeResponse(SimpleNamespace):
+    """usage가 포함된 가짜 응답 (SDK처럼 JSON 직렬화 지원)"""
+
+    def model_dump_json(self):
+        return json.dumps({"output_text": self.output_text, "output": [], "usage": USAGE})
+
+
+USAGE = {
+    "input_tokens": 1200,
+    "input_tokens_details": {"cached_tokens": 200},
+    "output_tokens": 300,
+    "output_tokens_details": {"reasoning_tokens": 100},
+}
+
+
+def make_response(text):
+    return FakeResponse(
+        output_text=text,
+        output=[SimpleNamespace(type="web_search_call"), SimpleNamespace(type="message")],
+        usage=SimpleNamespace(
+            input_tokens=USAGE["input_tokens"],
+            input_tokens_details=SimpleNamespace(**USAGE["input_tokens_details"]),
+            output_tokens=USAGE["output_tokens"],
+            output_tokens_details=SimpleNamespace(**USAGE["output_tokens_details"]),
+        ),
+    )
+
+
+class FakeResponses:
+    def create(self, **params):
+        if params.get("input") == "fail":
+            raise RuntimeError("rate limited")
+        return make_response(f"응답: {params['input']}")
+
+
+class FakeAsyncResponses:
+    async def create(self, **params):
+        await asyncio.sleep(0.01)
+        return make_response(params["input"])
+
+
+def test_usage_ledger():
+    """LLM 사용량 원장 테스트"""
+    with tempfile.TemporaryDirectory() as tmp:
+        response_cache._response_cache = ResponseCache(path=os.path.join(tmp, "cache.sqlite3"))
+        ledger = UsageLedger(path=os.path.join(tmp, "logs", "llm_usage.jsonl"), run_id="run-1")
+        usage_ledger._usage_ledger = ledger
+        client = SimpleNamespace(responses=FakeResponses())
+        params = {
+            "model": "gpt-5", "input": "요약", "reasoning": {"effort": "medium"}, "tools": [{"type": "web_search"}]
+        }
+
+        with llm_context(stage="summarize", source_url="https://news.smol.ai/issues/25-08-05"):
+            cached_create(client, **params)
+            with llm_context(stage="postprocess"):
+                cached_create(client, **params)  # 캐시 적중
+            try:
+                cached_create(client, model="gpt-5", input="fail")
+            except RuntimeError:
+                pass
+
+        first, hit, failed = ledger.records
+        assert first["stage"] == "summarize" and first["effort"] == "medium"
+        assert first["tools"] == ["web_search"] and first["tool_calls"] == 1
+        assert (first["input_tokens"], first["cached_tokens"], first["output_tokens"], first["reasoning_tokens"]) == (
+            1200, 200, 300, 100
+        )
+        assert hit["stage"] == "postprocess" and hit["cache_hit"] and hit["input_tokens"] == 1200
+        assert hit["source_url"] == first["source_url"]
+        assert failed["status"] == "error" and "rate limited" in failed["error"]
+        lines = Path(ledger.path).read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["run_id"] for line in lines] == ["run-1"] * 3
+        print("  ✓ 호출별 토큰/도구/캐시/에러 기록 (JSONL)")
+
+        # asyncio 태스크별 태그 분리
+        async def summarize(url):
+            with llm_context(stage="summarize", source_url=url):
+                await acached_create(SimpleNamespace(responses=FakeAsyncResponses()), model="gpt-5", input=url)
+
+        async def run_all():
+            await asyncio.gather(summarize("https://a.example/1"), summarize("https://a.example/2"))
+
+        asyncio.run(run_all())
+        tagged = {record["source_url"] for record in ledger.records[3:]}
+        assert tagged == {"https://a.example/1", "https://a.example/2"}
+        print("  ✓ 비동기 태스크별 단계/URL 태그")
+
+        # Pipeline 단계 스레드로 태그 전달
+        pipeline = Pipeline("ledger_test")
+        pipeline.add("compact", lambda _: cached_create(client, model="gpt-5", input="스레드"))
+        with llm_context(source_url="https://a.example/3"):
+            with llm_context(stage="compact"):
+                pipeline.run()
+        assert (ledger.records[-1]["stage"], ledger.records[-1]["source_url"]) == ("compact", "https://a.example/3")
+        print("  ✓ Pipeline 단계 스레드 태그 전달")
+
+        report = ledger.report("https://news.smol.ai/issues/25-08-05")
+        assert report["totals"]["calls"] == 3 and report["totals"]["cache_hits"] == 1
+        assert report["totals"]["input_tokens"] == 1200  # 캐시 적중 제외
+        assert report["by_stage"]["postprocess"]["input_tokens"] == 0
+        assert report["totals"]["errors"] == 1
+
+        md_path = os.path.join(tmp, "outputs", "smol_ai_news_20250805.md")
+        saved = ledger.write_report(usage_report_path(md_path), source_url="https://a.example/1")
+        assert saved.endswith("smol_ai_news_20250805_usage.json")
+        saved_report = json.loads(Path(saved).read_text(encoding="utf-8"))
+        assert [call["source_url"] for call in saved_report["calls"]] == ["https://a.example/1"]
+        print("  ✓ 실행 리포트 (.md 옆 _usage.json)")
+
+        response_cache._response_cache = None
+        usage_ledger._usage_ledger = None
+
+
+if __name__ == "__main__":
+    test_usage_ledger()
+    print("✅ 테스트 완료")
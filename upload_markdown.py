@@ -16,6 +16,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from src.publishers.github import GitHubPublisher
 from src.logger import setup_logger, logger
 from src.config import Config
+from src.markdown_utils import parse_markdown
 
 def parse_arguments():
     """명령줄 인자 파싱"""
@@ -24,13 +25,14 @@ def parse_arguments():
     )
     
     parser.add_argument(
-        "markdown_file",
-        help="게시할 마크다운 파일 경로"
+        "markdown_files",
+        nargs="+",
+        help="게시할 마크다운 파일 경로 (여러 개면 묶음 요청으로 일괄 게시)"
     )
     
     parser.add_argument(
         "--title",
-        help="Discussion 제목 (기본: 파일명에서 자동 생성)"
+        help="Discussion 제목 (기본: 파일명에서 자동 생성, 파일이 하나일 때만 사용)"
     )
     
     parser.add_argument(
@@ -50,9 +52,9 @@ def parse_arguments():
 def extract_headline_from_markdown(content: str) -> str:
     """마크다운에서 헤드라인 추출"""
     # "오늘의 요약" 섹션 찾기
-    summary_match = re.search(r'## 오늘의 요약\s*\n(.*?)(?:\n##|\Z)', content, re.DOTALL)
-    if summary_match:
-        summary_text = summary_match.group(1).strip()
+    section = parse_markdown(content).find("오늘의 요약")
+    if section:
+        summary_text = section.body
         # 첫 번째 불릿 포인트나 문장 추출
         first_item = re.search(r'[-*]\s*(.+?)(?:\n|$)', summary_text)
         if first_item:
@@ -100,27 +102,35 @@ def main():
     # 로거 초기화
     setup_logger(level="INFO")
     
-    # 마크다운 파일 읽기
-    if not os.path.exists(args.markdown_file):
-        logger.error(f"파일을 찾을 수 없습니다: {args.markdown_file}")
+    if args.title and len(args.markdown_files) > 1:
+        logger.error("--title은 파일이 하나일 때만 사용할 수 있습니다")
         return 1
     
-    with open(args.markdown_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    logger.info(f"📄 파일 읽기: {args.markdown_file}")
-    logger.info(f"   크기: {len(content)} 글자")
-    
-    # 제목 생성
-    if not args.title:
-        headline = ""
-        if args.extract_headline:
-            headline = extract_headline_from_markdown(content)
-            if headline:
-                logger.info(f"📝 추출된 헤드라인: {headline}")
+    # 마크다운 파일 읽기 및 제목 생성
+    items = []
+    for markdown_file in args.markdown_files:
+        if not os.path.exists(markdown_file):
+            logger.error(f"파일을 찾을 수 없습니다: {markdown_file}")
+            return 1
+        
+        with open(markdown_file, 'r', encoding='utf-8') as f:
+            content = f.read()
         
-        args.title = generate_title_from_filename(args.markdown_file, headline)
-        logger.info(f"📌 자동 생성 제목: {args.title}")
+        logger.info(f"📄 파일 읽기: {markdown_file}")
+        logger.info(f"   크기: {len(content)} 글자")
+        
+        title = args.title
+        if not title:
+            headline = ""
+            if args.extract_headline:
+                headline = extract_headline_from_markdown(content)
+                if headline:
+                    logger.info(f"📝 추출된 헤드라인: {headline}")
+            
+            title = generate_title_from_filename(markdown_file, headline)
+            logger.info(f"📌 자동 생성 제목: {title}")
+        
+        items.append((title, content))
     
     # GitHub Publisher 초기화
     publisher = GitHubPublisher(
@@ -141,17 +151,30 @@ def main():
     
     if args.dry_run:
         logger.info("[DRY-RUN] 실제 게시하지 않고 시뮬레이션")
-        logger.info(f"제목: {args.title}")
-        logger.info(f"내용: {len(content)} 글자")
+        for title, content in items:
+            logger.info(f"제목: {title}")
+            logger.info(f"내용: {len(content)} 글자")
         return 0
     
+    if len(items) > 1:
+        # 여러 파일은 createDiscussion 묶음 요청으로 일괄 게시
+        logger.info(f"📤 GitHub Discussions 일괄 게시 중... ({len(items)}건)")
+        urls = publisher.publish_many(items)
+        for (title, _), url in zip(items, urls):
+            if url:
+                logger.info(f"✅ {title}: {url}")
+            else:
+                logger.error(f"❌ {title}: 게시 실패")
+        return 0 if all(urls) else 1
+    
     # Discussion 게시
     logger.info("📤 GitHub Discussions 게시 중...")
     
+    title, content = items[0]
     result_data = {}
     success = publisher.publish(
         content,
-        title=args.title,
+        title=title,
         **result_data
     )
     